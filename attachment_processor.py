@@ -8,13 +8,17 @@
 """
 
 import os
+import re
 import base64
 import hashlib
 import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from cachetools import TTLCache
 
 # 파일 처리 라이브러리
 import PyPDF2
@@ -32,7 +36,7 @@ from module.logging_config import get_logger
 
 # Vector DB
 from chromadb_singleton import ChromaDBSingleton
-from vector_db_models import VectorDBManager
+from vector_db_models import VectorDBManager, AttachmentChunk
 
 
 @dataclass
@@ -62,11 +66,27 @@ class ProcessedAttachment:
 class AttachmentProcessor:
     """첨부파일 처리 클래스"""
 
-    def __init__(self, storage_dir: str = "attachments", chunk_size: int = 1000):
+    def __init__(self, storage_dir: str = "attachments", chunk_size: int = 1000,
+                 max_concurrency: Optional[int] = None):
+        """
+        Args:
+            storage_dir: 첨부파일 저장 디렉토리
+            chunk_size: 청크당 단어 수
+            max_concurrency: 배치 처리 시 동시 추출/분석 수 (기본: ATTACHMENT_MAX_CONCURRENCY 환경변수, 없으면 4)
+        """
         self.logger = get_logger(__name__)
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         self.chunk_size = chunk_size
+        self.max_concurrency = max(1, max_concurrency or int(os.getenv("ATTACHMENT_MAX_CONCURRENCY", "4")))
+
+        # 파일 해시별 LLM 분석 결과 (같은 파일을 다시 받으면 분석 호출 생략)
+        # 장기 실행 서버에서 무한히 커지지 않도록 크기/TTL 제한 (cachetools 캐시는 lock으로 보호)
+        self._analysis_cache: TTLCache = TTLCache(
+            maxsize=int(os.getenv("ATTACHMENT_ANALYSIS_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("ATTACHMENT_ANALYSIS_CACHE_TTL", "86400"))
+        )
+        self._analysis_cache_lock = threading.Lock()
 
         # LLM 클라이언트 초기화
         self.llm_client = None
@@ -414,17 +434,31 @@ JSON 형태로만 응답해주세요.
             self.logger.error(f"LLM 분석 실패: {e}")
             return {"error": str(e)}
 
+    def analyze_with_cache(self, metadata: AttachmentMetadata, content: str) -> Dict[str, Any]:
+        """파일 해시 기준으로 LLM 분석 결과를 재사용 (실패한 분석은 캐시하지 않음)"""
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(metadata.file_hash)
+        if cached is not None:
+            self.logger.info(f"LLM 분석 생략 (이미 분석된 파일): {metadata.original_filename}")
+            return cached
+
+        analysis_result = self.analyze_with_llm(metadata, content)
+        if "error" not in analysis_result:
+            with self._analysis_cache_lock:
+                self._analysis_cache[metadata.file_hash] = analysis_result
+        return analysis_result
+
     def create_chunks(self, content: str, metadata: AttachmentMetadata) -> List[Dict[str, Any]]:
-        """파일 내용을 청크로 분할"""
+        """파일 내용을 청크로 분할 (원문 내 문자 위치 포함)"""
         if not content.strip():
             return []
 
         chunks = []
-        words = content.split()
+        word_spans = [match.span() for match in re.finditer(r"\S+", content)]
 
-        for i in range(0, len(words), self.chunk_size):
-            chunk_words = words[i:i + self.chunk_size]
-            chunk_text = " ".join(chunk_words)
+        for i in range(0, len(word_spans), self.chunk_size):
+            spans = word_spans[i:i + self.chunk_size]
+            chunk_text = " ".join(content[start:end] for start, end in spans)
 
             chunk_metadata = {
                 "file_id": metadata.file_id,
@@ -432,7 +466,9 @@ JSON 형태로만 응답해주세요.
                 "mime_type": metadata.mime_type,
                 "chunk_index": len(chunks),
                 "file_size": metadata.file_size,
-                "source": "attachment"
+                "source": "attachment",
+                "char_start": spans[0][0],
+                "char_end": spans[-1][1]
             }
 
             chunks.append({
@@ -444,16 +480,14 @@ JSON 형태로만 응답해주세요.
 
     def store_in_vector_db(self, chunks: List[Dict[str, Any]], ticket_id: str,
                          analysis_result: Dict[str, Any]) -> List[str]:
-        """Vector DB에 첨부파일 청크 저장"""
+        """Vector DB에 첨부파일 청크 저장 (파일당 upsert 1회)"""
         try:
-            from vector_db_models import AttachmentChunk
-            vector_db_ids = []
+            created_at = datetime.now().isoformat()
+            attachment_chunks = []
 
             for chunk in chunks:
                 chunk_metadata = chunk["metadata"]
-
-                # AttachmentChunk 객체 생성
-                attachment_chunk = AttachmentChunk(
+                attachment_chunks.append(AttachmentChunk(
                     chunk_id=f"attachment_{ticket_id}_{chunk_metadata['file_id']}_{chunk_metadata['chunk_index']}",
                     ticket_id=ticket_id,
                     file_id=chunk_metadata["file_id"],
@@ -466,18 +500,15 @@ JSON 형태로만 응답해주세요.
                     keywords=analysis_result.get("keywords", []),
                     file_category=analysis_result.get("category"),
                     business_relevance=analysis_result.get("business_relevance"),
-                    created_at=datetime.now().isoformat(),
-                    source="attachment"
-                )
-
-                # Vector DB에 저장
-                success = self.vector_db.add_attachment_chunk(attachment_chunk)
+                    created_at=created_at,
+                    source="attachment",
+                    char_start=chunk_metadata.get("char_start", 0),
+                    char_end=chunk_metadata.get("char_end", 0)
+                ))
 
-                if success:
-                    vector_db_ids.append(attachment_chunk.chunk_id)
-                    self.logger.debug(f"첨부파일 청크 저장 성공: {attachment_chunk.chunk_id}")
-                else:
-                    self.logger.error(f"첨부파일 청크 저장 실패: {attachment_chunk.chunk_id}")
+            vector_db_ids = self.vector_db.add_attachment_chunks(attachment_chunks)
+            if len(vector_db_ids) != len(attachment_chunks):
+                self.logger.error(f"첨부파일 청크 저장 실패: {len(attachment_chunks)}개 중 {len(vector_db_ids)}개 저장")
 
             self.logger.info(f"Vector DB에 {len(vector_db_ids)}개 첨부파일 청크 저장 완료")
             return vector_db_ids
@@ -486,6 +517,36 @@ JSON 형태로만 응답해주세요.
             self.logger.error(f"Vector DB 저장 실패: {e}")
             return []
 
+    def _extract_and_analyze(self, metadata: AttachmentMetadata) -> Tuple[str, Dict[str, Any]]:
+        """텍스트 추출 + LLM 분석 (배치 처리의 워커 단위)"""
+        extracted_text = self.extract_text_content(metadata)
+        return extracted_text, self.analyze_with_cache(metadata, extracted_text)
+
+    def _finalize_attachment(self, metadata: AttachmentMetadata, extracted_text: str,
+                             analysis_result: Dict[str, Any], ticket_id: str) -> ProcessedAttachment:
+        """분석 결과 반영 → 청크 생성 → Vector DB 저장"""
+        metadata.extracted_text = extracted_text
+        if "summary" in analysis_result:
+            metadata.analysis_summary = analysis_result["summary"]
+            metadata.keywords = analysis_result.get("keywords", [])
+            metadata.file_type_category = analysis_result.get("category", "기타")
+
+        # 청크 생성
+        chunks = self.create_chunks(extracted_text, metadata)
+
+        # Vector DB 저장
+        vector_db_ids = []
+        if chunks:
+            vector_db_ids = self.store_in_vector_db(chunks, ticket_id, analysis_result)
+
+        self.logger.info(f"첨부파일 처리 완료: {metadata.original_filename}")
+
+        return ProcessedAttachment(
+            metadata=metadata,
+            vector_db_ids=vector_db_ids,
+            analysis_result=analysis_result
+        )
+
     def process_attachment_from_base64(self,
                                      base64_data: str,
                                      filename: str,
@@ -499,45 +560,88 @@ JSON 형태로만 응답해주세요.
             # 파일 저장
             metadata = self.save_attachment(file_data, filename, mime_type)
 
-            # 텍스트 추출
-            extracted_text = self.extract_text_content(metadata)
-            metadata.extracted_text = extracted_text
+            # 텍스트 추출 + LLM 분석
+            extracted_text, analysis_result = self._extract_and_analyze(metadata)
 
-            # LLM 분석
-            analysis_result = self.analyze_with_llm(metadata, extracted_text)
-            if "summary" in analysis_result:
-                metadata.analysis_summary = analysis_result["summary"]
-                metadata.keywords = analysis_result.get("keywords", [])
-                metadata.file_type_category = analysis_result.get("category", "기타")
-
-            # 청크 생성
-            chunks = self.create_chunks(extracted_text, metadata)
-
-            # Vector DB 저장
-            vector_db_ids = []
-            if chunks:
-                vector_db_ids = self.store_in_vector_db(chunks, ticket_id, analysis_result)
-
-            self.logger.info(f"첨부파일 처리 완료: {filename}")
-
-            return ProcessedAttachment(
-                metadata=metadata,
-                vector_db_ids=vector_db_ids,
-                analysis_result=analysis_result
-            )
+            # 청크 생성 + Vector DB 저장
+            return self._finalize_attachment(metadata, extracted_text, analysis_result, ticket_id)
 
         except Exception as e:
             self.logger.error(f"첨부파일 처리 실패: {e}")
             return None
 
-    def search_attachments_in_vector_db(self, query: str, ticket_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Vector DB에서 첨부파일 검색"""
+    def process_attachments_batch(self, attachments: List[Dict[str, Any]],
+                                  ticket_id: str) -> List[Optional[ProcessedAttachment]]:
+        """
+        여러 첨부파일을 한 번에 처리
+
+        - 저장(디코드/쓰기)은 순서대로, 텍스트 추출과 LLM 분석은 max_concurrency개씩 병렬 수행
+        - 같은 내용(해시)의 첨부파일은 한 번만 추출/분석
+        - 첨부파일별 청크는 upsert 1회로 저장
+
+        Args:
+            attachments: {'base64_data', 'filename', 'mime_type'} 딕셔너리 목록
+            ticket_id: 티켓 ID
+
+        Returns:
+            입력 순서와 같은 ProcessedAttachment 목록 (실패한 항목은 None)
+        """
+        saved: List[Optional[AttachmentMetadata]] = []
+        for index, attachment_data in enumerate(attachments):
+            filename = attachment_data.get('filename') or f'attachment_{index}.bin'
+            try:
+                file_data = base64.b64decode(attachment_data.get('base64_data', ''))
+                saved.append(self.save_attachment(
+                    file_data, filename, attachment_data.get('mime_type', 'application/octet-stream')
+                ))
+            except Exception as e:
+                self.logger.error(f"첨부파일 저장 실패: {filename} - {e}")
+                saved.append(None)
+
+        # 해시별 대표 파일만 추출/분석
+        unique: Dict[str, AttachmentMetadata] = {}
+        for metadata in saved:
+            if metadata is not None and metadata.file_hash not in unique:
+                unique[metadata.file_hash] = metadata
+
+        analyzed: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, max(1, len(unique)))) as executor:
+            futures = {
+                file_hash: executor.submit(self._extract_and_analyze, metadata)
+                for file_hash, metadata in unique.items()
+            }
+            for file_hash, future in futures.items():
+                try:
+                    analyzed[file_hash] = future.result()
+                except Exception as e:
+                    self.logger.error(f"첨부파일 분석 실패: {unique[file_hash].original_filename} - {e}")
+
+        results: List[Optional[ProcessedAttachment]] = []
+        for metadata in saved:
+            if metadata is None or metadata.file_hash not in analyzed:
+                results.append(None)
+                continue
+            try:
+                extracted_text, analysis_result = analyzed[metadata.file_hash]
+                results.append(self._finalize_attachment(metadata, extracted_text, analysis_result, ticket_id))
+            except Exception as e:
+                self.logger.error(f"첨부파일 처리 실패: {metadata.original_filename} - {e}")
+                results.append(None)
+
+        self.logger.info(
+            f"첨부파일 배치 처리 완료: {sum(1 for r in results if r)}/{len(attachments)}개 "
+            f"(고유 파일 {len(unique)}개, 동시성 {self.max_concurrency})"
+        )
+        return results
+
+    def search_attachments_in_vector_db(self, query: str, ticket_id: Optional[str] = None,
+                                        file_category: Optional[str] = None,
+                                        n_results: int = 5) -> List[Dict[str, Any]]:
+        """Vector DB에서 첨부파일 검색 (벡터 + BM25, 청크 단위 결과)"""
         try:
-            # Vector DB에서 검색 (content_type이 attachment인 것만)
-            results = []
-
-            # 검색 쿼리 실행 (Vector DB 검색 로직 구현 필요)
-            # 현재는 기본 구조만 제공
+            results = self.vector_db.search_attachment_chunks(
+                query, n_results=n_results, ticket_id=ticket_id, file_category=file_category
+            )
 
             self.logger.info(f"첨부파일 검색 완료: {len(results)}개 결과")
             return results
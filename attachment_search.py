@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+첨부파일 청크 하이브리드 검색
+- attachment_chunks 컬렉션에서 티켓 ID / 파일 카테고리로 필터링
+- ko-sroberta 임베딩 벡터 검색 + BM25 키워드 점수를 RRF로 융합
+- 청크 단위 결과와 원문 내 위치(char_start/char_end) 반환
+
+티켓 추천 중 인라인으로 호출되므로 필터는 ChromaDB where 절로 먼저 적용하고,
+BM25는 필터링된 청크(또는 벡터 검색 후보)에 대해서만 계산한다.
+필터별 BM25 인덱스(토큰화 결과 포함)는 캐시하고, 같은 티켓에 청크가 저장되면 무효화한다.
+
+ko-sroberta 임베딩은 컬렉션에 임베딩 함수를 연결하지 않고 저장/검색 시 직접 계산해 전달한다.
+(기본 임베딩으로 만들어진 기존 attachment_chunks 컬렉션에 다른 임베딩 함수를 연결하면
+ChromaDB가 "Embedding function conflict"로 거부하므로, ko-sroberta 벡터는 별도 컬렉션에 저장)
+"""
+
+import os
+import json
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from cachetools import TTLCache
+
+# BM25 관련 import
+try:
+    from rank_bm25 import BM25Okapi
+    BM25_AVAILABLE = True
+except ImportError:
+    BM25_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ATTACHMENT_COLLECTION = "attachment_chunks"  # ChromaDB 기본 임베딩 (ko-sroberta 사용 불가 시)
+ATTACHMENT_KO_COLLECTION = "attachment_chunks_ko_sroberta"  # ko-sroberta 임베딩 직접 전달
+RRF_K = 60
+BM25_CACHE_SIZE = int(os.getenv("ATTACHMENT_BM25_CACHE_SIZE", "256"))
+# 다른 프로세스의 저장은 무효화 알림을 받지 못하므로 TTL로 상한을 둠
+BM25_CACHE_TTL = int(os.getenv("ATTACHMENT_BM25_CACHE_TTL", "300"))
+
+_embedding_function = None
+_embedding_function_loaded = False
+_tokenizer = None
+_shared_lock = threading.Lock()
+
+
+def get_attachment_embedding_function():
+    """
+    첨부파일 컬렉션용 ko-sroberta 임베딩 함수 (프로세스 공용)
+
+    sentence_transformers가 없거나 모델 로딩에 실패하면 None을 반환하며,
+    이 경우 ChromaDB 기본 임베딩(ATTACHMENT_COLLECTION)을 사용한다.
+    컬렉션에 연결하지 않고 저장(embeddings)/검색(query_embeddings) 시 직접 호출한다.
+    """
+    global _embedding_function, _embedding_function_loaded
+    if not _embedding_function_loaded:
+        with _shared_lock:
+            if not _embedding_function_loaded:
+                try:
+                    from clean_korean_embedding import CleanKoreanEmbeddingFunction
+                    _embedding_function = CleanKoreanEmbeddingFunction()
+                except Exception as e:
+                    logger.warning(f"⚠️ ko-sroberta 임베딩 사용 불가, ChromaDB 기본 임베딩 사용: {e}")
+                    _embedding_function = None
+                _embedding_function_loaded = True
+    return _embedding_function
+
+
+def get_attachment_collection_name() -> str:
+    """현재 프로세스에서 사용할 첨부파일 컬렉션 이름 (임베딩 차원이 다르므로 컬렉션을 분리)"""
+    return ATTACHMENT_KO_COLLECTION if get_attachment_embedding_function() is not None else ATTACHMENT_COLLECTION
+
+
+def embed_attachment_texts(texts: List[str]) -> Optional[List[List[float]]]:
+    """ko-sroberta 임베딩 계산 (사용 불가 시 None → ChromaDB 기본 임베딩)"""
+    embedding_function = get_attachment_embedding_function()
+    if embedding_function is None or not texts:
+        return None
+    return [list(map(float, vector)) for vector in embedding_function(list(texts))]
+
+
+class _LexicalIndexCache:
+    """where 절별 BM25 인덱스 캐시 (Thread-safe, 티켓 단위 무효화)"""
+
+    def __init__(self, maxsize: int = BM25_CACHE_SIZE, ttl: int = BM25_CACHE_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(collection_name: str, where: Dict[str, Any]) -> str:
+        return f"{collection_name}:{json.dumps(where, sort_keys=True, ensure_ascii=False)}"
+
+    def get(self, key: str):
+        with self._lock:
+            return self._cache.get(key)
+
+    def put(self, key: str, ticket_id: Optional[str], index: Dict[str, Any]):
+        with self._lock:
+            self._cache[key] = (ticket_id, index)
+
+    def invalidate(self, ticket_ids: Optional[Iterable[str]] = None):
+        """
+        저장된 청크의 티켓에 해당하는 인덱스 무효화
+
+        Args:
+            ticket_ids: 변경된 티켓 ID 목록 (None이면 전체 무효화)
+        """
+        with self._lock:
+            if ticket_ids is None:
+                self._cache.clear()
+                return
+            changed = {str(t) for t in ticket_ids}
+            for key, entry in list(self._cache.items()):
+                # 티켓 필터가 없는 인덱스(카테고리 필터만)는 모든 저장의 영향을 받음
+                if entry[0] is None or entry[0] in changed:
+                    self._cache.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+_lexical_index_cache = _LexicalIndexCache()
+
+
+def invalidate_attachment_index(ticket_ids: Optional[Iterable[str]] = None):
+    """첨부파일 청크 저장 후 BM25 인덱스 캐시 무효화 (VectorDBManager.add_attachment_chunks에서 호출)"""
+    _lexical_index_cache.invalidate(ticket_ids)
+
+
+def _get_default_tokenizer():
+    """RRF 시스템과 같은 한국어 토크나이저 (초기화 비용이 커서 공용 인스턴스 사용)"""
+    global _tokenizer
+    if _tokenizer is None:
+        with _shared_lock:
+            if _tokenizer is None:
+                try:
+                    from rrf_fusion_rag_system import KoreanTokenizer
+                    _tokenizer = KoreanTokenizer().tokenize
+                except Exception as e:
+                    logger.warning(f"⚠️ 한국어 토크나이저 사용 불가, 공백 분리 사용: {e}")
+                    _tokenizer = lambda text: text.lower().split()
+    return _tokenizer
+
+
+def build_attachment_where(ticket_id: Optional[str] = None,
+                           file_category: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """티켓 ID / 파일 카테고리 필터를 ChromaDB where 절로 변환"""
+    conditions = []
+    if ticket_id:
+        conditions.append({"ticket_id": str(ticket_id)})
+    if file_category:
+        conditions.append({"file_category": file_category})
+
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
+class AttachmentSearcher:
+    """첨부파일 청크 하이브리드 검색기 (벡터 + BM25, RRF 융합)"""
+
+    def __init__(self, collection, tokenizer=None, candidate_multiplier: int = 4,
+                 max_lexical_candidates: Optional[int] = None, rrf_k: int = RRF_K,
+                 embedding_function=None, index_cache: Optional[_LexicalIndexCache] = None):
+        """
+        Args:
+            collection: 첨부파일 ChromaDB 컬렉션
+            tokenizer: BM25 토크나이저 (text -> 토큰 목록, 기본: 한국어 형태소 토크나이저)
+            candidate_multiplier: 벡터 검색 후보 수 = n_results * candidate_multiplier
+            max_lexical_candidates: 필터 적용 시 BM25로 점수를 매길 최대 청크 수
+                (기본: ATTACHMENT_BM25_MAX_CANDIDATES 환경변수, 없으면 2000)
+            rrf_k: RRF 상수
+            embedding_function: 쿼리 임베딩 함수 (None이면 query_texts로 컬렉션 기본 임베딩 사용)
+            index_cache: 필터별 BM25 인덱스 캐시 (기본: 프로세스 공용 캐시)
+        """
+        self.collection = collection
+        self.embedding_function = embedding_function
+        self.index_cache = index_cache if index_cache is not None else _lexical_index_cache
+        self.tokenizer = tokenizer
+        self.candidate_multiplier = max(1, candidate_multiplier)
+        self.max_lexical_candidates = max_lexical_candidates or int(
+            os.getenv("ATTACHMENT_BM25_MAX_CANDIDATES", "2000")
+        )
+        self.rrf_k = rrf_k
+
+    def _tokenize(self, text: str) -> List[str]:
+        tokenizer = self.tokenizer or _get_default_tokenizer()
+        return tokenizer(text or "")
+
+    def _dense_search(self, query: str, n_candidates: int,
+                      where: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """벡터 검색 후보 {chunk_id: {document, metadata, dense_score}}"""
+        kwargs = {
+            "n_results": n_candidates,
+            "include": ["metadatas", "documents", "distances"]
+        }
+        if self.embedding_function is not None:
+            kwargs["query_embeddings"] = [list(map(float, self.embedding_function([query])[0]))]
+        else:
+            kwargs["query_texts"] = [query]
+        if where:
+            kwargs["where"] = where
+
+        results = self.collection.query(**kwargs)
+        candidates = {}
+        for i, chunk_id in enumerate(results["ids"][0]):
+            distance = results["distances"][0][i] if results.get("distances") else 1.0
+            candidates[chunk_id] = {
+                "document": results["documents"][0][i],
+                "metadata": results["metadatas"][0][i],
+                "dense_score": max(0.0, 1.0 - distance)
+            }
+        return candidates
+
+    def _filtered_chunks(self, where: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """필터에 해당하는 청크 전체 (BM25 대상)"""
+        results = self.collection.get(
+            where=where,
+            limit=self.max_lexical_candidates,
+            include=["metadatas", "documents"]
+        )
+        return {
+            chunk_id: {"document": results["documents"][i], "metadata": results["metadatas"][i]}
+            for i, chunk_id in enumerate(results["ids"])
+        }
+
+    def _build_lexical_index(self, candidates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """후보 청크의 BM25 인덱스 {'chunks', 'chunk_ids', 'bm25'} (토큰이 없으면 bm25=None)"""
+        chunk_ids = list(candidates)
+        if not BM25_AVAILABLE or not chunk_ids:
+            return {"chunks": candidates, "chunk_ids": chunk_ids, "bm25": None}
+
+        corpus = [self._tokenize(candidates[chunk_id]["document"]) for chunk_id in chunk_ids]
+        bm25 = BM25Okapi(corpus) if any(corpus) else None
+        return {"chunks": candidates, "chunk_ids": chunk_ids, "bm25": bm25}
+
+    def _filtered_index(self, where: Dict[str, Any]) -> Dict[str, Any]:
+        """필터에 해당하는 청크 전체의 BM25 인덱스 (캐시 우선)"""
+        key = self.index_cache.make_key(getattr(self.collection, "name", ""), where)
+        cached = self.index_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        index = self._build_lexical_index(self._filtered_chunks(where))
+        ticket_filter = [c["ticket_id"] for c in where.get("$and", [where]) if "ticket_id" in c]
+        self.index_cache.put(key, ticket_filter[0] if ticket_filter else None, index)
+        return index
+
+    def _bm25_scores(self, query: str, index: Dict[str, Any]) -> Dict[str, float]:
+        """인덱스 청크에 대한 BM25 점수 (0점은 제외)"""
+        if index["bm25"] is None:
+            return {}
+
+        scores = index["bm25"].get_scores(self._tokenize(query))
+        return {chunk_id: float(score) for chunk_id, score in zip(index["chunk_ids"], scores) if score > 0}
+
+    def search(self, query: str, n_results: int = 5, ticket_id: Optional[str] = None,
+               file_category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        첨부파일 청크 검색
+
+        Args:
+            query: 검색 쿼리
+            n_results: 반환할 청크 수
+            ticket_id: 특정 티켓의 첨부파일로 제한
+            file_category: 파일 카테고리로 제한 ("문서", "보고서", "스프레드시트", "이미지", "기타")
+
+        Returns:
+            RRF 점수 순 청크 목록
+        """
+        if not query or not query.strip():
+            return []
+
+        where = build_attachment_where(ticket_id, file_category)
+        candidates = self._dense_search(query, n_results * self.candidate_multiplier, where)
+
+        # 필터가 있으면 해당 청크 전체(캐시된 인덱스)를, 없으면 벡터 후보만 BM25 대상으로 사용
+        if where and BM25_AVAILABLE:
+            index = self._filtered_index(where)
+        else:
+            index = self._build_lexical_index(candidates)
+        bm25_scores = self._bm25_scores(query, index)
+        lexical_pool = dict(index["chunks"])
+        lexical_pool.update(candidates)
+
+        dense_ranking = sorted(candidates, key=lambda cid: candidates[cid]["dense_score"], reverse=True)
+        bm25_ranking = sorted(bm25_scores, key=bm25_scores.get, reverse=True)
+
+        fused: Dict[str, float] = {}
+        for ranking in (dense_ranking, bm25_ranking):
+            for rank, chunk_id in enumerate(ranking, 1):
+                fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (self.rrf_k + rank)
+
+        hits = []
+        for chunk_id in sorted(fused, key=fused.get, reverse=True)[:n_results]:
+            chunk = lexical_pool[chunk_id]
+            metadata = chunk["metadata"] or {}
+            dense_score = candidates.get(chunk_id, {}).get("dense_score", 0.0)
+            hits.append({
+                "chunk_id": chunk_id,
+                "ticket_id": metadata.get("ticket_id", ""),
+                "file_id": metadata.get("file_id", ""),
+                "original_filename": metadata.get("original_filename", ""),
+                "file_category": metadata.get("file_category", ""),
+                "chunk_index": metadata.get("chunk_index", 0),
+                "char_start": metadata.get("char_start", 0),
+                "char_end": metadata.get("char_end", 0),
+                "content": chunk["document"],
+                "metadata": metadata,
+                # 메일 검색 결과와 함께 정렬되므로 similarity_score는 코사인 유사도 유지
+                "similarity_score": dense_score,
+                "dense_score": dense_score,
+                "bm25_score": bm25_scores.get(chunk_id, 0.0),
+                "rrf_score": fused[chunk_id],
+                "search_method": "attachment_hybrid" if bm25_scores else "attachment_vector"
+            })
+
+        logger.info(f"✅ 첨부파일 검색 완료: {len(hits)}개 결과 (벡터 후보 {len(candidates)}, BM25 {len(bm25_scores)})")
+        return hits
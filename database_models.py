@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 import uuid
+from utils.sqlite_pool import get_sqlite_pool, chunked, placeholders
 
 @dataclass
 class Mail:
@@ -100,17 +101,18 @@ class DatabaseManager:
         if not os.path.exists(db_dir):
             os.makedirs(db_dir, mode=0o755, exist_ok=True)
             print(f"✅ RDB 디렉토리 생성 및 권한 설정: {db_dir}")
+        # 스레드 로컬 커넥션 풀 (db 파일별 공유)
+        self._pool = get_sqlite_pool(db_path)
         self.init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 풀 커넥션 (with 블록 종료 시 commit/rollback, 커넥션은 유지)"""
+        return self._pool.connection()
     
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            # WAL 모드로 설정하여 동시성 개선
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA cache_size=1000")
-            conn.execute("PRAGMA temp_store=memory")
-            
+        with self._connect() as conn:
+            # WAL/synchronous 등 PRAGMA는 커넥션 풀에서 커넥션 생성 시 1회 설정
             cursor = conn.cursor()
             
             # tickets 테이블 생성
@@ -199,6 +201,12 @@ class DatabaseManager:
                 CREATE INDEX IF NOT EXISTS idx_ticket_events_ticket_id 
                 ON ticket_events(ticket_id)
             """)
+
+            # get_all_tickets 정렬용 인덱스
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tickets_created_at
+                ON tickets(created_at)
+            """)
             
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_user_actions_ticket_id 
@@ -235,6 +243,12 @@ class DatabaseManager:
                     CREATE INDEX IF NOT EXISTS idx_integrations_source
                     ON integrations(source)
                 """)
+
+                # 슬랙/카카오 이벤트마다 호출되는 get_user_id_by_integration용 커버링 인덱스
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_integrations_lookup
+                    ON integrations(source, type, value, user_id)
+                """)
             elif 'email' in integration_columns:
                 # 구 스키마 인덱스 (마이그레이션 전)
                 cursor.execute("""
@@ -251,8 +265,7 @@ class DatabaseManager:
 
     def migrate_integrations_to_new_schema(self):
         """기존 Integration 테이블 데이터를 새 스키마로 마이그레이션"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             print("🔄 Integration 테이블 마이그레이션 시작...")
@@ -369,8 +382,7 @@ class DatabaseManager:
 
     def migrate_user_data_to_integrations(self):
         """기존 User 테이블의 통합 정보를 Integration 테이블로 마이그레이션 (레거시)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             print("🔄 User 테이블에서 Integration 테이블로 마이그레이션 시작...")
@@ -435,8 +447,7 @@ class DatabaseManager:
 
     def insert_ticket(self, ticket: Ticket) -> int:
         """티켓 삽입"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -456,8 +467,7 @@ class DatabaseManager:
     
     def insert_ticket_event(self, event: TicketEvent) -> int:
         """티켓 이벤트 삽입"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -472,10 +482,28 @@ class DatabaseManager:
             conn.commit()
             return event_id
     
+    def insert_ticket_events(self, events: List[TicketEvent]) -> int:
+        """티켓 이벤트 일괄 삽입 (단일 트랜잭션)
+
+        Returns:
+            삽입된 이벤트 수
+        """
+        if not events:
+            return 0
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT INTO ticket_events (
+                    ticket_id, event_type, old_value, new_value, created_at
+                ) VALUES (?, ?, ?, ?, ?)
+            """, [
+                (event.ticket_id, event.event_type, event.old_value, event.new_value, event.created_at)
+                for event in events
+            ])
+            return len(events)
+    
     def insert_user_action(self, action: UserAction) -> int:
         """사용자 액션 삽입 (장기 기억용)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -494,8 +522,7 @@ class DatabaseManager:
     
     def get_user_actions_by_ticket_id(self, ticket_id: int) -> List[UserAction]:
         """티켓 ID로 관련 사용자 액션 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -522,8 +549,7 @@ class DatabaseManager:
     
     def get_user_actions_by_message_id(self, message_id: str) -> List[UserAction]:
         """메일 ID로 관련 사용자 액션 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -550,8 +576,7 @@ class DatabaseManager:
     
     def get_all_user_actions(self, limit: int = 100) -> List[UserAction]:
         """모든 사용자 액션 조회 (최근 순)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -578,8 +603,7 @@ class DatabaseManager:
     
     def get_ticket_by_id(self, ticket_id: int) -> Optional[Ticket]:
         """티켓 ID로 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -609,8 +633,7 @@ class DatabaseManager:
     
     def get_tickets_by_message_id(self, message_id: str) -> List[Ticket]:
         """메일 ID로 관련 티켓 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -641,7 +664,7 @@ class DatabaseManager:
     def update_ticket_status(self, ticket_id: int, new_status: str, old_status: str):
         """티켓 상태 업데이트 및 이벤트 기록"""
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 트랜잭션 시작
@@ -679,8 +702,7 @@ class DatabaseManager:
         
         for attempt in range(max_retries):
             try:
-                with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                    conn.execute("PRAGMA journal_mode=WAL")  # WAL 모드로 동시성 개선
+                with self._connect() as conn:
                     cursor = conn.cursor()
                     
                     # 티켓 상태 업데이트
@@ -709,8 +731,7 @@ class DatabaseManager:
     
     def get_all_tickets(self) -> List[Ticket]:
         """모든 티켓 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -738,12 +759,40 @@ class DatabaseManager:
                 ))
             return tickets
     
+    def get_tickets_by_ids(self, ticket_ids: List[int]) -> List[Ticket]:
+        """여러 티켓 ID로 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        tickets_by_id = {}
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            for batch in chunked(dict.fromkeys(ticket_ids)):
+                cursor.execute(f"""
+                    SELECT ticket_id, original_message_id, status, title, description,
+                           priority, ticket_type, reporter, reporter_email, labels,
+                           created_at, updated_at
+                    FROM tickets WHERE ticket_id IN ({placeholders(len(batch))})
+                """, batch)
+                for row in cursor.fetchall():
+                    tickets_by_id[row[0]] = Ticket(
+                        ticket_id=row[0],
+                        original_message_id=row[1],
+                        status=row[2],
+                        title=row[3],
+                        description=row[4],
+                        priority=row[5],
+                        ticket_type=row[6],
+                        reporter=row[7],
+                        reporter_email=row[8],
+                        labels=json.loads(row[9]) if row[9] else [],
+                        created_at=row[10],
+                        updated_at=row[11]
+                    )
+        return [tickets_by_id[ticket_id] for ticket_id in ticket_ids if ticket_id in tickets_by_id]
+    
     # === 사용자 관련 메서드들 ===
     
     def insert_user(self, user: User) -> int:
         """사용자 삽입"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -761,8 +810,7 @@ class DatabaseManager:
     
     def get_user_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -784,8 +832,7 @@ class DatabaseManager:
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """ID로 사용자 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -820,8 +867,7 @@ class DatabaseManager:
     
     def update_user_jira_info(self, user_id: int, jira_endpoint: str, jira_api_token: str):
         """사용자의 Jira 정보 업데이트"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -832,8 +878,7 @@ class DatabaseManager:
     
     def user_exists(self, email: str) -> bool:
         """이메일로 사용자 존재 여부 확인"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM users WHERE email = ?", (email,))
@@ -844,8 +889,7 @@ class DatabaseManager:
 
     def insert_integration(self, integration: Integration) -> int:
         """통합 서비스 정보 삽입"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -867,8 +911,7 @@ class DatabaseManager:
 
     def get_integration(self, user_id: int, source: str, type: str) -> Optional[Integration]:
         """특정 사용자, 소스, 타입으로 통합 정보 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -892,8 +935,7 @@ class DatabaseManager:
 
     def get_all_integrations_by_user(self, user_id: int) -> List[Integration]:
         """특정 사용자의 모든 통합 정보 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -917,8 +959,7 @@ class DatabaseManager:
 
     def get_integrations_by_source(self, user_id: int, source: str) -> List[Integration]:
         """특정 사용자의 특정 소스에 대한 모든 설정 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -942,8 +983,7 @@ class DatabaseManager:
 
     def update_integration_value(self, user_id: int, source: str, type: str, value: str):
         """통합 서비스의 값 업데이트"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -956,8 +996,7 @@ class DatabaseManager:
 
     def delete_integration(self, integration_id: int):
         """통합 서비스 정보 삭제 (ID로)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -969,8 +1008,7 @@ class DatabaseManager:
 
     def delete_integration_by_type(self, user_id: int, source: str, type: str):
         """통합 서비스 정보 삭제 (특정 타입)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -982,8 +1020,7 @@ class DatabaseManager:
 
     def delete_integration_source(self, user_id: int, source: str):
         """통합 서비스 정보 삭제 (소스 전체)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -995,8 +1032,7 @@ class DatabaseManager:
 
     def get_user_id_by_kakao_id(self, kakao_id: str) -> Optional[int]:
         """카카오 ID로 사용자 ID 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -1012,8 +1048,7 @@ class DatabaseManager:
 
     def get_user_id_by_integration(self, source: str, type: str, value: str) -> Optional[int]:
         """통합 서비스 정보로 사용자 ID 조회 (범용)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -1027,6 +1062,61 @@ class DatabaseManager:
                 return row[0]
             return None
 
+    def get_integrations_for_users(self, user_ids: List[int], source: Optional[str] = None) -> Dict[int, List[Integration]]:
+        """여러 사용자의 통합 정보를 일괄 조회
+
+        Args:
+            user_ids: 사용자 ID 목록
+            source: 특정 소스만 조회할 경우 소스명 ('jira', 'slack' 등)
+
+        Returns:
+            {user_id: [Integration, ...]} (통합 정보가 없는 사용자는 빈 리스트)
+        """
+        integrations = {user_id: [] for user_id in user_ids}
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            for batch in chunked(dict.fromkeys(user_ids)):
+                query = f"""
+                    SELECT id, user_id, source, type, value, created_at, updated_at
+                    FROM integrations
+                    WHERE user_id IN ({placeholders(len(batch))})
+                """
+                params = list(batch)
+                if source is not None:
+                    query += " AND source = ?"
+                    params.append(source)
+                cursor.execute(query, params)
+                for row in cursor.fetchall():
+                    integrations.setdefault(row[1], []).append(Integration(
+                        id=row[0],
+                        user_id=row[1],
+                        source=row[2],
+                        type=row[3],
+                        value=row[4],
+                        created_at=row[5],
+                        updated_at=row[6]
+                    ))
+        return integrations
+
+    def get_user_ids_by_integration_values(self, source: str, type: str, values: List[str]) -> Dict[str, int]:
+        """여러 통합 서비스 값으로 사용자 ID 일괄 조회 (예: 슬랙 user_id 목록 → 시스템 user_id)
+
+        Returns:
+            {value: user_id} (연동되지 않은 값은 제외)
+        """
+        user_ids = {}
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            for batch in chunked(dict.fromkeys(str(value) for value in values)):
+                cursor.execute(f"""
+                    SELECT value, user_id
+                    FROM integrations
+                    WHERE source = ? AND type = ? AND value IN ({placeholders(len(batch))})
+                """, [source, type] + batch)
+                for value, user_id in cursor.fetchall():
+                    user_ids[value] = user_id
+        return user_ids
+
 class MailParser:
     """메일 파싱 및 구조화 클래스"""
     
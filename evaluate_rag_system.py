@@ -6,13 +6,18 @@ test_data.csv의 쿼리를 사용하여 RAG 시스템의 성능을 평가합니
 - MRR (Mean Reciprocal Rank): 정답이 나타나는 위치의 역수 평균
 - Hit@K: 상위 K개 결과에 정답이 포함되는 비율
 - Top-1 Accuracy: 1위가 정답인 비율
+- Latency: 검색 구간별(multi_query, hyde, bm25, fusion, load, dedup) p50/p95/p99 및 처리량
+
+쿼리는 워커 풀에서 병렬로 평가한다 (RAG_EVAL_WORKERS 환경변수, 기본 4).
 """
 
 import csv
 import os
 import sys
+import time
 import logging
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime
 import json
 
@@ -20,6 +25,10 @@ import json
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from rrf_fusion_rag_system import RRFRAGSystem, RRFConfig
+from utils.latency_stats import summarize_latencies
+
+# 지연 시간 리포트에 표시할 검색 구간 (rrf_search의 timings 키)
+LATENCY_LEGS = ['multi_query', 'hyde', 'bm25', 'fusion', 'load', 'weighting', 'dedup']
 
 # 로깅 설정
 logging.basicConfig(
@@ -36,15 +45,18 @@ logger = logging.getLogger(__name__)
 class RAGEvaluator:
     """RAG 시스템 평가 클래스"""
 
-    def __init__(self, rag_system: RRFRAGSystem):
+    def __init__(self, rag_system: RRFRAGSystem, max_workers: Optional[int] = None):
         """
         RAG 평가기 초기화
 
         Args:
             rag_system: 평가할 RAG 시스템
+            max_workers: 동시에 평가할 쿼리 수 (기본: RAG_EVAL_WORKERS 환경변수, 없으면 4)
         """
         self.rag_system = rag_system
+        self.max_workers = max(1, max_workers or int(os.getenv("RAG_EVAL_WORKERS", "4")))
         self.results = []
+        self.wall_time_seconds = 0.0
 
     def load_test_data(self, csv_path: str) -> List[Dict[str, Any]]:
         """
@@ -132,6 +144,17 @@ class RAGEvaluator:
         else:
             return -1, False, None
 
+    @staticmethod
+    def _query_latency(timings: Dict[str, float], wall_seconds: float) -> float:
+        """
+        쿼리 전체 지연 시간 (초)
+
+        구간이 순차 실행되므로 구간별 시간의 합을 사용한다. 구간 캐시/트레이스 재생은
+        검색을 건너뛰고 기록된 소요 시간만 timings에 더하므로, 벽시계 시간을 쓰면
+        캐시를 맞은 설정이 실제보다 훨씬 빠르게 보인다. 구간 기록이 없으면 벽시계 시간.
+        """
+        return sum(timings.values()) if timings else wall_seconds
+
     def evaluate_single_query(self, query: str, answer_ticket_ids: List[str]) -> Dict[str, Any]:
         """
         단일 쿼리 평가 (여러 정답 지원)
@@ -143,12 +166,15 @@ class RAGEvaluator:
         Returns:
             평가 결과 딕셔너리
         """
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
         try:
             answer_str = ', '.join(answer_ticket_ids)
             logger.info(f"🔍 평가 중: '{query}' (정답: {answer_str})")
 
-            # RAG 검색 실행
-            search_results = self.rag_system.rrf_search(query)
+            # RAG 검색 실행 (구간별 소요 시간 기록)
+            search_results = self.rag_system.rrf_search(query, timings=timings)
+            latency = self._query_latency(timings, time.perf_counter() - start)
 
             if not search_results:
                 logger.warning(f"⚠️ 검색 결과 없음: '{query}'")
@@ -159,6 +185,8 @@ class RAGEvaluator:
                     'found': False,
                     'found_ticket': None,
                     'reciprocal_rank': 0.0,
+                    'latency': latency,
+                    'leg_latencies': timings,
                     'top_results': []
                 }
 
@@ -189,6 +217,8 @@ class RAGEvaluator:
                 'found': found,
                 'found_ticket': found_ticket,
                 'reciprocal_rank': reciprocal_rank,
+                'latency': latency,
+                'leg_latencies': timings,
                 'top_results': top_results
             }
 
@@ -208,40 +238,84 @@ class RAGEvaluator:
                 'found': False,
                 'found_ticket': None,
                 'reciprocal_rank': 0.0,
+                'latency': time.perf_counter() - start,
+                'leg_latencies': timings,
                 'error': str(e),
                 'top_results': []
             }
 
     def evaluate_all(self, test_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        모든 테스트 케이스 평가
+        모든 테스트 케이스 평가 (워커 풀에서 병렬 실행)
 
         Args:
             test_cases: 테스트 케이스 리스트
 
         Returns:
-            평가 결과 리스트
+            평가 결과 리스트 (테스트 케이스 순서 유지)
         """
-        results = []
-
-        logger.info(f"🚀 전체 평가 시작: {len(test_cases)}개 케이스")
-
-        for i, test_case in enumerate(test_cases, start=1):
-            logger.info(f"\n{'='*60}")
-            logger.info(f"진행률: {i}/{len(test_cases)}")
+        total = len(test_cases)
+        workers = min(self.max_workers, total) or 1
+        logger.info(f"🚀 전체 평가 시작: {total}개 케이스 (워커 {workers}개)")
 
+        def _evaluate(indexed_case):
+            i, test_case = indexed_case
             result = self.evaluate_single_query(
                 test_case['query'],
                 test_case['answer_ticket_ids']  # 리스트로 변경
             )
-            results.append(result)
+            logger.info(f"진행률: {i}/{total}")
+            return result
+
+        start = time.perf_counter()
+        if workers == 1:
+            results = [_evaluate(item) for item in enumerate(test_cases, start=1)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_evaluate, enumerate(test_cases, start=1)))
+        self.wall_time_seconds = time.perf_counter() - start
 
         logger.info(f"\n{'='*60}")
-        logger.info("✅ 전체 평가 완료")
+        logger.info(f"✅ 전체 평가 완료 ({self.wall_time_seconds:.1f}초)")
 
         self.results = results
         return results
 
+    def calculate_latency_metrics(self, results: List[Dict[str, Any]],
+                                  wall_time_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        지연 시간 메트릭 계산
+
+        Args:
+            results: 평가 결과 리스트
+            wall_time_seconds: 전체 평가 소요 시간 (기본: 마지막 evaluate_all 실행 시간)
+
+        Returns:
+            {'total': 요약, 'legs': {구간: 요약 + share}, 'throughput_qps', 'wall_time_seconds', 'workers'}
+        """
+        latencies = [r['latency'] for r in results if 'latency' in r]
+        if wall_time_seconds is None:
+            wall_time_seconds = self.wall_time_seconds
+
+        legs = {}
+        total_time = sum(latencies)
+        for leg in LATENCY_LEGS:
+            values = [r['leg_latencies'][leg] for r in results if leg in r.get('leg_latencies', {})]
+            if not values:
+                continue
+            summary = summarize_latencies(values)
+            # 전체 검색 시간 중 이 구간이 차지하는 비율 (비용 비중)
+            summary['share'] = sum(values) / total_time if total_time else 0.0
+            legs[leg] = summary
+
+        return {
+            'total': summarize_latencies(latencies),
+            'legs': legs,
+            'throughput_qps': len(latencies) / wall_time_seconds if wall_time_seconds else 0.0,
+            'wall_time_seconds': wall_time_seconds,
+            'workers': self.max_workers
+        }
+
     def calculate_metrics(self, results: List[Dict[str, Any]]) -> Dict[str, float]:
         """
         평가 메트릭 계산
@@ -290,7 +364,8 @@ class RAGEvaluator:
             'top1_accuracy': top1_accuracy,
             'found_rate': found_rate,
             'avg_rank': avg_rank,
-            'found_count': len(found_results)
+            'found_count': len(found_results),
+            'latency': self.calculate_latency_metrics(results)
         }
 
         return metrics
@@ -312,6 +387,17 @@ class RAGEvaluator:
         print(f"  Hit@10:                     {metrics['hit@10']:.2%}")
         print()
         print(f"평균 정답 순위 (발견된 경우): {metrics['avg_rank']:.2f}")
+
+        latency = metrics.get('latency')
+        if latency and latency['total']['count']:
+            total = latency['total']
+            print()
+            print(f"⏱️ 지연 시간 (워커 {latency['workers']}개, {latency['wall_time_seconds']:.1f}초):")
+            print(f"  처리량:                     {latency['throughput_qps']:.2f} queries/s")
+            print(f"  전체 p50/p95/p99:           {total['p50_ms']:.0f} / {total['p95_ms']:.0f} / {total['p99_ms']:.0f} ms")
+            for leg, summary in latency['legs'].items():
+                print(f"  {leg:<12} p50/p95/p99: {summary['p50_ms']:>7.0f} / {summary['p95_ms']:>7.0f} / "
+                      f"{summary['p99_ms']:>7.0f} ms ({summary['share']:.0%})")
         print("="*60)
 
     def save_results(self, results: List[Dict[str, Any]], metrics: Dict[str, float],
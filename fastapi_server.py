@@ -4,6 +4,10 @@
 회원가입, 로그인, 외부 서비스 연동 관리
 """
 import re
+import asyncio
+import anyio
+import hashlib
+import time
 from fastapi import FastAPI, HTTPException, Depends, Cookie, Response, Request, BackgroundTasks
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -25,12 +29,15 @@ import dotenv
 from slack_sdk.web import WebClient
 from slack_sdk.signature import SignatureVerifier
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 from database_models import DatabaseManager, User
 from auth_utils import password_manager, token_encryption, session_manager
 import datefinder
 from dateutil.parser import parse as dateutil_parse
 import dateparser
 import urllib.parse
+from cachetools import TTLCache
+from utils.job_queue import SQLiteJobQueue, JobWorkerPool
 
 # .env 파일 로드 (반드시 os.getenv() 호출 전에 실행)
 dotenv.load_dotenv()
@@ -2026,10 +2033,187 @@ async def check_oauth_status(provider: str, current_user: User = Depends(get_cur
 client = WebClient(token=dotenv.get_key(".env", "SLACK_BOT_TOKEN"))
 signature_verifier = SignatureVerifier(dotenv.get_key(".env", "SLACK_SIGNING_SECRET"))
 
-async def make_ticket_data(original_text_parts: list):
-    # 1. 문의 내용 (제목 재료)
+# === 메신저 이벤트 작업 큐 ===
+# 웹훅은 즉시 ack하고, 스레드 조회/LLM 호출/티켓 생성은 워커가 처리
+# (Slack은 3초 내 응답이 없으면 동일 이벤트를 재전송함)
+event_job_queue = SQLiteJobQueue(os.getenv("EVENT_JOB_QUEUE_DB", "job_queue.db"))
+event_worker_pool = JobWorkerPool(
+    event_job_queue,
+    concurrency=int(os.getenv("EVENT_WORKER_CONCURRENCY", "2")),
+    retention=float(os.getenv("EVENT_JOB_RETENTION_SECONDS", str(7 * 24 * 3600)))
+)
+
+# 카카오 스킬 요청에는 이벤트 ID가 없으므로 같은 발화가 마지막 접수 후 이 시간(초) 안에 오면 중복으로 간주
+KAKAO_DEDUP_WINDOW = int(os.getenv("KAKAO_DEDUP_WINDOW", "60"))
+
+# 카카오 이벤트 API (티켓 생성 최종 실패 알림) - 설정되지 않으면 로그만 남김
+KAKAO_BOT_ID = os.getenv("KAKAO_BOT_ID")
+KAKAO_FAILURE_EVENT = os.getenv("KAKAO_FAILURE_EVENT", "ticket_failed")
+
+# 슬랙 사용자 프로필 캐시 (user_id → user 정보, 10분 TTL)
+slack_user_cache = TTLCache(maxsize=1024, ttl=600)
+slack_user_cache_lock = threading.Lock()
+
+
+async def fetch_slack_user_infos(user_ids: list) -> dict:
+    """슬랙 사용자 정보를 캐시 우선으로 조회하고, 캐시 미스는 동시에 조회"""
+    user_infos = {}
+    missing = []
+    with slack_user_cache_lock:
+        for user_id in dict.fromkeys(user_ids):
+            if user_id in slack_user_cache:
+                user_infos[user_id] = slack_user_cache[user_id]
+            else:
+                missing.append(user_id)
+
+    async def _lookup(user_id: str):
+        try:
+            result = await asyncio.to_thread(client.users_info, user=user_id)
+            return user_id, result.get('user', {})
+        except Exception as e:
+            logging.error(f"슬랙 사용자 정보 조회 실패: user={user_id}, error={e}")
+            return user_id, None
+
+    for user_id, user_info in await asyncio.gather(*[_lookup(u) for u in missing]):
+        user_infos[user_id] = user_info
+        if user_info is not None:
+            with slack_user_cache_lock:
+                slack_user_cache[user_id] = user_info
+
+    return user_infos
+
+
+async def post_slack_message(channel: str, thread_ts: str, text: str):
+    """슬랙 스레드에 메시지 전송 (이벤트 루프 블로킹 방지)"""
+    try:
+        await asyncio.to_thread(client.chat_postMessage, channel=channel, thread_ts=thread_ts, text=text)
+    except Exception as e:
+        logging.error(f"슬랙 메시지 전송 실패: {e}")
+
+
+@app.on_event("startup")
+async def start_event_workers():
+    app.state.mcp_pooled = await open_pooled_mcp_session()
+    event_worker_pool.start()
+
+
+@app.on_event("shutdown")
+async def stop_event_workers():
+    await event_worker_pool.stop()
+    if getattr(app.state, "mcp_pooled", False):
+        await mcp.__aexit__(None, None, None)
+
+
+@app.get("/jobs/metrics")
+async def get_job_queue_metrics():
+    """메신저 이벤트 작업 큐 메트릭 (상태별 건수, 큐 대기 시간, 처리 시간)"""
+    return await asyncio.to_thread(event_job_queue.get_metrics)
+
+# 티켓 제목/요약 생성 모드: 'parallel' (제목·요약 LLM 동시 호출) 또는 'combined' (단일 호출 JSON 응답)
+TICKET_PROMPT_MODE = os.getenv("TICKET_PROMPT_MODE", "parallel")
+
+
+async def open_pooled_mcp_session():
+    """
+    서버 수명 동안 유지되는 MCP 세션 열기
+
+    fastmcp Client는 재진입 가능한 컨텍스트 매니저이므로, 세션이 열려 있으면
+    이후의 `async with mcp`는 새 연결 없이 기존 세션을 재사용한다.
+    """
+    try:
+        await mcp.__aenter__()
+        logging.info("✅ MCP 세션 풀 연결 완료")
+        return True
+    except Exception as e:
+        logging.warning(f"⚠️ MCP 세션 풀 연결 실패 (요청마다 개별 연결 사용): {e}")
+        return False
+
+
+mcp_reconnect_lock = asyncio.Lock()
+mcp_session_generation = 0  # 재연결할 때마다 증가 (동시 재연결 중복 방지)
+
+
+async def reconnect_pooled_mcp_session(seen_generation: int):
+    """
+    끊긴 MCP 세션을 닫고 풀 세션을 다시 연결
+
+    MCP 서버 재시작/전송 끊김 후에는 세션 태스크가 종료되어 기존 세션을 재사용할 수 없으므로
+    강제 종료(중첩 카운터 초기화) 후 새로 연결한다.
+
+    Args:
+        seen_generation: 실패를 관찰한 시점의 mcp_session_generation
+            (그 사이 다른 요청이 이미 재연결했으면 건너뜀)
+    """
+    global mcp_session_generation
+    async with mcp_reconnect_lock:
+        if mcp_session_generation != seen_generation:
+            return
+        logging.warning("⚠️ MCP 세션 끊김 감지 → 재연결")
+        try:
+            await mcp.close()
+        except Exception as e:
+            logging.warning(f"⚠️ 끊긴 MCP 세션 종료 중 오류 (무시): {e}")
+        app.state.mcp_pooled = await open_pooled_mcp_session()
+        mcp_session_generation += 1
+
+
+def is_mcp_connection_error(error: Exception) -> bool:
+    """MCP 호출 실패가 연결 문제인지 (도구 실행 오류는 재연결/재시도 대상 아님)"""
+    if isinstance(error, ToolError):
+        return False
+    if isinstance(error, (httpx.TransportError, ConnectionError, anyio.ClosedResourceError, anyio.BrokenResourceError)):
+        return True
+    # 풀 세션의 백그라운드 태스크가 종료된 경우 (서버 재시작 등)
+    return getattr(app.state, "mcp_pooled", False) and not mcp.is_connected()
+
+
+def is_mcp_request_unsent(error: Exception) -> bool:
+    """
+    요청이 서버에 전달되지 않은 것이 확실한 연결 오류인지 (재시도해도 중복 실행이 없는 경우만)
+
+    ReadTimeout/연결 리셋처럼 요청을 보낸 뒤의 실패는 서버에서 이미 실행됐을 수 있으므로
+    create_ticket_from_single_email_tool 같은 비멱등 도구가 중복 실행되지 않도록 재시도하지 않는다.
+    """
+    # 연결 수립 실패 / 커넥션 풀 대기 초과 / 이미 닫힌 세션 스트림에 쓰기 시도
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout,
+                              ConnectionRefusedError, anyio.ClosedResourceError))
+
+
+async def call_mcp_tool(name: str, arguments: dict):
+    """
+    MCP 도구 호출 (풀 세션이 끊겼으면 재연결, 연결 오류로 실패하면 재연결)
+
+    재시도는 요청이 전달되지 않은 실패(is_mcp_request_unsent)에 한해 1회만 한다.
+    그 외 연결 오류는 세션만 재연결하고 오류를 그대로 올린다.
+
+    Args:
+        name: MCP 도구 이름
+        arguments: 도구 인자
+    """
+    generation = mcp_session_generation
+    if getattr(app.state, "mcp_pooled", False) and not mcp.is_connected():
+        await reconnect_pooled_mcp_session(generation)
+        generation = mcp_session_generation
+
+    try:
+        async with mcp:
+            return await mcp.call_tool(name, arguments)
+    except Exception as e:
+        if not is_mcp_connection_error(e):
+            raise
+        await reconnect_pooled_mcp_session(generation)
+        if not is_mcp_request_unsent(e):
+            logging.warning(f"⚠️ MCP 호출 중 연결 끊김, 중복 실행 방지를 위해 재시도하지 않음: tool={name}, error={e}")
+            raise
+        logging.warning(f"⚠️ MCP 요청 전송 실패, 세션 재연결 후 재시도: tool={name}, error={e}")
+        async with mcp:
+            return await mcp.call_tool(name, arguments)
+
+
+def build_ticket_prompts(original_text_parts: list) -> dict:
+    """티켓 제목/요약 프롬프트 생성"""
     first_message = original_text_parts[0]
-    middle_messages = original_text_parts[1:]
+    original_text = "\n".join([part.get('received_date', '') + " " + part.get('sender', '') + ": " + part.get('text', '') for part in original_text_parts])
 
     # 제목 만들기
     title_prompt = f"""
@@ -2039,53 +2223,126 @@ async def make_ticket_data(original_text_parts: list):
     {first_message.get('text', '')}
     """
 
-    # LLM 호출
-    async with mcp:
+    # 요약 생성
+    summary_prompt = f"""
+    다음은 고객 문의와 내부 댓글 대화 내용이야. 이 대화는 구어체로 작성되어 있어.\n
+    이 내용을 아래 형식에 맞춰 구조화하고 요약해주세요\n
+    1.핵심 문제 요약:\n
+    2.문제의 상세 원인:\n
+    3.논의된 해결 방안들:\n
+    4.최종적으로 결정된 사항:\n
+    5.각 인물별 역할 정리:\n
+        
+    고객 문의:  
+    {first_message.get('text', '')}
 
-        ticket_title_result = await mcp.call_tool("simple_llm_call", {"prompt": title_prompt})
-        ticket_title = ticket_title_result.content[0].text
+    대화 내용:
+    {original_text}
+    """
 
-        
-        original_text = "\n".join([part.get('received_date', '') + " " + part.get('sender', '') + ": " + part.get('text', '') for part in original_text_parts])
-
-        # 요약 생성
-        summary_prompt = f"""
-        다음은 고객 문의와 내부 댓글 대화 내용이야. 이 대화는 구어체로 작성되어 있어.\n
-        이 내용을 아래 형식에 맞춰 구조화하고 요약해주세요\n
-        1.핵심 문제 요약:\n
-        2.문제의 상세 원인:\n
-        3.논의된 해결 방안들:\n
-        4.최종적으로 결정된 사항:\n
-        5.각 인물별 역할 정리:\n
-            
-        고객 문의:  
-        {first_message.get('text', '')}
-
-        대화 내용:
-        {original_text}
-        """
-        summary_text = await mcp.call_tool("simple_llm_call", {"prompt": summary_prompt}) # "요약 내용"
-
-        ticket_body = f"""
-        ### 💬 원문
-        {original_text}
-
-        ---
-
-        ### 📝 요약
-        {summary_text}
-        """
-
-        # sender 정보 추출
-        email_data = {
-            "id": first_message.get('client_msg_id', ''), # 원본 메시지 ID
-            "subject": ticket_title,                       # 2단계에서 만든 제목
-            "sender": first_message.get('user', ''),       # 문의를 시작한 사람
-            "body": ticket_body,                           # 3단계에서 만든 본문
-            "received_date": first_message.get('ts', '')   # 문의 시작 시간
-        }
-        
-        return email_data
+    # 제목 + 요약 단일 호출 (JSON 응답)
+    combined_prompt = f"""
+    다음은 고객 문의와 내부 댓글 대화 내용이야. 이 대화는 구어체로 작성되어 있어.
+    아래 두 가지를 만들어 JSON으로만 응답해줘. 다른 텍스트는 포함하지 마.
+
+    - title: 고객 문의를 바탕으로 Jira 티켓 제목으로 사용할 만한 핵심 내용 한 줄 요약
+    - summary: 대화를 아래 형식에 맞춰 구조화한 요약
+        1.핵심 문제 요약:
+        2.문제의 상세 원인:
+        3.논의된 해결 방안들:
+        4.최종적으로 결정된 사항:
+        5.각 인물별 역할 정리:
+
+    응답 형식:
+    {{"title": "...", "summary": "..."}}
+
+    고객 문의:
+    {first_message.get('text', '')}
+
+    대화 내용:
+    {original_text}
+    """
+
+    return {
+        "original_text": original_text,
+        "title_prompt": title_prompt,
+        "summary_prompt": summary_prompt,
+        "combined_prompt": combined_prompt
+    }
+
+
+def parse_combined_ticket_response(content: str) -> Optional[dict]:
+    """단일 호출 응답에서 제목/요약 JSON 추출 (실패 시 None)"""
+    # JSON 추출 (```json ``` 제거)
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+
+    try:
+        result = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(result, dict) or not result.get("title") or not result.get("summary"):
+        return None
+    return {"title": str(result["title"]).strip(), "summary": str(result["summary"]).strip()}
+
+
+async def generate_ticket_title_and_summary(prompts: dict, mode: str = TICKET_PROMPT_MODE) -> tuple:
+    """
+    티켓 제목과 요약을 생성 (서버 수명 동안 유지되는 MCP 세션 재사용)
+
+    Args:
+        prompts: build_ticket_prompts() 결과
+        mode: 'parallel' (두 호출 동시 실행) 또는 'combined' (단일 호출, 파싱 실패 시 parallel로 폴백)
+
+    Returns:
+        (ticket_title, summary_text)
+    """
+    if mode == "combined":
+        combined_result = await call_mcp_tool("simple_llm_call", {"prompt": prompts["combined_prompt"]})
+        parsed = parse_combined_ticket_response(combined_result.content[0].text)
+        if parsed:
+            return parsed["title"], parsed["summary"]
+        logging.warning("⚠️ 제목/요약 JSON 파싱 실패 → 개별 호출로 폴백")
+
+    ticket_title_result, summary_result = await asyncio.gather(
+        call_mcp_tool("simple_llm_call", {"prompt": prompts["title_prompt"]}),
+        call_mcp_tool("simple_llm_call", {"prompt": prompts["summary_prompt"]})
+    )
+    return ticket_title_result.content[0].text, summary_result.content[0].text
+
+
+async def make_ticket_data(original_text_parts: list):
+    # 1. 문의 내용 (제목 재료)
+    first_message = original_text_parts[0]
+
+    # 2~3. 제목/요약 LLM 호출 (동시 실행)
+    prompts = build_ticket_prompts(original_text_parts)
+    ticket_title, summary_text = await generate_ticket_title_and_summary(prompts)
+    original_text = prompts["original_text"]
+
+    ticket_body = f"""
+    ### 💬 원문
+    {original_text}
+
+    ---
+
+    ### 📝 요약
+    {summary_text}
+    """
+
+    # sender 정보 추출
+    email_data = {
+        "id": first_message.get('client_msg_id', ''), # 원본 메시지 ID
+        "subject": ticket_title,                       # 2단계에서 만든 제목
+        "sender": first_message.get('user', ''),       # 문의를 시작한 사람
+        "body": ticket_body,                           # 3단계에서 만든 본문
+        "received_date": first_message.get('ts', '')   # 문의 시작 시간
+    }
+
+    return email_data
 
 
 @app.post("/slack/events")
@@ -2105,91 +2362,97 @@ async def handle_slack_events(request: Request):
     # URL 검증을 위한 초기 요청 처리
     if "challenge" in event_data:
         return {"challenge": event_data["challenge"]}
-        
-    # --- 3. app_mention 이벤트 처리 ---
+
+    # --- 3. app_mention 이벤트는 큐에 넣고 즉시 ack ---
     if event_data.get("event", {}).get("type") == "app_mention":
         event = event_data["event"]
+        event_id = event_data.get("event_id") or f"{event.get('channel')}:{event.get('ts')}"
 
-        # 이벤트를 발생시킨 사용자 ID 가져오기
-        slack_user_id = event.get("user")
-        channel_id = event.get("channel")
-        thread_ts = event.get("thread_ts")
-        message_ts = event.get("ts")
-        target_ts = thread_ts if thread_ts else message_ts
+        enqueued = event_job_queue.enqueue(f"slack:{event_id}", "slack", {"event": event})
+        if enqueued:
+            event_worker_pool.notify()
+            logging.info(f"📥 슬랙 이벤트 큐 등록: event_id={event_id}")
+        else:
+            retry_num = request.headers.get("X-Slack-Retry-Num")
+            logging.info(f"⏭️ 중복 슬랙 이벤트 무시: event_id={event_id}, retry={retry_num}")
 
-        logging.info(f"🔍 슬랙 이벤트 발생: user={slack_user_id}, channel={channel_id}")
+    return {"status": "ok"}
 
-        # Integration 테이블에서 slack_user_id로 시스템 user_id 조회
-        system_user_id = db_manager.get_user_id_by_integration(source='slack', type='user_id', value=slack_user_id)
 
-        if not system_user_id:
-            # 권한이 없는 사용자 → 에러 메시지 전송
-            logging.warning(f"⚠️ 권한 없는 사용자: slack_user_id={slack_user_id}")
-            try:
-                client.chat_postMessage(
-                    channel=channel_id,
-                    thread_ts=target_ts,
-                    text="❌ 권한이 없는 사용자입니다.\n\n티켓을 생성하려면 먼저 웹 페이지에서 슬랙 계정을 연동해주세요.\n연동 페이지: http://localhost:8501"
-                )
-            except Exception as e:
-                logging.error(f"슬랙 메시지 전송 실패: {e}")
+async def process_slack_mention_job(payload: dict):
+    """큐 워커: 슬랙 app_mention 이벤트로 티켓 생성"""
+    event = payload["event"]
 
-            return {"status": "ok"}
+    # 이벤트를 발생시킨 사용자 ID 가져오기
+    slack_user_id = event.get("user")
+    channel_id = event.get("channel")
+    thread_ts = event.get("thread_ts")
+    message_ts = event.get("ts")
+    target_ts = thread_ts if thread_ts else message_ts
 
-        logging.info(f"✅ 연동된 사용자 확인: system_user_id={system_user_id}")
+    logging.info(f"🔍 슬랙 이벤트 처리: user={slack_user_id}, channel={channel_id}")
 
-        # 권한이 있는 사용자 → 티켓 생성 진행
-        try:
-            result = client.conversations_replies(channel=channel_id, ts=target_ts)
-            messages = result['messages']
-
-            # 원문 정리
-            original_text_parts = []
-            for msg in messages[1:-1]:
-                sender = msg.get('user', 'unknown')
-                sender_info_raw = client.users_info(user=sender)
-                sender_info = sender_info_raw.get('user', {})
-                logging.info(f"Sender info: {sender_info}")
-                if not sender_info:
-                    continue
-                if sender_info.get('is_bot') == True or sender_info.get('is_app_user') == True:
-                    continue
-                original_text_parts.append({
-                    "sender": sender_info.get('profile', {}).get('real_name', 'unknown'),
-                    "text": msg.get('text', ''),
-                    "received_date": msg.get('ts', '')
-                })
-
-            if original_text_parts:
-                email_data = await make_ticket_data(original_text_parts)
-                email_data['force_create'] = True
-
-                async with mcp:
-                    await mcp.call_tool("create_ticket_from_single_email_tool", {"email_data": email_data})
-
-                # 티켓 생성 완료 메시지 전송
-                try:
-                    client.chat_postMessage(
-                        channel=channel_id,
-                        thread_ts=target_ts,
-                        text="✅ 티켓이 생성되었습니다."
-                    )
-                except Exception as e:
-                    logging.error(f"슬랙 메시지 전송 실패: {e}")
+    # Integration 테이블에서 slack_user_id로 시스템 user_id 조회
+    system_user_id = db_manager.get_user_id_by_integration(source='slack', type='user_id', value=slack_user_id)
 
-        except Exception as e:
-            logging.error(f"티켓 생성 중 오류 발생: {e}")
-            # 오류 메시지 전송
-            try:
-                client.chat_postMessage(
-                    channel=channel_id,
-                    thread_ts=target_ts,
-                    text=f"❌ 티켓 생성 중 오류가 발생했습니다: {str(e)}"
-                )
-            except Exception as msg_error:
-                logging.error(f"슬랙 메시지 전송 실패: {msg_error}")
-            
-    return {"status": "ok"}
+    if not system_user_id:
+        # 권한이 없는 사용자 → 에러 메시지 전송
+        logging.warning(f"⚠️ 권한 없는 사용자: slack_user_id={slack_user_id}")
+        await post_slack_message(
+            channel_id,
+            target_ts,
+            "❌ 권한이 없는 사용자입니다.\n\n티켓을 생성하려면 먼저 웹 페이지에서 슬랙 계정을 연동해주세요.\n연동 페이지: http://localhost:8501"
+        )
+        return
+
+    logging.info(f"✅ 연동된 사용자 확인: system_user_id={system_user_id}")
+
+    # 권한이 있는 사용자 → 티켓 생성 진행
+    try:
+        result = await asyncio.to_thread(client.conversations_replies, channel=channel_id, ts=target_ts)
+        messages = result['messages']
+        thread_messages = messages[1:-1]
+
+        # 발신자 정보는 캐시 우선 + 동시 조회
+        sender_infos = await fetch_slack_user_infos([msg.get('user', 'unknown') for msg in thread_messages])
+
+        # 원문 정리
+        original_text_parts = []
+        for msg in thread_messages:
+            sender_info = sender_infos.get(msg.get('user', 'unknown'))
+            if not sender_info:
+                continue
+            if sender_info.get('is_bot') == True or sender_info.get('is_app_user') == True:
+                continue
+            original_text_parts.append({
+                "sender": sender_info.get('profile', {}).get('real_name', 'unknown'),
+                "text": msg.get('text', ''),
+                "received_date": msg.get('ts', '')
+            })
+
+        if original_text_parts:
+            email_data = await make_ticket_data(original_text_parts)
+            email_data['force_create'] = True
+
+            await call_mcp_tool("create_ticket_from_single_email_tool", {"email_data": email_data})
+
+            # 티켓 생성 완료 메시지 전송
+            await post_slack_message(channel_id, target_ts, "✅ 티켓이 생성되었습니다.")
+
+    except Exception as e:
+        # 큐가 재시도/실패 처리하도록 다시 발생 (최종 실패 시 notify_slack_mention_failure)
+        logging.error(f"티켓 생성 중 오류 발생: {e}")
+        raise
+
+
+async def notify_slack_mention_failure(payload: dict, error: str):
+    """큐 워커: 재시도까지 모두 실패한 슬랙 이벤트에 오류 메시지 전송"""
+    event = payload["event"]
+    target_ts = event.get("thread_ts") or event.get("ts")
+    await post_slack_message(event.get("channel"), target_ts, f"❌ 티켓 생성 중 오류가 발생했습니다: {error}")
+
+
+event_worker_pool.register("slack", process_slack_mention_job, on_failure=notify_slack_mention_failure)
 
 @app.post("/kakao/events")
 async def handle_kakao_events(request: Request):
@@ -2262,26 +2525,76 @@ async def handle_kakao_events(request: Request):
     # action.params 존재 여부 확인
     has_params = bool(event_data.get("action", {}).get("params"))
 
-    # 사용자 이메일을 sender로 사용
-    parsed_data, additional_text = parse_kakao_utterance(utterance, user.email, has_params)
-
-    email_data = await make_ticket_data(parsed_data)
-    email_data['force_create'] = True
-
-    async with mcp:
-        await mcp.call_tool("create_ticket_from_single_email_tool", {"email_data": email_data})
+    # 카카오 스킬 요청에는 이벤트 ID가 없으므로 사용자+발화 내용 해시로 중복 제거
+    # (마지막 접수 후 KAKAO_DEDUP_WINDOW 안에 같은 발화가 오면 재전송으로 간주 - 슬라이딩 윈도우)
+    dedup_key = "kakao:" + hashlib.sha256(f"{bot_user_key}:{utterance}".encode('utf-8')).hexdigest()
+    enqueued = event_job_queue.enqueue(f"kakao:{uuid.uuid4().hex}", "kakao", {
+        "utterance": utterance,
+        "sender": user.email,
+        "has_params": has_params,
+        "bot_user_key": bot_user_key
+    }, dedup_key=dedup_key, dedup_window=KAKAO_DEDUP_WINDOW)
+    if enqueued:
+        event_worker_pool.notify()
+        message = "✅ 티켓 생성 요청이 접수되었습니다."
+    else:
+        logging.info(f"⏭️ 중복 카카오 이벤트 무시: dedup_key={dedup_key}")
+        message = "ℹ️ 이미 접수된 요청입니다."
 
     return {
         "version": "2.0",
         "template": {
             "outputs": [{
                 "simpleText": {
-                    "text": "✅ 티켓이 생성되었습니다."
+                    "text": message
                 }
             }]
         }
     }
 
+
+async def process_kakao_utterance_job(payload: dict):
+    """큐 워커: 카카오 발화로 티켓 생성"""
+    # 사용자 이메일을 sender로 사용
+    parsed_data, additional_text = parse_kakao_utterance(
+        payload["utterance"], payload["sender"], payload["has_params"]
+    )
+
+    email_data = await make_ticket_data(parsed_data)
+    email_data['force_create'] = True
+
+    await call_mcp_tool("create_ticket_from_single_email_tool", {"email_data": email_data})
+
+
+async def notify_kakao_utterance_failure(payload: dict, error: str):
+    """
+    큐 워커: 재시도까지 모두 실패한 카카오 요청을 사용자에게 알림
+
+    스킬 응답은 이미 "접수됨"으로 나갔으므로 카카오 이벤트 API로 봇 사용자에게 실패 이벤트를 보낸다.
+    (KAKAO_BOT_ID와 REST API 키(KAKAO_CLIENT_ID)가 없으면 로그만 남김)
+    """
+    bot_user_key = payload.get("bot_user_key")
+    logging.error(f"❌ 카카오 티켓 생성 최종 실패: sender={payload.get('sender')}, error={error}")
+    if not (KAKAO_BOT_ID and KAKAO_CLIENT_ID and bot_user_key):
+        return
+
+    try:
+        async with httpx.AsyncClient(timeout=10.0) as kakao_client:
+            response = await kakao_client.post(
+                f"https://bot-api.kakao.com/v2/bots/{KAKAO_BOT_ID}/talk",
+                headers={"Authorization": f"KakaoAK {KAKAO_CLIENT_ID}"},
+                json={
+                    "event": {"name": KAKAO_FAILURE_EVENT, "data": {"error": error}},
+                    "user": [{"type": "botUserKey", "id": bot_user_key}]
+                }
+            )
+            response.raise_for_status()
+    except Exception as e:
+        logging.error(f"카카오 실패 알림 전송 실패: {e}")
+
+
+event_worker_pool.register("kakao", process_kakao_utterance_job, on_failure=notify_kakao_utterance_failure)
+
 def parse_kakao_utterance(utterance: str, user_id: str, has_date_in_utterance: bool = False):
     utterance_type = classify_kakao_utterance(utterance)
     parsed_data, additional_text = None, None
@@ -4,12 +4,16 @@
 BM25 키워드 검색과 벡터 검색을 결합한 EnsembleRetriever 구현
 """
 
+import time
 import logging
-from typing import List, Dict, Any, Optional
-from langchain_community.retrievers import BM25Retriever
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Optional, Callable
 from langchain.retrievers import EnsembleRetriever
 from langchain_core.documents import Document
-from vector_db_models import VectorDBManager
+from vector_db_models import VectorDBManager, add_vector_db_write_listener, remove_vector_db_write_listener
+from incremental_bm25_index import IncrementalBM25Index
 from text_preprocessor import preprocess_for_embedding
 from keyword_extractor import KeywordExtractor
 import os
@@ -19,29 +23,470 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+BM25_SNAPSHOT_FILENAME = "hybrid_bm25_snapshot.json"
+BM25_SOURCE_TYPES = ("file_chunk", "mail", "structured_chunk")
+
+# 소스별 벡터 검색 마감 시간 (초) - 늦은 소스는 건너뛰고 나머지 결과만 사용
+SOURCE_SEARCH_TIMEOUT = float(os.getenv("HYBRID_SOURCE_TIMEOUT", "5.0"))
+
+# 공용 풀 크기 - 마감 시간을 넘겨 계속 실행 중인 작업(straggler)이 남아 있어도
+# 다음 요청의 소스 검색이 큐에서 기다리지 않도록 소스 수보다 넉넉하게 잡는다
+SOURCE_SEARCH_WORKERS = int(os.getenv("HYBRID_SOURCE_WORKERS", "16"))
+
+_source_executor: Optional[ThreadPoolExecutor] = None
+_source_executor_lock = threading.Lock()
+_straggler_count = 0
+_straggler_lock = threading.Lock()
+
+
+def _get_source_executor() -> ThreadPoolExecutor:
+    """소스별 검색용 공용 스레드 풀"""
+    global _source_executor
+    if _source_executor is None:
+        with _source_executor_lock:
+            if _source_executor is None:
+                _source_executor = ThreadPoolExecutor(
+                    max_workers=SOURCE_SEARCH_WORKERS,
+                    thread_name_prefix="hybrid-source"
+                )
+    return _source_executor
+
+
+def _straggler_done(_future):
+    global _straggler_count
+    with _straggler_lock:
+        _straggler_count -= 1
+
+
+def _abandon_future(source: str, future) -> None:
+    """
+    마감 시간을 넘긴 작업 정리
+
+    아직 시작하지 않은 작업은 취소하여 풀 슬롯을 돌려주고, 이미 실행 중인 작업은
+    스레드를 중단할 수 없으므로 끝날 때까지 straggler로 집계한다.
+    """
+    global _straggler_count
+    if future.cancel():
+        logger.warning(f"⏱️ {source} 검색 마감 시간 초과 (시작 전 취소), 부분 결과로 진행")
+        return
+
+    with _straggler_lock:
+        _straggler_count += 1
+        stragglers = _straggler_count
+    future.add_done_callback(_straggler_done)
+    logger.warning(f"⏱️ {source} 검색 마감 시간 초과, 부분 결과로 진행 (실행 중인 지연 작업 {stragglers}개)")
+    if stragglers >= SOURCE_SEARCH_WORKERS // 2:
+        logger.warning(f"⚠️ 지연 작업이 검색 풀({SOURCE_SEARCH_WORKERS})의 절반 이상을 점유 중 - "
+                       f"HYBRID_SOURCE_WORKERS 또는 HYBRID_SOURCE_TIMEOUT 조정 필요")
+
+
+def get_straggler_count() -> int:
+    """마감 시간을 넘긴 뒤에도 아직 실행 중인 소스 검색 수"""
+    with _straggler_lock:
+        return _straggler_count
+
+
+def search_sources_concurrently(searches: Dict[str, Callable[[], List[Any]]],
+                                timeouts: Optional[Dict[str, float]] = None) -> Dict[str, List[Any]]:
+    """
+    소스별 검색을 동시에 실행하고 마감 시간 안에 끝난 결과만 반환
+
+    Args:
+        searches: {소스 이름: 검색 함수}
+        timeouts: {소스 이름: 마감 시간(초)} (없는 소스는 SOURCE_SEARCH_TIMEOUT)
+
+    Returns:
+        {소스 이름: 결과 목록} (시간 초과/실패한 소스는 빈 목록)
+    """
+    timeouts = timeouts or {}
+    executor = _get_source_executor()
+    started = time.monotonic()
+    futures = {source: executor.submit(search) for source, search in searches.items()}
+
+    results = {}
+    for source, future in futures.items():
+        deadline = started + timeouts.get(source, SOURCE_SEARCH_TIMEOUT)
+        try:
+            results[source] = future.result(timeout=max(0.0, deadline - time.monotonic())) or []
+        except FutureTimeoutError:
+            _abandon_future(source, future)
+            results[source] = []
+        except Exception as e:
+            logger.error(f"{source} 검색 실패: {e}")
+            results[source] = []
+
+    logger.info(f"✅ 소스별 병렬 검색 완료 ({time.monotonic() - started:.2f}초): "
+                + ", ".join(f"{source} {len(items)}개" for source, items in results.items()))
+    return results
+
+
+def _file_results_to_documents(file_results: List[Any]) -> List[Document]:
+    documents = []
+    for result in file_results:
+        if isinstance(result, dict):
+            content = result.get('content', '')
+            metadata = result.get('metadata', {})
+            metadata.update({
+                'source': 'file_chunk',
+                'similarity_score': result.get('similarity_score', 0.0)
+            })
+            if result.get('score_ceiling'):
+                # RRF 점수는 코사인 유사도와 범위가 달라 정규화 상한을 함께 전달
+                metadata['score_ceiling'] = result['score_ceiling']
+        else:
+            content = getattr(result, 'text_chunk', '')
+            metadata = {
+                'source': 'file_chunk',
+                'file_name': getattr(result, 'file_name', ''),
+                'similarity_score': getattr(result, 'similarity_score', 0.0)
+            }
+
+        if content:
+            documents.append(Document(page_content=content, metadata=metadata))
+    return documents
+
+
+def _mail_results_to_documents(mail_results: List[Any]) -> List[Document]:
+    documents = []
+    for result in mail_results:
+        if isinstance(result, dict):
+            content = result.get('refined_content', '')
+            metadata = result.get('metadata', {})
+            metadata.update({
+                'source': 'mail',
+                'similarity_score': result.get('similarity_score', 0.0)
+            })
+        else:
+            content = getattr(result, 'refined_content', '')
+            metadata = {
+                'source': 'mail',
+                'subject': getattr(result, 'subject', ''),
+                'sender': getattr(result, 'sender', ''),
+                'similarity_score': getattr(result, 'similarity_score', 0.0)
+            }
+
+        if content:
+            documents.append(Document(page_content=content, metadata=metadata))
+    return documents
+
+
+def _structured_results_to_documents(structured_results: List[Any]) -> List[Document]:
+    documents = []
+    for result in structured_results:
+        if isinstance(result, dict):
+            content = result.get('content', '')
+            metadata = result.get('metadata', {})
+            metadata.update({
+                'source': 'structured_chunk',
+                'similarity_score': result.get('similarity_score', 0.0)
+            })
+        else:
+            content = getattr(result, 'content', '')
+            metadata = {
+                'source': 'structured_chunk',
+                'ticket_id': getattr(result, 'ticket_id', ''),
+                'chunk_type': getattr(result, 'chunk_type', ''),
+                'similarity_score': getattr(result, 'similarity_score', 0.0)
+            }
+
+        if content:
+            documents.append(Document(page_content=content, metadata=metadata))
+    return documents
+
+
+SOURCE_CONVERTERS = {
+    'file_chunk': _file_results_to_documents,
+    'mail': _mail_results_to_documents,
+    'structured_chunk': _structured_results_to_documents,
+}
+
+
+def merge_normalized_documents(documents_by_source: Dict[str, List[Document]]) -> List[Document]:
+    """
+    소스별 similarity_score를 고정 범위(0~1)로 정규화하여 normalized_score에 기록하고
+    소스 구분 없이 정규화 점수 순으로 통합
+
+    코사인 유사도는 원점수를 0~1로 clamp하고, RRF 점수처럼 범위가 다른 점수는
+    metadata['score_ceiling'](이론상 최대 점수)으로 나눈 뒤 clamp한다.
+    소스 내 min-max 정규화와 달리 약한 결과 하나만 낸 소스가 1.0으로 부풀려지지 않는다.
+    """
+    merged = []
+    for documents in documents_by_source.values():
+        for doc in documents:
+            score = float(doc.metadata.get('similarity_score') or 0.0)
+            ceiling = float(doc.metadata.get('score_ceiling') or 1.0)
+            doc.metadata['normalized_score'] = min(1.0, max(0.0, score / ceiling))
+            merged.append(doc)
+
+    merged.sort(key=lambda doc: doc.metadata['normalized_score'], reverse=True)
+    return merged
+
+def _run_verifier(retriever_ref, stop: threading.Event, interval: float):
+    """
+    verify_index 백그라운드 루프
+
+    retriever를 약한 참조로만 잡아 close() 없이 버려진 retriever도 GC될 수 있게 하고,
+    GC되거나 close()로 stop이 설정되면 종료한다.
+    """
+    while not stop.wait(interval):
+        retriever = retriever_ref()
+        if retriever is None:
+            return
+        try:
+            retriever.verify_index()
+        except Exception as e:
+            logger.warning(f"⚠️ BM25 인덱스 확인 실패: {e}")
+        del retriever
+
+
 class HybridSearchRetriever:
     """
     하이브리드 검색 시스템
     BM25 키워드 검색 + 벡터 검색을 결합한 EnsembleRetriever
+
+    BM25 쪽은 IncrementalBM25Index를 사용한다.
+    - Vector DB 쓰기 이벤트를 구독하여 추가/삭제를 즉시 반영
+    - 디스크 스냅샷의 워터마크(소스별 문서 수 + 쓰기 순번)가 현재와 같으면 BM25 재구성 없이 시작
+    - 이벤트의 쓰기 순번이 건너뛰면(다른 프로세스의 쓰기) 해당 소스를 재구성 대상으로 표시하고,
+      백그라운드 스레드가 주기적으로 verify_index를 실행하여 검색 경로 밖에서 재구성
     """
     
-    def __init__(self, vector_db_manager: VectorDBManager):
+    def __init__(self, vector_db_manager: VectorDBManager, snapshot_path: Optional[str] = None):
+        """
+        Args:
+            vector_db_manager: VectorDBManager 인스턴스
+            snapshot_path: BM25 스냅샷 경로 (기본: HYBRID_BM25_SNAPSHOT_PATH 환경변수,
+                없으면 <vector_db 경로>/hybrid_bm25_snapshot.json)
+        """
         self.vector_db_manager = vector_db_manager
         self.bm25_retriever = None
         self.ensemble_retriever = None
         self.documents = []
         self.keyword_extractor = KeywordExtractor()  # 키워드 추출기 초기화
+
+        # 증분 BM25 인덱스 + 스냅샷 설정
+        self.bm25_index = IncrementalBM25Index()
+        self.snapshot_path = snapshot_path or os.getenv(
+            "HYBRID_BM25_SNAPSHOT_PATH",
+            os.path.join(getattr(vector_db_manager, "db_path", "./vector_db"), BM25_SNAPSHOT_FILENAME)
+        )
+        self.snapshot_every = int(os.getenv("HYBRID_BM25_SNAPSHOT_EVERY", "200"))
+        self.verify_interval = float(os.getenv("HYBRID_BM25_VERIFY_INTERVAL", "300"))
+        self._pending_changes = 0
+        self._snapshot_lock = threading.Lock()
+        self._sequences: Dict[str, int] = {}  # 인덱스에 반영된 소스별 쓰기 순번
+        self._stale_sources = set()  # 순번이 건너뛰어 재구성이 필요한 소스
+        self._verify_stop = threading.Event()
         
-        # 문서 수집 및 인덱스 생성
-        self._collect_documents()
+        # 문서 수집 및 인덱스 생성 (스냅샷 우선)
+        self._init_bm25_index()
         self._setup_retrievers()
+        add_vector_db_write_listener(self._on_vector_db_write)
+        self._start_verifier()
         
         logger.info("✅ HybridSearchRetriever 초기화 완료")
+
+    def _current_watermark(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """컬렉션의 현재 워터마크 (조회 실패 시 None)"""
+        try:
+            return self.vector_db_manager.get_write_watermark()
+        except Exception as e:
+            logger.warning(f"⚠️ 컬렉션 워터마크 조회 실패: {e}")
+            return None
+
+    def _init_bm25_index(self):
+        """스냅샷 워터마크가 현재와 같으면 로드, 아니면 전체 문서를 수집하여 인덱스 생성 후 스냅샷 저장"""
+        watermark = self._current_watermark()
+        if watermark is not None:
+            self._sequences = {source_type: watermark[source_type]['seq'] for source_type in BM25_SOURCE_TYPES}
+        extra = self.bm25_index.load_snapshot(self.snapshot_path)
+        if extra is not None and watermark is not None and extra.get('watermark') == watermark:
+            logger.info(f"⚡ BM25 스냅샷으로 빠른 시작: {len(self.bm25_index)}개 문서")
+            return
+
+        if extra is not None:
+            logger.info("🔄 BM25 스냅샷 워터마크가 컬렉션과 달라 전체 재구성")
+        self._collect_documents()
+        self.bm25_index.clear()
+        self.bm25_index.add_documents(
+            (self._document_key(doc.metadata), doc.page_content, doc.metadata) for doc in self.documents
+        )
+        self.documents = []  # 본문은 인덱스가 보관하므로 수집 목록은 해제
+        self.save_snapshot()
+
+    def _start_verifier(self):
+        """verify_index를 주기적으로 실행하는 백그라운드 스레드 시작 (검색 경로와 분리)"""
+        if self.verify_interval <= 0:
+            return
+        thread = threading.Thread(
+            target=_run_verifier, args=(weakref.ref(self), self._verify_stop, self.verify_interval),
+            name="hybrid-bm25-verify", daemon=True
+        )
+        thread.start()
+
+    def verify_index(self) -> List[str]:
+        """
+        쓰기 순번이 인덱스와 다르거나 재구성 대상으로 표시된 소스의 BM25 인덱스를 재구성
+
+        같은 프로세스의 쓰기는 이벤트로 이미 반영되고 순번도 함께 따라간다.
+        다른 프로세스의 쓰기는 순번 차이로만 알 수 있으므로 해당 소스만 다시 읽는다.
+        순번 조회만 하므로 변경이 없으면 비용이 거의 없다. 검색 경로에서는 호출하지 않는다.
+
+        Returns:
+            재구성한 소스 타입 목록
+        """
+        try:
+            sequences = self.vector_db_manager.get_write_sequences()
+        except Exception as e:
+            logger.warning(f"⚠️ 쓰기 순번 조회 실패: {e}")
+            return []
+
+        with self._snapshot_lock:
+            changed = [source_type for source_type in BM25_SOURCE_TYPES
+                       if source_type in self._stale_sources
+                       or sequences.get(source_type, 0) != self._sequences.get(source_type)]
+            self._stale_sources.difference_update(changed)
+
+        loaders = {
+            'file_chunk': self._get_file_chunks,
+            'mail': self._get_mail_documents,
+            'structured_chunk': self._get_structured_documents,
+        }
+        for source_type in changed:
+            documents = loaders[source_type]()
+            self.bm25_index.clear(f"{source_type}:")
+            self.bm25_index.add_documents(
+                (self._document_key(doc.metadata), doc.page_content, doc.metadata) for doc in documents
+            )
+            # 읽기 전에 조회한 순번으로 맞춤 - 읽는 동안 들어온 쓰기는 다음 확인에서 다시 잡힌다
+            with self._snapshot_lock:
+                self._sequences[source_type] = sequences.get(source_type, 0)
+            logger.info(f"🔄 BM25 {source_type} 인덱스 재구성 (쓰기 순번 불일치): {len(documents)}개 문서")
+
+        if changed:
+            self.save_snapshot()
+        return changed
+
+    @staticmethod
+    def _document_key(metadata: Dict[str, Any]) -> str:
+        """BM25 인덱스 문서 키 (소스 타입 + 원본 ID)"""
+        source_type = metadata.get('source_type', '')
+        doc_id = metadata.get('message_id') if source_type == 'mail' else metadata.get('chunk_id')
+        return f"{source_type}:{doc_id}"
+
+    def _build_document(self, source_type: str, record: Dict[str, Any]) -> Optional[Document]:
+        """get_all_* 레코드를 BM25용 Document로 변환 (본문이 비어 있으면 None)"""
+        content = record.get('content', '')
+        if not content or len(content.strip()) == 0:
+            return None
+
+        metadata = dict(record.get('metadata') or {})
+        metadata['source_type'] = source_type
+        if source_type == 'mail':
+            metadata.update({
+                'message_id': record.get('message_id', ''),
+                'subject': record.get('subject', ''),
+                'sender': record.get('sender', '')
+            })
+        elif source_type == 'structured_chunk':
+            metadata.update({
+                'chunk_id': record.get('chunk_id', ''),
+                'ticket_id': record.get('ticket_id', ''),
+                'chunk_type': record.get('chunk_type', '')
+            })
+        else:
+            metadata.update({
+                'chunk_id': record.get('chunk_id', ''),
+                'file_name': record.get('file_name', '')
+            })
+        return Document(page_content=content, metadata=metadata)
+
+    def _on_vector_db_write(self, event: Dict[str, Any]):
+        """Vector DB 쓰기 이벤트를 BM25 인덱스에 증분 반영"""
+        op = event.get('op')
+        source_type = event.get('source_type')
+
+        if op == 'clear':
+            removed = self.bm25_index.clear(f"{source_type}:" if source_type else None)
+            changes = max(removed, 1)
+        elif op == 'delete':
+            changes = self.bm25_index.delete_documents(f"{source_type}:{doc_id}" for doc_id in event['ids'])
+        elif op == 'upsert' and source_type in BM25_SOURCE_TYPES:
+            id_field = 'message_id' if source_type == 'mail' else 'chunk_id'
+            documents = []
+            stale_keys = []
+            for doc_id, content, metadata in zip(event['ids'], event['documents'], event['metadatas']):
+                metadata = metadata or {}
+                record = {
+                    id_field: metadata.get(id_field, doc_id),
+                    'content': content,
+                    'metadata': metadata,
+                    'file_name': metadata.get('file_name', ''),
+                    'subject': metadata.get('subject', ''),
+                    'sender': metadata.get('sender', ''),
+                    'ticket_id': metadata.get('ticket_id', ''),
+                    'chunk_type': metadata.get('chunk_type', '')
+                }
+                document = self._build_document(source_type, record)
+                if document is None:
+                    stale_keys.append(f"{source_type}:{record[id_field]}")
+                else:
+                    documents.append((self._document_key(document.metadata), document.page_content, document.metadata))
+            changes = self.bm25_index.add_documents(documents) + self.bm25_index.delete_documents(stale_keys)
+        else:
+            return
+
+        logger.debug(f"🔄 BM25 증분 반영: {op} {source_type} ({changes}건)")
+        with self._snapshot_lock:
+            # 순번이 바로 다음이면 따라가고, 건너뛰면 그 사이 다른 프로세스의 쓰기가 있었으므로 재구성 대상
+            for written, sequence in (event.get('sequences') or {}).items():
+                if written not in BM25_SOURCE_TYPES:
+                    continue
+                if sequence == self._sequences.get(written, 0) + 1:
+                    self._sequences[written] = sequence
+                else:
+                    self._stale_sources.add(written)
+            self._pending_changes += changes
+            should_snapshot = self.snapshot_every > 0 and self._pending_changes >= self.snapshot_every
+        if should_snapshot:
+            self.save_snapshot()
+
+    def save_snapshot(self):
+        """
+        BM25 인덱스 스냅샷 저장
+
+        인덱스에 반영된 쓰기 순번과 현재 문서 수를 워터마크로 함께 기록하여 다음 시작 시 비교한다.
+        재구성 대상 소스는 순번을 -1로 기록하여 다음 시작 시 반드시 재구성되도록 한다.
+        """
+        try:
+            watermark = self._current_watermark()
+            if watermark is None:
+                return
+            with self._snapshot_lock:
+                self._pending_changes = 0
+                watermark = {
+                    source_type: {
+                        'count': watermark[source_type]['count'],
+                        'seq': -1 if source_type in self._stale_sources else self._sequences.get(source_type, -1)
+                    }
+                    for source_type in BM25_SOURCE_TYPES
+                }
+            self.bm25_index.save_snapshot(self.snapshot_path, extra={'watermark': watermark})
+        except Exception as e:
+            logger.warning(f"⚠️ BM25 스냅샷 저장 실패: {e}")
+
+    def close(self):
+        """백그라운드 확인 중지, 쓰기 이벤트 구독 해제 및 마지막 스냅샷 저장"""
+        self._verify_stop.set()
+        remove_vector_db_write_listener(self._on_vector_db_write)
+        if self._pending_changes:
+            self.save_snapshot()
     
     def _collect_documents(self):
         """모든 문서를 수집하여 BM25 인덱스 생성을 위한 Document 객체 생성"""
         try:
             logger.info("📚 문서 수집 시작...")
+            self.documents = []
             
             # 1. 파일 청크 문서 수집
             file_chunks = self._get_file_chunks()
@@ -71,15 +516,9 @@ class HybridSearchRetriever:
             file_chunks = self.vector_db_manager.get_all_file_chunks()
             
             for chunk in file_chunks:
-                content = chunk.get('content', '')
-                if content and len(content.strip()) > 0:
-                    metadata = chunk.get('metadata', {})
-                    metadata.update({
-                        'source_type': 'file_chunk',
-                        'chunk_id': chunk.get('chunk_id', ''),
-                        'file_name': chunk.get('file_name', '')
-                    })
-                    documents.append(Document(page_content=content, metadata=metadata))
+                document = self._build_document('file_chunk', chunk)
+                if document is not None:
+                    documents.append(document)
             
             logger.info(f"✅ 파일 청크 문서 {len(documents)}개 처리 완료")
             
@@ -98,16 +537,9 @@ class HybridSearchRetriever:
             mails = self.vector_db_manager.get_all_mails()
             
             for mail in mails:
-                content = mail.get('content', '')
-                if content and len(content.strip()) > 0:
-                    metadata = mail.get('metadata', {})
-                    metadata.update({
-                        'source_type': 'mail',
-                        'message_id': mail.get('message_id', ''),
-                        'subject': mail.get('subject', ''),
-                        'sender': mail.get('sender', '')
-                    })
-                    documents.append(Document(page_content=content, metadata=metadata))
+                document = self._build_document('mail', mail)
+                if document is not None:
+                    documents.append(document)
             
             logger.info(f"✅ 메일 문서 {len(documents)}개 처리 완료")
             
@@ -126,16 +558,9 @@ class HybridSearchRetriever:
             structured_chunks = self.vector_db_manager.get_all_structured_chunks()
             
             for chunk in structured_chunks:
-                content = chunk.get('content', '')
-                if content and len(content.strip()) > 0:
-                    metadata = chunk.get('metadata', {})
-                    metadata.update({
-                        'source_type': 'structured_chunk',
-                        'chunk_id': chunk.get('chunk_id', ''),
-                        'ticket_id': chunk.get('ticket_id', ''),
-                        'chunk_type': chunk.get('chunk_type', '')
-                    })
-                    documents.append(Document(page_content=content, metadata=metadata))
+                document = self._build_document('structured_chunk', chunk)
+                if document is not None:
+                    documents.append(document)
             
             logger.info(f"✅ 구조적 청크 문서 {len(documents)}개 처리 완료")
             
@@ -147,15 +572,10 @@ class HybridSearchRetriever:
     def _setup_retrievers(self):
         """BM25Retriever와 EnsembleRetriever 설정"""
         try:
-            if not self.documents:
-                logger.warning("⚠️ 수집된 문서가 없습니다. 빈 BM25Retriever를 생성합니다.")
-                self.documents = [Document(page_content="", metadata={})]
-            
-            # 1. BM25Retriever 생성
+            # 1. BM25 Retriever 생성 (증분 인덱스 기반)
             logger.info("🔍 BM25Retriever 생성 중...")
-            self.bm25_retriever = BM25Retriever.from_documents(self.documents)
-            self.bm25_retriever.k = 10  # 검색 결과 수 설정
-            logger.info("✅ BM25Retriever 생성 완료")
+            self.bm25_retriever = self._create_bm25_retriever()
+            logger.info(f"✅ BM25Retriever 생성 완료 ({len(self.bm25_index)}개 문서)")
             
             # 2. Vector Retriever 생성 (기존 VectorDBManager 기반)
             logger.info("🔍 Vector Retriever 생성 중...")
@@ -173,6 +593,24 @@ class HybridSearchRetriever:
         except Exception as e:
             logger.error(f"❌ Retriever 설정 실패: {e}")
             self.ensemble_retriever = None
+
+    def _create_bm25_retriever(self):
+        """IncrementalBM25Index 기반의 BM25 Retriever 생성"""
+        from langchain_core.retrievers import BaseRetriever
+
+        class IncrementalBM25Retriever(BaseRetriever):
+            """증분 BM25 인덱스를 위한 BaseRetriever 구현"""
+
+            index: Any
+            k: int = 10
+
+            def _get_relevant_documents(self, query: str, **kwargs) -> List[Document]:
+                return [
+                    Document(page_content=content, metadata=metadata)
+                    for _, _, content, metadata in self.index.search(query, k=self.k)
+                ]
+
+        return IncrementalBM25Retriever(index=self.bm25_index, k=10)
     
     def _create_vector_retriever(self):
         """VectorDBManager 기반의 Vector Retriever 생성"""
@@ -192,86 +630,30 @@ class HybridSearchRetriever:
                 )
             
             def _get_relevant_documents(self, query: str) -> List[Document]:
-                """VectorDBManager에서 관련 문서 검색"""
+                """VectorDBManager에서 관련 문서 검색 (소스별 병렬 + 점수 정규화)"""
                 try:
                     # 쿼리 전처리
                     preprocessed_query = preprocess_for_embedding(query)
+                    per_source = max(1, self.k // 3)
                     
-                    # 통합 검색 수행
-                    results = []
-                    
-                    # 파일 청크 검색
-                    file_results = self.vector_db_manager.search_similar_file_chunks(
-                        preprocessed_query, n_results=self.k//3
-                    )
-                    for result in file_results:
-                        if isinstance(result, dict):
-                            content = result.get('content', '')
-                            metadata = result.get('metadata', {})
-                            metadata.update({
-                                'source': 'file_chunk',
-                                'similarity_score': result.get('similarity_score', 0.0)
-                            })
-                        else:
-                            content = getattr(result, 'text_chunk', '')
-                            metadata = {
-                                'source': 'file_chunk',
-                                'file_name': getattr(result, 'file_name', ''),
-                                'similarity_score': getattr(result, 'similarity_score', 0.0)
-                            }
-                        
-                        if content:
-                            results.append(Document(page_content=content, metadata=metadata))
-                    
-                    # 메일 검색
-                    mail_results = self.vector_db_manager.search_similar_mails(
-                        preprocessed_query, n_results=self.k//3
-                    )
-                    for result in mail_results:
-                        if isinstance(result, dict):
-                            content = result.get('refined_content', '')
-                            metadata = result.get('metadata', {})
-                            metadata.update({
-                                'source': 'mail',
-                                'similarity_score': result.get('similarity_score', 0.0)
-                            })
-                        else:
-                            content = getattr(result, 'refined_content', '')
-                            metadata = {
-                                'source': 'mail',
-                                'subject': getattr(result, 'subject', ''),
-                                'sender': getattr(result, 'sender', ''),
-                                'similarity_score': getattr(result, 'similarity_score', 0.0)
-                            }
-                        
-                        if content:
-                            results.append(Document(page_content=content, metadata=metadata))
+                    # 파일 청크 / 메일 / 구조적 청크를 동시에 검색 (소스별 마감 시간 적용)
+                    searches = {
+                        'file_chunk': lambda: self.vector_db_manager.search_similar_file_chunks(
+                            preprocessed_query, n_results=per_source),
+                        'mail': lambda: self.vector_db_manager.search_similar_mails(
+                            preprocessed_query, n_results=per_source),
+                        'structured_chunk': lambda: self.vector_db_manager.search_structured_chunks(
+                            preprocessed_query, n_results=per_source),
+                    }
+                    raw_results = search_sources_concurrently(searches)
                     
-                    # 구조적 청크 검색
-                    structured_results = self.vector_db_manager.search_structured_chunks(
-                        preprocessed_query, n_results=self.k//3
-                    )
-                    for result in structured_results:
-                        if isinstance(result, dict):
-                            content = result.get('content', '')
-                            metadata = result.get('metadata', {})
-                            metadata.update({
-                                'source': 'structured_chunk',
-                                'similarity_score': result.get('similarity_score', 0.0)
-                            })
-                        else:
-                            content = getattr(result, 'content', '')
-                            metadata = {
-                                'source': 'structured_chunk',
-                                'ticket_id': getattr(result, 'ticket_id', ''),
-                                'chunk_type': getattr(result, 'chunk_type', ''),
-                                'similarity_score': getattr(result, 'similarity_score', 0.0)
-                            }
-                        
-                        if content:
-                            results.append(Document(page_content=content, metadata=metadata))
+                    documents_by_source = {
+                        source: SOURCE_CONVERTERS[source](results)
+                        for source, results in raw_results.items()
+                    }
                     
-                    return results[:self.k]
+                    # 소스별 점수를 정규화한 뒤 하나의 순위로 통합
+                    return merge_normalized_documents(documents_by_source)[:self.k]
                     
                 except Exception as e:
                     logger.error(f"Vector 검색 실패: {e}")
@@ -298,9 +680,10 @@ class HybridSearchRetriever:
             # 벡터 검색 결과 처리
             vector_results = []
             for i, doc in enumerate(vector_docs):
-                # 벡터 검색 결과에 정규화된 점수 부여
+                # 벡터 검색 결과에 정규화된 점수 부여 (소스 간 정규화 점수 우선)
                 vector_score = doc.metadata.get('similarity_score', 0.0)
-                normalized_vector_score = min(vector_score * 0.8, 0.8)  # 최대 0.8로 제한
+                source_score = doc.metadata.get('normalized_score', vector_score)
+                normalized_vector_score = min(source_score * 0.8, 0.8)  # 최대 0.8로 제한
                 
                 doc.metadata.update({
                     'search_weight': normalized_vector_score,
@@ -441,7 +824,7 @@ class HybridSearchRetriever:
     def get_search_info(self) -> Dict[str, Any]:
         """검색 시스템 정보 반환"""
         return {
-            "total_documents": len(self.documents),
+            "total_documents": len(self.bm25_index),
             "bm25_retriever_ready": self.bm25_retriever is not None,
             "ensemble_retriever_ready": self.ensemble_retriever is not None,
             "weights": [0.2, 0.8] if self.ensemble_retriever else None,  # BM25: 0.2, Vector: 0.8
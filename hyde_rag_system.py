@@ -2,17 +2,26 @@
 """
 HyDE (Hypothetical Document Embeddings) 기반 RAG 시스템
 멀티 쿼리와 HyDE를 결합한 하이브리드 검색 전략 구현
+
+- 멀티 쿼리 / HyDE 문서 생성(LLM 호출)은 동시에 실행
+- 생성 결과는 정규화된 질문 기준 TTL 캐시로 재사용
+- 모든 검색 텍스트는 한 번의 collection.query로 일괄 임베딩/검색
 """
 
 import os
+import re
 import logging
+import unicodedata
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import chromadb
 from chromadb.config import Settings
 from dotenv import load_dotenv
 import numpy as np
+from cachetools import TTLCache
 
 # Azure OpenAI 설정
 load_dotenv()
@@ -46,6 +55,28 @@ class HyDEConfig:
     top_k_per_query: int = 15  # 쿼리당 검색 결과 수
     final_candidates: int = 50  # 최종 후보 수
 
+    # 생성 결과 캐시 설정 (정규화된 질문 기준, 환경변수는 설정 생성 시점에 읽음)
+    generation_cache_size: int = field(default_factory=lambda: int(os.getenv("HYDE_CACHE_SIZE", "256")))
+    generation_cache_ttl: float = field(default_factory=lambda: float(os.getenv("HYDE_CACHE_TTL", "3600")))
+
+
+def normalize_question(question: str) -> str:
+    """캐시 키용 질문 정규화 (유니코드 정규화, 소문자, 공백 압축, 끝 문장부호 제거)"""
+    normalized = unicodedata.normalize("NFKC", question or "").lower()
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    return normalized.rstrip("?!.。 ")
+
+
+class FallbackText(str):
+    """LLM 호출 실패 시 반환하는 대체 HyDE 문서 (생성 결과 캐시에 저장하지 않음)"""
+    is_fallback = True
+
+
+class FallbackQueries(list):
+    """LLM 호출 실패 시 반환하는 대체 멀티 쿼리 (생성 결과 캐시에 저장하지 않음)"""
+    is_fallback = True
+
+
 class HyDEPromptTemplate:
     """HyDE 프롬프트 템플릿 관리 클래스"""
 
@@ -151,7 +182,7 @@ class HyDEDocumentGenerator:
         except Exception as e:
             logger.error(f"❌ HyDE 문서 생성 실패: {e}")
             # 실패 시 원본 질문을 기반으로 간단한 가상 문서 생성
-            return f"질문 '{question}'에 대한 해결 방법과 상세한 설명이 포함된 문서입니다."
+            return FallbackText(f"질문 '{question}'에 대한 해결 방법과 상세한 설명이 포함된 문서입니다.")
 
     def generate_multi_queries(self, question: str) -> List[str]:
         """
@@ -212,22 +243,25 @@ class HyDEDocumentGenerator:
         except Exception as e:
             logger.error(f"❌ 멀티 쿼리 생성 실패: {e}")
             # 실패 시 간단한 변형 쿼리 생성
-            return [
+            return FallbackQueries([
                 f"{question} 문제",
                 f"{question} 해결",
                 f"{question} 방법"
-            ]
+            ])
 
 class HyDERAGSystem:
     """HyDE 기반 RAG 시스템"""
 
-    def __init__(self, collection_name: str = "file_chunks", config: Optional[HyDEConfig] = None):
+    def __init__(self, collection_name: str = "file_chunks", config: Optional[HyDEConfig] = None,
+                 generator=None):
         """
         HyDE RAG 시스템 초기화
 
         Args:
             collection_name: ChromaDB 컬렉션 이름
             config: HyDE 설정
+            generator: 멀티 쿼리/HyDE 문서 생성기 (기본: Azure OpenAI 생성기.
+                오프라인 테스트는 MockHyDEGenerator 등을 명시적으로 주입)
         """
         self.collection_name = collection_name
         self.config = config or HyDEConfig()
@@ -236,8 +270,11 @@ class HyDERAGSystem:
         self.client = None
         self.collection = None
         self.embedding_function = None
-        self.hyde_generator = None
+        self.hyde_generator = generator
         self.weighting_system = None
+        self.generation_cache = TTLCache(maxsize=self.config.generation_cache_size,
+                                         ttl=self.config.generation_cache_ttl)
+        self._generation_cache_lock = threading.Lock()  # cachetools 캐시는 스레드 안전하지 않음
 
         self._init_components()
 
@@ -254,8 +291,9 @@ class HyDERAGSystem:
             # 한국어 임베딩 함수 (기존 컬렉션과 호환되도록 384차원 사용)
             self.embedding_function = KoreanEmbeddingFunction()
 
-            # HyDE 문서 생성기
-            self.hyde_generator = HyDEDocumentGenerator(self.config)
+            # HyDE 문서 생성기 (Azure OpenAI 설정 오류는 그대로 발생)
+            if self.hyde_generator is None:
+                self.hyde_generator = HyDEDocumentGenerator(self.config)
 
             # 가중치 시스템
             self.weighting_system = IntelligentChunkWeighting()
@@ -266,6 +304,55 @@ class HyDERAGSystem:
             logger.error(f"❌ HyDE RAG 시스템 초기화 실패: {e}")
             raise e
 
+    def _cached_generate(self, kind: str, question: str, generate_fn):
+        """생성 결과 캐시 조회 후 없으면 생성하여 저장 (LLM 실패 대체 결과는 저장하지 않음)"""
+        key = (kind, normalize_question(question))
+        with self._generation_cache_lock:
+            cached = self.generation_cache.get(key)
+        if cached is not None:
+            logger.info(f"♻️ {kind} 생성 결과 캐시 사용")
+            return cached
+
+        generated = generate_fn(question)
+        if getattr(generated, "is_fallback", False):
+            # 일시적인 LLM 실패의 대체 결과가 TTL 동안 고정되지 않도록 캐시하지 않음
+            logger.warning(f"⚠️ {kind} 생성 실패로 대체 결과 사용 (캐시하지 않음)")
+            return generated
+
+        with self._generation_cache_lock:
+            self.generation_cache[key] = generated
+        return generated
+
+    def generate_search_texts(self, query: str, use_hyde: bool = True,
+                              use_multi_query: bool = True) -> Dict[str, Any]:
+        """
+        멀티 쿼리와 HyDE 문서를 동시에 생성 (캐시 적중 시 LLM 호출 생략)
+
+        Returns:
+            {'multi_queries': [...], 'hypothetical_doc': str 또는 None}
+        """
+        tasks = {}
+        if use_multi_query:
+            tasks['multi_queries'] = ("multi", self.hyde_generator.generate_multi_queries)
+        if use_hyde:
+            tasks['hypothetical_doc'] = ("hyde", self.hyde_generator.generate_hypothetical_document)
+
+        generated = {'multi_queries': [], 'hypothetical_doc': None}
+        if len(tasks) == 1:
+            name, (kind, generate_fn) = next(iter(tasks.items()))
+            generated[name] = self._cached_generate(kind, query, generate_fn)
+        elif tasks:
+            # 두 LLM 호출은 서로 독립적이므로 병렬 실행
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {
+                    name: executor.submit(self._cached_generate, kind, query, generate_fn)
+                    for name, (kind, generate_fn) in tasks.items()
+                }
+                for name, future in futures.items():
+                    generated[name] = future.result()
+
+        return generated
+
     def search(self, query: str, use_hyde: bool = True, use_multi_query: bool = True) -> List[Dict[str, Any]]:
         """
         HyDE 기반 하이브리드 검색
@@ -281,52 +368,51 @@ class HyDERAGSystem:
         try:
             logger.info(f"🚀 HyDE RAG 검색 시작: '{query}'")
 
-            # 1. 검색할 텍스트 리스트 준비
+            # 1~3. 검색할 텍스트 준비 (원본 질문 + 멀티 쿼리 + HyDE 문서, 생성은 병렬)
+            generated = self.generate_search_texts(query, use_hyde, use_multi_query)
             texts_to_embed = [query]  # 원본 질문은 항상 포함
+            query_types = ['original']
 
-            # 2. 멀티 쿼리 생성 (옵션)
             if use_multi_query:
-                multi_queries = self.hyde_generator.generate_multi_queries(query)
+                multi_queries = generated['multi_queries']
                 texts_to_embed.extend(multi_queries)
+                query_types.extend(['multi'] * len(multi_queries))
                 logger.info(f"📝 멀티 쿼리: {multi_queries}")
 
-            # 3. HyDE 문서 생성 (옵션)
             if use_hyde:
-                hypothetical_doc = self.hyde_generator.generate_hypothetical_document(query)
+                hypothetical_doc = generated['hypothetical_doc']
                 texts_to_embed.append(hypothetical_doc)
+                query_types.append('hyde')
                 logger.info(f"🎯 HyDE 문서: {hypothetical_doc[:100]}...")
 
             logger.info(f"🔍 총 {len(texts_to_embed)}개 텍스트로 검색 수행")
 
-            # 4. 각 텍스트로 벡터 검색 수행
+            # 4. 모든 텍스트를 한 번에 임베딩하여 벡터 검색 (기존 컬렉션의 임베딩 함수 사용)
+            results = self.collection.query(
+                query_texts=texts_to_embed,
+                n_results=self.config.top_k_per_query
+            )
+
             all_results = []
             for i, text in enumerate(texts_to_embed):
-                try:
-                    # 검색 수행 (기존 컬렉션의 임베딩 함수 사용)
-                    results = self.collection.query(
-                        query_texts=[text],
-                        n_results=self.config.top_k_per_query
-                    )
-
-                    # 결과 처리
-                    if results['ids'][0]:
-                        for j in range(len(results['ids'][0])):
-                            result = {
-                                'id': results['ids'][0][j],
-                                'content': results['documents'][0][j] if results['documents'][0] else "",
-                                'distance': results['distances'][0][j] if results['distances'][0] else 1.0,
-                                'metadata': results['metadatas'][0][j] if results['metadatas'][0] else {},
-                                'query_type': 'original' if i == 0 else ('multi' if i < len(texts_to_embed) - (1 if use_hyde else 0) else 'hyde'),
-                                'query_index': i,
-                                'source_text': text[:100] + "..." if len(text) > 100 else text
-                            }
-                            all_results.append(result)
-
-                    logger.info(f"   쿼리 {i+1}: {len(results['ids'][0]) if results['ids'][0] else 0}개 결과")
-
-                except Exception as e:
-                    logger.error(f"❌ 쿼리 {i+1} 검색 실패: {e}")
-                    continue
+                ids = results['ids'][i] if i < len(results['ids']) else []
+                documents = results['documents'][i] if results.get('documents') else None
+                distances = results['distances'][i] if results.get('distances') else None
+                metadatas = results['metadatas'][i] if results.get('metadatas') else None
+
+                for j in range(len(ids)):
+                    result = {
+                        'id': ids[j],
+                        'content': documents[j] if documents else "",
+                        'distance': distances[j] if distances else 1.0,
+                        'metadata': (metadatas[j] if metadatas else None) or {},
+                        'query_type': query_types[i],
+                        'query_index': i,
+                        'source_text': text[:100] + "..." if len(text) > 100 else text
+                    }
+                    all_results.append(result)
+
+                logger.info(f"   쿼리 {i+1}: {len(ids)}개 결과")
 
             # 5. 결과 통합 및 중복 제거
             unique_results = self._process_and_deduplicate(all_results, query)
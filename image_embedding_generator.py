@@ -7,8 +7,10 @@ Azure Vision API 또는 CLIP 모델을 사용하여 이미지에서 벡터 임
 import os
 import base64
 import io
+import hashlib
 import logging
-from typing import List, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, Union
 from PIL import Image
 import requests
 import json
@@ -77,29 +79,7 @@ class ImageEmbeddingGenerator:
         """
         try:
             # 이미지 데이터 전처리
-            if isinstance(image_data, str):
-                # 파일 경로인 경우
-                if os.path.exists(image_data):
-                    with open(image_data, 'rb') as f:
-                        image_bytes = f.read()
-                    image = Image.open(io.BytesIO(image_bytes))
-                else:
-                    # Base64 데이터인 경우
-                    if image_data.startswith('data:image'):
-                        image_data = image_data.split(',')[1]
-                    image_bytes = base64.b64decode(image_data)
-                    image = Image.open(io.BytesIO(image_bytes))
-            elif isinstance(image_data, bytes):
-                image_bytes = image_data
-                image = Image.open(io.BytesIO(image_bytes))
-            elif isinstance(image_data, Image.Image):
-                image = image_data
-                # PIL Image를 bytes로 변환
-                img_byte_arr = io.BytesIO()
-                image.save(img_byte_arr, format='PNG')
-                image_bytes = img_byte_arr.getvalue()
-            else:
-                raise ValueError("지원하지 않는 이미지 데이터 타입입니다")
+            image_bytes, image = self._load_image(image_data)
             
             # 이미지 메타데이터 추출
             metadata = {
@@ -127,6 +107,33 @@ class ImageEmbeddingGenerator:
             logger.error(f"❌ 이미지 임베딩 생성 실패: {e}")
             raise
     
+    @staticmethod
+    def _load_image(image_data: Union[str, bytes, Image.Image]) -> Tuple[bytes, Image.Image]:
+        """이미지 데이터(파일 경로, Base64, bytes, PIL Image)를 (bytes, PIL Image)로 변환"""
+        if isinstance(image_data, str):
+            # 파일 경로인 경우
+            if os.path.exists(image_data):
+                with open(image_data, 'rb') as f:
+                    image_bytes = f.read()
+            else:
+                # Base64 데이터인 경우
+                if image_data.startswith('data:image'):
+                    image_data = image_data.split(',')[1]
+                image_bytes = base64.b64decode(image_data)
+            image = Image.open(io.BytesIO(image_bytes))
+        elif isinstance(image_data, bytes):
+            image_bytes = image_data
+            image = Image.open(io.BytesIO(image_bytes))
+        elif isinstance(image_data, Image.Image):
+            image = image_data
+            # PIL Image를 bytes로 변환
+            img_byte_arr = io.BytesIO()
+            image.save(img_byte_arr, format='PNG')
+            image_bytes = img_byte_arr.getvalue()
+        else:
+            raise ValueError("지원하지 않는 이미지 데이터 타입입니다")
+        return image_bytes, image
+    
     def _generate_azure_embedding(self, image_bytes: bytes) -> List[float]:
         """Azure Vision API로 이미지 임베딩 생성"""
         try:
@@ -189,6 +196,28 @@ class ImageEmbeddingGenerator:
             # 폴백: 해시 기반 임베딩
             return self._generate_hash_embedding(image.tobytes())
     
+    def _generate_clip_embeddings(self, images: List[Image.Image]) -> List[List[float]]:
+        """CLIP 모델로 여러 이미지를 한 번의 forward로 임베딩"""
+        try:
+            import torch
+            
+            resized = [
+                image.convert('RGB').resize((224, 224), Image.Resampling.LANCZOS) if image.size != (224, 224)
+                else image.convert('RGB')
+                for image in images
+            ]
+            inputs = self.processor(images=resized, return_tensors="pt").to(self.device)
+            
+            with torch.no_grad():
+                image_features = self.model.get_image_features(**inputs)
+                image_features = image_features / image_features.norm(dim=-1, keepdim=True)
+            
+            return image_features.cpu().numpy().tolist()
+            
+        except Exception as e:
+            logger.error(f"❌ CLIP 배치 임베딩 생성 실패, 개별 처리로 전환: {e}")
+            return [self._generate_clip_embedding(image) for image in images]
+    
     def _generate_text_embedding(self, text: str) -> List[float]:
         """텍스트에서 임베딩 생성 (OpenAI API 사용)"""
         try:
@@ -240,33 +269,89 @@ class ImageEmbeddingGenerator:
         return embedding[:1536]
     
     def batch_generate_embeddings(self, image_data_list: List[Union[str, bytes, Image.Image]], 
-                                 image_ids: List[str] = None) -> List[Dict[str, any]]:
+                                 image_ids: List[str] = None, batch_size: Optional[int] = None,
+                                 max_workers: Optional[int] = None) -> List[Dict[str, any]]:
         """
         여러 이미지의 임베딩을 배치로 생성
         
+        1. 이미지 디코딩을 스레드 풀에서 병렬 수행
+        2. 내용 해시(sha256)가 같은 이미지는 한 번만 임베딩
+        3. 고유 이미지를 batch_size 단위로 묶어 임베딩 (CLIP은 배치당 forward 1회,
+           Azure Vision은 배치 내 요청을 병렬 호출)
+        
         Args:
             image_data_list: 이미지 데이터 리스트
             image_ids: 이미지 ID 리스트
+            batch_size: 임베딩 배치 크기 (기본: IMAGE_EMBEDDING_BATCH_SIZE 환경변수, 없으면 16)
+            max_workers: 디코딩/API 호출 동시 실행 수 (기본: IMAGE_EMBEDDING_WORKERS 환경변수, 없으면 4)
             
         Returns:
-            임베딩 정보 리스트
+            입력 순서와 같은 임베딩 정보 리스트 (실패 항목은 method='failed')
         """
-        results = []
+        batch_size = max(1, batch_size or int(os.getenv("IMAGE_EMBEDDING_BATCH_SIZE", "16")))
+        max_workers = max(1, max_workers or int(os.getenv("IMAGE_EMBEDDING_WORKERS", "4")))
+        method = 'azure_vision' if self.use_azure_vision else 'clip'
+        
+        def _decode(image_data):
+            image_bytes, image = self._load_image(image_data)
+            if not self.use_azure_vision:
+                # Image.open은 헤더만 읽으므로 CLIP 입력용 픽셀 디코딩도 워커 스레드에서 수행
+                image.load()
+            return image_bytes, image, hashlib.sha256(image_bytes).hexdigest()
         
-        for i, image_data in enumerate(image_data_list):
-            try:
-                image_id = image_ids[i] if image_ids and i < len(image_ids) else None
-                result = self.generate_embedding(image_data, image_id)
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"❌ 이미지 {i} 임베딩 생성 실패: {e}")
-                results.append({
-                    'embedding': None,
-                    'metadata': {'error': str(e)},
-                    'method': 'failed'
-                })
+        results: List[Optional[Dict[str, any]]] = [None] * len(image_data_list)
+        decoded = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_decode, image_data) for image_data in image_data_list]
+            for i, future in enumerate(futures):
+                try:
+                    decoded[i] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ 이미지 {i} 디코딩 실패: {e}")
+                    results[i] = {'embedding': None, 'metadata': {'error': str(e)}, 'method': 'failed'}
+            
+            # 해시별 대표 이미지만 임베딩
+            unique = {}
+            for i, (image_bytes, image, image_hash) in decoded.items():
+                unique.setdefault(image_hash, (image_bytes, image))
+            hashes = list(unique)
+            
+            embeddings = {}
+            for start in range(0, len(hashes), batch_size):
+                batch_hashes = hashes[start:start + batch_size]
+                try:
+                    if self.use_azure_vision:
+                        vectors = list(executor.map(
+                            lambda image_hash: self._generate_azure_embedding(unique[image_hash][0]),
+                            batch_hashes
+                        ))
+                    else:
+                        vectors = self._generate_clip_embeddings([unique[h][1] for h in batch_hashes])
+                    embeddings.update(zip(batch_hashes, vectors))
+                except Exception as e:
+                    logger.error(f"❌ 이미지 임베딩 배치 실패 ({len(batch_hashes)}개): {e}")
+        
+        for i, (image_bytes, image, image_hash) in decoded.items():
+            embedding = embeddings.get(image_hash)
+            if embedding is None:
+                results[i] = {'embedding': None, 'metadata': {'error': '임베딩 생성 실패'}, 'method': 'failed'}
+                continue
+            image_id = image_ids[i] if image_ids and i < len(image_ids) else None
+            results[i] = {
+                'embedding': embedding,
+                'metadata': {
+                    'image_id': image_id or f"img_{image_hash[:12]}",
+                    'image_hash': image_hash,
+                    'width': image.width,
+                    'height': image.height,
+                    'format': image.format,
+                    'mode': image.mode,
+                    'size_bytes': len(image_bytes)
+                },
+                'method': method
+            }
         
+        logger.info(f"✅ 이미지 배치 임베딩 완료: {len(image_data_list)}개 입력, 고유 {len(embeddings)}개 임베딩")
         return results
 
 
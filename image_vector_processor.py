@@ -5,9 +5,11 @@
 """
 
 import os
+import time
 import base64
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Union
 from datetime import datetime
 from PIL import Image
@@ -52,26 +54,50 @@ class ImageVectorProcessor:
             images = self._extract_images_from_html(html_content)
             logger.info(f"🖼️ 발견된 이미지 수: {len(images)}개")
             
-            processed_images = []
+            if not images:
+                return []
             
-            for i, image_data in enumerate(images):
-                try:
-                    # 이미지 벡터 생성 및 저장
-                    result = self._process_single_image(
-                        image_data, 
-                        mail_id, 
-                        f"{mail_id}_img_{i+1}"
-                    )
-                    
-                    if result:
-                        processed_images.append(result)
-                        logger.info(f"✅ 이미지 {i+1} 처리 완료")
-                    else:
-                        logger.warning(f"⚠️ 이미지 {i+1} 처리 실패")
-                        
-                except Exception as e:
-                    logger.error(f"❌ 이미지 {i+1} 처리 중 오류: {e}")
+            start_time = time.time()
+            image_ids = [f"{mail_id}_img_{i+1}" for i in range(len(images))]
+            
+            # 이미지 바이트 확보 (Base64 디코딩/외부 다운로드) 병렬 수행
+            with ThreadPoolExecutor(max_workers=int(os.getenv("IMAGE_EMBEDDING_WORKERS", "4"))) as executor:
+                image_bytes_list = list(executor.map(
+                    lambda image_info: self._resolve_image_bytes(image_info, mail_id), images
+                ))
+            
+            targets = []
+            for i, image_bytes in enumerate(image_bytes_list):
+                if image_bytes:
+                    targets.append(i)
+                else:
+                    logger.warning(f"⚠️ 이미지 {i+1} 처리 실패")
+            
+            # 배치 임베딩 (같은 이미지는 한 번만 임베딩)
+            embedding_results = self.embedding_generator.batch_generate_embeddings(
+                [image_bytes_list[i] for i in targets],
+                [image_ids[i] for i in targets]
+            )
+            
+            image_vectors = []
+            for i, embedding_result in zip(targets, embedding_results):
+                if not embedding_result.get('embedding'):
+                    logger.error(f"이미지 임베딩 생성 실패: {image_ids[i]}")
                     continue
+                image_vectors.append(self._build_image_vector(
+                    images[i], image_bytes_list[i], mail_id, image_ids[i], embedding_result
+                ))
+            
+            # 메일 단위 일괄 저장
+            duration = time.time() - start_time
+            for image_vector in image_vectors:
+                image_vector.processing_duration = duration / len(image_vectors)
+            
+            processed_images = []
+            if image_vectors and self.vector_db.save_image_vectors(image_vectors):
+                processed_images = [self._to_result(image_vector) for image_vector in image_vectors]
+            elif image_vectors:
+                logger.error(f"이미지 벡터 저장 실패: 메일 {mail_id}")
             
             logger.info(f"✅ 메일 이미지 처리 완료 - {len(processed_images)}개 성공")
             return processed_images
@@ -108,18 +134,12 @@ class ImageVectorProcessor:
                     'is_local': not src.startswith('http') and not src.startswith('data:image') and 'cid:' not in src
                 }
                 
-                # Base64 인라인 이미지인 경우 데이터 추출
+                # Base64 인라인 이미지인 경우 데이터 추출 (디코딩은 처리 단계에서 병렬 수행)
                 if image_info['is_base64']:
-                    try:
-                        if ';base64,' in src:
-                            base64_data = src.split(';base64,')[1]
-                            image_bytes = base64.b64decode(base64_data)
-                            image_info['image_data'] = image_bytes
-                            image_info['image_format'] = src.split(';')[0].split('/')[1]
-                        else:
-                            continue
-                    except Exception as e:
-                        logger.warning(f"Base64 이미지 디코딩 실패: {e}")
+                    if ';base64,' in src:
+                        image_info['base64_data'] = src.split(';base64,')[1]
+                        image_info['image_format'] = src.split(';')[0].split('/')[1]
+                    else:
                         continue
                 
                 # 외부 이미지인 경우 URL 저장
@@ -142,88 +162,94 @@ class ImageVectorProcessor:
             logger.error(f"❌ HTML 이미지 추출 실패: {e}")
             return []
     
-    def _process_single_image(self, image_info: Dict[str, any], 
-                            mail_id: str, image_id: str) -> Optional[Dict[str, any]]:
-        """단일 이미지 처리"""
+    def _resolve_image_bytes(self, image_info: Dict[str, any], mail_id: str) -> Optional[bytes]:
+        """이미지 정보에서 이미지 바이트 확보 (실패 시 None)"""
         try:
-            # 이미지 데이터 준비
-            if image_info.get('is_base64') and 'image_data' in image_info:
+            if image_info.get('is_base64'):
                 # Base64 이미지 처리
-                image_data = image_info['image_data']
-                image = Image.open(io.BytesIO(image_data))
-                
+                return base64.b64decode(image_info['base64_data'])
+            
             elif image_info.get('is_external'):
                 # 외부 이미지 처리 (URL에서 다운로드)
-                image_data = self._download_external_image(image_info['image_url'])
-                if not image_data:
-                    return None
-                image = Image.open(io.BytesIO(image_data))
-                
+                return self._download_external_image(image_info['image_url'])
+            
             elif image_info.get('is_cid'):
                 # CID 첨부 이미지 처리 (메일 첨부파일에서 찾기)
-                image_data = self._get_cid_image(image_info['cid'], mail_id)
-                if not image_data:
-                    return None
-                image = Image.open(io.BytesIO(image_data))
-                
+                return self._get_cid_image(image_info['cid'], mail_id)
+            
             elif image_info.get('is_local'):
                 # 로컬 이미지 처리
                 local_path = image_info['local_path']
                 if os.path.exists(local_path):
-                    image = Image.open(local_path)
                     with open(local_path, 'rb') as f:
-                        image_data = f.read()
-                else:
-                    logger.warning(f"로컬 이미지 파일을 찾을 수 없습니다: {local_path}")
-                    return None
-                
-            else:
-                logger.warning(f"지원하지 않는 이미지 타입: {image_info}")
+                        return f.read()
+                logger.warning(f"로컬 이미지 파일을 찾을 수 없습니다: {local_path}")
+                return None
+            
+            logger.warning(f"지원하지 않는 이미지 타입: {image_info}")
+            return None
+            
+        except Exception as e:
+            logger.warning(f"이미지 데이터 확보 실패: {e}")
+            return None
+    
+    def _build_image_vector(self, image_info: Dict[str, any], image_data: bytes, mail_id: str,
+                            image_id: str, embedding_result: Dict[str, any]) -> ImageVector:
+        """임베딩 결과로 ImageVector 생성"""
+        # 이미지 설명 생성 (간단한 방법)
+        description = self._generate_image_description(image_info, embedding_result)
+        
+        return ImageVector(
+            image_id=image_id,
+            mail_id=mail_id,
+            image_data=base64.b64encode(image_data).decode('utf-8'),
+            image_metadata=embedding_result['metadata'],
+            embedding=embedding_result['embedding'],
+            description=description,
+            tags=self._extract_image_tags(image_info, embedding_result),
+            created_at=datetime.now().isoformat(),
+            embedding_method=embedding_result['method'],
+            file_size=len(image_data),
+            processing_duration=0.0
+        )
+    
+    @staticmethod
+    def _to_result(image_vector: ImageVector) -> Dict[str, any]:
+        return {
+            'image_id': image_vector.image_id,
+            'mail_id': image_vector.mail_id,
+            'description': image_vector.description,
+            'tags': image_vector.tags,
+            'embedding_method': image_vector.embedding_method,
+            'file_size': image_vector.file_size,
+            'success': True
+        }
+    
+    def _process_single_image(self, image_info: Dict[str, any], 
+                            mail_id: str, image_id: str) -> Optional[Dict[str, any]]:
+        """단일 이미지 처리"""
+        try:
+            start_time = time.time()
+            image_data = self._resolve_image_bytes(image_info, mail_id)
+            if not image_data:
                 return None
             
             # 이미지 임베딩 생성
-            embedding_result = self.embedding_generator.generate_embedding(
-                image, image_id
-            )
+            embedding_result = self.embedding_generator.generate_embedding(image_data, image_id)
             
             if not embedding_result or not embedding_result.get('embedding'):
                 logger.error(f"이미지 임베딩 생성 실패: {image_id}")
                 return None
             
-            # 이미지 설명 생성 (간단한 방법)
-            description = self._generate_image_description(image_info, embedding_result)
-            
-            # 이미지 벡터 객체 생성
-            image_vector = ImageVector(
-                image_id=image_id,
-                mail_id=mail_id,
-                image_data=base64.b64encode(image_data).decode('utf-8') if isinstance(image_data, bytes) else image_data,
-                image_metadata=embedding_result['metadata'],
-                embedding=embedding_result['embedding'],
-                description=description,
-                tags=self._extract_image_tags(image_info, embedding_result),
-                created_at=datetime.now().isoformat(),
-                embedding_method=embedding_result['method'],
-                file_size=len(image_data) if isinstance(image_data, bytes) else 0,
-                processing_duration=0.0  # 실제로는 시간 측정 필요
-            )
+            image_vector = self._build_image_vector(image_info, image_data, mail_id, image_id, embedding_result)
+            image_vector.processing_duration = time.time() - start_time
             
             # Vector DB에 저장
-            success = self.vector_db.save_image_vector(image_vector)
-            
-            if success:
-                return {
-                    'image_id': image_id,
-                    'mail_id': mail_id,
-                    'description': description,
-                    'tags': image_vector.tags,
-                    'embedding_method': embedding_result['method'],
-                    'file_size': image_vector.file_size,
-                    'success': True
-                }
-            else:
-                logger.error(f"이미지 벡터 저장 실패: {image_id}")
-                return None
+            if self.vector_db.save_image_vector(image_vector):
+                return self._to_result(image_vector)
+            
+            logger.error(f"이미지 벡터 저장 실패: {image_id}")
+            return None
                 
         except Exception as e:
             logger.error(f"❌ 단일 이미지 처리 실패: {e}")
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+증분 BM25 인덱스
+- 역색인(term → {문서 키: tf})을 유지하여 문서 추가/삭제를 전체 재구성 없이 반영
+- Vector DB 쓰기 이벤트(upsert/delete/clear)를 그대로 적용 가능
+- 디스크 스냅샷으로 재시작 시 전체 스캔 없이 빠르게 복구
+
+HybridSearchRetriever의 BM25 쪽이 생성 시점 이후 저장된 문서를 보지 못하고
+매번 BM25Retriever.from_documents로 전체를 다시 만들던 문제를 대체한다.
+"""
+
+import os
+import json
+import math
+import heapq
+import logging
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+def default_tokenize(text: str) -> List[str]:
+    """공백 분리 토크나이저 (langchain BM25Retriever 기본 전처리와 동일)"""
+    return (text or "").split()
+
+
+class IncrementalBM25Index:
+    """문서 단위 추가/삭제를 지원하는 BM25 인덱스 (Thread-safe)"""
+
+    def __init__(self, tokenizer: Optional[Callable[[str], List[str]]] = None,
+                 k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            tokenizer: text -> 토큰 목록 (기본: 공백 분리)
+            k1, b: BM25 파라미터
+        """
+        self.tokenizer = tokenizer or default_tokenize
+        self.k1 = k1
+        self.b = b
+
+        # 문서 키 → {'content', 'metadata', 'tf', 'length'}
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        # term → {문서 키: tf}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------------
+
+    def _remove_locked(self, key: str) -> bool:
+        entry = self._documents.pop(key, None)
+        if entry is None:
+            return False
+        for term in entry["tf"]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= entry["length"]
+        return True
+
+    def _insert_locked(self, key: str, content: str, metadata: Dict[str, Any],
+                       tf: Dict[str, int], length: int):
+        self._documents[key] = {"content": content, "metadata": metadata, "tf": tf, "length": length}
+        for term, count in tf.items():
+            self._postings.setdefault(term, {})[key] = count
+        self._total_length += length
+
+    def add_documents(self, documents: Iterable[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """
+        문서 추가 (같은 키가 있으면 교체)
+
+        Args:
+            documents: (문서 키, 본문, 메타데이터) 목록
+
+        Returns:
+            반영된 문서 수
+        """
+        # 토크나이징은 락 밖에서 수행
+        prepared = []
+        for key, content, metadata in documents:
+            tokens = self.tokenizer(content)
+            prepared.append((key, content, metadata or {}, dict(Counter(tokens)), len(tokens)))
+
+        with self._lock:
+            for key, content, metadata, tf, length in prepared:
+                self._remove_locked(key)
+                self._insert_locked(key, content, metadata, tf, length)
+        return len(prepared)
+
+    def delete_documents(self, keys: Iterable[str]) -> int:
+        """문서 삭제 (삭제된 수 반환)"""
+        with self._lock:
+            return sum(1 for key in keys if self._remove_locked(key))
+
+    def clear(self, key_prefix: Optional[str] = None) -> int:
+        """전체 또는 키 접두사가 일치하는 문서 삭제"""
+        with self._lock:
+            if key_prefix is None:
+                removed = len(self._documents)
+                self._documents.clear()
+                self._postings.clear()
+                self._total_length = 0
+                return removed
+            keys = [key for key in self._documents if key.startswith(key_prefix)]
+            for key in keys:
+                self._remove_locked(key)
+            return len(keys)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float, str, Dict[str, Any]]]:
+        """
+        BM25 검색
+
+        idf는 log(1 + (N - df + 0.5) / (df + 0.5))를 사용하여 항상 양수이므로
+        문서가 적은 인덱스에서도 점수가 음수로 뒤집히지 않는다.
+
+        Returns:
+            [(문서 키, 점수, 본문, 메타데이터)] 점수 내림차순
+        """
+        query_terms = self.tokenizer(query)
+        with self._lock:
+            total_docs = len(self._documents)
+            if not total_docs or not query_terms:
+                return []
+
+            avg_length = self._total_length / total_docs or 1.0
+            scores: Dict[str, float] = {}
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1.0 + (total_docs - df + 0.5) / (df + 0.5))
+                for key, tf in postings.items():
+                    length = self._documents[key]["length"]
+                    norm = self.k1 * (1.0 - self.b + self.b * length / avg_length)
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (self.k1 + 1.0) / (tf + norm)
+
+            top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+            return [
+                (key, score, self._documents[key]["content"], dict(self._documents[key]["metadata"]))
+                for key, score in top
+            ]
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._documents
+
+    # ------------------------------------------------------------------
+    # 스냅샷
+    # ------------------------------------------------------------------
+
+    def save_snapshot(self, path: str, extra: Optional[Dict[str, Any]] = None):
+        """
+        인덱스를 JSON 스냅샷으로 저장 (임시 파일에 쓴 뒤 교체하여 원자적으로 저장)
+
+        Args:
+            path: 스냅샷 파일 경로
+            extra: 함께 저장할 부가 정보 (예: 저장 시점의 컬렉션 문서 수)
+        """
+        with self._lock:
+            payload = {
+                "version": SNAPSHOT_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "extra": extra or {},
+                "documents": {
+                    key: {"content": entry["content"], "metadata": entry["metadata"], "tf": entry["tf"]}
+                    for key, entry in self._documents.items()
+                }
+            }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 BM25 스냅샷 저장: {path} ({len(payload['documents'])}개 문서)")
+
+    def load_snapshot(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷 로드 (토크나이징 없이 tf로 역색인 복원)
+
+        Returns:
+            저장 시 함께 기록한 extra 정보, 스냅샷이 없거나 손상되었으면 None
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != SNAPSHOT_VERSION:
+                logger.warning(f"⚠️ BM25 스냅샷 버전 불일치, 무시: {path}")
+                return None
+        except Exception as e:
+            logger.warning(f"⚠️ BM25 스냅샷 로드 실패: {e}")
+            return None
+
+        with self._lock:
+            self.clear()
+            for key, entry in payload["documents"].items():
+                tf = entry["tf"]
+                self._insert_locked(key, entry["content"], entry["metadata"], tf, sum(tf.values()))
+
+        logger.info(f"✅ BM25 스냅샷 로드: {path} ({len(self)}개 문서)")
+        return payload.get("extra", {})
@@ -7,7 +7,9 @@ Jira CSV 데이터를 전문화된 청크로 처리하는 프로세서
 import csv
 import os
 import json
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from datetime import datetime
 import logging
 
@@ -23,6 +25,11 @@ from text_preprocessor import preprocess_for_embedding
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 스트리밍 처리 설정 (process_csv_file_to_jsonl)
+JIRA_CHUNK_WORKERS = int(os.getenv("JIRA_CHUNK_WORKERS", str(os.cpu_count() or 1)))
+JIRA_CHUNK_BATCH_SIZE = int(os.getenv("JIRA_CHUNK_BATCH_SIZE", "200"))
+CHECKPOINT_VERSION = 1
+
 
 class JiraChunkProcessor:
     """Jira CSV 데이터를 전문화된 청크로 처리하는 프로세서"""
@@ -57,34 +64,202 @@ class JiraChunkProcessor:
         ticket_chunks_list = []
         
         try:
-            with open(csv_file_path, 'r', encoding='utf-8', errors='ignore') as csvfile:
-                # CSV 헤더 자동 감지
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
-                
-                reader = csv.DictReader(csvfile, delimiter=delimiter)
-                
-                for row_idx, row in enumerate(reader, 1):
-                    try:
-                        # 각 행(티켓)을 전문화된 청크들로 변환
-                        ticket_chunks = self._process_ticket_row(row, csv_file_path, row_idx)
-                        if ticket_chunks and ticket_chunks.get_total_chunks() > 0:
-                            ticket_chunks_list.append(ticket_chunks)
-                            logger.info(f"티켓 {ticket_chunks.ticket_id} 처리 완료: {ticket_chunks.get_total_chunks()}개 청크")
-                        
-                    except Exception as e:
-                        logger.error(f"행 {row_idx} 처리 오류: {e}")
-                        continue
-                
-                logger.info(f"CSV 파일 처리 완료: {len(ticket_chunks_list)}개 티켓, 총 {sum(tc.get_total_chunks() for tc in ticket_chunks_list)}개 청크")
-                return ticket_chunks_list
+            for row_idx, row in self._iter_csv_rows(csv_file_path):
+                ticket_chunks = self._process_row_safely(row, csv_file_path, row_idx)
+                if ticket_chunks:
+                    ticket_chunks_list.append(ticket_chunks)
+            
+            logger.info(f"CSV 파일 처리 완료: {len(ticket_chunks_list)}개 티켓, 총 {sum(tc.get_total_chunks() for tc in ticket_chunks_list)}개 청크")
+            return ticket_chunks_list
                 
         except Exception as e:
             logger.error(f"CSV 파일 처리 실패: {e}")
             raise
     
+    def _iter_csv_rows(self, csv_file_path: str, start_after: int = 0) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """
+        CSV 행을 한 줄씩 읽어 (행 번호, 행) 반환 (파일 전체를 메모리에 올리지 않음)
+        
+        Args:
+            csv_file_path: Jira CSV 파일 경로
+            start_after: 이 행 번호까지는 건너뜀 (재개용)
+        """
+        with open(csv_file_path, 'r', encoding='utf-8', errors='ignore') as csvfile:
+            # CSV 헤더 자동 감지
+            sample = csvfile.read(1024)
+            csvfile.seek(0)
+            sniffer = csv.Sniffer()
+            delimiter = sniffer.sniff(sample).delimiter
+            
+            reader = csv.DictReader(csvfile, delimiter=delimiter)
+            
+            for row_idx, row in enumerate(reader, 1):
+                if row_idx > start_after:
+                    yield row_idx, row
+    
+    def _process_row_safely(self, row: Dict[str, str], file_name: str, row_idx: int) -> Optional[JiraTicketChunks]:
+        """행 하나를 처리하고, 청크가 없거나 오류가 나면 None 반환"""
+        try:
+            # 각 행(티켓)을 전문화된 청크들로 변환
+            ticket_chunks = self._process_ticket_row(row, file_name, row_idx)
+            if ticket_chunks and ticket_chunks.get_total_chunks() > 0:
+                logger.info(f"티켓 {ticket_chunks.ticket_id} 처리 완료: {ticket_chunks.get_total_chunks()}개 청크")
+                return ticket_chunks
+        except Exception as e:
+            logger.error(f"행 {row_idx} 처리 오류: {e}")
+        return None
+    
+    def process_csv_file_to_jsonl(self, csv_file_path: str, output_file: str,
+                                  batch_size: Optional[int] = None,
+                                  max_workers: Optional[int] = None,
+                                  resume: bool = True) -> Dict[str, Any]:
+        """
+        대용량 Jira CSV를 스트리밍으로 읽어 행 배치를 프로세스 풀에 분산 처리하고,
+        티켓별 청크를 JSONL로 순서대로 증분 저장 (체크포인트 기반 재개)
+        
+        각 JSONL 줄은 save_chunks_to_json의 "tickets" 항목과 같은 형식이다.
+        배치를 쓸 때마다 "<output_file>.checkpoint"에 마지막 완료 행 번호와
+        JSONL 바이트 오프셋을 기록하므로, 중단 후 다시 실행하면 그 다음 행부터 이어서 처리한다.
+        
+        Args:
+            csv_file_path: Jira CSV 파일 경로
+            output_file: JSONL 출력 경로
+            batch_size: 워커에 넘길 행 배치 크기 (기본: JIRA_CHUNK_BATCH_SIZE)
+            max_workers: 프로세스 풀 크기 (기본: JIRA_CHUNK_WORKERS, 1이면 순차 처리)
+            resume: 체크포인트가 있으면 이어서 처리 (False면 처음부터)
+            
+        Returns:
+            {total_tickets, total_chunks, last_row, resumed_from, completed}
+        """
+        if not os.path.exists(csv_file_path):
+            raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {csv_file_path}")
+        
+        batch_size = batch_size or JIRA_CHUNK_BATCH_SIZE
+        max_workers = max_workers or JIRA_CHUNK_WORKERS
+        checkpoint_file = f"{output_file}.checkpoint"
+        source = self._csv_fingerprint(csv_file_path)
+        
+        state = self._load_checkpoint(checkpoint_file, source, output_file) if resume else None
+        if state is None:
+            state = {"version": CHECKPOINT_VERSION, "source": source, "last_row": 0,
+                     "output_bytes": 0, "total_tickets": 0, "total_chunks": 0, "completed": False}
+        else:
+            logger.info(f"🔁 체크포인트에서 재개: 행 {state['last_row']} 이후부터 ({state['total_tickets']}개 티켓 처리됨)")
+        resumed_from = state["last_row"]
+        
+        logger.info(f"Jira CSV 스트리밍 처리 시작: {csv_file_path} (배치 {batch_size}행, 워커 {max_workers}개)")
+        
+        # 체크포인트 이후에 쓰다 만 내용은 잘라내고 이어서 기록
+        with open(output_file, 'r+b' if os.path.exists(output_file) else 'wb') as out:
+            out.truncate(state["output_bytes"])
+            out.seek(state["output_bytes"])
+            
+            batches = self._iter_row_batches(csv_file_path, batch_size, state["last_row"])
+            for last_row, tickets in self._map_row_batches(batches, csv_file_path, max_workers):
+                for ticket in tickets:
+                    out.write((json.dumps(ticket, ensure_ascii=False) + "\n").encode('utf-8'))
+                    state["total_tickets"] += 1
+                    state["total_chunks"] += ticket["total_chunks"]
+                out.flush()
+                os.fsync(out.fileno())
+                
+                state["last_row"] = last_row
+                state["output_bytes"] = out.tell()
+                self._save_checkpoint(checkpoint_file, state)
+        
+        state["completed"] = True
+        self._save_checkpoint(checkpoint_file, state)
+        
+        logger.info(f"CSV 스트리밍 처리 완료: {state['total_tickets']}개 티켓, 총 {state['total_chunks']}개 청크 → {output_file}")
+        return {
+            "total_tickets": state["total_tickets"],
+            "total_chunks": state["total_chunks"],
+            "last_row": state["last_row"],
+            "resumed_from": resumed_from,
+            "completed": True
+        }
+    
+    def _iter_row_batches(self, csv_file_path: str, batch_size: int,
+                          start_after: int) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+        """(행 번호, 행) 목록을 batch_size 단위로 묶어 반환"""
+        batch = []
+        for row_idx, row in self._iter_csv_rows(csv_file_path, start_after):
+            batch.append((row_idx, row))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _map_row_batches(self, batches: Iterator[List[Tuple[int, Dict[str, str]]]], file_name: str,
+                         max_workers: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        행 배치를 처리하여 입력 순서대로 (배치 마지막 행 번호, 티켓 dict 목록) 반환
+        
+        프로세스 풀 사용 시 동시에 제출하는 배치 수를 워커 수의 2배로 제한하여
+        CSV 전체가 메모리에 쌓이지 않도록 한다.
+        """
+        if max_workers <= 1:
+            for batch in batches:
+                yield batch[-1][0], self._process_rows(batch, file_name)
+            return
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for batch in batches:
+                future = executor.submit(_process_row_batch, file_name, self.enable_text_cleaning, batch)
+                pending.append((batch[-1][0], future))
+                if len(pending) >= max_workers * 2:
+                    last_row, future = pending.popleft()
+                    yield last_row, future.result()
+            while pending:
+                last_row, future = pending.popleft()
+                yield last_row, future.result()
+    
+    def _process_rows(self, rows: List[Tuple[int, Dict[str, str]]], file_name: str) -> List[Dict[str, Any]]:
+        """행 배치를 티켓 dict 목록으로 변환 (처리 실패/빈 행은 제외)"""
+        tickets = []
+        for row_idx, row in rows:
+            ticket_chunks = self._process_row_safely(row, file_name, row_idx)
+            if ticket_chunks:
+                tickets.append(ticket_chunks_to_dict(ticket_chunks))
+        return tickets
+    
+    @staticmethod
+    def _csv_fingerprint(csv_file_path: str) -> Dict[str, Any]:
+        """체크포인트가 같은 CSV에 대한 것인지 확인하기 위한 파일 정보"""
+        stat = os.stat(csv_file_path)
+        return {"path": os.path.abspath(csv_file_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    
+    @staticmethod
+    def _load_checkpoint(checkpoint_file: str, source: Dict[str, Any], output_file: str) -> Optional[Dict[str, Any]]:
+        """유효한 체크포인트 로드 (없거나, CSV가 바뀌었거나, 출력이 잘렸으면 None)"""
+        if not os.path.exists(checkpoint_file):
+            return None
+        try:
+            with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ 체크포인트 로드 실패, 처음부터 처리: {e}")
+            return None
+        
+        if state.get("version") != CHECKPOINT_VERSION or state.get("source") != source:
+            logger.warning("⚠️ CSV 파일이 변경되어 체크포인트를 무시하고 처음부터 처리합니다.")
+            return None
+        output_size = os.path.getsize(output_file) if os.path.exists(output_file) else 0
+        if output_size < state.get("output_bytes", 0):
+            logger.warning("⚠️ 출력 파일이 체크포인트보다 짧아 처음부터 처리합니다.")
+            return None
+        return state
+    
+    @staticmethod
+    def _save_checkpoint(checkpoint_file: str, state: Dict[str, Any]):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_file = f"{checkpoint_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_file, checkpoint_file)
+    
     def _process_ticket_row(self, row: Dict[str, str], file_name: str, row_idx: int) -> Optional[JiraTicketChunks]:
         """
         하나의 티켓 행을 전문화된 청크들로 변환
@@ -535,12 +710,7 @@ class JiraChunkProcessor:
         }
         
         for ticket_chunks in ticket_chunks_list:
-            ticket_data = {
-                "ticket_id": ticket_chunks.ticket_id,
-                "total_chunks": ticket_chunks.get_total_chunks(),
-                "chunks": ticket_chunks.to_vector_db_list()
-            }
-            output_data["tickets"].append(ticket_data)
+            output_data["tickets"].append(ticket_chunks_to_dict(ticket_chunks))
         
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(output_data, f, ensure_ascii=False, indent=2)
@@ -548,6 +718,27 @@ class JiraChunkProcessor:
         logger.info(f"JSON 파일 저장 완료: {output_file}")
 
 
+def ticket_chunks_to_dict(ticket_chunks: JiraTicketChunks) -> Dict[str, Any]:
+    """티켓 청크를 JSON 저장 형식으로 변환 (JSON/JSONL 출력 공통)"""
+    return {
+        "ticket_id": ticket_chunks.ticket_id,
+        "total_chunks": ticket_chunks.get_total_chunks(),
+        "chunks": ticket_chunks.to_vector_db_list()
+    }
+
+
+_worker_processor: Optional[JiraChunkProcessor] = None
+
+
+def _process_row_batch(file_name: str, enable_text_cleaning: bool,
+                       rows: List[Tuple[int, Dict[str, str]]]) -> List[Dict[str, Any]]:
+    """프로세스 풀 워커: 행 배치를 티켓 dict 목록으로 변환 (프로세서는 워커당 1회 생성)"""
+    global _worker_processor
+    if _worker_processor is None or _worker_processor.enable_text_cleaning != enable_text_cleaning:
+        _worker_processor = JiraChunkProcessor(enable_text_cleaning=enable_text_cleaning)
+    return _worker_processor._process_rows(rows, file_name)
+
+
 def main():
     """테스트용 메인 함수"""
     # 샘플 CSV 파일로 테스트
@@ -8,10 +8,20 @@ mem0 라이브러리를 사용하여 AI 에이전트의 메모리 시스템을 
 
 import os
 import json
+import uuid
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
+import numpy as np
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -22,20 +32,396 @@ except ImportError:
     MEM0_AVAILABLE = False
     print("⚠️ mem0 라이브러리가 설치되지 않았습니다. pip install mem0ai 명령으로 설치해주세요.")
 
+@contextmanager
+def _exclusive_file_lock(lock_path: str, thread_lock):
+    """스레드 잠금 + lock 파일 flock (프로세스 간 쓰기 직렬화)"""
+    with thread_lock:
+        with open(lock_path, "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class UserMemoryLog:
+    """
+    사용자별 append-only 메모리 로그 (JSONL)
+
+    - 추가/삭제를 `{"op": "add"|"delete", ...}` 레코드로 파일 끝에 기록 (쓰기당 O(1))
+    - 메모리는 id → memory 인메모리 인덱스로 유지하고, 다른 프로세스가 추가한 레코드는
+      마지막으로 읽은 오프셋 이후만 읽어 반영
+    - 쓰기는 `.lock` 파일에 대한 flock으로 프로세스 간 직렬화
+    - 삭제 레코드가 쌓이면 살아있는 메모리만 남기도록 compaction
+    - 기존 `{user}.json` 배열 파일은 최초 로드 시 JSONL로 변환
+    """
+
+    # 전체 레코드 중 불필요한(삭제/삭제된) 레코드 비율이 이 값을 넘으면 compaction
+    COMPACT_RATIO = 0.5
+    COMPACT_MIN_RECORDS = 1000
+
+    def __init__(self, storage_dir: str, user_id: str):
+        safe_user = (user_id or "default_user").replace("/", "_")
+        self.log_path = os.path.join(storage_dir, f"{safe_user}.jsonl")
+        self.lock_path = os.path.join(storage_dir, f"{safe_user}.lock")
+        self.legacy_path = os.path.join(storage_dir, f"{safe_user}.json")
+        self._memories: "OrderedDict[str, dict]" = OrderedDict()
+        self._record_count = 0
+        self._offset = 0
+        self._inode = None
+        self._thread_lock = threading.RLock()
+        with self._locked():
+            self._migrate_legacy_file()
+            self._reload()
+
+    def _locked(self):
+        """스레드 + 프로세스 간 쓰기 잠금"""
+        return _exclusive_file_lock(self.lock_path, self._thread_lock)
+
+    def _migrate_legacy_file(self):
+        if os.path.exists(self.log_path) or not os.path.exists(self.legacy_path):
+            return
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, list):
+                return
+            self._write_compacted(data)
+            os.replace(self.legacy_path, self.legacy_path + ".migrated")
+            print(f"✅ 메모리 파일 JSONL 변환 완료: {self.log_path} ({len(data)}개)")
+        except Exception as e:
+            print(f"⚠️ 기존 메모리 파일 변환 실패: {e}")
+
+    def _apply(self, record: dict):
+        self._record_count += 1
+        if record.get("op") == "delete":
+            self._memories.pop(record.get("id"), None)
+        elif record.get("op") == "add" and record.get("memory"):
+            memory = record["memory"]
+            self._memories[memory["id"]] = memory
+
+    def _read_from(self, offset: int) -> int:
+        """offset 이후에 추가된 레코드를 읽어 반영하고 새 offset 반환"""
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                # 기록 중인 마지막 줄(개행 없음)은 다음 읽기에서 처리
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                try:
+                    self._apply(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return offset
+
+    def _reload(self):
+        self._memories = OrderedDict()
+        self._record_count = 0
+        self._offset = 0
+        self._inode = None
+        if os.path.exists(self.log_path):
+            self._inode = os.stat(self.log_path).st_ino
+            self._offset = self._read_from(0)
+
+    def refresh(self):
+        """다른 프로세스가 기록한 레코드 반영 (변경 없으면 stat 1회)"""
+        with self._thread_lock:
+            try:
+                stat = os.stat(self.log_path)
+            except FileNotFoundError:
+                return
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                # 다른 프로세스가 compaction한 경우 전체 재로딩
+                self._reload()
+            elif stat.st_size > self._offset:
+                self._offset = self._read_from(self._offset)
+
+    def _append(self, records: List[dict]):
+        with self._locked():
+            self.refresh()
+            data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if self._inode is None:
+                self._inode = os.stat(self.log_path).st_ino
+            self._offset += len(data.encode("utf-8"))
+            for record in records:
+                self._apply(record)
+            if self._needs_compaction():
+                self._compact_locked()
+
+    def add(self, memory: dict):
+        """메모리 추가 레코드 기록"""
+        self._append([{"op": "add", "memory": memory}])
+
+    def delete(self, memory_id: str) -> bool:
+        """메모리 삭제 레코드 기록"""
+        self.refresh()
+        if memory_id not in self._memories:
+            return False
+        self._append([{"op": "delete", "id": memory_id}])
+        return True
+
+    def get(self, memory_id: str) -> Optional[dict]:
+        self.refresh()
+        return self._memories.get(memory_id)
+
+    def all_memories(self) -> List[dict]:
+        """살아있는 메모리 목록 (추가 순)"""
+        self.refresh()
+        return list(self._memories.values())
+
+    def __len__(self):
+        self.refresh()
+        return len(self._memories)
+
+    def _needs_compaction(self) -> bool:
+        dead = self._record_count - len(self._memories)
+        return self._record_count >= self.COMPACT_MIN_RECORDS and dead > self._record_count * self.COMPACT_RATIO
+
+    def compact(self):
+        """살아있는 메모리만 남기도록 로그 재작성"""
+        with self._locked():
+            self.refresh()
+            self._compact_locked()
+
+    def _compact_locked(self):
+        self._write_compacted(list(self._memories.values()))
+        self._reload()
+
+    def _write_compacted(self, memories: List[dict]):
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for memory in memories:
+                f.write(json.dumps({"op": "add", "memory": memory}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.log_path)
+
+
+class UserMemoryVectorIndex:
+    """
+    사용자별 메모리 임베딩 인덱스
+
+    - 벡터는 정규화된 float32로 `{user}.vec`에, ID는 `{user}.ids`에 append-only로 저장
+    - 쓰기는 `{user}.index.lock` flock으로 프로세스 간 직렬화 (ID와 벡터 행 순서 일치 보장)
+    - 다른 프로세스의 추가/compaction은 파일 크기/inode 변화로 감지하여 다시 로드
+    - 삭제된 메모리의 벡터가 쌓이면 살아있는 ID만 남기도록 compaction
+    - 검색은 NumPy 내적(코사인 유사도) 기반 exact top-k
+    """
+
+    # 삭제된 벡터 비율이 이 값을 넘으면 compaction
+    COMPACT_RATIO = 0.5
+    COMPACT_MIN_VECTORS = 100
+
+    def __init__(self, index_dir: str, user_id: str):
+        safe_user = (user_id or "default_user").replace("/", "_")
+        self.vector_path = os.path.join(index_dir, f"{safe_user}.vec")
+        self.ids_path = os.path.join(index_dir, f"{safe_user}.ids")
+        self.meta_path = os.path.join(index_dir, f"{safe_user}.meta.json")
+        self.lock_path = os.path.join(index_dir, f"{safe_user}.index.lock")
+        self.ids: List[str] = []
+        self.id_set = set()
+        self.dim: Optional[int] = None
+        self._chunks: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._vector_inode = None
+        self._thread_lock = threading.RLock()
+        with self._locked():
+            self._load()
+
+    def _locked(self):
+        return _exclusive_file_lock(self.lock_path, self._thread_lock)
+
+    def _load(self):
+        """파일에서 인덱스 로드 (잠금 상태에서 호출)"""
+        self.ids, self.id_set, self._chunks, self._matrix = [], set(), [], None
+        self._vector_inode = None
+        if not (os.path.exists(self.meta_path) and os.path.exists(self.ids_path)):
+            return
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                dim = json.load(f)["dim"]
+            with open(self.ids_path, "r", encoding="utf-8") as f:
+                ids = [line.strip() for line in f if line.strip()]
+            flat = np.fromfile(self.vector_path, dtype=np.float32) if os.path.exists(self.vector_path) else np.empty(0, dtype=np.float32)
+            # 기록 도중 중단된 경우를 대비해 ID/벡터 중 짧은 쪽에 맞춤
+            count = min(len(ids), flat.size // dim)
+            if count != len(ids) or flat.size != count * dim:
+                with open(self.ids_path, "w", encoding="utf-8") as f:
+                    f.write("".join(f"{memory_id}\n" for memory_id in ids[:count]))
+                flat[:count * dim].tofile(self.vector_path)
+            self.dim = dim
+            self.ids = ids[:count]
+            self.id_set = set(self.ids)
+            self._matrix = flat[:count * dim].reshape(count, dim)
+            self._chunks = [self._matrix]
+            if os.path.exists(self.vector_path):
+                self._vector_inode = os.stat(self.vector_path).st_ino
+        except Exception as e:
+            print(f"⚠️ 메모리 인덱스 로드 실패 (재구축 예정): {e}")
+            self.ids, self.id_set, self._chunks, self._matrix = [], set(), [], None
+
+    def _is_stale(self) -> bool:
+        """다른 프로세스가 벡터를 추가했거나 compaction했는지 (stat 1회)"""
+        try:
+            stat = os.stat(self.vector_path)
+        except FileNotFoundError:
+            return bool(self.ids)
+        expected_size = len(self.ids) * (self.dim or 0) * 4
+        return stat.st_ino != self._vector_inode or stat.st_size != expected_size
+
+    def refresh(self):
+        """다른 프로세스의 변경 반영"""
+        with self._locked():
+            if self._is_stale():
+                self._load()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def missing(self, memory_ids: List[str]) -> List[str]:
+        """인덱스에 아직 없는 메모리 ID 목록"""
+        return [memory_id for memory_id in memory_ids if memory_id not in self.id_set]
+
+    def append(self, memory_ids: List[str], vectors: np.ndarray):
+        """벡터 추가 (정규화 후 잠금 상태에서 파일 끝에 append, 이미 있는 ID는 건너뜀)"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(memory_ids), -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1.0, norms)
+
+        with self._locked():
+            if self._is_stale():
+                self._load()
+            if self.dim is not None and vectors.shape[1] != self.dim:
+                print(f"⚠️ 임베딩 차원 불일치 ({vectors.shape[1]} != {self.dim}), 추가 건너뜀")
+                return
+            # 다른 프로세스가 먼저 같은 메모리를 추가했을 수 있음
+            keep = [i for i, memory_id in enumerate(memory_ids) if memory_id not in self.id_set]
+            if not keep:
+                return
+            memory_ids = [memory_ids[i] for i in keep]
+            vectors = vectors[keep]
+
+            if self.dim is None:
+                with open(self.meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"dim": int(vectors.shape[1])}, f)
+            with open(self.vector_path, "ab") as f:
+                f.write(vectors.tobytes())
+            with open(self.ids_path, "a", encoding="utf-8") as f:
+                f.write("".join(f"{memory_id}\n" for memory_id in memory_ids))
+
+            self.dim = vectors.shape[1]
+            self.ids.extend(memory_ids)
+            self.id_set.update(memory_ids)
+            self._chunks.append(vectors)
+            self._matrix = None
+            self._vector_inode = os.stat(self.vector_path).st_ino
+
+    def needs_compaction(self, live_count: int) -> bool:
+        dead = len(self.ids) - live_count
+        return len(self.ids) >= self.COMPACT_MIN_VECTORS and dead > len(self.ids) * self.COMPACT_RATIO
+
+    def compact(self, live_ids) -> int:
+        """
+        살아있는 메모리의 벡터만 남기도록 인덱스 파일 재작성
+
+        Args:
+            live_ids: 살아있는 메모리 ID 집합
+
+        Returns:
+            제거된 벡터 수
+        """
+        live_ids = set(live_ids)
+        with self._locked():
+            if self._is_stale():
+                self._load()
+            if not self.ids:
+                return 0
+            if self._matrix is None:
+                self._matrix = np.vstack(self._chunks)
+            keep = [i for i, memory_id in enumerate(self.ids) if memory_id in live_ids]
+            removed = len(self.ids) - len(keep)
+            if removed == 0:
+                return 0
+
+            # 벡터 → ID 순으로 교체 (중간에 중단되면 로드 시 짧은 쪽에 맞춰 복구)
+            for path, write in (
+                (self.vector_path, lambda f: f.write(self._matrix[keep].tobytes())),
+                (self.ids_path, lambda f: f.write("".join(f"{self.ids[i]}\n" for i in keep).encode("utf-8"))),
+            ):
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    write(f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            self._load()
+            return removed
+
+    def search(self, query_vector: np.ndarray, k: int) -> List[tuple]:
+        """
+        코사인 유사도 top-k 검색
+
+        Returns:
+            [(memory_id, score), ...] 점수 내림차순
+        """
+        if not self.ids:
+            return []
+        if self._matrix is None:
+            self._matrix = np.vstack(self._chunks)
+            self._chunks = [self._matrix]
+
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if norm == 0 or query.shape[0] != self.dim:
+            return []
+        scores = self._matrix @ (query / norm)
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i])) for i in top]
+
+
 class AzureOpenAIMemory:
     """Azure OpenAI를 사용하는 커스텀 메모리 클래스"""
-    
-    def __init__(self):
-        self.memories = []
-        self.storage_dir = os.path.join("./vector_db", "mem0_fallback")
-        self.memory_id_counter = 1
+
+    # LLM 재정렬 시 LLM에 전달할 최대 후보 수
+    RERANK_CANDIDATES = 10
+
+    def __init__(self, storage_dir: Optional[str] = None,
+                 embed_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
+                 llm_rerank: Optional[bool] = None):
+        """
+        Args:
+            storage_dir: 사용자별 메모리 저장 디렉토리 (기본: ./vector_db/mem0_fallback)
+            embed_fn: 텍스트 목록 → 임베딩 목록 함수 (None이면 Azure OpenAI 임베딩 사용)
+            llm_rerank: 벡터 검색 상위 후보를 LLM으로 재정렬할지 여부 (기본: MEM0_LLM_RERANK 환경변수)
+        """
+        self.storage_dir = storage_dir or os.path.join("./vector_db", "mem0_fallback")
+        self.index_dir = os.path.join(self.storage_dir, "index")
         self.azure_client = None
-        self._initialize_azure_client()
+        self.embed_fn = embed_fn
+        self.embedding_deployment = os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME", "text-embedding-ada-002")
+        if llm_rerank is None:
+            llm_rerank = os.getenv("MEM0_LLM_RERANK", "false").lower() == "true"
+        self.llm_rerank = llm_rerank
+        # 사용자별 메모리/인덱스 캐시 (검색마다 디스크를 다시 읽지 않도록)
+        self._stores: Dict[str, UserMemoryLog] = {}
+        self._indexes: Dict[str, UserMemoryVectorIndex] = {}
+        if embed_fn is None:
+            self._initialize_azure_client()
         self._ensure_storage_dir()
     
     def _ensure_storage_dir(self):
         try:
-            os.makedirs(self.storage_dir, exist_ok=True)
+            os.makedirs(self.index_dir, exist_ok=True)
         except Exception:
             pass
     
@@ -54,34 +440,51 @@ class AzureOpenAIMemory:
             print(f"⚠️ Azure OpenAI 클라이언트 초기화 실패: {e}")
             self.azure_client = None
     
-    def _storage_path(self, user_id: str) -> str:
-        safe_user = (user_id or "default_user").replace("/", "_")
-        return os.path.join(self.storage_dir, f"{safe_user}.json")
+    def _get_store(self, user_id: str) -> UserMemoryLog:
+        """사용자 메모리 로그 (최초 1회만 파일 전체를 읽고 이후에는 추가분만 반영)"""
+        key = user_id or "default_user"
+        if key not in self._stores:
+            self._stores[key] = UserMemoryLog(self.storage_dir, key)
+        return self._stores[key]
 
-    def _load_user_memories(self, user_id: str):
-        path = self._storage_path(user_id)
-        if os.path.exists(path):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        return data
-            except Exception:
-                return []
-        return []
+    def _get_index(self, user_id: str) -> UserMemoryVectorIndex:
+        key = user_id or "default_user"
+        if key not in self._indexes:
+            self._indexes[key] = UserMemoryVectorIndex(self.index_dir, key)
+        return self._indexes[key]
 
-    def _save_user_memories(self, user_id: str, memories: list):
-        path = self._storage_path(user_id)
+    def _can_embed(self) -> bool:
+        return self.embed_fn is not None or self.azure_client is not None
+
+    def _embed(self, texts: List[str]) -> Optional[np.ndarray]:
+        """텍스트 목록 임베딩 (실패 시 None)"""
+        if not texts:
+            return None
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(memories, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+            if self.embed_fn is not None:
+                vectors = self.embed_fn(texts)
+            else:
+                response = self.azure_client.embeddings.create(
+                    model=self.embedding_deployment,
+                    input=texts
+                )
+                vectors = [item.embedding for item in response.data]
+            return np.asarray(vectors, dtype=np.float32)
+        except Exception as e:
+            print(f"⚠️ 메모리 임베딩 실패: {e}")
+            return None
+
+    def _index_memories(self, user_id: str, memories: list):
+        """메모리를 임베딩하여 사용자 인덱스에 추가"""
+        if not memories or not self._can_embed():
+            return
+        vectors = self._embed([mem["memory"] for mem in memories])
+        if vectors is not None:
+            self._get_index(user_id).append([mem["id"] for mem in memories], vectors)
 
     def add(self, messages, user_id=None, metadata=None):
         """메모리 추가"""
-        memory_id = f"azure_{self.memory_id_counter}"
-        self.memory_id_counter += 1
+        memory_id = f"azure_{uuid.uuid4().hex[:12]}"
         
         # 메모리 저장
         memory_data = {
@@ -91,36 +494,70 @@ class AzureOpenAIMemory:
             "user_id": user_id,
             "created_at": datetime.now().isoformat()
         }
-        # 인메모리 보관
-        self.memories.append(memory_data)
-        # 사용자별 파일에 영속화
-        user_memories = self._load_user_memories(user_id)
-        user_memories.append(memory_data)
-        self._save_user_memories(user_id, user_memories)
+        # 사용자별 로그 파일에 append (인메모리 사본은 UserMemoryLog가 관리)
+        self._get_store(user_id).add(memory_data)
+        # 벡터 인덱스에 증분 추가 (실패 시 다음 검색에서 보충)
+        self._index_memories(user_id, [memory_data])
         
         return {"id": memory_id}
     
     def search(self, query, user_id=None, limit=5):
-        """Azure OpenAI를 사용한 의미적 검색"""
-        if not self.azure_client:
+        """임베딩 인덱스 기반 의미적 검색 (선택적으로 상위 후보만 LLM 재정렬)"""
+        if not self._can_embed():
             return self._fallback_search(query, user_id, limit)
         
         try:
-            # 사용자별 필터링된 메모리 가져오기
-            filtered_memories = [
-                mem for mem in self.memories 
-                if user_id is None or mem['user_id'] == user_id
-            ]
-            
-            if not filtered_memories:
+            user_memories = self._get_store(user_id).all_memories()
+            if not user_memories:
                 return []
+            memories_by_id = {mem["id"]: mem for mem in user_memories}
+
+            # 인덱스에 없는 메모리 보충 (이전 버전 데이터, 임베딩 실패분)
+            index = self._get_index(user_id)
+            index.refresh()
+            missing_ids = set(index.missing(list(memories_by_id.keys())))
+            if missing_ids:
+                self._index_memories(user_id, [mem for mem in user_memories if mem["id"] in missing_ids])
+
+            query_vector = self._embed([query])
+            if query_vector is None:
+                return self._fallback_search(query, user_id, limit)
+
+            use_rerank = self.llm_rerank and self.azure_client is not None
+            candidate_count = max(limit, self.RERANK_CANDIDATES) if use_rerank else limit
+            # 삭제된 메모리가 인덱스에 남아 있을 수 있으므로 여유분 조회 후 필터링
+            hits = index.search(query_vector[0], candidate_count + max(0, len(index) - len(memories_by_id)))
+
+            candidates = []
+            for memory_id, score in hits:
+                mem = memories_by_id.get(memory_id)
+                if mem is None:
+                    continue
+                candidates.append({
+                    "memory": mem["memory"],
+                    "score": score,
+                    "metadata": mem["metadata"],
+                    "id": mem["id"]
+                })
+                if len(candidates) >= candidate_count:
+                    break
+
+            if use_rerank and len(candidates) > 1:
+                return self._llm_rerank(query, candidates, limit)
+            return candidates[:limit]
             
-            # Azure OpenAI를 사용한 의미적 검색
-            memories_text = "\n".join([
-                f"- ID: {mem['id']}, 내용: {mem['memory']}, 메타데이터: {mem['metadata']}"
-                for mem in filtered_memories
-            ])
-            
+        except Exception as e:
+            print(f"⚠️ 임베딩 검색 실패: {e}")
+            return self._fallback_search(query, user_id, limit)
+
+    def _llm_rerank(self, query, candidates, limit=5):
+        """벡터 검색 상위 후보만 Azure OpenAI로 재정렬"""
+        memories_text = "\n".join([
+            f"- ID: {mem['id']}, 내용: {mem['memory']}, 메타데이터: {mem['metadata']}"
+            for mem in candidates
+        ])
+
+        try:
             response = self.azure_client.chat.completions.create(
                 model=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
                 messages=[
@@ -143,56 +580,33 @@ class AzureOpenAIMemory:
                 temperature=0.1,
                 max_tokens=500
             )
-            
+
             # JSON 응답 파싱
             content = response.choices[0].message.content
-            print(f"🔍 Azure OpenAI 검색 응답: {content[:200]}...")
-            
-            import json
-            try:
-                llm_result = json.loads(content)
-                results = []
-                
-                for item in llm_result.get("results", []):
-                    memory_id = item.get("id")
-                    score = item.get("score", 0.0)
-                    
-                    # 메모리 ID로 실제 메모리 찾기
-                    for mem in filtered_memories:
-                        if mem["id"] == memory_id:
-                            results.append({
-                                "memory": mem["memory"],
-                                "score": score,
-                                "metadata": mem["metadata"],
-                                "id": mem["id"]
-                            })
-                            break
-                
-                # 점수순으로 정렬하고 limit만큼 반환
-                results.sort(key=lambda x: x["score"], reverse=True)
-                return results[:limit]
-                
-            except json.JSONDecodeError:
-                print("⚠️ Azure OpenAI 응답 JSON 파싱 실패, 폴백 검색 사용")
-                return self._fallback_search(query, user_id, limit)
-            
+            print(f"🔍 Azure OpenAI 재정렬 응답: {content[:200]}...")
+
+            llm_result = json.loads(content)
+            candidates_by_id = {mem["id"]: mem for mem in candidates}
+            results = []
+            for item in llm_result.get("results", []):
+                mem = candidates_by_id.get(item.get("id"))
+                if mem:
+                    results.append({**mem, "score": item.get("score", 0.0)})
+
+            # 점수순으로 정렬하고 limit만큼 반환
+            results.sort(key=lambda x: x["score"], reverse=True)
+            return results[:limit] if results else candidates[:limit]
+
         except Exception as e:
-            print(f"⚠️ Azure OpenAI 검색 실패: {e}")
-            return self._fallback_search(query, user_id, limit)
+            print(f"⚠️ Azure OpenAI 재정렬 실패, 벡터 검색 순서 사용: {e}")
+            return candidates[:limit]
     
     def _fallback_search(self, query, user_id=None, limit=5):
         """폴백 검색 (키워드 기반)"""
         results = []
         query_lower = query.lower()
-        
-        # 디스크 + 인메모리 병합 후 검색
-        combined = []
-        # 파일에서 불러오기
-        combined.extend(self._load_user_memories(user_id))
-        # 인메모리 추가
-        combined.extend([m for m in self.memories if (user_id is None or m["user_id"] == user_id)])
-
-        for memory in combined:
+
+        for memory in self._get_store(user_id).all_memories():
             if user_id is None or memory["user_id"] == user_id:
                 memory_text = memory["memory"].lower()
                 # 간단한 키워드 매칭으로 점수 계산
@@ -216,17 +630,7 @@ class AzureOpenAIMemory:
     def get_all(self, user_id=None, limit=100):
         """모든 메모리 조회"""
         filtered_memories = []
-        # 파일에서 불러오기
-        for memory in self._load_user_memories(user_id):
-            if user_id is None or memory["user_id"] == user_id:
-                filtered_memories.append({
-                    "memory": memory["memory"],
-                    "metadata": memory["metadata"],
-                    "id": memory["id"],
-                    "created_at": memory["created_at"]
-                })
-        # 인메모리 포함
-        for memory in self.memories:
+        for memory in self._get_store(user_id).all_memories():
             if user_id is None or memory["user_id"] == user_id:
                 filtered_memories.append({
                     "memory": memory["memory"],
@@ -238,18 +642,23 @@ class AzureOpenAIMemory:
         return {"results": filtered_memories[:limit]}
     
     def delete(self, memory_id, user_id=None):
-        """메모리 삭제"""
-        for i, memory in enumerate(self.memories):
-            if memory["id"] == memory_id and (memory["user_id"] == user_id or user_id is None):
-                del self.memories[i]
-                return {"success": True}
-        return {"success": False}
+        """메모리 삭제 (인덱스 벡터는 검색 시 제외하고, 삭제분이 쌓이면 compaction)"""
+        store = self._get_store(user_id)
+        if not store.delete(memory_id):
+            return {"success": False}
+
+        index = self._get_index(user_id)
+        live_count = len(store)
+        if index.needs_compaction(live_count):
+            removed = index.compact(mem["id"] for mem in store.all_memories())
+            print(f"🧹 메모리 인덱스 compaction: 벡터 {removed}개 제거")
+        return {"success": True}
 
 class DummyMemory:
-    """테스트용 더미 메모리 클래스"""
+    """테스트용 더미 메모리 클래스 (최근 max_memories개만 보관)"""
     
-    def __init__(self):
-        self.memories = []
+    def __init__(self, max_memories: int = 1000):
+        self.memories = deque(maxlen=max_memories)
         self.memory_id_counter = 1
     
     def add(self, messages, user_id=None, metadata=None):
@@ -12,20 +12,31 @@ import pandas as pd
 
 from module.image_to_text import AzureOpenAIImageProcessor
 from module.types import DocumentType, ContentType, ElementType, ClassificationResult
-from module.page_analyzer import PageContentAnalyzer
+from module.page_analyzer import PageContentAnalyzer, DOCX_PARAGRAPHS_PER_PAGE
 from module.file_processor import DocumentElement, ProcessedPage, TextBasedProcessor, LayoutBasedProcessor
 
 
 class AdaptiveFileProcessor:
     """페이지별로 최적의 처리 방식을 선택하는 적응형 파일 프로세서"""
     
-    def __init__(self, azure_processor: AzureOpenAIImageProcessor):
+    def __init__(self, azure_processor: AzureOpenAIImageProcessor, analysis_workers: Optional[int] = None):
+        """
+        Args:
+            azure_processor: GPT Vision 처리기
+            analysis_workers: PDF 페이지 분석 프로세스 수 (기본: PAGE_ANALYSIS_WORKERS 환경변수)
+        """
         self.azure_processor = azure_processor
+        self.analysis_workers = analysis_workers
         self.page_analyzer = PageContentAnalyzer()
         self.text_processor = TextBasedProcessor(azure_processor)
         self.layout_processor = LayoutBasedProcessor(azure_processor)
         self.temp_storage = {}
         
+        # 레이아웃 처리용 PDF 변환 결과 (원본 경로 -> PDF 경로, 변환에 성공한 것만)
+        self._converted_pdfs: Dict[str, str] = {}
+        # 처리 중 만든 임시 PDF 경로 (파일 처리가 끝나면 모두 삭제)
+        self._temp_pdf_paths: List[str] = []
+        
         # 처리 통계
         self.processing_stats = {
             "text_based_pages": 0,
@@ -39,6 +50,8 @@ class AdaptiveFileProcessor:
         try:
             print(f"\n🚀 적응형 처리 시작: {file_path}")
             print(f"📄 파일 타입: {doc_type.value}")
+            self._converted_pdfs = {}
+            self._temp_pdf_paths = []
             
             # 페이지별 처리
             if doc_type == DocumentType.PDF:
@@ -76,18 +89,39 @@ class AdaptiveFileProcessor:
         except Exception as e:
             print(f"❌ 적응형 처리 오류: {e}")
             return {"error": str(e)}
+        
+        finally:
+            self._cleanup_converted_pdfs()
+    
+    def _cleanup_converted_pdfs(self):
+        """처리 중 변환한 임시 PDF 삭제 (문서마다 고유 파일이므로 남기면 temp_pdfs/가 계속 커짐)"""
+        for pdf_path in self._temp_pdf_paths:
+            self._remove_temp_pdf(pdf_path)
+        self._converted_pdfs = {}
+        self._temp_pdf_paths = []
+    
+    @staticmethod
+    def _remove_temp_pdf(pdf_path: str):
+        try:
+            os.remove(pdf_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️ 임시 PDF 삭제 실패: {pdf_path} ({e})")
     
     def _process_pdf_adaptive(self, file_path: str) -> List[ProcessedPage]:
         """PDF를 페이지별 적응형으로 처리"""
         try:
             doc = fitz.open(file_path)
             processed_pages = []
+            total_pages = len(doc)
             
-            for page_num in range(1, len(doc) + 1):
-                print(f"📄 페이지 {page_num}/{len(doc)} 분석 중...")
-                
-                # 페이지별 콘텐츠 분석
-                classification = self.page_analyzer.analyze_pdf_page(file_path, page_num)
+            # 문서를 한 번만 열어 페이지별 콘텐츠 분석
+            analyses = self.page_analyzer.analyze_pdf_document(
+                file_path, doc=doc, max_workers=self.analysis_workers
+            )
+            for page_num, classification in analyses:
+                print(f"📄 페이지 {page_num}/{total_pages} 분석 완료")
                 self._update_stats(page_num, classification)
                 
                 # 분류 결과에 따른 처리
@@ -111,21 +145,21 @@ class AdaptiveFileProcessor:
             doc = Document(file_path)
             processed_pages = []
             
-            # 문단을 페이지로 분할 (대략적)
-            paragraphs_per_page = 12
-            total_paragraphs = len(doc.paragraphs)
-            total_pages = (total_paragraphs + paragraphs_per_page - 1) // paragraphs_per_page
+            # 문단을 페이지로 분할 (대략적), doc.paragraphs는 접근마다 새 리스트를 만들므로 1회만 조회
+            paragraphs_per_page = DOCX_PARAGRAPHS_PER_PAGE
+            paragraphs = doc.paragraphs
+            total_pages = (len(paragraphs) + paragraphs_per_page - 1) // paragraphs_per_page
             
-            for page_num in range(1, total_pages + 1):
-                print(f"📄 페이지 {page_num}/{total_pages} 분석 중...")
-                
-                # 페이지별 콘텐츠 분석
-                classification = self.page_analyzer.analyze_docx_page(file_path, page_num)
+            analyses = self.page_analyzer.analyze_docx_document(
+                file_path, paragraphs=paragraphs, paragraphs_per_page=paragraphs_per_page
+            )
+            for page_num, classification in analyses:
+                print(f"📄 페이지 {page_num}/{total_pages} 분석 완료")
                 self._update_stats(page_num, classification)
                 
                 # 분류 결과에 따른 처리
                 if classification.content_type == ContentType.TEXT_BASED:
-                    page = self._process_docx_page_text_based(doc, page_num, paragraphs_per_page, classification)
+                    page = self._process_docx_page_text_based(paragraphs, page_num, paragraphs_per_page, classification)
                 else:
                     page = self._process_docx_page_layout_based(file_path, page_num, classification)
                 
@@ -143,11 +177,10 @@ class AdaptiveFileProcessor:
             prs = Presentation(file_path)
             processed_pages = []
             
-            for slide_num in range(1, len(prs.slides) + 1):
-                print(f"📊 슬라이드 {slide_num}/{len(prs.slides)} 분석 중...")
-                
-                # 슬라이드별 콘텐츠 분석
-                classification = self.page_analyzer.analyze_pptx_slide(file_path, slide_num)
+            total_slides = len(prs.slides)
+            
+            for slide_num, classification in self.page_analyzer.analyze_pptx_document(file_path, prs=prs):
+                print(f"📊 슬라이드 {slide_num}/{total_slides} 분석 완료")
                 self._update_stats(slide_num, classification)
                 
                 # 분류 결과에 따른 처리
@@ -171,11 +204,10 @@ class AdaptiveFileProcessor:
             wb = load_workbook(file_path, data_only=True)
             processed_pages = []
             
-            for sheet_num in range(1, len(wb.sheetnames) + 1):
-                print(f"📋 시트 {sheet_num}/{len(wb.sheetnames)} 분석 중...")
-                
-                # 시트별 콘텐츠 분석
-                classification = self.page_analyzer.analyze_xlsx_sheet(file_path, sheet_num)
+            total_sheets = len(wb.sheetnames)
+            
+            for sheet_num, classification in self.page_analyzer.analyze_xlsx_document(file_path, wb=wb):
+                print(f"📋 시트 {sheet_num}/{total_sheets} 분석 완료")
                 self._update_stats(sheet_num, classification)
                 
                 # Excel은 대부분 text-based로 처리
@@ -236,7 +268,7 @@ class AdaptiveFileProcessor:
             
             # GPT Vision으로 처리
             try:
-                vision_result = self.azure_processor.process_image_from_bytes(
+                vision_result = self.azure_processor.image_bytes_to_text(
                     img_data, 
                     f"페이지 {page_num}의 모든 텍스트를 추출하고 표나 이미지가 있다면 설명해주세요."
                 )
@@ -283,14 +315,14 @@ class AdaptiveFileProcessor:
             print(f"PDF 페이지 {page_num} 레이아웃 처리 오류: {e}")
             return ProcessedPage(page_num, [], "page", {"error": str(e)})
     
-    def _process_docx_page_text_based(self, doc: Document, page_num: int, paragraphs_per_page: int,
+    def _process_docx_page_text_based(self, paragraphs: List, page_num: int, paragraphs_per_page: int,
                                      classification: ClassificationResult) -> ProcessedPage:
         """DOCX 페이지를 텍스트 기반으로 처리"""
         try:
             start_idx = (page_num - 1) * paragraphs_per_page
-            end_idx = min(start_idx + paragraphs_per_page, len(doc.paragraphs))
+            end_idx = min(start_idx + paragraphs_per_page, len(paragraphs))
             
-            page_paragraphs = doc.paragraphs[start_idx:end_idx]
+            page_paragraphs = paragraphs[start_idx:end_idx]
             text_content = "\n".join([p.text for p in page_paragraphs if p.text.strip()])
             
             elements = [DocumentElement(
@@ -322,14 +354,8 @@ class AdaptiveFileProcessor:
                                        classification: ClassificationResult) -> ProcessedPage:
         """DOCX 페이지를 레이아웃 기반으로 처리 (PDF 변환 후 이미지 처리)"""
         try:
-            # DOCX를 PDF로 변환 후 해당 페이지만 이미지로 처리
-            # 임시 PDF 생성
-            temp_dir = "temp_pdfs"
-            os.makedirs(temp_dir, exist_ok=True)
-            pdf_path = os.path.join(temp_dir, f"temp_docx_page_{page_num}.pdf")
-            
-            # LibreOffice로 변환 (기존 레이아웃 프로세서 활용)
-            self.layout_processor._convert_docx_to_pdf(file_path, pdf_path)
+            # DOCX를 PDF로 변환 후 해당 페이지만 이미지로 처리 (변환은 문서당 1회)
+            pdf_path = self._get_converted_pdf(file_path, self.layout_processor._convert_docx_to_pdf)
             
             # PDF의 해당 페이지를 이미지로 처리
             result_page = self._process_pdf_page_layout_based(pdf_path, page_num, classification)
@@ -343,7 +369,9 @@ class AdaptiveFileProcessor:
         except Exception as e:
             print(f"DOCX 페이지 {page_num} 레이아웃 처리 오류: {e}")
             # 폴백: 텍스트 기반 처리
-            return self._process_docx_page_text_based(Document(file_path), page_num, 12, classification)
+            return self._process_docx_page_text_based(
+                Document(file_path).paragraphs, page_num, DOCX_PARAGRAPHS_PER_PAGE, classification
+            )
     
     def _process_pptx_slide_text_based(self, prs: Presentation, slide_idx: int,
                                       classification: ClassificationResult) -> ProcessedPage:
@@ -384,13 +412,8 @@ class AdaptiveFileProcessor:
                                         classification: ClassificationResult) -> ProcessedPage:
         """PPTX 슬라이드를 레이아웃 기반으로 처리"""
         try:
-            # PPTX를 PDF로 변환 후 해당 슬라이드만 이미지로 처리
-            temp_dir = "temp_pdfs"
-            os.makedirs(temp_dir, exist_ok=True)
-            pdf_path = os.path.join(temp_dir, f"temp_pptx_slide_{slide_num}.pdf")
-            
-            # PPTX를 PDF로 변환
-            self.layout_processor._convert_pptx_to_pdf(file_path, pdf_path)
+            # PPTX를 PDF로 변환 후 해당 슬라이드만 이미지로 처리 (변환은 문서당 1회)
+            pdf_path = self._get_converted_pdf(file_path, self.layout_processor._convert_pptx_to_pdf)
             
             # PDF의 해당 슬라이드를 이미지로 처리
             result_page = self._process_pdf_page_layout_based(pdf_path, slide_num, classification)
@@ -407,6 +430,30 @@ class AdaptiveFileProcessor:
             # 폴백: 텍스트 기반 처리
             return self._process_pptx_slide_text_based(Presentation(file_path), slide_num - 1, classification)
     
+    def _get_converted_pdf(self, file_path: str, convert_fn) -> str:
+        """레이아웃 처리용 PDF 변환 (같은 파일은 처리 중 1회만 변환)"""
+        pdf_path = self._converted_pdfs.get(file_path)
+        if pdf_path and os.path.exists(pdf_path):
+            return pdf_path
+        
+        temp_dir = "temp_pdfs"
+        os.makedirs(temp_dir, exist_ok=True)
+        fd, pdf_path = tempfile.mkstemp(prefix=f"{Path(file_path).stem}_", suffix=".pdf", dir=temp_dir)
+        os.close(fd)
+        # 정리 목록에 먼저 등록 (변환 중 예외가 전파되어도 파일 처리 종료 시 삭제됨)
+        self._temp_pdf_paths.append(pdf_path)
+        
+        try:
+            convert_fn(file_path, pdf_path)
+        except Exception:
+            # 실패한(빈/잘린) PDF는 재사용되지 않도록 바로 삭제하고 캐시하지 않음
+            self._converted_pdfs.pop(file_path, None)
+            self._remove_temp_pdf(pdf_path)
+            raise
+        
+        self._converted_pdfs[file_path] = pdf_path
+        return pdf_path
+    
     def _process_xlsx_sheet_text_based(self, wb, sheet_num: int,
                                       classification: ClassificationResult) -> ProcessedPage:
         """XLSX 시트를 텍스트 기반으로 처리"""
@@ -3,14 +3,13 @@
 """
 
 import os
-import subprocess
-import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 import logging
 
 from module.exceptions import ConversionError
+from module.libreoffice_pool import get_libreoffice_pool, is_soffice_available
 
 logger = logging.getLogger(__name__)
 
@@ -42,26 +41,17 @@ class BaseConverter(ABC):
 
 
 class LibreOfficeConverter(BaseConverter):
-    """LibreOffice를 사용한 파일 변환기"""
+    """LibreOffice를 사용한 파일 변환기 (상주 워커 풀 사용)"""
     
     def __init__(self):
         self.converter_name = "LibreOffice"
     
     def is_available(self) -> bool:
-        """LibreOffice가 설치되어 있는지 확인"""
-        try:
-            result = subprocess.run(
-                ["soffice", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        """LibreOffice가 설치되어 있는지 확인 (결과 캐시)"""
+        return is_soffice_available()
     
     def convert(self, source_path: str, target_path: str) -> bool:
-        """LibreOffice를 사용하여 파일을 변환"""
+        """LibreOffice 워커 풀을 사용하여 파일을 변환"""
         if not self.is_available():
             raise ConversionError(
                 "LibreOffice가 설치되어 있지 않습니다", 
@@ -69,61 +59,7 @@ class LibreOfficeConverter(BaseConverter):
                 Path(target_path).suffix
             )
         
-        try:
-            # LibreOffice 변환 명령 실행
-            cmd = [
-                "soffice", 
-                "--headless", 
-                "--convert-to", 
-                Path(target_path).suffix[1:],  # .pdf -> pdf
-                "--outdir", 
-                os.path.dirname(target_path), 
-                source_path
-            ]
-            
-            logger.info(f"LibreOffice 변환 명령 실행: {' '.join(cmd)}")
-            
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=60
-            )
-            
-            if result.returncode != 0:
-                raise ConversionError(
-                    f"LibreOffice 변환 실패: {result.stderr}", 
-                    source_path, 
-                    Path(target_path).suffix
-                )
-            
-            # 변환된 파일 이름 변경
-            converted_filename = Path(source_path).stem + Path(target_path).suffix
-            converted_path = os.path.join(os.path.dirname(target_path), converted_filename)
-            
-            if os.path.exists(converted_path):
-                os.rename(converted_path, target_path)
-                logger.info(f"LibreOffice 변환 성공: {source_path} -> {target_path}")
-                return True
-            else:
-                raise ConversionError(
-                    "변환된 파일을 찾을 수 없습니다", 
-                    source_path, 
-                    Path(target_path).suffix
-                )
-                
-        except subprocess.TimeoutExpired:
-            raise ConversionError(
-                "LibreOffice 변환 시간 초과", 
-                source_path, 
-                Path(target_path).suffix
-            )
-        except Exception as e:
-            raise ConversionError(
-                f"LibreOffice 변환 중 오류: {str(e)}", 
-                source_path, 
-                Path(target_path).suffix
-            )
+        return get_libreoffice_pool().convert(source_path, target_path)
 
 
 class Docx2PdfConverter(BaseConverter):
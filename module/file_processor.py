@@ -3,7 +3,7 @@ import sys
 import json
 import tempfile
 import shutil
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator
 from enum import Enum
 from pathlib import Path
 import fitz  # PyMuPDF
@@ -18,6 +18,13 @@ import xml.etree.ElementTree as ET
 import html
 
 from module.image_to_text import AzureOpenAIImageProcessor
+from module.vision_pipeline import VisionPagePipeline
+from module.ingestion_manifest import (
+    IngestionManifest, PageCheckpoint, hash_file_content,
+    STAGE_EXTRACT, STATUS_IN_PROGRESS, STATUS_COMPLETED, STATUS_FAILED
+)
+from module.converters import LibreOfficeConverter
+from module.html_table_stream import scan_html_table_row_counts, iter_html_table_rows
 from structured_chunking import JiraStructuredChunker, StructuredChunk
 
 class DocumentType(Enum):
@@ -459,65 +466,43 @@ class TextBasedProcessor:
         """HTML 테이블을 행별로 분할하여 처리 (각 티켓을 개별 청크로)"""
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+                head = f.read(200)
             
-            print(f"🔍 HTML 파일 내용 길이: {len(content)}자")
-            print(f"🔍 HTML 파일 첫 200자: {content[:200]}")
+            print(f"🔍 HTML 파일 크기: {os.path.getsize(file_path)}바이트")
+            print(f"🔍 HTML 파일 첫 200자: {head}")
             
-            # BeautifulSoup으로 HTML 테이블 파싱
-            from bs4 import BeautifulSoup
-            
-            print("🔧 BeautifulSoup으로 HTML 테이블 파싱 시도...")
-            soup = BeautifulSoup(content, 'html.parser')
+            # 문서 전체를 트리로 만들지 않고 스트리밍으로 테이블 파싱
+            print("🔧 스트리밍 파서로 HTML 테이블 파싱 시도...")
             
             # 테이블 찾기 (모든 테이블 중 가장 큰 것 선택)
-            tables = soup.find_all('table')
-            if not tables:
+            row_counts = scan_html_table_row_counts(file_path)
+            if not row_counts:
                 print("⚠️ 테이블을 찾을 수 없음, 일반 텍스트로 처리")
                 raise Exception("No table found")
             
-            # 가장 많은 행을 가진 테이블 찾기 (실제 데이터 테이블)
-            table_info = [(i, t, len(t.find_all('tr'))) for i, t in enumerate(tables)]
-            table_info.sort(key=lambda x: x[2], reverse=True)  # 행 수로 내림차순 정렬
-            
             print(f"🔍 테이블 분석:")
-            for i, (table_idx, table, row_count) in enumerate(table_info):
+            for table_idx, row_count in sorted(enumerate(row_counts), key=lambda x: x[1], reverse=True):
                 print(f"   테이블 {table_idx+1}: {row_count}행")
             
-            # 가장 많은 행을 가진 테이블 선택
-            table = table_info[0][1]
-            selected_table_idx = table_info[0][0]
-            selected_row_count = table_info[0][2]
+            # 가장 많은 행을 가진 테이블 선택 (실제 데이터 테이블)
+            selected_table_idx = max(range(len(row_counts)), key=lambda i: row_counts[i])
+            selected_row_count = row_counts[selected_table_idx]
             print(f"✅ 선택된 테이블: 테이블 {selected_table_idx+1} ({selected_row_count}행)")
             
-            # 테이블 행들 추출
-            rows = table.find_all('tr')
-            print(f"🔍 발견된 테이블 행 수: {len(rows)}")
-            
-            if len(rows) < 2:
+            if selected_row_count < 2:
                 print("⚠️ 데이터 행이 없음, 일반 텍스트로 처리")
                 raise Exception("No data rows found")
             
-            # 헤더 행과 데이터 행 분리
-            header_row = rows[0]
-            data_rows = rows[1:]
+            # 테이블 행을 하나씩 읽음
+            rows = iter_html_table_rows(file_path, selected_table_idx)
             
-            # 헤더 추출 (더 강력한 방법)
-            headers = []
-            for cell in header_row.find_all(['td', 'th']):
-                header_text = cell.get_text(strip=True)
-                if header_text:
-                    headers.append(header_text)
+            # 헤더 추출 (첫 번째 행)
+            headers = [cell_text for cell_text in next(rows, []) if cell_text]
             
             # 헤더가 비어있으면 첫 번째 데이터 행을 헤더로 사용
-            if not headers and data_rows:
+            if not headers:
                 print("⚠️ 헤더가 비어있음, 첫 번째 데이터 행을 헤더로 사용")
-                first_data_row = data_rows[0]
-                for cell in first_data_row.find_all(['td', 'th']):
-                    header_text = cell.get_text(strip=True)
-                    if header_text:
-                        headers.append(header_text)
-                data_rows = data_rows[1:]  # 첫 번째 데이터 행 제거
+                headers = [cell_text for cell_text in next(rows, []) if cell_text]
             
             # 여전히 헤더가 없으면 기본 헤더 사용
             if not headers:
@@ -525,29 +510,21 @@ class TextBasedProcessor:
                 headers = ['Column1', 'Column2', 'Column3', 'Column4', 'Column5']
             
             print(f"🔍 테이블 헤더: {headers}")
-            print(f"🔍 데이터 행 수: {len(data_rows)}")
-            
-            # 각 행의 셀 수 확인
-            if data_rows:
-                first_data_cells = data_rows[0].find_all(['td', 'th'])
-                print(f"🔍 첫 번째 데이터 행의 셀 수: {len(first_data_cells)}")
-                print(f"🔍 첫 번째 데이터 행 내용: {[cell.get_text(strip=True) for cell in first_data_cells]}")
             
             # 각 데이터 행을 개별 청크로 처리
             processed_elements = []
             
-            for row_idx, row in enumerate(data_rows):
+            for row_idx, cells in enumerate(rows):
+                if row_idx == 0:
+                    print(f"🔍 첫 번째 데이터 행의 셀 수: {len(cells)}")
+                    print(f"🔍 첫 번째 데이터 행 내용: {cells}")
+                
                 # 행의 셀들 추출
-                cells = row.find_all(['td', 'th'])
                 if len(cells) == 0:
                     continue
                 
                 # 셀 텍스트 추출
-                row_data = []
-                for cell in cells:
-                    cell_text = cell.get_text(strip=True)
-                    if cell_text:
-                        row_data.append(cell_text)
+                row_data = [cell_text for cell_text in cells if cell_text]
                 
                 if len(row_data) == 0:
                     continue
@@ -1230,14 +1207,15 @@ class LayoutBasedProcessor:
     def __init__(self, azure_processor: AzureOpenAIImageProcessor):
         self.azure_processor = azure_processor
     
-    def process_file(self, file_path: str, doc_type: DocumentType) -> List[ProcessedPage]:
+    def process_file(self, file_path: str, doc_type: DocumentType,
+                     checkpoint: Optional[PageCheckpoint] = None) -> List[ProcessedPage]:
         """Layout-based 파일을 PDF로 변환 후 처리"""
         try:
             # PDF로 변환
             pdf_path = self._convert_to_pdf(file_path, doc_type)
             
             # PDF를 이미지로 변환하여 처리
-            return self._process_pdf_as_images(pdf_path)
+            return self._process_pdf_as_images(pdf_path, checkpoint)
             
         except Exception as e:
             print(f"Layout-based 처리 오류: {e}")
@@ -1271,16 +1249,8 @@ class LayoutBasedProcessor:
     def _convert_docx_to_pdf(self, docx_path: str, pdf_path: str):
         """DOCX를 PDF로 변환 (LibreOffice 사용)"""
         try:
-            import subprocess
-            # LibreOffice를 사용하여 변환
-            cmd = ["soffice", "--headless", "--convert-to", "pdf", "--outdir", 
-                   os.path.dirname(pdf_path), docx_path]
-            subprocess.run(cmd, check=True, capture_output=True)
-            
-            # 변환된 파일 이름 변경
-            converted_path = docx_path.replace('.docx', '.pdf')
-            if os.path.exists(converted_path):
-                shutil.move(converted_path, pdf_path)
+            # LibreOffice 상주 워커 풀을 사용하여 변환
+            LibreOfficeConverter().convert(docx_path, pdf_path)
                 
         except Exception as e:
             print(f"LibreOffice 변환 실패, 대안 방법 사용: {e}")
@@ -1321,44 +1291,29 @@ class LayoutBasedProcessor:
             print(f"XLSX 변환 실패, LibreOffice 사용: {e}")
             self._convert_docx_to_pdf(xlsx_path, pdf_path)
     
-    def _process_pdf_as_images(self, pdf_path: str) -> List[ProcessedPage]:
-        """PDF를 이미지로 변환하여 GPT Vision으로 처리"""
+    def _process_pdf_as_images(self, pdf_path: str,
+                               checkpoint: Optional[PageCheckpoint] = None) -> List[ProcessedPage]:
+        """PDF를 이미지로 변환하여 GPT Vision으로 처리 (페이지 병렬 처리, 체크포인트 재개 지원)"""
         try:
-            doc = fitz.open(pdf_path)
+            prompt = "이 페이지의 모든 텍스트 내용을 추출하고, 표나 이미지가 있다면 설명해주세요."
+            pipeline = VisionPagePipeline(self.azure_processor)
             processed_pages = []
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # 페이지를 이미지로 변환
-                mat = fitz.Matrix(2.0, 2.0)  # 2배 확대
-                pix = page.get_pixmap(matrix=mat)
-                
-                # 이미지 저장
-                temp_dir = "temp_images"
-                os.makedirs(temp_dir, exist_ok=True)
-                
-                image_filename = f"pdf_page{page_num + 1}.png"
-                image_path = os.path.join(temp_dir, image_filename)
-                pix.save(image_path)
-                
-                # GPT Vision으로 이미지 처리
-                prompt = "이 페이지의 모든 텍스트 내용을 추출하고, 표나 이미지가 있다면 설명해주세요."
-                text_content = self.azure_processor.image_to_text(image_path, prompt)
+            for result in pipeline.process_pdf(pdf_path, prompt, checkpoint=checkpoint):
+                source = "gpt_vision" if result.processing_method == "gpt_vision" else "text_extraction"
                 
                 # 결과를 텍스트 요소로 저장
                 elements = [DocumentElement(
                     ElementType.TEXT,
-                    text_content,
-                    {"page_number": page_num + 1, "source": "gpt_vision"}
+                    result.text,
+                    {"page_number": result.page_number, "source": source}
                 )]
                 
                 processed_pages.append(ProcessedPage(
-                    page_num + 1, elements, "page",
-                    {"file_type": "pdf", "processing_method": "gpt_vision"}
+                    result.page_number, elements, "page",
+                    {"file_type": "pdf", "processing_method": result.processing_method}
                 ))
             
-            doc.close()
             return processed_pages
             
         except Exception as e:
@@ -1367,26 +1322,57 @@ class LayoutBasedProcessor:
 class FileProcessor:
     """메인 파일 처리기"""
     
-    def __init__(self, azure_processor: AzureOpenAIImageProcessor):
+    def __init__(self, azure_processor: AzureOpenAIImageProcessor,
+                 manifest: Optional[IngestionManifest] = None):
+        """
+        Args:
+            azure_processor: 비전 처리기
+            manifest: 수집 매니페스트 (지정 시 저장 완료 파일은 건너뛰고 중단된 파일은 페이지 단위로 재개)
+        """
         self.azure_processor = azure_processor
         self.text_processor = TextBasedProcessor(azure_processor)
         self.layout_processor = LayoutBasedProcessor(azure_processor)
+        self.manifest = manifest
         self.temp_storage = {}
     
-    def process_file(self, file_path: str) -> Dict[str, Any]:
-        """파일을 처리하고 결과를 반환"""
+    def process_file(self, file_path: str, file_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        파일을 처리하고 결과를 반환
+        
+        매니페스트가 있으면 결과에 file_hash(내용 sha256)가 포함되며,
+        이미 벡터 DB 저장까지 끝난 파일은 처리 없이 {"skipped": True, ...}를 반환한다.
+        """
+        file_hash = None
         try:
+            checkpoint = None
+            if self.manifest is not None:
+                file_hash = hash_file_content(file_path)
+                if self.manifest.is_stored(file_hash):
+                    print(f"⏭️ 이미 수집된 파일입니다 (해시 {file_hash[:12]}), 처리를 건너뜁니다.")
+                    return {
+                        "file_path": file_path,
+                        "file_hash": file_hash,
+                        "skipped": True,
+                        "processed_pages": [],
+                        "total_pages": 0
+                    }
+                self.manifest.register_file(
+                    file_hash, file_name or Path(file_path).name, os.path.getsize(file_path)
+                )
+                self.manifest.mark_stage(file_hash, STAGE_EXTRACT, STATUS_IN_PROGRESS)
+                checkpoint = PageCheckpoint(self.manifest, file_hash)
+            
             # 1. 파일 타입 판별
             doc_type = FileTypeDetector.detect_file_type(file_path)
             content_type = FileTypeDetector.detect_content_type(file_path, doc_type)
             
             print(f"파일 타입: {doc_type.value}, 콘텐츠 타입: {content_type.value}")
             
-            # 2. 콘텐츠 타입에 따른 처리
+            # 2. 콘텐츠 타입에 따른 처리 (비전 처리 페이지만 체크포인트 대상)
             if content_type == ContentType.TEXT_BASED:
                 processed_pages = self._process_text_based(file_path, doc_type)
             else:
-                processed_pages = self._process_layout_based(file_path, doc_type)
+                processed_pages = self._process_layout_based(file_path, doc_type, checkpoint)
             
             # 3. 결과를 메타데이터와 함께 임시 저장
             result = {
@@ -1398,6 +1384,12 @@ class FileProcessor:
                 "processing_timestamp": str(pd.Timestamp.now())
             }
             
+            if file_hash is not None:
+                result["file_hash"] = file_hash
+                self.manifest.mark_stage(
+                    file_hash, STAGE_EXTRACT, STATUS_COMPLETED, {"total_pages": len(processed_pages)}
+                )
+            
             # 임시 저장
             self._save_to_temp_storage(file_path, result)
             
@@ -1405,6 +1397,8 @@ class FileProcessor:
 
         except Exception as e:
             print(f"파일 처리 오류: {e}")
+            if file_hash is not None:
+                self.manifest.mark_stage(file_hash, STAGE_EXTRACT, STATUS_FAILED, {"error": str(e)})
             return {"error": str(e)}
     
     def _process_text_based(self, file_path: str, doc_type: DocumentType) -> List[ProcessedPage]:
@@ -1427,9 +1421,10 @@ class FileProcessor:
         else:
             return []
 
-    def _process_layout_based(self, file_path: str, doc_type: DocumentType) -> List[ProcessedPage]:
+    def _process_layout_based(self, file_path: str, doc_type: DocumentType,
+                              checkpoint: Optional[PageCheckpoint] = None) -> List[ProcessedPage]:
         """Layout-based 파일 처리"""
-        return self.layout_processor.process_file(file_path, doc_type)
+        return self.layout_processor.process_file(file_path, doc_type, checkpoint)
     
     def _process_pdf_text_based(self, file_path: str) -> List[ProcessedPage]:
         """Text-based PDF 처리"""
@@ -1537,6 +1532,31 @@ class FileProcessor:
             print(f"❌ 구조적 청킹 실패: {str(e)}")
             return []
     
+    def iter_structured_chunks(self, file_path: str) -> Iterator[StructuredChunk]:
+        """
+        구조적 청킹의 스트리밍 버전 (process_with_structured_chunking과 같은 파일 유형 지원)
+        
+        파일 전체를 읽거나 파싱하지 않고 행 단위로 청크를 반환하므로
+        VectorDBManager.add_structured_chunks에 바로 넘겨 배치 저장할 수 있다.
+        
+        Args:
+            file_path: 처리할 파일 경로
+        """
+        file_extension = Path(file_path).suffix.lower()
+        file_name = Path(file_path).name
+        chunker = JiraStructuredChunker()
+        
+        print(f"🔧 구조적 청킹 시작 (스트리밍): {file_name}")
+        
+        if file_extension in ['.xls', '.html'] and self._is_jira_html(file_path):
+            print("📋 Jira HTML 파일 감지 - 구조적 청킹 적용")
+            yield from chunker.iter_jira_html_chunks(file_path, file_name)
+        elif file_extension == '.csv':
+            print("📋 CSV 파일 감지 - 구조적 청킹 적용")
+            yield from chunker.iter_csv_file_chunks(file_path, file_name)
+        else:
+            print(f"⚠️ 구조적 청킹 미지원 파일: {file_extension}")
+    
     def _is_jira_html(self, file_path: str) -> bool:
         """파일이 Jira HTML인지 확인"""
         try:
@@ -0,0 +1,202 @@
+"""
+HTML 테이블 스트리밍 추출기
+
+BeautifulSoup으로 문서 전체를 트리로 만들지 않고, 파일을 블록 단위로 읽어
+표준 라이브러리 HTMLParser에 흘려보내며 테이블 행을 하나씩 꺼낸다.
+메모리 사용량은 파일 크기가 아니라 현재 행 크기에 비례한다.
+
+- scan_html_table_row_counts: 1차 패스, 테이블별 행(tr) 수 집계 (가장 큰 테이블 선택용)
+- iter_html_table_rows: 2차 패스, 선택한 테이블의 행을 셀 텍스트 목록으로 순서대로 반환
+- iter_html_rows_by_class: 특정 class의 행(예: Jira issuerow)을 속성과 셀 텍스트로 반환
+"""
+
+from html.parser import HTMLParser
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1MB
+
+_CELL_TAGS = ("td", "th")
+_SKIP_TEXT_TAGS = ("script", "style")
+
+
+def _feed_stream(parser: HTMLParser, stream: IO[str], chunk_size: int) -> Iterator[None]:
+    """텍스트 스트림을 블록 단위로 파서에 공급 (블록마다 한 번씩 제어를 돌려줌)"""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        parser.feed(block)
+        yield
+    parser.close()
+    yield
+
+
+def _feed_file(parser: HTMLParser, source: Union[str, IO[str]], chunk_size: int) -> Iterator[None]:
+    """파일 경로 또는 텍스트 스트림을 블록 단위로 파서에 공급"""
+    if not isinstance(source, str):
+        yield from _feed_stream(parser, source, chunk_size)
+        return
+    with open(source, "r", encoding="utf-8", errors="ignore") as f:
+        yield from _feed_stream(parser, f, chunk_size)
+
+
+class _TableRowCounter(HTMLParser):
+    """테이블별 하위 tr 개수 집계 (문서 순서 = BeautifulSoup find_all 순서)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.row_counts: List[int] = []
+        self._stack: List[int] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self.row_counts.append(0)
+            self._stack.append(len(self.row_counts) - 1)
+        elif tag == "tr":
+            for table_idx in self._stack:
+                self.row_counts[table_idx] += 1
+
+    def handle_endtag(self, tag):
+        if tag == "table" and self._stack:
+            self._stack.pop()
+
+
+class _TableRowExtractor(HTMLParser):
+    """
+    대상 테이블의 직계 행에서 셀 텍스트 추출
+
+    row_class를 주면 해당 class의 행만 추출하고, table_index가 None이면
+    그 class의 행이 처음 나온 테이블을 대상 테이블로 삼는다.
+    """
+
+    def __init__(self, table_index: Optional[int], row_class: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.table_index = table_index
+        self.row_class = row_class
+        self.completed_rows: List[List[str]] = []
+        self.completed_attrs: List[Dict[str, str]] = []
+        self._table_count = 0
+        self._stack: List[int] = []
+        self._row: Optional[List[str]] = None
+        self._row_attrs: Dict[str, str] = {}
+        self._cell: Optional[List[str]] = None
+        self._text: List[str] = []  # 블록 경계에서 나뉘어 들어온 현재 텍스트 노드 조각
+        self._skip_depth = 0
+
+    def _in_target(self) -> bool:
+        return bool(self._stack) and self._stack[-1] == self.table_index
+
+    def _flush_text(self):
+        # BeautifulSoup get_text(strip=True)와 동일: 텍스트 노드 단위로 strip 후 이어붙임
+        text = "".join(self._text).strip()
+        self._text = []
+        if text and self._cell is not None:
+            self._cell.append(text)
+
+    def _finish_cell(self):
+        if self._cell is not None and self._row is not None:
+            self._row.append("".join(self._cell))
+        self._cell = None
+
+    def _finish_row(self):
+        self._finish_cell()
+        if self._row is not None:
+            self.completed_rows.append(self._row)
+            self.completed_attrs.append(self._row_attrs)
+        self._row = None
+
+    def _matches_row_class(self, attrs) -> bool:
+        if self.row_class is None:
+            return True
+        return self.row_class in (dict(attrs).get("class") or "").split()
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == "table":
+            self._stack.append(self._table_count)
+            self._table_count += 1
+        elif tag == "tr":
+            if self.table_index is None and self._stack and self._matches_row_class(attrs):
+                self.table_index = self._stack[-1]
+            if self._in_target():
+                self._finish_row()  # 닫히지 않은 이전 행 정리
+                if self._matches_row_class(attrs):
+                    self._row = []
+                    self._row_attrs = {name: value or "" for name, value in attrs}
+        elif tag in _CELL_TAGS and self._in_target() and self._row is not None:
+            self._finish_cell()  # 닫히지 않은 이전 셀 정리
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "table":
+            if self._in_target():
+                self._finish_row()
+            if self._stack:
+                self._stack.pop()
+        elif tag == "tr" and self._in_target():
+            self._finish_row()
+        elif tag in _CELL_TAGS and self._in_target():
+            self._finish_cell()
+
+    def handle_data(self, data):
+        # 중첩 테이블의 텍스트도 바깥 셀 텍스트에 포함 (get_text 동작과 동일)
+        if self._cell is not None and not self._skip_depth:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+
+def scan_html_table_row_counts(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[int]:
+    """문서 내 테이블별 행 수 (문서 순서)"""
+    parser = _TableRowCounter()
+    for _ in _feed_file(parser, file_path, chunk_size):
+        pass
+    return parser.row_counts
+
+
+def iter_html_table_rows(file_path: str, table_index: int,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    지정한 테이블의 행을 셀 텍스트 목록으로 하나씩 반환
+
+    Args:
+        file_path: HTML 파일 경로
+        table_index: 문서 순서 기준 테이블 번호 (0부터)
+        chunk_size: 한 번에 읽을 문자 수
+
+    Yields:
+        행의 셀 텍스트 목록 (빈 셀은 빈 문자열)
+    """
+    parser = _TableRowExtractor(table_index)
+    for _ in _feed_file(parser, file_path, chunk_size):
+        if parser.completed_rows:
+            rows, parser.completed_rows, parser.completed_attrs = parser.completed_rows, [], []
+            yield from rows
+
+
+def iter_html_rows_by_class(source: Union[str, IO[str]], row_class: str,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[Dict[str, str], List[str]]]:
+    """
+    지정한 class의 행을 (행 속성, 셀 텍스트 목록)으로 하나씩 반환
+
+    대상 테이블은 해당 class의 행이 처음 나온 테이블이며, 중첩 테이블의 텍스트는
+    바깥 셀 텍스트에 포함된다.
+
+    Args:
+        source: HTML 파일 경로 또는 텍스트 스트림
+        row_class: 추출할 행의 class (예: "issuerow")
+        chunk_size: 한 번에 읽을 문자 수
+    """
+    parser = _TableRowExtractor(None, row_class=row_class)
+    for _ in _feed_file(parser, source, chunk_size):
+        if parser.completed_rows:
+            rows, attrs = parser.completed_rows, parser.completed_attrs
+            parser.completed_rows, parser.completed_attrs = [], []
+            yield from zip(attrs, rows)
@@ -2,10 +2,17 @@ import openai
 import base64
 import sys
 import os
+import threading
 from typing import Optional
 
+from module.vision_cache import VisionResultCache, hash_image_bytes, hash_request
+
+# 요청 파라미터(max_tokens, temperature 등)가 바뀌면 올려서 기존 캐시를 무효화
+VISION_REQUEST_VERSION = "v1:max_tokens=1024:temperature=0.1"
+
 class AzureOpenAIImageProcessor:
-    def __init__(self, api_key: str, endpoint: str, deployment_name: str):
+    def __init__(self, api_key: str, endpoint: str, deployment_name: str,
+                 cache: Optional[VisionResultCache] = None, use_cache: Optional[bool] = None):
         """
         Azure OpenAI 이미지 처리기 초기화
         
@@ -13,6 +20,8 @@ class AzureOpenAIImageProcessor:
             api_key: Azure OpenAI API 키
             endpoint: Azure OpenAI 엔드포인트 (예: https://your-resource.openai.azure.com/)
             deployment_name: 배포된 모델 이름
+            cache: 결과 캐시 (기본: 첫 호출 시 VISION_CACHE_DB 경로로 생성)
+            use_cache: 캐시 사용 여부 (기본: VISION_CACHE_ENABLED 환경변수, 없으면 사용)
         """
         # API 키 검증
         if not api_key or api_key.strip() == "":
@@ -25,6 +34,12 @@ class AzureOpenAIImageProcessor:
         self.endpoint = endpoint
         self.deployment_name = deployment_name
         
+        if use_cache is None:
+            use_cache = os.getenv("VISION_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+        self.use_cache = use_cache
+        self._cache = cache
+        self._cache_lock = threading.Lock()
+        
         # Azure OpenAI 클라이언트 설정 (새로운 API)
         try:
             self.client = openai.AzureOpenAI(
@@ -48,9 +63,45 @@ class AzureOpenAIImageProcessor:
             변환된 텍스트
         """
         try:
-            # 이미지 파일 읽기 및 base64 인코딩
+            # 이미지 파일 읽기
             with open(image_path, "rb") as image_file:
-                base64_image = base64.b64encode(image_file.read()).decode("utf-8")
+                image_bytes = image_file.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
+        
+        return self.image_bytes_to_text(image_bytes, prompt, mime_type="image/jpeg")
+    
+    def image_bytes_to_text(self, image_bytes: bytes, prompt: str = "이 이미지의 내용을 텍스트로 변환해주세요.",
+                            mime_type: str = "image/png") -> str:
+        """
+        메모리상의 이미지 바이트를 텍스트로 변환 (임시 파일 불필요, 결과 캐시 적용)
+        
+        Args:
+            image_bytes: 이미지 바이트 (PNG/JPEG 등)
+            prompt: 이미지 분석을 위한 프롬프트
+            mime_type: data URL에 사용할 MIME 타입
+            
+        Returns:
+            변환된 텍스트
+        """
+        cache = self.get_cache()
+        if cache is not None:
+            image_hash = hash_image_bytes(image_bytes)
+            request_hash = hash_request(prompt, self.deployment_name, f"{VISION_REQUEST_VERSION}:{mime_type}")
+            cached = cache.get(image_hash, request_hash)
+            if cached is not None:
+                return cached
+        
+        result = self._call_vision_api(image_bytes, prompt, mime_type)
+        
+        if cache is not None and result:
+            cache.put(image_hash, request_hash, result, self.deployment_name)
+        return result
+    
+    def _call_vision_api(self, image_bytes: bytes, prompt: str, mime_type: str) -> str:
+        """Azure OpenAI Vision API 호출 (캐시 미적용)"""
+        try:
+            base64_image = base64.b64encode(image_bytes).decode("utf-8")
             
             # Azure OpenAI API 호출 (새로운 API)
             response = self.client.chat.completions.create(
@@ -63,7 +114,7 @@ class AzureOpenAIImageProcessor:
                             {
                                 "type": "image_url", 
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64_image}"
+                                    "url": f"data:{mime_type};base64,{base64_image}"
                                 }
                             }
                         ]
@@ -75,11 +126,26 @@ class AzureOpenAIImageProcessor:
             
             return response.choices[0].message.content
             
-        except FileNotFoundError:
-            raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
         except Exception as e:
             raise Exception(f"이미지 처리 중 오류가 발생했습니다: {str(e)}")
     
+    def get_cache(self) -> Optional[VisionResultCache]:
+        """결과 캐시 반환 (비활성화 시 None)"""
+        if not self.use_cache:
+            return None
+        if self._cache is None:
+            with self._cache_lock:
+                if self._cache is None:
+                    self._cache = VisionResultCache()
+        return self._cache
+    
+    def get_cache_stats(self) -> dict:
+        """캐시 적중/미스 통계"""
+        cache = self.get_cache()
+        if cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **cache.get_stats()}
+    
     def image_to_text_with_summary(self, image_path: str, summary_prompt: str = "이미지 내용을 간단히 요약해주세요.") -> dict:
         """
         이미지를 텍스트로 변환하고 요약
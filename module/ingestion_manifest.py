@@ -0,0 +1,248 @@
+"""
+파일 수집(ingestion) 매니페스트
+
+파일 내용의 sha256 해시를 키로 파일별 단계(extract/store) 완료 여부와
+페이지별 비전 처리 결과를 SQLite에 기록한다.
+
+- 이미 저장(store)까지 끝난 파일은 통째로 건너뛴다.
+- 중간에 실패/중단된 파일은 완료된 페이지 결과를 재사용하고 남은 페이지만 다시 처리한다.
+
+SystemInfoVectorDBManager의 해시 기반 중복 방지를 module/ 파이프라인 전체로 확장한 것이다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from utils.sqlite_pool import get_sqlite_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST_DB = "ingestion_manifest.db"
+
+# 파이프라인 단계
+STAGE_EXTRACT = "extract"   # 파일 → 페이지 텍스트 (비전 처리 포함)
+STAGE_STORE = "store"       # 청크 → 벡터 DB
+
+# 단계 상태
+STATUS_PENDING = "pending"
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+_HASH_BLOCK_SIZE = 1 << 20  # 1MB
+
+
+def hash_file_content(file_path: str) -> str:
+    """파일 내용의 sha256 해시 (블록 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_bytes(content: bytes) -> str:
+    """바이트 내용의 sha256 해시 (업로드 파일용)"""
+    return hashlib.sha256(content).hexdigest()
+
+
+class IngestionManifest:
+    """SQLite 기반 파일 수집 매니페스트"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: 매니페스트 DB 경로 (기본: INGESTION_MANIFEST_DB 환경변수, 없으면 ingestion_manifest.db)
+        """
+        self.db_path = db_path or os.getenv("INGESTION_MANIFEST_DB", DEFAULT_MANIFEST_DB)
+        self._pool = get_sqlite_pool(self.db_path)
+        self._init_db()
+
+    def _init_db(self):
+        with self._pool.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingestion_files (
+                    file_hash TEXT PRIMARY KEY,
+                    file_name TEXT,
+                    file_size INTEGER,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingestion_stages (
+                    file_hash TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    detail TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (file_hash, stage)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingestion_pages (
+                    file_hash TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    page_number INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (file_hash, stage, page_number)
+                )
+            """)
+
+    # ------------------------------------------------------------------
+    # 파일 / 단계
+    # ------------------------------------------------------------------
+
+    def register_file(self, file_hash: str, file_name: str = "", file_size: int = 0):
+        """파일 등록 (이미 있으면 이름/크기/갱신 시각만 업데이트)"""
+        now = time.time()
+        with self._pool.connection() as conn:
+            conn.execute(
+                "INSERT INTO ingestion_files (file_hash, file_name, file_size, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(file_hash) DO UPDATE SET file_name = excluded.file_name, "
+                "file_size = excluded.file_size, updated_at = excluded.updated_at",
+                (file_hash, file_name, file_size, now, now)
+            )
+
+    def mark_stage(self, file_hash: str, stage: str, status: str, detail: Optional[Dict[str, Any]] = None):
+        """단계 상태 기록"""
+        with self._pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ingestion_stages (file_hash, stage, status, detail, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (file_hash, stage, status, json.dumps(detail or {}, ensure_ascii=False), time.time())
+            )
+
+    def get_stage(self, file_hash: str, stage: str) -> Optional[Dict[str, Any]]:
+        """단계 상태 조회 (기록이 없으면 None)"""
+        row = self._pool.connection().execute(
+            "SELECT status, detail, updated_at FROM ingestion_stages WHERE file_hash = ? AND stage = ?",
+            (file_hash, stage)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"status": row[0], "detail": json.loads(row[1] or "{}"), "updated_at": row[2]}
+
+    def is_stage_completed(self, file_hash: str, stage: str) -> bool:
+        stage_info = self.get_stage(file_hash, stage)
+        return stage_info is not None and stage_info["status"] == STATUS_COMPLETED
+
+    def is_stored(self, file_hash: str) -> bool:
+        """벡터 DB 저장까지 끝난 파일인지 확인"""
+        return self.is_stage_completed(file_hash, STAGE_STORE)
+
+    # ------------------------------------------------------------------
+    # 페이지
+    # ------------------------------------------------------------------
+
+    def record_page(self, file_hash: str, page_number: int, payload: Dict[str, Any],
+                    stage: str = STAGE_EXTRACT):
+        """페이지 처리 결과 기록 (같은 페이지는 덮어씀)"""
+        with self._pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ingestion_pages (file_hash, stage, page_number, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (file_hash, stage, page_number, json.dumps(payload, ensure_ascii=False), time.time())
+            )
+
+    def get_completed_pages(self, file_hash: str, stage: str = STAGE_EXTRACT) -> Dict[int, Dict[str, Any]]:
+        """완료된 페이지 결과 {page_number: payload}"""
+        rows = self._pool.connection().execute(
+            "SELECT page_number, payload FROM ingestion_pages WHERE file_hash = ? AND stage = ? "
+            "ORDER BY page_number",
+            (file_hash, stage)
+        ).fetchall()
+        return {page_number: json.loads(payload) for page_number, payload in rows}
+
+    def get_last_completed_page(self, file_hash: str, stage: str = STAGE_EXTRACT) -> int:
+        """마지막으로 완료된 페이지 번호 (없으면 0)"""
+        row = self._pool.connection().execute(
+            "SELECT MAX(page_number) FROM ingestion_pages WHERE file_hash = ? AND stage = ?",
+            (file_hash, stage)
+        ).fetchone()
+        return row[0] or 0
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+
+    def get_entry(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """파일의 등록 정보 + 단계별 상태 + 완료 페이지 수"""
+        conn = self._pool.connection()
+        row = conn.execute(
+            "SELECT file_name, file_size, created_at, updated_at FROM ingestion_files WHERE file_hash = ?",
+            (file_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        stages = {
+            stage: {"status": status, "detail": json.loads(detail or "{}")}
+            for stage, status, detail in conn.execute(
+                "SELECT stage, status, detail FROM ingestion_stages WHERE file_hash = ?", (file_hash,)
+            )
+        }
+        completed_pages = conn.execute(
+            "SELECT COUNT(*) FROM ingestion_pages WHERE file_hash = ?", (file_hash,)
+        ).fetchone()[0]
+        return {
+            "file_hash": file_hash,
+            "file_name": row[0],
+            "file_size": row[1],
+            "created_at": row[2],
+            "updated_at": row[3],
+            "stages": stages,
+            "completed_pages": completed_pages
+        }
+
+    def forget(self, file_hash: str):
+        """파일 기록 삭제 (강제 재처리용)"""
+        with self._pool.connection() as conn:
+            for table in ("ingestion_pages", "ingestion_stages", "ingestion_files"):
+                conn.execute(f"DELETE FROM {table} WHERE file_hash = ?", (file_hash,))
+
+    def clear(self):
+        """매니페스트 전체 삭제 (벡터 DB 초기화 시 함께 호출)"""
+        with self._pool.connection() as conn:
+            for table in ("ingestion_pages", "ingestion_stages", "ingestion_files"):
+                conn.execute(f"DELETE FROM {table}")
+
+
+class PageCheckpoint:
+    """한 파일의 페이지 단위 체크포인트 (파이프라인에 전달하는 얇은 래퍼)"""
+
+    def __init__(self, manifest: IngestionManifest, file_hash: str, stage: str = STAGE_EXTRACT):
+        self.manifest = manifest
+        self.file_hash = file_hash
+        self.stage = stage
+
+    def completed_pages(self) -> Dict[int, Dict[str, Any]]:
+        return self.manifest.get_completed_pages(self.file_hash, self.stage)
+
+    def record(self, page_number: int, payload: Dict[str, Any]):
+        try:
+            self.manifest.record_page(self.file_hash, page_number, payload, self.stage)
+        except Exception as e:
+            # 체크포인트 기록 실패가 본 처리를 막지 않도록 경고만 남김
+            logger.warning(f"페이지 {page_number} 체크포인트 기록 실패: {e}")
+
+
+_manifest: Optional[IngestionManifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_ingestion_manifest() -> IngestionManifest:
+    """프로세스 공용 IngestionManifest 반환"""
+    global _manifest
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                _manifest = IngestionManifest()
+    return _manifest
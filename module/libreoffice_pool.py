@@ -0,0 +1,475 @@
+"""
+LibreOffice 변환 워커 풀
+
+변환마다 `soffice --version` 확인 + 콜드 스타트 `soffice --convert-to`를 실행하던 방식을
+상주 워커 풀로 대체한다.
+
+- 워커별 격리된 사용자 프로필(-env:UserInstallation) 사용 → 동시 변환 시 프로필 잠금 충돌 없음
+- UNO 브리지(python3-uno)가 있으면 소켓으로 연결된 상주 headless soffice로 변환 (웜 워커)
+- UNO가 없으면 워커별 프로필로 soffice 서브프로세스를 실행 (콜드 워커)
+- 대기열: 유휴 워커가 없으면 호출자가 워커 반환을 기다림
+- 헬스 체크 / 변환 시간 초과(행) 시 워커 자동 재시작
+- soffice 설치 여부 확인 결과 캐시
+"""
+
+import os
+import time
+import queue
+import shutil
+import socket
+import logging
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from module.exceptions import ConversionError
+
+logger = logging.getLogger(__name__)
+
+SOFFICE_BINARY = os.getenv("SOFFICE_BINARY", "soffice")
+AVAILABILITY_CACHE_TTL = 300.0
+
+# UNO storeToURL 필터 (대상 확장자 → 원본 문서 계열별 필터)
+_WRITER_EXTS = {".doc", ".docx", ".odt", ".rtf", ".txt", ".html", ".htm"}
+_IMPRESS_EXTS = {".ppt", ".pptx", ".odp"}
+_CALC_EXTS = {".xls", ".xlsx", ".ods", ".csv"}
+_PDF_FILTERS = {
+    "writer": "writer_pdf_Export",
+    "impress": "impress_pdf_Export",
+    "calc": "calc_pdf_Export",
+}
+_OFFICE_FILTERS = {
+    ".docx": "MS Word 2007 XML",
+    ".pptx": "Impress MS PowerPoint 2007 XML",
+    ".xlsx": "Calc MS Excel 2007 XML",
+}
+
+_availability_lock = threading.Lock()
+_availability_cache: Dict[str, tuple] = {}
+
+
+def is_soffice_available(binary: str = SOFFICE_BINARY, ttl: float = AVAILABILITY_CACHE_TTL) -> bool:
+    """soffice 설치 여부 확인 (결과를 ttl초 동안 캐시)"""
+    now = time.time()
+    with _availability_lock:
+        cached = _availability_cache.get(binary)
+        if cached and now - cached[1] < ttl:
+            return cached[0]
+
+    try:
+        result = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=5)
+        available = result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError):
+        available = False
+
+    with _availability_lock:
+        _availability_cache[binary] = (available, now)
+    return available
+
+
+def clear_availability_cache():
+    """설치 확인 캐시 초기화 (설치/삭제 직후 또는 테스트용)"""
+    with _availability_lock:
+        _availability_cache.clear()
+
+
+def resolve_filter_name(source_path: str, target_path: str) -> Optional[str]:
+    """원본/대상 확장자로 UNO 내보내기 필터 이름 결정 (모르면 None)"""
+    source_ext = Path(source_path).suffix.lower()
+    target_ext = Path(target_path).suffix.lower()
+
+    if target_ext != ".pdf":
+        return _OFFICE_FILTERS.get(target_ext)
+
+    if source_ext in _IMPRESS_EXTS:
+        return _PDF_FILTERS["impress"]
+    if source_ext in _CALC_EXTS:
+        return _PDF_FILTERS["calc"]
+    if source_ext in _WRITER_EXTS:
+        return _PDF_FILTERS["writer"]
+    return None
+
+
+def _uno_available() -> bool:
+    try:
+        import uno  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class LibreOfficeWorker:
+    """격리된 프로필을 가진 단일 LibreOffice 워커"""
+
+    def __init__(self, worker_id: int, binary: str = SOFFICE_BINARY, use_uno: Optional[bool] = None,
+                 startup_timeout: float = 30.0):
+        """
+        Args:
+            worker_id: 워커 번호 (로그용)
+            binary: soffice 실행 파일
+            use_uno: UNO 상주 프로세스 사용 여부 (기본: uno 모듈 설치 여부)
+            startup_timeout: 상주 프로세스 기동 대기 시간 (초)
+        """
+        self.worker_id = worker_id
+        self.binary = binary
+        self.use_uno = _uno_available() if use_uno is None else use_uno
+        self.startup_timeout = startup_timeout
+        self.profile_dir = tempfile.mkdtemp(prefix=f"lo_profile_{worker_id}_")
+        self.process: Optional[subprocess.Popen] = None
+        self.port: Optional[int] = None
+        self._desktop = None
+        self._child: Optional[subprocess.Popen] = None
+
+    @property
+    def profile_url(self) -> str:
+        return Path(self.profile_dir).as_uri()
+
+    def start(self):
+        """워커 기동 (UNO 모드에서만 상주 프로세스 실행)"""
+        if not self.use_uno:
+            return
+
+        self.port = _free_port()
+        self.process = subprocess.Popen(
+            [
+                self.binary,
+                f"-env:UserInstallation={self.profile_url}",
+                "--headless", "--invisible", "--nologo", "--norestore", "--nodefault",
+                f"--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.time() + self.startup_timeout
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                self._connect()
+                logger.info(f"LibreOffice 워커 {self.worker_id} 기동 완료 (port={self.port})")
+                return
+            except Exception:
+                time.sleep(0.3)
+
+        self.stop()
+        raise ConversionError(f"LibreOffice 워커 {self.worker_id} 기동 실패", "", "")
+
+    def _connect(self):
+        import uno
+
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx
+        )
+        ctx = resolver.resolve(
+            f"uno:socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext"
+        )
+        self._desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+    def is_healthy(self) -> bool:
+        """워커 상태 확인"""
+        if not self.use_uno:
+            return True
+        if self.process is None or self.process.poll() is not None:
+            return False
+        try:
+            self._connect()
+            return True
+        except Exception:
+            return False
+
+    def convert(self, source_path: str, target_path: str, timeout: float) -> bool:
+        """파일 변환 (시간 초과는 호출한 풀에서 감지)"""
+        filter_name = resolve_filter_name(source_path, target_path)
+        if self.use_uno and filter_name:
+            return self._convert_uno(source_path, target_path, filter_name)
+        return self._convert_subprocess(source_path, target_path, timeout)
+
+    def _convert_uno(self, source_path: str, target_path: str, filter_name: str) -> bool:
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def prop(name, value):
+            p = PropertyValue()
+            p.Name = name
+            p.Value = value
+            return p
+
+        if self._desktop is None:
+            self._connect()
+
+        source_url = uno.systemPathToFileUrl(os.path.abspath(source_path))
+        target_url = uno.systemPathToFileUrl(os.path.abspath(target_path))
+
+        doc = self._desktop.loadComponentFromURL(source_url, "_blank", 0, (prop("Hidden", True),))
+        if doc is None:
+            raise ConversionError("문서를 열 수 없습니다", source_path, Path(target_path).suffix)
+        try:
+            doc.storeToURL(target_url, (prop("FilterName", filter_name),))
+        finally:
+            doc.close(True)
+
+        if not os.path.exists(target_path):
+            raise ConversionError("변환된 파일을 찾을 수 없습니다", source_path, Path(target_path).suffix)
+        return True
+
+    def _convert_subprocess(self, source_path: str, target_path: str, timeout: float) -> bool:
+        target_ext = Path(target_path).suffix
+        # 대상 파일명과 충돌하지 않도록 워커 전용 출력 디렉토리 사용
+        out_dir = tempfile.mkdtemp(prefix=f"lo_out_{self.worker_id}_")
+        try:
+            cmd = [
+                self.binary,
+                f"-env:UserInstallation={self.profile_url}",
+                "--headless", "--norestore",
+                "--convert-to", target_ext[1:],
+                "--outdir", out_dir,
+                source_path
+            ]
+            logger.info(f"LibreOffice 변환 명령 실행: {' '.join(cmd)}")
+
+            self._child = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            try:
+                _, stderr = self._child.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self._child.kill()
+                self._child.communicate()
+                raise
+            finally:
+                child, self._child = self._child, None
+            if child.returncode != 0:
+                raise ConversionError(f"LibreOffice 변환 실패: {stderr}", source_path, target_ext)
+
+            converted_path = os.path.join(out_dir, Path(source_path).stem + target_ext)
+            if not os.path.exists(converted_path):
+                raise ConversionError("변환된 파일을 찾을 수 없습니다", source_path, target_ext)
+
+            os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+            shutil.move(converted_path, target_path)
+            return True
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+    def kill(self):
+        """응답 없는 워커 강제 종료"""
+        for proc in (self._child, self.process):
+            if proc is not None and proc.poll() is None:
+                try:
+                    proc.kill()
+                except OSError:
+                    pass
+        self._desktop = None
+
+    def stop(self):
+        """워커 종료 및 프로필 삭제"""
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+            except Exception:
+                pass
+        self.kill()
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+        self.process = None
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class LibreOfficeWorkerPool:
+    """LibreOffice 워커 풀"""
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        conversion_timeout: float = 60.0,
+        acquire_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        hang_grace: float = 5.0,
+        worker_factory: Optional[Callable[[int], LibreOfficeWorker]] = None
+    ):
+        """
+        Args:
+            size: 워커 수 (기본: LIBREOFFICE_POOL_SIZE 환경변수, 없으면 2)
+            conversion_timeout: 변환 1건 최대 시간 (초과 시 워커 재시작)
+            acquire_timeout: 유휴 워커 대기 최대 시간
+            health_check_interval: 워커 헬스 체크 주기 (초)
+            hang_grace: 시간 초과 후 행(hang)으로 판정하기까지의 추가 대기 (초)
+            worker_factory: 워커 생성 함수 (테스트 주입용)
+        """
+        self.size = max(1, size or int(os.getenv("LIBREOFFICE_POOL_SIZE", "2")))
+        self.conversion_timeout = conversion_timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self.hang_grace = hang_grace
+        self._worker_factory = worker_factory or (lambda worker_id: LibreOfficeWorker(worker_id))
+
+        self._idle: "queue.Queue[LibreOfficeWorker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._next_id = 0
+        self._last_health_check: Dict[int, float] = {}
+        self._closed = False
+        self._stats = {"conversions": 0, "failures": 0, "timeouts": 0, "restarts": 0, "wait_seconds": 0.0}
+
+    def _new_worker(self) -> LibreOfficeWorker:
+        with self._lock:
+            worker_id = self._next_id
+            self._next_id += 1
+        worker = self._worker_factory(worker_id)
+        worker.start()
+        self._last_health_check[worker.worker_id] = time.time()
+        return worker
+
+    def _acquire(self) -> LibreOfficeWorker:
+        if self._closed:
+            raise ConversionError("LibreOffice 워커 풀이 종료되었습니다", "", "")
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                return self._new_worker()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise ConversionError("유휴 LibreOffice 워커 대기 시간 초과", "", "")
+
+    def _release(self, worker: LibreOfficeWorker):
+        if self._closed:
+            worker.stop()
+            return
+        self._idle.put(worker)
+
+    def _restart(self, worker: LibreOfficeWorker) -> LibreOfficeWorker:
+        logger.warning(f"LibreOffice 워커 {worker.worker_id} 재시작")
+        worker.kill()
+        worker.stop()
+        self._last_health_check.pop(worker.worker_id, None)
+        with self._lock:
+            self._stats["restarts"] += 1
+        try:
+            return self._new_worker()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _ensure_healthy(self, worker: LibreOfficeWorker) -> LibreOfficeWorker:
+        last = self._last_health_check.get(worker.worker_id, 0.0)
+        if time.time() - last < self.health_check_interval:
+            return worker
+        if worker.is_healthy():
+            self._last_health_check[worker.worker_id] = time.time()
+            return worker
+        return self._restart(worker)
+
+    def convert(self, source_path: str, target_path: str, timeout: Optional[float] = None) -> bool:
+        """
+        유휴 워커로 파일 변환
+
+        Raises:
+            ConversionError: 변환 실패/시간 초과 시
+        """
+        timeout = timeout or self.conversion_timeout
+        target_ext = Path(target_path).suffix
+
+        wait_start = time.time()
+        worker = self._ensure_healthy(self._acquire())
+        with self._lock:
+            self._stats["wait_seconds"] += time.time() - wait_start
+
+        outcome: Dict[str, object] = {}
+
+        def _run():
+            try:
+                outcome["result"] = worker.convert(source_path, target_path, timeout)
+            except BaseException as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=_run, name=f"lo-worker-{worker.worker_id}", daemon=True)
+        thread.start()
+        # 서브프로세스 자체 시간 초과가 먼저 처리되도록 약간의 여유를 둠
+        thread.join(timeout + self.hang_grace)
+
+        if thread.is_alive() or isinstance(outcome.get("error"), subprocess.TimeoutExpired):
+            # 행(hang) 감지: 워커를 버리고 새로 기동
+            with self._lock:
+                self._stats["timeouts"] += 1
+                self._stats["failures"] += 1
+            try:
+                self._release(self._restart(worker))
+            except Exception as e:
+                logger.error(f"LibreOffice 워커 재시작 실패: {e}")
+            raise ConversionError("LibreOffice 변환 시간 초과", source_path, target_ext)
+
+        self._release(worker)
+
+        error = outcome.get("error")
+        if error is not None:
+            with self._lock:
+                self._stats["failures"] += 1
+            if isinstance(error, ConversionError):
+                raise error
+            raise ConversionError(f"LibreOffice 변환 중 오류: {error}", source_path, target_ext)
+
+        with self._lock:
+            self._stats["conversions"] += 1
+        logger.info(f"LibreOffice 변환 성공: {source_path} -> {target_path}")
+        return True
+
+    def get_stats(self) -> Dict[str, float]:
+        """풀 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["workers"] = self._created
+        stats["idle"] = self._idle.qsize()
+        return stats
+
+    def shutdown(self):
+        """모든 워커 종료"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+_pool: Optional[LibreOfficeWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_libreoffice_pool() -> LibreOfficeWorkerPool:
+    """프로세스 공용 LibreOffice 워커 풀 반환"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                import atexit
+
+                _pool = LibreOfficeWorkerPool()
+                atexit.register(_pool.shutdown)
+    return _pool
@@ -2,7 +2,8 @@
 
 import os
 import tempfile
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from pathlib import Path
 import fitz  # PyMuPDF
 from docx import Document
@@ -14,6 +15,12 @@ import io
 
 from module.types import DocumentType, ContentType, ElementType, ContentMetrics, ClassificationResult
 
+# DOCX는 실제 페이지 정보가 없어 문단 수로 가상 페이지를 나눔
+DOCX_PARAGRAPHS_PER_PAGE = 12
+
+# 이보다 페이지 수가 적으면 프로세스 풀 기동 비용이 더 커서 순차 분석
+PARALLEL_MIN_PAGES = 8
+
 
 class PageContentAnalyzer:
     """개별 페이지/슬라이드의 콘텐츠 타입을 분석하는 클래스"""
@@ -28,226 +35,322 @@ class PageContentAnalyzer:
         }
     
     def analyze_pdf_page(self, pdf_path: str, page_num: int) -> ClassificationResult:
-        """PDF 특정 페이지 분석"""
+        """PDF 특정 페이지 분석 (여러 페이지 분석 시 analyze_pdf_document 사용)"""
         try:
             doc = fitz.open(pdf_path)
-            page = doc[page_num - 1]  # 0-based index
-            
-            # 텍스트 추출 및 분석
-            text = page.get_text()
-            text_blocks = page.get_text("dict")
-            
-            # 이미지 정보 추출
-            image_list = page.get_images()
-            
-            # 메트릭 계산
-            metrics = ContentMetrics()
-            metrics.text_length = len(text.strip())
-            metrics.word_count = len(text.split())
-            metrics.image_count = len(image_list)
-            metrics.has_selectable_text = bool(text.strip())
-            
-            # 텍스트 밀도 계산 (페이지 크기 대비)
-            page_area = page.rect.width * page.rect.height
-            text_area = sum(block.get("bbox", [0, 0, 0, 0])[2] * block.get("bbox", [0, 0, 0, 0])[3] 
-                          for block in text_blocks.get("blocks", []) if "lines" in block)
-            metrics.text_density = text_area / page_area if page_area > 0 else 0
-            
-            # 레이아웃 복잡도 분석
-            layout_complexity = self._analyze_pdf_layout_complexity(text_blocks)
-            
-            doc.close()
-            
-            # 분류 결정
-            content_type, confidence, reasoning = self._classify_page_content(
-                metrics, layout_complexity
-            )
-            
-            return ClassificationResult(
-                content_type=content_type,
-                confidence=confidence,
-                reasoning=reasoning,
-                metrics=metrics,
-                feature_scores={"layout_complexity": layout_complexity}
-            )
-            
+            try:
+                return self.analyze_pdf_page_object(doc[page_num - 1])  # 0-based index
+            finally:
+                doc.close()
+        except Exception as e:
+            print(f"PDF 페이지 {page_num} 분석 오류: {e}")
+            return self._default_result(e)
+    
+    def analyze_pdf_page_object(self, page: fitz.Page) -> ClassificationResult:
+        """이미 열린 PDF 페이지 객체 분석"""
+        # 텍스트 추출 및 분석
+        text = page.get_text()
+        text_blocks = page.get_text("dict")
+        
+        # 이미지 정보 추출
+        image_list = page.get_images()
+        
+        # 메트릭 계산
+        metrics = ContentMetrics()
+        metrics.text_length = len(text.strip())
+        metrics.word_count = len(text.split())
+        metrics.image_count = len(image_list)
+        metrics.has_selectable_text = bool(text.strip())
+        
+        # 텍스트 밀도 계산 (페이지 크기 대비)
+        page_area = page.rect.width * page.rect.height
+        text_area = sum(block.get("bbox", [0, 0, 0, 0])[2] * block.get("bbox", [0, 0, 0, 0])[3] 
+                      for block in text_blocks.get("blocks", []) if "lines" in block)
+        metrics.text_density = text_area / page_area if page_area > 0 else 0
+        
+        # 레이아웃 복잡도 분석
+        layout_complexity = self._analyze_pdf_layout_complexity(text_blocks)
+        
+        # 분류 결정
+        content_type, confidence, reasoning = self._classify_page_content(
+            metrics, layout_complexity
+        )
+        
+        return ClassificationResult(
+            content_type=content_type,
+            confidence=confidence,
+            reasoning=reasoning,
+            metrics=metrics,
+            feature_scores={"layout_complexity": layout_complexity}
+        )
+    
+    def analyze_pdf_document(self, pdf_path: str, doc: Optional[fitz.Document] = None,
+                             max_workers: Optional[int] = None) -> Iterator[Tuple[int, ClassificationResult]]:
+        """
+        PDF 전체 페이지를 파일 1회 열기로 분석하여 (페이지 번호, 분류 결과)를 순서대로 반환
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            doc: 이미 열린 문서 (순차 분석 시 재사용)
+            max_workers: 프로세스 풀 크기 (기본: PAGE_ANALYSIS_WORKERS 환경변수, 1이면 순차 분석)
+        """
+        max_workers = max_workers or int(os.getenv("PAGE_ANALYSIS_WORKERS", "1"))
+        
+        own_doc = doc is None
+        if own_doc:
+            doc = fitz.open(pdf_path)
+        try:
+            page_count = len(doc)
+            if max_workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+                if own_doc:
+                    doc.close()
+                    own_doc = False
+                yield from self._analyze_pdf_parallel(pdf_path, page_count, max_workers)
+                return
+            
+            for page_idx in range(page_count):
+                yield page_idx + 1, self._safe_analyze_pdf_page(doc[page_idx], page_idx + 1)
+        finally:
+            if own_doc:
+                doc.close()
+    
+    def _safe_analyze_pdf_page(self, page: fitz.Page, page_num: int) -> ClassificationResult:
+        try:
+            return self.analyze_pdf_page_object(page)
         except Exception as e:
             print(f"PDF 페이지 {page_num} 분석 오류: {e}")
-            return ClassificationResult(
-                content_type=ContentType.LAYOUT_BASED,
-                confidence=0.5,
-                reasoning=[f"분석 오류로 인한 기본값: {str(e)}"],
-                metrics=ContentMetrics()
-            )
+            return self._default_result(e)
+    
+    def _analyze_pdf_parallel(self, pdf_path: str, page_count: int,
+                              max_workers: int) -> Iterator[Tuple[int, ClassificationResult]]:
+        """페이지 구간을 프로세스 풀로 분산 분석 (워커마다 문서를 1회만 염)"""
+        chunk_size = max(1, -(-page_count // (max_workers * 4)))
+        ranges = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_analyze_pdf_page_range, pdf_path, start, end, self.thresholds)
+                for start, end in ranges
+            ]
+            for future in futures:
+                yield from future.result()
     
     def analyze_docx_page(self, docx_path: str, page_num: int) -> ClassificationResult:
-        """DOCX 가상 페이지 분석 (문단 기준으로 나눔)"""
+        """DOCX 가상 페이지 분석 (여러 페이지 분석 시 analyze_docx_document 사용)"""
         try:
-            doc = Document(docx_path)
-            paragraphs = doc.paragraphs
-            
-            # 페이지 당 약 10-15개 문단으로 가정하여 분할
-            paragraphs_per_page = 12
-            start_idx = (page_num - 1) * paragraphs_per_page
-            end_idx = min(start_idx + paragraphs_per_page, len(paragraphs))
-            
-            page_paragraphs = paragraphs[start_idx:end_idx]
-            
-            # 텍스트 분석
-            text_content = "\n".join([p.text for p in page_paragraphs])
-            
-            # 이미지 분석 (해당 문단 범위에서)
-            image_count = 0
-            for para in page_paragraphs:
-                for run in para.runs:
-                    if run._element.xpath('.//pic:pic'):
-                        image_count += 1
-            
-            # 메트릭 계산
-            metrics = ContentMetrics()
-            metrics.text_length = len(text_content.strip())
-            metrics.word_count = len(text_content.split())
-            metrics.paragraph_count = len([p for p in page_paragraphs if p.text.strip()])
-            metrics.image_count = image_count
-            
-            # 스타일 분석
-            style_diversity = len(set(p.style.name for p in page_paragraphs if p.style))
-            metrics.font_variation = style_diversity  # font_diversity 대신 font_variation 사용
-            
-            # 분류 결정
-            content_type, confidence, reasoning = self._classify_page_content(metrics)
-            
-            return ClassificationResult(
-                content_type=content_type,
-                confidence=confidence,
-                reasoning=reasoning,
-                metrics=metrics
-            )
-            
+            paragraphs = Document(docx_path).paragraphs
+            start_idx = (page_num - 1) * DOCX_PARAGRAPHS_PER_PAGE
+            return self.analyze_docx_paragraphs(paragraphs[start_idx:start_idx + DOCX_PARAGRAPHS_PER_PAGE])
         except Exception as e:
             print(f"DOCX 페이지 {page_num} 분석 오류: {e}")
-            return ClassificationResult(
-                content_type=ContentType.LAYOUT_BASED,
-                confidence=0.5,
-                reasoning=[f"분석 오류로 인한 기본값: {str(e)}"],
-                metrics=ContentMetrics()
-            )
+            return self._default_result(e)
+    
+    def analyze_docx_paragraphs(self, page_paragraphs: List) -> ClassificationResult:
+        """DOCX 가상 페이지(문단 묶음) 분석"""
+        # 텍스트 분석
+        text_content = "\n".join([p.text for p in page_paragraphs])
+        
+        # 이미지 분석 (해당 문단 범위에서)
+        image_count = 0
+        for para in page_paragraphs:
+            for run in para.runs:
+                if run._element.xpath('.//pic:pic'):
+                    image_count += 1
+        
+        # 메트릭 계산
+        metrics = ContentMetrics()
+        metrics.text_length = len(text_content.strip())
+        metrics.word_count = len(text_content.split())
+        metrics.paragraph_count = len([p for p in page_paragraphs if p.text.strip()])
+        metrics.image_count = image_count
+        
+        # 스타일 분석
+        style_diversity = len(set(p.style.name for p in page_paragraphs if p.style))
+        metrics.font_variation = style_diversity  # font_diversity 대신 font_variation 사용
+        
+        # 분류 결정
+        content_type, confidence, reasoning = self._classify_page_content(metrics)
+        
+        return ClassificationResult(
+            content_type=content_type,
+            confidence=confidence,
+            reasoning=reasoning,
+            metrics=metrics
+        )
+    
+    def analyze_docx_document(self, docx_path: str, paragraphs: Optional[List] = None,
+                              paragraphs_per_page: int = DOCX_PARAGRAPHS_PER_PAGE
+                              ) -> Iterator[Tuple[int, ClassificationResult]]:
+        """
+        DOCX를 1회만 로드하여 가상 페이지별 (페이지 번호, 분류 결과)를 순서대로 반환
+        
+        Args:
+            docx_path: DOCX 파일 경로
+            paragraphs: 이미 로드한 문단 목록 (재사용)
+            paragraphs_per_page: 가상 페이지당 문단 수
+        """
+        if paragraphs is None:
+            paragraphs = Document(docx_path).paragraphs
+        
+        for page_idx, start_idx in enumerate(range(0, len(paragraphs), paragraphs_per_page)):
+            try:
+                result = self.analyze_docx_paragraphs(paragraphs[start_idx:start_idx + paragraphs_per_page])
+            except Exception as e:
+                print(f"DOCX 페이지 {page_idx + 1} 분석 오류: {e}")
+                result = self._default_result(e)
+            yield page_idx + 1, result
     
     def analyze_pptx_slide(self, pptx_path: str, slide_num: int) -> ClassificationResult:
-        """PPTX 특정 슬라이드 분석"""
+        """PPTX 특정 슬라이드 분석 (여러 슬라이드 분석 시 analyze_pptx_document 사용)"""
         try:
             prs = Presentation(pptx_path)
             if slide_num > len(prs.slides):
                 raise IndexError(f"슬라이드 {slide_num}이 존재하지 않습니다")
             
-            slide = prs.slides[slide_num - 1]  # 0-based index
-            
-            # 텍스트 및 도형 분석
-            text_content = ""
-            image_count = 0
-            text_box_count = 0
-            shape_count = 0
-            
-            for shape in slide.shapes:
-                shape_count += 1
-                
-                if hasattr(shape, "text") and shape.text.strip():
-                    text_content += shape.text + "\n"
-                    text_box_count += 1
-                
-                if shape.shape_type == 13:  # 이미지
-                    image_count += 1
-            
-            # 메트릭 계산
-            metrics = ContentMetrics()
-            metrics.text_length = len(text_content.strip())
-            metrics.word_count = len(text_content.split())
-            metrics.image_count = image_count
-            metrics.shape_count = shape_count
-            metrics.text_box_count = text_box_count
-            
-            # 레이아웃 복잡도 (도형 수 기준)
-            layout_complexity = min(shape_count / 10.0, 1.0)  # 10개 이상이면 복잡
-            
-            # 분류 결정
-            content_type, confidence, reasoning = self._classify_page_content(
-                metrics, layout_complexity
-            )
-            
-            return ClassificationResult(
-                content_type=content_type,
-                confidence=confidence,
-                reasoning=reasoning,
-                metrics=metrics,
-                feature_scores={"layout_complexity": layout_complexity}
-            )
+            return self.analyze_pptx_slide_object(prs.slides[slide_num - 1])  # 0-based index
             
         except Exception as e:
             print(f"PPTX 슬라이드 {slide_num} 분석 오류: {e}")
-            return ClassificationResult(
-                content_type=ContentType.LAYOUT_BASED,
-                confidence=0.5,
-                reasoning=[f"분석 오류로 인한 기본값: {str(e)}"],
-                metrics=ContentMetrics()
-            )
+            return self._default_result(e)
+    
+    def analyze_pptx_slide_object(self, slide) -> ClassificationResult:
+        """이미 로드된 슬라이드 객체 분석"""
+        # 텍스트 및 도형 분석
+        text_content = ""
+        image_count = 0
+        text_box_count = 0
+        shape_count = 0
+        
+        for shape in slide.shapes:
+            shape_count += 1
+            
+            if hasattr(shape, "text") and shape.text.strip():
+                text_content += shape.text + "\n"
+                text_box_count += 1
+            
+            if shape.shape_type == 13:  # 이미지
+                image_count += 1
+        
+        # 메트릭 계산
+        metrics = ContentMetrics()
+        metrics.text_length = len(text_content.strip())
+        metrics.word_count = len(text_content.split())
+        metrics.image_count = image_count
+        metrics.shape_count = shape_count
+        metrics.text_box_count = text_box_count
+        
+        # 레이아웃 복잡도 (도형 수 기준)
+        layout_complexity = min(shape_count / 10.0, 1.0)  # 10개 이상이면 복잡
+        
+        # 분류 결정
+        content_type, confidence, reasoning = self._classify_page_content(
+            metrics, layout_complexity
+        )
+        
+        return ClassificationResult(
+            content_type=content_type,
+            confidence=confidence,
+            reasoning=reasoning,
+            metrics=metrics,
+            feature_scores={"layout_complexity": layout_complexity}
+        )
+    
+    def analyze_pptx_document(self, pptx_path: str, prs: Optional[Presentation] = None
+                              ) -> Iterator[Tuple[int, ClassificationResult]]:
+        """PPTX를 1회만 로드하여 슬라이드별 (슬라이드 번호, 분류 결과)를 순서대로 반환"""
+        if prs is None:
+            prs = Presentation(pptx_path)
+        
+        for slide_idx, slide in enumerate(prs.slides):
+            try:
+                result = self.analyze_pptx_slide_object(slide)
+            except Exception as e:
+                print(f"PPTX 슬라이드 {slide_idx + 1} 분석 오류: {e}")
+                result = self._default_result(e)
+            yield slide_idx + 1, result
     
     def analyze_xlsx_sheet(self, xlsx_path: str, sheet_num: int) -> ClassificationResult:
-        """XLSX 특정 시트 분석"""
+        """XLSX 특정 시트 분석 (여러 시트 분석 시 analyze_xlsx_document 사용)"""
         try:
             wb = load_workbook(xlsx_path, data_only=True)
-            sheet_names = wb.sheetnames
-            
-            if sheet_num > len(sheet_names):
-                raise IndexError(f"시트 {sheet_num}이 존재하지 않습니다")
-            
-            ws = wb[sheet_names[sheet_num - 1]]
-            
-            # 데이터 분석
-            text_content = ""
-            non_empty_cells = 0
-            total_cells = 0
-            
-            for row in ws.iter_rows(values_only=True):
-                for cell in row:
-                    total_cells += 1
-                    if cell is not None:
-                        non_empty_cells += 1
-                        text_content += str(cell) + " "
-            
-            wb.close()
-            
-            # 메트릭 계산
-            metrics = ContentMetrics()
-            metrics.text_length = len(text_content.strip())
-            metrics.word_count = len(text_content.split())
-            metrics.sheet_count = 1
-            metrics.non_empty_cell_ratio = non_empty_cells / total_cells if total_cells > 0 else 0
-            
-            # Excel은 기본적으로 text-based이지만, 빈 셀이 많으면 layout-based일 수 있음
-            content_type = ContentType.TEXT_BASED
-            confidence = 0.8
-            reasoning = ["Excel 시트는 기본적으로 텍스트 기반"]
-            
-            if metrics.non_empty_cell_ratio < 0.1:
-                content_type = ContentType.LAYOUT_BASED
-                confidence = 0.6
-                reasoning = ["빈 셀이 많아 레이아웃 중심으로 판단"]
-            
-            return ClassificationResult(
-                content_type=content_type,
-                confidence=confidence,
-                reasoning=reasoning,
-                metrics=metrics
-            )
+            try:
+                sheet_names = wb.sheetnames
+                
+                if sheet_num > len(sheet_names):
+                    raise IndexError(f"시트 {sheet_num}이 존재하지 않습니다")
+                
+                return self.analyze_xlsx_worksheet(wb[sheet_names[sheet_num - 1]])
+            finally:
+                wb.close()
             
         except Exception as e:
             print(f"XLSX 시트 {sheet_num} 분석 오류: {e}")
-            return ClassificationResult(
-                content_type=ContentType.TEXT_BASED,
-                confidence=0.5,
-                reasoning=[f"분석 오류로 인한 기본값: {str(e)}"],
-                metrics=ContentMetrics()
-            )
+            return self._default_result(e, ContentType.TEXT_BASED)
+    
+    def analyze_xlsx_worksheet(self, ws) -> ClassificationResult:
+        """이미 로드된 워크시트 분석"""
+        # 데이터 분석
+        text_content = ""
+        non_empty_cells = 0
+        total_cells = 0
+        
+        for row in ws.iter_rows(values_only=True):
+            for cell in row:
+                total_cells += 1
+                if cell is not None:
+                    non_empty_cells += 1
+                    text_content += str(cell) + " "
+        
+        # 메트릭 계산
+        metrics = ContentMetrics()
+        metrics.text_length = len(text_content.strip())
+        metrics.word_count = len(text_content.split())
+        metrics.sheet_count = 1
+        metrics.non_empty_cell_ratio = non_empty_cells / total_cells if total_cells > 0 else 0
+        
+        # Excel은 기본적으로 text-based이지만, 빈 셀이 많으면 layout-based일 수 있음
+        content_type = ContentType.TEXT_BASED
+        confidence = 0.8
+        reasoning = ["Excel 시트는 기본적으로 텍스트 기반"]
+        
+        if metrics.non_empty_cell_ratio < 0.1:
+            content_type = ContentType.LAYOUT_BASED
+            confidence = 0.6
+            reasoning = ["빈 셀이 많아 레이아웃 중심으로 판단"]
+        
+        return ClassificationResult(
+            content_type=content_type,
+            confidence=confidence,
+            reasoning=reasoning,
+            metrics=metrics
+        )
+    
+    def analyze_xlsx_document(self, xlsx_path: str, wb=None) -> Iterator[Tuple[int, ClassificationResult]]:
+        """XLSX를 1회만 로드하여 시트별 (시트 번호, 분류 결과)를 순서대로 반환"""
+        own_wb = wb is None
+        if own_wb:
+            wb = load_workbook(xlsx_path, data_only=True)
+        try:
+            for sheet_idx, sheet_name in enumerate(wb.sheetnames):
+                try:
+                    result = self.analyze_xlsx_worksheet(wb[sheet_name])
+                except Exception as e:
+                    print(f"XLSX 시트 {sheet_idx + 1} 분석 오류: {e}")
+                    result = self._default_result(e, ContentType.TEXT_BASED)
+                yield sheet_idx + 1, result
+        finally:
+            if own_wb:
+                wb.close()
+    
+    def _default_result(self, error: Exception,
+                        content_type: ContentType = ContentType.LAYOUT_BASED) -> ClassificationResult:
+        """분석 오류 시 기본 분류 결과"""
+        return ClassificationResult(
+            content_type=content_type,
+            confidence=0.5,
+            reasoning=[f"분석 오류로 인한 기본값: {str(error)}"],
+            metrics=ContentMetrics()
+        )
     
     def _analyze_pdf_layout_complexity(self, text_blocks: Dict) -> float:
         """PDF 페이지의 레이아웃 복잡도 분석"""
@@ -319,4 +422,20 @@ class PageContentAnalyzer:
         confidence = abs(score - 0.5) * 2  # 0.5에서 떨어진 정도를 신뢰도로 변환
         confidence = min(max(confidence, 0.1), 0.9)  # 0.1~0.9 범위로 제한
         
-        return content_type, confidence, reasoning
\ No newline at end of file
+        return content_type, confidence, reasoning
+
+
+def _analyze_pdf_page_range(pdf_path: str, start: int, end: int,
+                            thresholds: Dict[str, float]) -> List[Tuple[int, ClassificationResult]]:
+    """프로세스 풀 워커: 문서를 1회 열어 [start, end) 페이지 분석"""
+    analyzer = PageContentAnalyzer()
+    analyzer.thresholds = thresholds
+    
+    doc = fitz.open(pdf_path)
+    try:
+        return [
+            (page_idx + 1, analyzer._safe_analyze_pdf_page(doc[page_idx], page_idx + 1))
+            for page_idx in range(start, end)
+        ]
+    finally:
+        doc.close()
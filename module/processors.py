@@ -16,6 +16,7 @@ from openpyxl import load_workbook
 
 from module.exceptions import ContentExtractionError, ProcessingError
 from module.converters import ConverterFactory
+from module.vision_pipeline import VisionPagePipeline
 
 # .env 파일 로드
 load_dotenv()
@@ -1776,45 +1777,30 @@ class LayoutBasedProcessor(BaseProcessor):
             raise ProcessingError(f"PDF 변환 실패: {str(e)}", file_path)
     
     def _process_pdf_as_images(self, pdf_path: str, temp_dir: str) -> List[Dict[str, Any]]:
-        """PDF를 이미지로 변환하여 처리"""
+        """PDF를 이미지로 변환하여 처리 (페이지 병렬 처리, 실패 페이지는 텍스트로 대체)"""
         try:
             if not self.azure_processor:
                 logger.warning("Azure OpenAI 프로세서가 없어 텍스트 기반 처리로 대체")
                 return self._process_pdf_text_based(pdf_path)
             
-            doc = fitz.open(pdf_path)
+            prompt = "이 페이지의 모든 텍스트 내용을 추출하고, 표나 이미지가 있다면 설명해주세요."
+            pipeline = VisionPagePipeline(self.azure_processor)
             chunks = []
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # 페이지를 이미지로 변환
-                mat = fitz.Matrix(2.0, 2.0)  # 2배 확대
-                pix = page.get_pixmap(matrix=mat)
-                
-                # 임시 이미지 저장
-                image_filename = f"pdf_page{page_num + 1}.png"
-                image_path = os.path.join(temp_dir, image_filename)
-                pix.save(image_path)
-                
-                # GPT Vision으로 이미지 처리
-                prompt = "이 페이지의 모든 텍스트 내용을 추출하고, 표나 이미지가 있다면 설명해주세요."
-                text_content = self.azure_processor.image_to_text(image_path, prompt)
-                
+            for result in pipeline.process_pdf(pdf_path, prompt):
                 # 결과를 청크로 저장
                 metadata = {
                     "source_file": Path(pdf_path).name,
-                    "section_title": f"페이지 {page_num + 1}",
-                    "page_number": page_num + 1,
+                    "section_title": f"페이지 {result.page_number}",
+                    "page_number": result.page_number,
                     "element_type": "image_processed",
-                    "processing_method": "gpt_vision",
+                    "processing_method": result.processing_method,
                     "file_type": "pdf"
                 }
                 
-                chunk = self._create_text_chunk(text_content, metadata)
+                chunk = self._create_text_chunk(result.text, metadata)
                 chunks.append(chunk)
             
-            doc.close()
             logger.info(f"PDF 이미지 처리 완료: {len(chunks)}개 청크 생성")
             return chunks
             
@@ -0,0 +1,118 @@
+"""
+이미지→텍스트 결과 영구 캐시 (content-addressed)
+
+키: sha256(이미지 바이트) + sha256(프롬프트 + 모델 배포명 + 요청 파라미터 버전)
+같은 문서/슬라이드/첨부 이미지를 다시 처리할 때 비전 호출 없이 결과를 재사용한다.
+AzureOpenAIImageProcessor가 내부적으로 사용하므로 file_processor, processors,
+adaptive_processor가 모두 같은 캐시를 공유한다.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional
+
+from utils.sqlite_pool import get_sqlite_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DB = "vision_cache.db"
+
+
+def hash_image_bytes(image_bytes: bytes) -> str:
+    """이미지 바이트의 sha256 해시"""
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+def hash_request(prompt: str, model: str, params_version: str = "") -> str:
+    """프롬프트/모델/요청 파라미터 조합의 sha256 해시"""
+    key = "\x1f".join([model or "", params_version or "", prompt or ""])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class VisionResultCache:
+    """SQLite 기반 이미지→텍스트 결과 캐시"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: 캐시 DB 경로 (기본: VISION_CACHE_DB 환경변수, 없으면 vision_cache.db)
+        """
+        self.db_path = db_path or os.getenv("VISION_CACHE_DB", DEFAULT_CACHE_DB)
+        self._pool = get_sqlite_pool(self.db_path)
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._init_db()
+
+    def _init_db(self):
+        with self._pool.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS vision_results (
+                    image_hash TEXT NOT NULL,
+                    request_hash TEXT NOT NULL,
+                    model TEXT,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_hit_at REAL,
+                    hit_count INTEGER DEFAULT 0,
+                    PRIMARY KEY (image_hash, request_hash)
+                )
+            """)
+
+    def get(self, image_hash: str, request_hash: str) -> Optional[str]:
+        """캐시된 결과 조회 (없으면 None)"""
+        conn = self._pool.connection()
+        row = conn.execute(
+            "SELECT result FROM vision_results WHERE image_hash = ? AND request_hash = ?",
+            (image_hash, request_hash)
+        ).fetchone()
+
+        with self._stats_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if row is None:
+            return None
+
+        with conn:
+            conn.execute(
+                "UPDATE vision_results SET hit_count = hit_count + 1, last_hit_at = ? "
+                "WHERE image_hash = ? AND request_hash = ?",
+                (time.time(), image_hash, request_hash)
+            )
+        return row[0]
+
+    def put(self, image_hash: str, request_hash: str, result: str, model: str = ""):
+        """결과 저장 (같은 키가 있으면 덮어씀)"""
+        with self._pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO vision_results "
+                "(image_hash, request_hash, model, result, created_at, hit_count) VALUES (?, ?, ?, ?, ?, 0)",
+                (image_hash, request_hash, model, result, time.time())
+            )
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._pool.connection() as conn:
+            conn.execute("DELETE FROM vision_results")
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        """적중/미스 통계 (현재 프로세스 기준) + 저장된 항목 수"""
+        entries = self._pool.connection().execute("SELECT COUNT(*) FROM vision_results").fetchone()[0]
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "entries": entries
+        }
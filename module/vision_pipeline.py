@@ -0,0 +1,202 @@
+"""
+PDF 페이지 GPT Vision 처리 파이프라인
+
+페이지를 메모리상의 PNG 바이트로 렌더링하고, 동시 실행 수를 제한한 채
+비전 호출을 병렬로 수행한 뒤 페이지 순서대로 결과를 재조립한다.
+공유 임시 경로(temp_images/pdf_pageN.png)를 사용하지 않으므로 동시 업로드 간 충돌이 없다.
+"""
+
+import os
+import time
+import random
+import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Container, Iterable, Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_PROMPT = "이 페이지의 모든 텍스트 내용을 추출하고, 표나 이미지가 있다면 설명해주세요."
+
+
+@dataclass
+class VisionPageResult:
+    """페이지 단위 비전 처리 결과"""
+    page_number: int
+    text: str
+    processing_method: str  # 'gpt_vision' 또는 'text_extraction' (비전 실패 시 대체)
+    attempts: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+def render_pdf_pages(pdf_path: str, zoom: float = 2.0,
+                     skip_pages: Container[int] = ()) -> Iterator[Tuple[int, bytes]]:
+    """PDF 페이지를 PNG 바이트로 렌더링 (page_number는 1부터, skip_pages는 렌더링 생략)"""
+    doc = fitz.open(pdf_path)
+    try:
+        mat = fitz.Matrix(zoom, zoom)
+        for page_index in range(len(doc)):
+            if page_index + 1 in skip_pages:
+                continue
+            pix = doc[page_index].get_pixmap(matrix=mat)
+            yield page_index + 1, pix.tobytes("png")
+    finally:
+        doc.close()
+
+
+def extract_pdf_page_texts(pdf_path: str, page_numbers: Iterable[int]) -> dict:
+    """지정한 페이지의 텍스트 레이어 추출 (비전 실패 페이지 대체용)"""
+    texts = {}
+    doc = fitz.open(pdf_path)
+    try:
+        for page_number in page_numbers:
+            texts[page_number] = doc[page_number - 1].get_text()
+    finally:
+        doc.close()
+    return texts
+
+
+class VisionPagePipeline:
+    """
+    동시 실행 수 제한 + 재시도/백오프를 갖춘 페이지 비전 처리기
+
+    vision_client는 `image_bytes_to_text(image_bytes, prompt)`를 제공해야 하며,
+    없으면 `image_to_text(image_path, prompt)`를 고유 임시 파일로 호출한다.
+    테스트에서는 두 메서드 중 하나만 구현한 가짜 클라이언트를 주입하면 된다.
+    """
+
+    def __init__(
+        self,
+        vision_client,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            vision_client: AzureOpenAIImageProcessor 또는 호환 객체
+            max_concurrency: 동시 비전 호출 수 (기본: VISION_MAX_CONCURRENCY 환경변수, 없으면 4)
+            max_retries: 페이지당 최대 시도 횟수
+            backoff_base: 재시도 대기 기본값 (초, 지수 증가)
+            backoff_max: 재시도 대기 최대값 (초)
+            sleep: 대기 함수 (테스트 주입용)
+        """
+        self.vision_client = vision_client
+        self.max_concurrency = max(1, max_concurrency or int(os.getenv("VISION_MAX_CONCURRENCY", "4")))
+        self.max_retries = max(1, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sleep = sleep
+
+    def _call_vision(self, image_bytes: bytes, prompt: str) -> str:
+        if hasattr(self.vision_client, "image_bytes_to_text"):
+            return self.vision_client.image_bytes_to_text(image_bytes, prompt)
+
+        # 파일 경로 API만 제공하는 클라이언트: 요청마다 고유 임시 파일 사용
+        fd, image_path = tempfile.mkstemp(suffix=".png")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(image_bytes)
+            return self.vision_client.image_to_text(image_path, prompt)
+        finally:
+            os.remove(image_path)
+
+    def _process_page(self, page_number: int, image_bytes: bytes, prompt: str) -> VisionPageResult:
+        start = time.time()
+        last_error = None
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                text = self._call_vision(image_bytes, prompt)
+                return VisionPageResult(page_number, text, "gpt_vision", attempt, time.time() - start)
+            except Exception as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+                    delay *= 0.5 + random.random() / 2  # jitter
+                    logger.warning(f"페이지 {page_number} 비전 처리 실패 ({attempt}/{self.max_retries}), {delay:.1f}초 후 재시도: {e}")
+                    self._sleep(delay)
+
+        logger.error(f"페이지 {page_number} 비전 처리 최종 실패: {last_error}")
+        return VisionPageResult(page_number, "", "gpt_vision", self.max_retries, time.time() - start, str(last_error))
+
+    def process_pages(self, pages: Iterable[Tuple[int, bytes]], prompt: str = DEFAULT_PAGE_PROMPT,
+                      on_page_done: Optional[Callable[[VisionPageResult], None]] = None) -> List[VisionPageResult]:
+        """
+        페이지 이미지들을 병렬로 처리하고 페이지 순서대로 반환
+
+        렌더링은 소비 속도에 맞춰 진행되며, 처리 대기 중인 페이지 이미지는
+        최대 max_concurrency * 2개로 제한된다.
+        on_page_done은 비전 처리에 성공한 페이지마다 완료 즉시 호출된다 (체크포인트 기록용).
+        """
+        in_flight = threading.BoundedSemaphore(self.max_concurrency * 2)
+        futures = []
+
+        def _run(page_number: int, image_bytes: bytes) -> VisionPageResult:
+            try:
+                result = self._process_page(page_number, image_bytes, prompt)
+                if on_page_done is not None and not result.error:
+                    on_page_done(result)
+                return result
+            finally:
+                in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for page_number, image_bytes in pages:
+                in_flight.acquire()
+                futures.append(executor.submit(_run, page_number, image_bytes))
+            results = [future.result() for future in futures]
+
+        results.sort(key=lambda result: result.page_number)
+        return results
+
+    def process_pdf(self, pdf_path: str, prompt: str = DEFAULT_PAGE_PROMPT, zoom: float = 2.0,
+                    fallback_to_text: bool = True, checkpoint=None) -> List[VisionPageResult]:
+        """
+        PDF 전체를 페이지 단위로 처리
+
+        Args:
+            pdf_path: PDF 파일 경로
+            prompt: 페이지 분석 프롬프트
+            zoom: 렌더링 배율
+            fallback_to_text: 비전 처리에 최종 실패한 페이지는 텍스트 레이어로 대체
+            checkpoint: PageCheckpoint (지정 시 완료된 페이지는 재사용하고 새로 끝난 페이지를 기록)
+        """
+        start = time.time()
+        resumed = []
+        on_page_done = None
+        if checkpoint is not None:
+            for page_number, payload in checkpoint.completed_pages().items():
+                resumed.append(VisionPageResult(
+                    page_number, payload.get("text", ""), payload.get("processing_method", "gpt_vision")
+                ))
+            on_page_done = lambda result: checkpoint.record(
+                result.page_number, {"text": result.text, "processing_method": result.processing_method}
+            )
+            if resumed:
+                logger.info(f"체크포인트에서 {len(resumed)}페이지 재사용, 남은 페이지만 처리")
+
+        skip_pages = {result.page_number for result in resumed}
+        results = self.process_pages(render_pdf_pages(pdf_path, zoom, skip_pages), prompt, on_page_done)
+
+        failed = [result for result in results if result.error]
+        if failed and fallback_to_text:
+            texts = extract_pdf_page_texts(pdf_path, [result.page_number for result in failed])
+            for result in failed:
+                result.text = texts.get(result.page_number, "")
+                result.processing_method = "text_extraction"
+
+        if resumed:
+            results = sorted(resumed + results, key=lambda result: result.page_number)
+
+        logger.info(
+            f"PDF 비전 파이프라인 완료: {len(results)}페이지 (재사용 {len(resumed)}), 실패 {len(failed)}페이지, "
+            f"동시성 {self.max_concurrency}, {time.time() - start:.1f}초"
+        )
+        return results
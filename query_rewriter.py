@@ -5,13 +5,131 @@ Query Rewriter - 도메인 용어 사전 기반 쿼리 재작성
 glossary.csv를 활용하여 쿼리의 도메인 용어를 확장하고 개선합니다.
 """
 
+import os
 import csv
-import re
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 용어 뒤에 붙을 수 있는 한국어 조사 (제거 시 앞쪽 항목 우선)
+KOREAN_JOSA = ['은', '는', '이', '가', '을', '를', '에', '에서', '로', '와', '과', '의', '도', '만']
+
+# 용어 앞 경계 문자 / 용어 뒤 종료 문자 (공백은 str.isspace로 별도 확인)
+_PREFIX_CHARS = frozenset('(')
+_SUFFIX_CHARS = frozenset(')?,.!') | frozenset(josa[0] for josa in KOREAN_JOSA)
+
+# 트라이 노드에서 종료 항목 목록을 담는 키 (문자와 겹치지 않도록 빈 문자열 사용)
+_TERMINAL = ''
+
+
+def _strip_josa(text: str) -> str:
+    """매칭 텍스트 끝의 조사 하나 제거"""
+    for josa in KOREAN_JOSA:
+        if text.endswith(josa):
+            return text[:-len(josa)]
+    return text
+
+
+class GlossaryMatcher:
+    """
+    용어/동의어 전체를 한 번에 찾는 사전 컴파일 매처
+
+    모든 표면형(용어 + 동의어)을 소문자 문자 단위 트라이 하나로 구성하고,
+    쿼리의 단어 경계(시작, 공백, 여는 괄호)에서만 트라이를 따라가므로
+    쿼리당 비용이 사전 크기와 무관하게 O(쿼리 길이 × 최장 용어 길이)이다.
+
+    경계/조사 규칙(앞: 시작/공백/'(' · 뒤: 공백/')?,.!'/조사/끝, 대소문자 무시)과
+    매칭 위치/텍스트는 기존 용어별 정규식 구현과 동일하다.
+    """
+
+    def __init__(self, terms: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            terms: {term: {type, synonyms, expand_to}}
+        """
+        self._entries: List[Tuple[str, Dict[str, Any]]] = list(terms.items())
+        self._root: Dict[str, Any] = {}
+        self.pattern_count = 0
+
+        for term_index, (term, info) in enumerate(self._entries):
+            for search_index, search_term in enumerate([term] + info['synonyms']):
+                node = self._root
+                for char in search_term:
+                    node = node.setdefault(char.lower(), {})
+                node.setdefault(_TERMINAL, []).append((term_index, search_index))
+                self.pattern_count += 1
+
+    def _suffix_length(self, query: str, end: int) -> Optional[int]:
+        """용어 끝 위치에서 종료 조건을 만족하면 소비하는 문자 수, 아니면 None"""
+        if end == len(query):
+            return 0
+        char = query[end]
+        if char.isspace() or char in _SUFFIX_CHARS:
+            return 1
+        return None
+
+    def find(self, query: str) -> List[Dict[str, Any]]:
+        """
+        쿼리에서 도메인 용어 찾기
+
+        Returns:
+            [{term, matched_text, position, type, synonyms, expand_to}, ...] (위치 순, 중복 제거)
+        """
+        lowered = [char.lower() for char in query]
+        # 패턴별 마지막 매칭 끝 위치 (정규식 finditer의 비중첩 규칙 재현)
+        last_end: Dict[Tuple[int, int], int] = {}
+        found = []
+
+        for start in range(len(query)):
+            # (매칭 시작, 용어 시작): 쿼리 맨 앞은 경계 문자 없이, 이후는 경계 문자 다음부터
+            if start == 0 and not (query[0].isspace() or query[0] in _PREFIX_CHARS):
+                term_start = 0
+            elif query[start].isspace() or query[start] in _PREFIX_CHARS:
+                term_start = start + 1
+            else:
+                continue
+
+            node = self._root
+            position = term_start
+            while position < len(query):
+                node = node.get(lowered[position])
+                if node is None:
+                    break
+                position += 1
+                terminals = node.get(_TERMINAL)
+                if not terminals:
+                    continue
+                suffix = self._suffix_length(query, position)
+                if suffix is None:
+                    continue
+                match_end = position + suffix
+                for pattern in terminals:
+                    if last_end.get(pattern, 0) > start:
+                        continue
+                    last_end[pattern] = match_end
+                    found.append((start, pattern, query[start:match_end]))
+
+        found.sort(key=lambda item: (item[0], item[1]))
+
+        seen = set()
+        unique_terms = []
+        for position, (term_index, _), matched in found:
+            term, info = self._entries[term_index]
+            if (position, term) in seen:
+                continue
+            seen.add((position, term))
+            unique_terms.append({
+                'term': term,  # 원본 용어 (glossary의 키)
+                'matched_text': _strip_josa(matched.strip()).strip(),
+                'position': position,
+                'type': info['type'],
+                'synonyms': info['synonyms'],
+                'expand_to': info['expand_to']
+            })
+        return unique_terms
+
 
 class DomainGlossary:
     """도메인 용어 사전"""
@@ -25,10 +143,21 @@ class DomainGlossary:
         """
         self.glossary_path = glossary_path
         self.terms = {}  # {term: {type, synonyms, expand_to}}
+        self.matcher = GlossaryMatcher({})
+        self._loaded_mtime = None
+        self._reload_lock = threading.Lock()
         self.load_glossary()
 
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.glossary_path).st_mtime_ns
+        except OSError:
+            return None
+
     def load_glossary(self):
-        """glossary.csv 로드"""
+        """glossary.csv 로드 후 매처 컴파일 (완성된 사전/매처를 한 번에 교체)"""
+        mtime = self._file_mtime()
+        terms = {}
         try:
             with open(self.glossary_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
@@ -40,17 +169,32 @@ class DomainGlossary:
                     # 동의어 파싱 (쉼표로 구분)
                     synonyms = [s.strip() for s in row['synonyms'].split(',') if s.strip()]
 
-                    self.terms[term] = {
+                    terms[term] = {
                         'type': row['type'].strip(),
                         'synonyms': synonyms,
                         'expand_to': row['expand_to'].strip()
                     }
 
-            logger.info(f"✅ 도메인 용어 사전 로드 완료: {len(self.terms)}개 용어")
+            logger.info(f"✅ 도메인 용어 사전 로드 완료: {len(terms)}개 용어")
 
         except Exception as e:
             logger.error(f"❌ 도메인 용어 사전 로드 실패: {e}")
-            self.terms = {}
+            terms = {}
+
+        self.terms = terms
+        self.matcher = GlossaryMatcher(terms)
+        self._loaded_mtime = mtime
+
+    def reload_if_changed(self) -> bool:
+        """glossary.csv 수정 시각이 바뀌었으면 다시 로드 (다시 로드했으면 True)"""
+        if self._file_mtime() == self._loaded_mtime:
+            return False
+        with self._reload_lock:
+            if self._file_mtime() == self._loaded_mtime:
+                return False
+            logger.info(f"🔄 도메인 용어 사전 변경 감지, 다시 로드: {self.glossary_path}")
+            self.load_glossary()
+            return True
 
     def find_terms_in_query(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -62,53 +206,8 @@ class DomainGlossary:
         Returns:
             발견된 용어 리스트 [{term, type, synonyms, expand_to, position}, ...]
         """
-        found_terms = []
-
-        for term, info in self.terms.items():
-            # 원본 용어와 동의어 모두 검색
-            search_terms = [term] + info['synonyms']
-
-            for search_term in search_terms:
-                # 한국어는 단어 경계가 명확하지 않으므로
-                # 앞뒤에 공백/문장부호/시작/끝이 있는지만 확인
-                # 또는 한국어 조사(은/는/이/가/을/를/에/에서/로/와/과)가 붙을 수 있음
-                pattern = re.compile(
-                    r'(?:^|[\s\(])' +  # 시작 또는 공백/괄호
-                    re.escape(search_term) +
-                    r'(?:[\s\)\?,\.!]|은|는|이|가|을|를|에|에서|로|와|과|의|도|만|$)',  # 끝 또는 조사
-                    re.IGNORECASE
-                )
-
-                matches = pattern.finditer(query)
-
-                for match in matches:
-                    # 실제 매칭된 용어만 추출 (조사 제외)
-                    matched_text = match.group().strip()
-                    # 조사 제거
-                    for josa in ['은', '는', '이', '가', '을', '를', '에', '에서', '로', '와', '과', '의', '도', '만']:
-                        if matched_text.endswith(josa):
-                            matched_text = matched_text[:-len(josa)]
-                            break
-
-                    found_terms.append({
-                        'term': term,  # 원본 용어 (glossary의 키)
-                        'matched_text': matched_text.strip(),
-                        'position': match.start(),
-                        'type': info['type'],
-                        'synonyms': info['synonyms'],
-                        'expand_to': info['expand_to']
-                    })
-
-        # 위치 순으로 정렬, 중복 제거
-        seen = set()
-        unique_terms = []
-        for ft in sorted(found_terms, key=lambda x: x['position']):
-            key = (ft['position'], ft['term'])
-            if key not in seen:
-                unique_terms.append(ft)
-                seen.add(key)
-
-        return unique_terms
+        self.reload_if_changed()
+        return self.matcher.find(query)
 
 
 class QueryRewriter:
@@ -8,12 +8,18 @@ Streamlit 앱에서 문서 업로드, 처리, 벡터 DB 저장 기능을 제공
 import os
 import tempfile
 import hashlib
+import threading
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from pathlib import Path
 import uuid
 
 # FileProcessor import
 from module.file_processor import FileProcessor, DocumentType, FileTypeDetector
+from module.ingestion_manifest import (
+    IngestionManifest, get_ingestion_manifest,
+    STAGE_STORE, STATUS_IN_PROGRESS, STATUS_COMPLETED, STATUS_FAILED
+)
 
 # Vector DB import
 from vector_db_models import VectorDBManager, StructuredChunk
@@ -92,198 +98,180 @@ class DummyEmbeddingClient:
         """더미 문서 임베딩 생성"""
         return [self.embed_query(text) for text in texts]
 
-def embed_and_store_chunks(file_processing_result: Dict[str, Any], file_name: str) -> int:
+_vector_db_manager: Optional[VectorDBManager] = None
+_vector_db_manager_lock = threading.Lock()
+
+def get_vector_db_manager() -> VectorDBManager:
+    """
+    프로세스 공용 VectorDBManager 반환
+    
+    VectorDBManager 생성 시 RRF 시스템 초기화(BM25 인덱스 구축 포함)가 일어나므로
+    업로드마다 새로 만들지 않고 재사용한다.
+    """
+    global _vector_db_manager
+    if _vector_db_manager is None:
+        with _vector_db_manager_lock:
+            if _vector_db_manager is None:
+                _vector_db_manager = VectorDBManager()
+    return _vector_db_manager
+
+def reset_vector_db_manager():
+    """공용 VectorDBManager 폐기 (ChromaDB 재설정/전체 삭제 후 호출)"""
+    global _vector_db_manager
+    with _vector_db_manager_lock:
+        _vector_db_manager = None
+
+def _table_to_text(table_data: list) -> str:
+    """테이블 요소 내용을 텍스트로 변환"""
+    table_text = ""
+    for row in table_data:
+        if isinstance(row, list):
+            row_text = " | ".join(str(cell) for cell in row if cell)
+            if row_text:
+                table_text += row_text + "\n"
+    return table_text
+
+def collect_unified_chunks(file_processing_result: Dict[str, Any], file_name: str) -> List[UnifiedChunk]:
+    """
+    파일 처리 결과에서 저장할 UnifiedChunk 목록 생성
+    
+    Args:
+        file_processing_result: FileProcessor.process_file()에서 반환된 결과
+        file_name: 원본 파일명
+    
+    Returns:
+        UnifiedChunk 목록
+    """
+    # 파일 해시 (매니페스트 사용 시 내용 sha256, 없으면 파일명 기반)
+    content_hash = file_processing_result.get('file_hash')
+    file_hash = content_hash or hashlib.md5(file_name.encode()).hexdigest()
+    file_type = file_processing_result.get('file_type', 'unknown')
+    chunks = []
+    
+    def add_chunk(text: str, page_data: Dict[str, Any], page_idx: int, elements: list):
+        # 내용 해시가 있으면 청크 ID를 결정적으로 만들어 재개 시 upsert가 중복 없이 덮어쓰게 함
+        chunk_id = f"{content_hash[:16]}_{len(chunks)}" if content_hash else None
+        chunks.append(create_file_unified_chunk(
+            text_chunk=text,
+            file_name=file_name,
+            file_hash=file_hash,
+            file_type=file_type,
+            file_size=len(text),
+            architecture="dual_path_hybrid",
+            processing_method="file_processor",
+            vision_analysis=False,
+            section_title=page_data.get('section_title', ''),
+            page_number=page_data.get('page_number', page_idx + 1),
+            element_count=1,
+            elements=elements,
+            processing_duration=0.0,
+            chunk_id=chunk_id
+        ))
+    
+    # processed_pages 배열에서 청크 추출
+    processed_pages = file_processing_result.get('processed_pages', [])
+    print(f"📄 처리된 페이지 수: {len(processed_pages)}")
+    
+    for page_idx, page_data in enumerate(processed_pages):
+        try:
+            if not isinstance(page_data, dict):
+                # page_data가 dict가 아닌 경우 문자열로 처리
+                page_text = str(page_data)
+                if len(page_text.strip()) > 10:
+                    add_chunk(page_text, {}, page_idx, [])
+                continue
+            
+            # elements 배열에서 텍스트 추출
+            for element_idx, element in enumerate(page_data.get('elements', [])):
+                try:
+                    if not isinstance(element, dict):
+                        # element가 dict가 아닌 경우 문자열로 변환
+                        element_text = str(element)
+                        if len(element_text.strip()) > 10:
+                            add_chunk(element_text, page_data, page_idx, [element])
+                    
+                    # 텍스트 요소 처리
+                    elif element.get('element_type') == 'text':
+                        content = element.get('content', '')
+                        if content and len(content.strip()) > 10:
+                            add_chunk(content, page_data, page_idx, [element])
+                    
+                    # 테이블 요소 처리
+                    elif element.get('element_type') == 'table':
+                        table_data = element.get('content', [])
+                        if isinstance(table_data, list) and table_data:
+                            table_text = _table_to_text(table_data)
+                            if table_text and len(table_text.strip()) > 10:
+                                add_chunk(table_text, page_data, page_idx, [element])
+                
+                except Exception as e:
+                    print(f"❌ 페이지 {page_idx+1} element {element_idx} 처리 실패: {e}")
+                    continue
+        
+        except Exception as e:
+            print(f"❌ 페이지 {page_idx+1} 처리 실패: {e}")
+            continue
+    
+    return chunks
+
+def embed_and_store_chunks(file_processing_result: Dict[str, Any], file_name: str,
+                           batch_size: Optional[int] = None,
+                           manifest: Optional[IngestionManifest] = None) -> int:
     """
-    파일 처리 결과를 임베딩하고 벡터 DB에 저장
+    파일 처리 결과를 임베딩하고 벡터 DB에 저장 (배치 단위 임베딩/upsert)
     
     Args:
         file_processing_result: FileProcessor.process_file()에서 반환된 결과
         file_name: 원본 파일명
+        batch_size: 배치 크기 (기본: VECTOR_DB_BATCH_SIZE 환경변수)
+        manifest: 수집 매니페스트 (결과에 file_hash가 있으면 store 단계 완료 여부를 기록)
     
     Returns:
         저장된 청크 개수
     """
+    file_hash = file_processing_result.get('file_hash') if isinstance(file_processing_result, dict) else None
+    if manifest is None or not file_hash:
+        return _embed_and_store_chunks(file_processing_result, file_name, batch_size)
+    
+    manifest.mark_stage(file_hash, STAGE_STORE, STATUS_IN_PROGRESS)
+    stats = _embed_and_store_chunks(file_processing_result, file_name, batch_size, return_stats=True)
+    if stats["stored"] > 0 and stats["failed"] == 0:
+        manifest.mark_stage(file_hash, STAGE_STORE, STATUS_COMPLETED, {"chunks": stats["stored"]})
+    else:
+        manifest.mark_stage(file_hash, STAGE_STORE, STATUS_FAILED, {"stored": stats["stored"], "failed": stats["failed"]})
+    return stats["stored"]
+
+def _embed_and_store_chunks(file_processing_result: Dict[str, Any], file_name: str,
+                            batch_size: Optional[int] = None, return_stats: bool = False):
+    """embed_and_store_chunks 본체 (return_stats=True면 저장 통계 dict 반환)"""
+    empty_stats = {"stored": 0, "failed": 0}
     try:
-        # ChromaDB 기본 임베딩을 사용하므로 별도 임베딩 클라이언트 불필요
-        vector_db = VectorDBManager()
-        
-        # 파일 해시 생성 (중복 방지용)
-        file_hash = hashlib.md5(file_name.encode()).hexdigest()
-        
-        stored_count = 0
-        
         # FileProcessor.process_file의 결과 구조 확인
         if not isinstance(file_processing_result, dict):
             print(f"❌ 예상치 못한 결과 타입: {type(file_processing_result)}")
-            return 0
-        
-        print(f"📊 파일 처리 결과 키들: {list(file_processing_result.keys())}")
+            return empty_stats if return_stats else 0
         
-        # processed_pages 배열에서 청크 추출
-        processed_pages = file_processing_result.get('processed_pages', [])
-        print(f"📄 처리된 페이지 수: {len(processed_pages)}")
+        chunks = collect_unified_chunks(file_processing_result, file_name)
+        if not chunks:
+            print("⚠️ 저장할 청크가 없습니다.")
+            return empty_stats if return_stats else 0
         
-        for page_idx, page_data in enumerate(processed_pages):
-            try:
-                print(f"🔍 페이지 {page_idx+1} 처리 중...")
-                print(f"📊 페이지 데이터 구조: {type(page_data)}")
-                
-                if isinstance(page_data, dict):
-                    print(f"📊 페이지 데이터 키들: {list(page_data.keys())}")
-                    
-                    # elements 배열에서 텍스트 추출
-                    elements = page_data.get('elements', [])
-                    print(f"🔍 elements 개수: {len(elements)}")
-                    
-                    for element_idx, element in enumerate(elements):
-                        try:
-                            print(f"🔍 element {element_idx}: {type(element)}")
-                            
-                            if isinstance(element, dict):
-                                # 텍스트 요소 처리
-                                if element.get('element_type') == 'text':
-                                    content = element.get('content', '')
-                                    if content and len(content.strip()) > 10:
-                                        print(f"✅ 텍스트 요소에서 내용 추출: {len(content)}자")
-
-                                        # UnifiedChunk 객체 생성 (파일 데이터)
-                                        unified_chunk = create_file_unified_chunk(
-                                            text_chunk=content,
-                                            file_name=file_name,
-                                            file_hash=file_hash,
-                                            file_type=file_processing_result.get('file_type', 'unknown'),
-                                            file_size=len(content),
-                                            architecture="dual_path_hybrid",
-                                            processing_method="file_processor",
-                                            vision_analysis=False,
-                                            section_title=page_data.get('section_title', ''),
-                                            page_number=page_data.get('page_number', page_idx + 1),
-                                            element_count=1,
-                                            elements=[element],
-                                            processing_duration=0.0
-                                        )
-
-                                        # 벡터 DB에 저장
-                                        vector_db.add_unified_chunk(unified_chunk)
-                                        stored_count += 1
-                                        print(f"✅ 텍스트 청크 {stored_count} 저장 완료")
-                                
-                                # 테이블 요소 처리
-                                elif element.get('element_type') == 'table':
-                                    table_data = element.get('content', [])
-                                    if isinstance(table_data, list) and table_data:
-                                        # 테이블을 텍스트로 변환
-                                        table_text = ""
-                                        for row in table_data:
-                                            if isinstance(row, list):
-                                                row_text = " | ".join(str(cell) for cell in row if cell)
-                                                if row_text:
-                                                    table_text += row_text + "\n"
-
-                                        if table_text and len(table_text.strip()) > 10:
-                                            print(f"✅ 테이블 요소에서 내용 추출: {len(table_text)}자")
-
-                                            # UnifiedChunk 객체 생성 (파일 데이터)
-                                            unified_chunk = create_file_unified_chunk(
-                                                text_chunk=table_text,
-                                                file_name=file_name,
-                                                file_hash=file_hash,
-                                                file_type=file_processing_result.get('file_type', 'unknown'),
-                                                file_size=len(table_text),
-                                                architecture="dual_path_hybrid",
-                                                processing_method="file_processor",
-                                                vision_analysis=False,
-                                                section_title=page_data.get('section_title', ''),
-                                                page_number=page_data.get('page_number', page_idx + 1),
-                                                element_count=1,
-                                                elements=[element],
-                                                processing_duration=0.0
-                                            )
-
-                                            # 벡터 DB에 저장
-                                            vector_db.add_unified_chunk(unified_chunk)
-                                            stored_count += 1
-                                            print(f"✅ 테이블 청크 {stored_count} 저장 완료")
-                            
-                            else:
-                                # element가 dict가 아닌 경우 문자열로 변환
-                                element_text = str(element)
-                                if len(element_text.strip()) > 10:
-                                    print(f"✅ element {element_idx}를 문자열로 변환: {len(element_text)}자")
-
-                                    # UnifiedChunk 객체 생성 (파일 데이터)
-                                    unified_chunk = create_file_unified_chunk(
-                                        text_chunk=element_text,
-                                        file_name=file_name,
-                                        file_hash=file_hash,
-                                        file_type=file_processing_result.get('file_type', 'unknown'),
-                                        file_size=len(element_text),
-                                        architecture="dual_path_hybrid",
-                                        processing_method="file_processor",
-                                        vision_analysis=False,
-                                        section_title=page_data.get('section_title', ''),
-                                        page_number=page_data.get('page_number', page_idx + 1),
-                                        element_count=1,
-                                        elements=[element],
-                                        processing_duration=0.0
-                                    )
-
-                                    # 벡터 DB에 저장
-                                    vector_db.add_unified_chunk(unified_chunk)
-                                    stored_count += 1
-                                    print(f"✅ 문자열 청크 {stored_count} 저장 완료")
-                        
-                        except Exception as e:
-                            print(f"❌ element {element_idx} 처리 실패: {e}")
-                            continue
-                
-                else:
-                    # page_data가 dict가 아닌 경우 문자열로 처리
-                    page_text = str(page_data)
-                    if len(page_text.strip()) > 10:
-                        print(f"✅ 페이지 {page_idx+1}를 문자열로 변환: {len(page_text)}자")
-                        
-                        # 청크 ID 생성
-                        chunk_id = str(uuid.uuid4())
-                        
-                        # FileChunk 객체 생성
-                        file_chunk = FileChunk(
-                            chunk_id=chunk_id,
-                            file_name=file_name,
-                            file_hash=file_hash,
-                            text_chunk=page_text,
-                            architecture="dual_path_hybrid",
-                            processing_method="file_processor",
-                            vision_analysis=False,
-                            section_title="",
-                            page_number=page_idx + 1,
-                            element_count=1,
-                            file_type=file_processing_result.get('file_type', 'unknown'),
-                            elements=[],
-                            created_at=datetime.now().isoformat(),
-                            file_size=len(page_text),
-                            processing_duration=0.0
-                        )
-                        
-                        # 벡터 DB에 저장
-                        vector_db.add_file_chunk(file_chunk)
-                        stored_count += 1
-                        print(f"✅ 페이지 청크 {stored_count} 저장 완료")
-                
-            except Exception as e:
-                print(f"❌ 페이지 {page_idx+1} 처리 실패: {e}")
-                continue
-    
-        return stored_count
+        # ChromaDB 기본 임베딩을 사용하므로 별도 임베딩 클라이언트 불필요
+        stats = get_vector_db_manager().add_unified_chunks(chunks, batch_size=batch_size)
+        print(
+            f"📊 {file_name}: {stats['stored']}개 청크 저장, {stats['batches']}개 배치, "
+            f"{stats['chunks_per_second']}개/초"
+        )
+        return stats if return_stats else stats["stored"]
         
     except Exception as e:
         print(f"❌ 청크 임베딩 및 저장 실패: {e}")
-        return 0
+        return empty_stats if return_stats else 0
 
 def get_db_statistics() -> Dict[str, int]:
     """벡터 DB 통계 정보 조회"""
     try:
-        vector_db = VectorDBManager()
+        vector_db = get_vector_db_manager()
         
         # 파일 청크 개수 조회
         file_chunks_count = vector_db.get_file_chunks_count()
@@ -303,8 +291,10 @@ def get_db_statistics() -> Dict[str, int]:
 def clear_all_data():
     """벡터 DB의 모든 데이터 삭제"""
     try:
-        vector_db = VectorDBManager()
+        vector_db = get_vector_db_manager()
         vector_db.clear_all_data()
+        reset_vector_db_manager()
+        get_ingestion_manifest().clear()  # 저장 기록도 함께 초기화 (재업로드 시 건너뛰지 않도록)
         print("✅ 모든 데이터가 삭제되었습니다.")
         return True
     except Exception as e:
@@ -321,6 +311,8 @@ def reset_chromadb():
         
         # 강제 재설정 실행
         success = vector_db.force_reset_chromadb()
+        reset_vector_db_manager()
+        get_ingestion_manifest().clear()
         
         if success:
             print("✅ ChromaDB 재설정이 완료되었습니다!")
@@ -418,8 +410,9 @@ def process_uploaded_files(uploaded_files):
         deployment_name=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
     )
     
-    # FileProcessor 인스턴스 생성
-    file_processor = FileProcessor(azure_processor)
+    # FileProcessor 인스턴스 생성 (매니페스트로 중복 건너뛰기/중단 지점 재개)
+    manifest = get_ingestion_manifest()
+    file_processor = FileProcessor(azure_processor, manifest=manifest)
     
     total_chunks = 0
     processed_files = 0
@@ -437,13 +430,16 @@ def process_uploaded_files(uploaded_files):
                 doc_type = FileTypeDetector.detect_file_type(tmp_file_path)
                 
                 # 파일 처리
-                result = file_processor.process_file(tmp_file_path)
+                result = file_processor.process_file(tmp_file_path, uploaded_file.name)
                 
-                if result and result.get('processed_pages'):
+                if result and result.get('skipped'):
+                    st.info(f"⏭️ {uploaded_file.name}은 이미 저장된 파일입니다. 건너뜁니다.")
+                elif result and result.get('processed_pages'):
                     # 청크 임베딩 및 저장
                     chunks_stored = embed_and_store_chunks(
                         result, 
-                        uploaded_file.name
+                        uploaded_file.name,
+                        manifest=manifest
                     )
                     
                     if chunks_stored > 0:
@@ -479,7 +475,7 @@ def process_uploaded_files_with_structured_chunking(uploaded_files, use_structur
         return
     
     # Vector DB 초기화
-    vector_db = VectorDBManager()
+    vector_db = get_vector_db_manager()
     
     # FileProcessor 초기화
     azure_processor = None  # 구조적 청킹에서는 Vision 처리 불필요
@@ -489,6 +485,7 @@ def process_uploaded_files_with_structured_chunking(uploaded_files, use_structur
     processed_files = 0
     
     for uploaded_file in uploaded_files:
+        tmp_file_path = None
         try:
             # 임시 파일로 저장
             with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
@@ -497,36 +494,36 @@ def process_uploaded_files_with_structured_chunking(uploaded_files, use_structur
             
             # 파일 처리
             with st.spinner(f"📄 {uploaded_file.name} 구조적 청킹 처리 중..."):
+                store_stats = None
                 if use_structured_chunking:
-                    # 구조적 청킹 처리
-                    structured_chunks = file_processor.process_with_structured_chunking(tmp_file_path)
+                    # 구조적 청킹 처리 (행 단위 스트리밍 → 배치 저장)
+                    file_type = Path(tmp_file_path).suffix.lower()
+                    structured_chunk_objs = (
+                        StructuredChunk(
+                            chunk_id=str(uuid.uuid4()),
+                            content=structured_chunk.content,
+                            chunk_type=structured_chunk.chunk_type,
+                            ticket_id=structured_chunk.ticket_id,
+                            field_name=structured_chunk.field_name,
+                            field_value=structured_chunk.field_value,
+                            priority=structured_chunk.priority,
+                            file_name=uploaded_file.name,
+                            file_type=file_type,
+                            metadata=structured_chunk.metadata,
+                            created_at=datetime.now().isoformat(),
+                            commenter=structured_chunk.commenter
+                        )
+                        for structured_chunk in file_processor.iter_structured_chunks(tmp_file_path)
+                    )
                     
-                    if structured_chunks:
-                        # 구조적 청크들을 Vector DB에 저장
-                        chunks_stored = 0
-                        for structured_chunk in structured_chunks:
-                            # StructuredChunk 객체 생성
-                            chunk_id = str(uuid.uuid4())
-                            file_hash = hashlib.md5(uploaded_file.getvalue()).hexdigest()
-                            
-                            structured_chunk_obj = StructuredChunk(
-                                chunk_id=chunk_id,
-                                content=structured_chunk.content,
-                                chunk_type=structured_chunk.chunk_type,
-                                ticket_id=structured_chunk.ticket_id,
-                                field_name=structured_chunk.field_name,
-                                field_value=structured_chunk.field_value,
-                                priority=structured_chunk.priority,
-                                file_name=uploaded_file.name,
-                                file_type=Path(tmp_file_path).suffix.lower(),
-                                metadata=structured_chunk.metadata,
-                                created_at=datetime.now().isoformat(),
-                                commenter=structured_chunk.commenter
-                            )
-                            
-                            # Vector DB에 저장
-                            if vector_db.add_structured_chunk(structured_chunk_obj):
-                                chunks_stored += 1
+                    # Vector DB에 배치 단위로 저장 (파싱 오류 시 저장된 배치는 롤백됨)
+                    try:
+                        store_stats = vector_db.add_structured_chunks(structured_chunk_objs)
+                    except Exception as e:
+                        st.warning(f"⚠️ {uploaded_file.name} 구조적 청킹 중 오류 발생: {e}")
+                    
+                    if store_stats and store_stats["total"] > 0:
+                        chunks_stored = store_stats["stored"]
                         
                         if chunks_stored > 0:
                             st.success(f"✅ {uploaded_file.name} 구조적 청킹 완료! {chunks_stored}개의 구조적 청크가 저장되었습니다.")
@@ -534,18 +531,11 @@ def process_uploaded_files_with_structured_chunking(uploaded_files, use_structur
                             processed_files += 1
                         else:
                             st.warning(f"⚠️ {uploaded_file.name} 구조적 청킹 완료되었지만 저장된 청크가 없습니다.")
-                    else:
+                
+                if not store_stats or store_stats["total"] == 0:
+                    if use_structured_chunking:
                         st.warning(f"⚠️ {uploaded_file.name} 구조적 청킹을 적용할 수 없습니다. 일반 처리로 전환합니다.")
-                        # 일반 처리로 폴백
-                        result = file_processor.process_file(tmp_file_path)
-                        if result and result.get('processed_pages'):
-                            chunks_stored = embed_and_store_chunks(result, uploaded_file.name)
-                            if chunks_stored > 0:
-                                st.success(f"✅ {uploaded_file.name} 일반 처리 완료! {chunks_stored}개의 청크가 저장되었습니다.")
-                                total_chunks += chunks_stored
-                                processed_files += 1
-                else:
-                    # 일반 처리
+                    # 일반 처리 (구조적 청킹 미적용/실패 시 폴백)
                     result = file_processor.process_file(tmp_file_path)
                     if result and result.get('processed_pages'):
                         chunks_stored = embed_and_store_chunks(result, uploaded_file.name)
@@ -554,11 +544,12 @@ def process_uploaded_files_with_structured_chunking(uploaded_files, use_structur
                             total_chunks += chunks_stored
                             processed_files += 1
             
-            # 임시 파일 삭제
-            os.unlink(tmp_file_path)
-            
         except Exception as e:
             st.error(f"❌ {uploaded_file.name} 처리 중 오류 발생: {e}")
+        finally:
+            # 임시 파일 삭제
+            if tmp_file_path and os.path.exists(tmp_file_path):
+                os.unlink(tmp_file_path)
     
     # 전체 결과 요약
     if processed_files > 0:
@@ -568,7 +559,7 @@ def process_uploaded_files_with_structured_chunking(uploaded_files, use_structur
 def get_structured_chunk_stats():
     """구조적 청크 통계 조회"""
     try:
-        vector_db = VectorDBManager()
+        vector_db = get_vector_db_manager()
         stats = vector_db.get_structured_chunk_stats()
         return stats
     except Exception as e:
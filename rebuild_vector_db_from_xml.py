@@ -9,7 +9,7 @@ XML Jira 데이터를 원문 그대로 사용하여 Vector DB 재구축
 import xml.etree.ElementTree as ET
 import re
 import html
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import chromadb
 from chromadb.config import Settings
 from clean_korean_embedding import CleanKoreanEmbeddingFunction
@@ -143,110 +143,136 @@ def clean_html_content(html_content: str) -> str:
     
     return text.strip()
 
-def parse_jira_xml(xml_file_path: str) -> List[Dict[str, Any]]:
-    """XML 파일에서 Jira 티켓 데이터 파싱"""
-    logger.info(f"📄 XML 파일 파싱 시작: {xml_file_path}")
+def _ticket_from_item(item: ET.Element) -> Dict[str, Any]:
+    """RSS item 요소 하나를 티켓 딕셔너리로 변환"""
+    # 기본 정보 추출
+    key_elem = item.find('key')
+    title_elem = item.find('title')
+    summary_elem = item.find('summary')
+    description_elem = item.find('description')
+    type_elem = item.find('type')
+    priority_elem = item.find('priority')
+    status_elem = item.find('status')
+    assignee_elem = item.find('assignee')
+    reporter_elem = item.find('reporter')
+    created_elem = item.find('created')
+    updated_elem = item.find('updated')
+    
+    # 키 추출
+    key = key_elem.text if key_elem is not None else "UNKNOWN"
+    
+    # 제목 추출 (title에서 [KEY] 부분 제거)
+    title = title_elem.text if title_elem is not None else ""
+    if title.startswith(f"[{key}]"):
+        title = title[len(f"[{key}]"):].strip()
+    
+    # 요약 추출
+    summary = summary_elem.text if summary_elem is not None else ""
+    if summary.startswith(f"[{key}]"):
+        summary = summary[len(f"[{key}]"):].strip()
+    
+    # 설명 추출 및 HTML 정리
+    description = ""
+    if description_elem is not None and description_elem.text:
+        description = clean_html_content(description_elem.text)
+    
+    # 기타 메타데이터
+    issue_type = type_elem.text if type_elem is not None else "Unknown"
+    priority = priority_elem.text if priority_elem is not None else "Unknown"
+    status = status_elem.text if status_elem is not None else "Unknown"
+    assignee = assignee_elem.text if assignee_elem is not None else "Unknown"
+    reporter = reporter_elem.text if reporter_elem is not None else "Unknown"
+    created = created_elem.text if created_elem is not None else ""
+    updated = updated_elem.text if updated_elem is not None else ""
+    
+    # 댓글 데이터 추출
+    comments = []
+    comments_elem = item.find('comments')
+    if comments_elem is not None:
+        for comment_elem in comments_elem.findall('comment'):
+            comment_text = ""
+            comment_author = "Unknown"
+            comment_date = ""
+            
+            # 댓글 텍스트 추출
+            if comment_elem.text:
+                comment_text = clean_html_content(comment_elem.text)
+            
+            # 댓글 작성자 추출
+            author_elem = comment_elem.find('author')
+            if author_elem is not None:
+                comment_author = author_elem.text or "Unknown"
+            
+            # 댓글 날짜 추출
+            date_elem = comment_elem.find('created')
+            if date_elem is not None:
+                comment_date = date_elem.text or ""
+            
+            if comment_text.strip():
+                comments.append({
+                    'text': comment_text,
+                    'author': comment_author,
+                    'date': comment_date
+                })
+    
+    # 티켓 데이터 구성
+    ticket = {
+        'Key': key,
+        'Summary': summary or title,  # summary가 없으면 title 사용
+        'Description': description,
+        'Status': status,
+        'Priority': priority,
+        'Issue Type': issue_type,
+        'Assignee': assignee,
+        'Reporter': reporter,
+        'Created': created,
+        'Updated': updated,
+        'Comments': comments
+    }
+    
+    return ticket
+
+def iter_jira_xml(xml_file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Jira XML 내보내기 파일을 스트리밍 파싱하여 티켓을 하나씩 반환
     
-    try:
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
+    iterparse로 item 요소가 끝날 때마다 티켓을 만들고 즉시 트리에서 제거하므로
+    파일 크기와 관계없이 메모리 사용량이 티켓 1개 수준으로 유지된다.
+    """
+    stack: List[ET.Element] = []
+    item_depth = 0
+    
+    for event, elem in ET.iterparse(xml_file_path, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            if elem.tag == "item":
+                item_depth += 1
+            continue
         
-        tickets = []
+        stack.pop()
+        if elem.tag != "item":
+            continue
         
-        # RSS 구조에서 item 요소들 찾기
-        for item in root.findall('.//item'):
-            try:
-                # 기본 정보 추출
-                key_elem = item.find('key')
-                title_elem = item.find('title')
-                summary_elem = item.find('summary')
-                description_elem = item.find('description')
-                type_elem = item.find('type')
-                priority_elem = item.find('priority')
-                status_elem = item.find('status')
-                assignee_elem = item.find('assignee')
-                reporter_elem = item.find('reporter')
-                created_elem = item.find('created')
-                updated_elem = item.find('updated')
-                
-                # 키 추출
-                key = key_elem.text if key_elem is not None else "UNKNOWN"
-                
-                # 제목 추출 (title에서 [KEY] 부분 제거)
-                title = title_elem.text if title_elem is not None else ""
-                if title.startswith(f"[{key}]"):
-                    title = title[len(f"[{key}]"):].strip()
-                
-                # 요약 추출
-                summary = summary_elem.text if summary_elem is not None else ""
-                if summary.startswith(f"[{key}]"):
-                    summary = summary[len(f"[{key}]"):].strip()
-                
-                # 설명 추출 및 HTML 정리
-                description = ""
-                if description_elem is not None and description_elem.text:
-                    description = clean_html_content(description_elem.text)
-                
-                # 기타 메타데이터
-                issue_type = type_elem.text if type_elem is not None else "Unknown"
-                priority = priority_elem.text if priority_elem is not None else "Unknown"
-                status = status_elem.text if status_elem is not None else "Unknown"
-                assignee = assignee_elem.text if assignee_elem is not None else "Unknown"
-                reporter = reporter_elem.text if reporter_elem is not None else "Unknown"
-                created = created_elem.text if created_elem is not None else ""
-                updated = updated_elem.text if updated_elem is not None else ""
-                
-                # 댓글 데이터 추출
-                comments = []
-                comments_elem = item.find('comments')
-                if comments_elem is not None:
-                    for comment_elem in comments_elem.findall('comment'):
-                        comment_text = ""
-                        comment_author = "Unknown"
-                        comment_date = ""
-                        
-                        # 댓글 텍스트 추출
-                        if comment_elem.text:
-                            comment_text = clean_html_content(comment_elem.text)
-                        
-                        # 댓글 작성자 추출
-                        author_elem = comment_elem.find('author')
-                        if author_elem is not None:
-                            comment_author = author_elem.text or "Unknown"
-                        
-                        # 댓글 날짜 추출
-                        date_elem = comment_elem.find('created')
-                        if date_elem is not None:
-                            comment_date = date_elem.text or ""
-                        
-                        if comment_text.strip():
-                            comments.append({
-                                'text': comment_text,
-                                'author': comment_author,
-                                'date': comment_date
-                            })
-                
-                # 티켓 데이터 구성
-                ticket = {
-                    'Key': key,
-                    'Summary': summary or title,  # summary가 없으면 title 사용
-                    'Description': description,
-                    'Status': status,
-                    'Priority': priority,
-                    'Issue Type': issue_type,
-                    'Assignee': assignee,
-                    'Reporter': reporter,
-                    'Created': created,
-                    'Updated': updated,
-                    'Comments': comments
-                }
-                
-                tickets.append(ticket)
-                
-            except Exception as e:
-                logger.warning(f"⚠️ 티켓 파싱 실패: {e}")
-                continue
+        item_depth -= 1
+        if item_depth > 0:
+            continue  # 중첩 item은 바깥 item과 함께 처리
         
+        try:
+            yield _ticket_from_item(elem)
+        except Exception as e:
+            logger.warning(f"⚠️ 티켓 파싱 실패: {e}")
+        
+        # 처리한 item을 부모에서 제거하여 메모리 해제
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+def parse_jira_xml(xml_file_path: str) -> List[Dict[str, Any]]:
+    """XML 파일에서 Jira 티켓 데이터 파싱 (대용량 파일은 iter_jira_xml 사용)"""
+    logger.info(f"📄 XML 파일 파싱 시작: {xml_file_path}")
+    
+    try:
+        tickets = list(iter_jira_xml(xml_file_path))
         logger.info(f"✅ {len(tickets)}개 티켓 파싱 완료")
         return tickets
         
@@ -254,6 +280,41 @@ def parse_jira_xml(xml_file_path: str) -> List[Dict[str, Any]]:
         logger.error(f"❌ XML 파싱 실패: {e}")
         return []
 
+# 스트리밍 재구축 시 한 번에 저장할 청크 수
+STORE_BATCH_SIZE = 256
+
+def build_chunk_record(chunk: JiraChunk):
+    """청크를 ChromaDB 저장용 (document, metadata, id)로 변환"""
+    # 문서 확장된 내용 사용
+    expanded_content = chunk.create_expanded_content()
+    
+    # ChromaDB 메타데이터 (None 값 제거)
+    metadata = {
+        'parent_ticket_id': chunk.parent_ticket_id or '',
+        'ticket_key': chunk.ticket_id or '',
+        'ticket_summary': chunk.ticket_summary or '',
+        'chunk_type': chunk.chunk_type.value,
+        'original_content': chunk.content or '',
+        'expanded_content': expanded_content or '',
+        'field_name': chunk.field_name or '',
+        'field_value': chunk.field_value or '',
+        'document_expansion': True,
+        'custom_preprocessing': False,
+        'l2_normalization': True,
+        'multi_vector_representation': True
+    }
+    
+    # None이 아닌 댓글 관련 필드만 추가
+    if chunk.comment_author is not None:
+        metadata['comment_author'] = chunk.comment_author
+    if chunk.comment_date is not None:
+        metadata['comment_date'] = chunk.comment_date
+    if chunk.comment_id is not None:
+        metadata['comment_id'] = chunk.comment_id
+    
+    chunk_id = f"{chunk.parent_ticket_id}_{chunk.chunk_type.value}_{chunk.chunk_id}"
+    return expanded_content, metadata, chunk_id
+
 def rebuild_vector_db():
     """Vector DB 재구축"""
     logger.info("🏗️ Vector DB 재구축 시작...")
@@ -311,89 +372,89 @@ def rebuild_vector_db():
     logger.info("🔧 Jira 청크 프로세서 초기화...")
     processor = JiraChunkProcessor(enable_text_cleaning=False)
     
-    # 6. XML 파일들에서 Jira 데이터 파싱
+    # 6. XML 파일들을 스트리밍 파싱하면서 바로 청크 생성 및 Vector DB에 저장
+    #    (전체 티켓을 메모리에 올리지 않고 STORE_BATCH_SIZE 단위로 저장)
+    logger.info("🔄 청크 생성 및 Vector DB 저장 시작...")
     xml_files = ['ncms_1.xml', 'ncms_2.xml']
-    all_tickets = []
+    total_tickets = 0
+    total_chunks = 0
+    processed_tickets = 0
+    batch = {'documents': [], 'metadatas': [], 'ids': []}
+    
+    def flush_batch() -> int:
+        if not batch['ids']:
+            return 0
+        count = len(batch['ids'])
+        try:
+            collection.add(**batch)
+        except Exception as e:
+            logger.warning(f"⚠️ 배치 저장 실패 ({count}개), 개별 저장으로 재시도: {e}")
+            count = 0
+            for document, metadata, chunk_id in zip(batch['documents'], batch['metadatas'], batch['ids']):
+                try:
+                    collection.add(documents=[document], metadatas=[metadata], ids=[chunk_id])
+                    count += 1
+                except Exception as e2:
+                    logger.warning(f"⚠️ 청크 저장 실패 {chunk_id}: {e2}")
+        for values in batch.values():
+            values.clear()
+        return count
     
     for xml_file in xml_files:
-        if os.path.exists(xml_file):
-            tickets = parse_jira_xml(xml_file)
-            all_tickets.extend(tickets)
-            logger.info(f"📊 {xml_file}: {len(tickets)}개 티켓")
-        else:
+        if not os.path.exists(xml_file):
             logger.warning(f"⚠️ 파일 없음: {xml_file}")
+            continue
+        
+        logger.info(f"📄 XML 파일 스트리밍 파싱 시작: {xml_file}")
+        file_tickets = 0
+        
+        try:
+            for ticket in iter_jira_xml(xml_file):
+                file_tickets += 1
+                total_tickets += 1
+                try:
+                    # 직접 청크 생성 (원문 그대로)
+                    chunks = create_chunks_from_ticket(ticket)
+                    
+                    if chunks:
+                        for chunk in chunks:
+                            try:
+                                document, metadata, chunk_id = build_chunk_record(chunk)
+                                batch['documents'].append(document)
+                                batch['metadatas'].append(metadata)
+                                batch['ids'].append(chunk_id)
+                            except Exception as e:
+                                logger.warning(f"⚠️ 청크 변환 실패 {chunk.ticket_id}: {e}")
+                                continue
+                        
+                        processed_tickets += 1
+                    
+                    if len(batch['ids']) >= STORE_BATCH_SIZE:
+                        total_chunks += flush_batch()
+                    
+                    # 진행 상황 로그
+                    if total_tickets % 50 == 0:
+                        logger.info(f"📈 진행률: {total_tickets} 티켓, {total_chunks}개 청크 저장됨")
+                    
+                except Exception as e:
+                    logger.warning(f"⚠️ 티켓 처리 실패 {ticket.get('Key', 'UNKNOWN')}: {e}")
+                    continue
+        except Exception as e:
+            logger.error(f"❌ XML 파싱 실패 ({xml_file}): {e}")
+        
+        logger.info(f"📊 {xml_file}: {file_tickets}개 티켓")
+    
+    total_chunks += flush_batch()
     
-    logger.info(f"📊 총 {len(all_tickets)}개 티켓 파싱 완료")
+    logger.info(f"📊 총 {total_tickets}개 티켓 파싱 완료")
     
-    if not all_tickets:
+    if not total_tickets:
         logger.error("❌ 파싱된 티켓이 없습니다")
         return False
     
-    # 7. 청크 생성 및 Vector DB에 저장
-    logger.info("🔄 청크 생성 및 Vector DB 저장 시작...")
-    total_chunks = 0
-    processed_tickets = 0
-    
-    for i, ticket in enumerate(all_tickets):
-        try:
-            # 직접 청크 생성 (원문 그대로)
-            chunks = create_chunks_from_ticket(ticket)
-            
-            if chunks:
-                # Vector DB에 저장
-                for chunk in chunks:
-                    try:
-                        # 문서 확장된 내용 사용
-                        expanded_content = chunk.create_expanded_content()
-                        
-                        # ChromaDB에 추가 (None 값 제거)
-                        metadata = {
-                            'parent_ticket_id': chunk.parent_ticket_id or '',
-                            'ticket_key': chunk.ticket_id or '',
-                            'ticket_summary': chunk.ticket_summary or '',
-                            'chunk_type': chunk.chunk_type.value,
-                            'original_content': chunk.content or '',
-                            'expanded_content': expanded_content or '',
-                            'field_name': chunk.field_name or '',
-                            'field_value': chunk.field_value or '',
-                            'document_expansion': True,
-                            'custom_preprocessing': False,
-                            'l2_normalization': True,
-                            'multi_vector_representation': True
-                        }
-                        
-                        # None이 아닌 댓글 관련 필드만 추가
-                        if chunk.comment_author is not None:
-                            metadata['comment_author'] = chunk.comment_author
-                        if chunk.comment_date is not None:
-                            metadata['comment_date'] = chunk.comment_date
-                        if chunk.comment_id is not None:
-                            metadata['comment_id'] = chunk.comment_id
-                        
-                        collection.add(
-                            documents=[expanded_content],
-                            metadatas=[metadata],
-                            ids=[f"{chunk.parent_ticket_id}_{chunk.chunk_type.value}_{chunk.chunk_id}"]
-                        )
-                        total_chunks += 1
-                        
-                    except Exception as e:
-                        logger.warning(f"⚠️ 청크 저장 실패 {chunk.ticket_id}: {e}")
-                        continue
-                
-                processed_tickets += 1
-                
-                # 진행 상황 로그
-                if (i + 1) % 50 == 0:
-                    logger.info(f"📈 진행률: {i + 1}/{len(all_tickets)} 티켓, {total_chunks}개 청크 저장됨")
-            
-        except Exception as e:
-            logger.warning(f"⚠️ 티켓 처리 실패 {ticket.get('Key', 'UNKNOWN')}: {e}")
-            continue
-    
     # 8. 최종 결과
     logger.info("🎉 다중 벡터 Vector DB 재구축 완료!")
-    logger.info(f"   ✅ 처리된 티켓: {processed_tickets}/{len(all_tickets)}")
+    logger.info(f"   ✅ 처리된 티켓: {processed_tickets}/{total_tickets}")
     logger.info(f"   ✅ 저장된 청크: {total_chunks}개")
     logger.info(f"   ✅ 다중 벡터 표현 적용됨")
     logger.info(f"   ✅ 제목/설명/댓글별 개별 벡터")
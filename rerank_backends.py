@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+재순위화(Re-rank) 백엔드
+- CohereRerankBackend: Cohere rerank API (rerank-multilingual-v3.0)
+- CrossEncoderRerankBackend: 로컬 한국어 Cross-Encoder (bongsoo/kpf-cross-encoder-v1)
+- Reranker: 백엔드 폴백 체인 + (백엔드, 쿼리, 문서 해시) 점수 캐시
+
+API 키가 없거나 네트워크 호출이 실패해도 로컬 Cross-Encoder로
+동일한 품질의 재순위화를 유지하기 위해 사용한다.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+COHERE_RERANK_MODEL = os.getenv("COHERE_RERANK_MODEL", "rerank-multilingual-v3.0")
+CROSS_ENCODER_MODEL = os.getenv("RERANK_CROSS_ENCODER_MODEL", "bongsoo/kpf-cross-encoder-v1")
+CROSS_ENCODER_FALLBACK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+# auto: Cohere(API 키가 있을 때) → 로컬 Cross-Encoder 순서로 시도
+RERANK_BACKEND = os.getenv("RERANK_BACKEND", "auto")
+RERANK_CACHE_SIZE = int(os.getenv("RERANK_CACHE_SIZE", "4096"))
+RERANK_CACHE_TTL = float(os.getenv("RERANK_CACHE_TTL", "3600"))
+
+
+class CohereRerankBackend:
+    """Cohere rerank API 백엔드"""
+
+    name = "cohere"
+
+    def __init__(self, client=None, model: str = COHERE_RERANK_MODEL):
+        """
+        Args:
+            client: cohere.Client (None이면 COHERE_API_KEY로 생성)
+            model: rerank 모델명
+        """
+        if client is None:
+            import cohere
+            client = cohere.Client(os.getenv("COHERE_API_KEY"))
+        self.client = client
+        self.model = model
+
+    def score(self, query: str, texts: Sequence[str]) -> List[float]:
+        """입력 순서대로 관련도 점수 반환"""
+        response = self.client.rerank(
+            model=self.model,
+            query=query,
+            documents=list(texts),
+            top_n=len(texts)
+        )
+        scores = [0.0] * len(texts)
+        for result in response.results:
+            scores[result.index] = float(result.relevance_score)
+        return scores
+
+
+_cross_encoders: Dict[str, object] = {}
+_cross_encoder_lock = threading.Lock()
+
+
+def get_cross_encoder(model_name: str = CROSS_ENCODER_MODEL):
+    """모델명별 CrossEncoder 싱글톤 반환 (최초 호출 시 로드, 실패 시 대체 모델)"""
+    model = _cross_encoders.get(model_name)
+    if model is None:
+        with _cross_encoder_lock:
+            model = _cross_encoders.get(model_name)
+            if model is None:
+                from sentence_transformers import CrossEncoder
+                try:
+                    logger.info(f"🔄 Cross-Encoder 모델 로딩 중: {model_name}")
+                    model = CrossEncoder(model_name)
+                except Exception as e:
+                    logger.error(f"❌ Cross-Encoder 모델 로딩 실패: {e}")
+                    logger.info(f"🔄 대체 모델 시도: {CROSS_ENCODER_FALLBACK_MODEL}")
+                    model = CrossEncoder(CROSS_ENCODER_FALLBACK_MODEL)
+                _cross_encoders[model_name] = model
+                logger.info("✅ Cross-Encoder 모델 로딩 완료")
+    return model
+
+
+class CrossEncoderRerankBackend:
+    """로컬 Cross-Encoder 백엔드 (네트워크 불필요)"""
+
+    name = "cross_encoder"
+
+    def __init__(self, model_name: str = CROSS_ENCODER_MODEL, batch_size: int = 16):
+        self.model_name = model_name
+        self.batch_size = batch_size
+
+    def score(self, query: str, texts: Sequence[str]) -> List[float]:
+        """입력 순서대로 관련도 점수 반환 (단일 라벨 모델은 sigmoid 적용된 0~1 점수)"""
+        model = get_cross_encoder(self.model_name)
+        scores = model.predict([[query, text] for text in texts], batch_size=self.batch_size)
+        return [float(score) for score in scores]
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class Reranker:
+    """
+    폴백 체인 + 점수 캐시를 가진 재순위화기
+
+    - 백엔드를 순서대로 시도하고, 실패하면 다음 백엔드로 넘어감
+    - 한 번의 재순위화에서 모든 점수는 같은 백엔드에서 나오도록 보장 (점수 스케일 혼합 방지)
+    - (백엔드, 쿼리, 문서 해시) 단위로 점수를 캐시하여 캐시되지 않은 문서만 채점
+    """
+
+    def __init__(self, backends: Sequence, cache: Optional[TTLCache] = None):
+        self.backends = list(backends)
+        self.cache = cache if cache is not None else TTLCache(maxsize=RERANK_CACHE_SIZE, ttl=RERANK_CACHE_TTL)
+        self._cache_lock = threading.Lock()  # cachetools 캐시는 스레드 안전하지 않음
+
+    @property
+    def backend_names(self) -> List[str]:
+        return [backend.name for backend in self.backends]
+
+    def _score_with(self, backend, query: str, texts: Sequence[str]) -> List[float]:
+        keys = [(backend.name, query, _text_hash(text)) for text in texts]
+        with self._cache_lock:
+            scores: List[Optional[float]] = [self.cache.get(key) for key in keys]
+
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            fresh = backend.score(query, [texts[i] for i in missing])
+            with self._cache_lock:
+                for i, score in zip(missing, fresh):
+                    scores[i] = score
+                    self.cache[keys[i]] = score
+        return scores
+
+    def rerank(self, query: str, texts: Sequence[str],
+               top_n: Optional[int] = None) -> Optional[Tuple[str, List[Tuple[int, float]]]]:
+        """
+        재순위화 수행
+
+        Returns:
+            (사용한 백엔드 이름, [(입력 인덱스, 점수)] 점수 내림차순 상위 top_n),
+            모든 백엔드가 실패하면 None
+        """
+        if not texts:
+            return None
+        for backend in self.backends:
+            try:
+                scores = self._score_with(backend, query, texts)
+            except Exception as e:
+                logger.warning(f"⚠️ {backend.name} 재순위화 실패, 다음 백엔드 시도: {e}")
+                continue
+            ranked = sorted(enumerate(scores), key=lambda item: item[1], reverse=True)
+            return backend.name, ranked[:top_n] if top_n is not None else ranked
+        return None
+
+
+def create_default_reranker(backend: str = RERANK_BACKEND) -> Reranker:
+    """
+    환경 설정에 따른 기본 재순위화기 생성
+
+    Args:
+        backend: "auto" | "cohere" | "cross_encoder"
+    """
+    backends = []
+    if backend in ("auto", "cohere") and os.getenv("COHERE_API_KEY"):
+        try:
+            backends.append(CohereRerankBackend())
+        except ImportError:
+            logger.warning("⚠️ cohere 패키지가 없어 Cohere 재순위화를 사용할 수 없습니다.")
+    if backend in ("auto", "cross_encoder") or not backends:
+        backends.append(CrossEncoderRerankBackend())
+
+    logger.info(f"🎯 재순위화 백엔드: {' → '.join(b.name for b in backends)}")
+    return Reranker(backends)
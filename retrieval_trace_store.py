@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+골든셋 검색 트레이스 저장소 (오프라인 재생용)
+
+골든 쿼리마다 검색 구간(multi_query/hyde/bm25)의 후보 목록, 점수, 소요 시간과
+후보 문서 본문/메타데이터를 gzip JSONL 파일에 한 줄씩 기록한다.
+
+TraceReplayRAGSystem(rrf_fusion_rag_system)은 이 트레이스로 검색 구간을 대체하여
+RRF 융합 → 가중치 적용 → 티켓 중복 제거 단계만 다시 실행하므로,
+융합 설정 실험에 Vector DB나 LLM 호출이 필요 없다.
+
+사용 예:
+    python rrf_config_sweep.py --record-traces traces/golden.jsonl.gz
+    python rrf_config_sweep.py --replay-traces traces/golden.jsonl.gz --grid '{"bm25_weight": [1, 3, 6]}'
+"""
+
+import os
+import gzip
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRACE_VERSION = 1
+
+# 구간별로 보존하는 점수 필드 (후보는 [문서 ID, 점수]로 압축 저장)
+LEG_SCORE_FIELDS = {
+    "multi_query": "cosine_score",
+    "hyde": "cosine_score",
+    "bm25": "bm25_score",
+}
+
+
+class RetrievalTraceStore:
+    """검색 트레이스 파일 (gzip JSONL, 쿼리당 한 줄, Thread-safe 추가 기록)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 트레이스 파일 경로 (예: traces/golden.jsonl.gz)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, query: str, legs: Dict[str, Tuple[List[Dict[str, Any]], float]],
+               documents: List[Dict[str, Any]], config: Dict[str, Any]):
+        """
+        쿼리 하나의 트레이스 기록
+
+        Args:
+            query: 골든 쿼리
+            legs: {구간: (순위 순 검색 결과, 소요 시간(초))}
+            documents: 후보 문서 [{'id', 'content', 'metadata'}] (load_documents_by_ids 결과)
+            config: 구간 결과에 영향을 준 설정값 (재생 시 일치 여부 확인용)
+        """
+        payload = {
+            "version": TRACE_VERSION,
+            "query": query,
+            "config": config,
+            "legs": {
+                leg: {
+                    "elapsed": round(elapsed, 6),
+                    "candidates": [
+                        [result['id'], round(float(result.get(LEG_SCORE_FIELDS.get(leg, "cosine_score"), 0.0)), 6)]
+                        for result in results
+                    ]
+                }
+                for leg, (results, elapsed) in legs.items()
+            },
+            "documents": {
+                doc['id']: {"content": doc.get('content', ""), "metadata": doc.get('metadata', {})}
+                for doc in documents
+            }
+        }
+        line = (json.dumps(payload, ensure_ascii=False) + "\n").encode('utf-8')
+
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # gzip 멤버를 이어 붙이는 방식이라 기록이 중단되어도 이전 줄은 그대로 읽힘
+            with gzip.open(self.path, 'ab') as f:
+                f.write(line)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        트레이스 로드
+
+        Returns:
+            {쿼리: 트레이스} (같은 쿼리가 여러 번 기록되었으면 마지막 기록 사용)
+        """
+        traces: Dict[str, Dict[str, Any]] = {}
+        if not os.path.exists(self.path):
+            return traces
+
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    trace = json.loads(line)
+                    if trace.get("version") != TRACE_VERSION:
+                        continue
+                    traces[trace["query"]] = trace
+        except (EOFError, json.JSONDecodeError) as e:
+            # 마지막 줄을 쓰던 중 중단된 경우: 그 전까지만 사용
+            logger.warning(f"⚠️ 트레이스 파일 끝부분 손상, {len(traces)}개 쿼리만 사용: {e}")
+
+        logger.info(f"✅ 검색 트레이스 로드: {self.path} ({len(traces)}개 쿼리)")
+        return traces
+
+
+def trace_leg_results(trace: Dict[str, Any], leg: str) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    트레이스의 구간 후보를 검색 결과 형식으로 복원
+
+    Returns:
+        ([{'id', 'content', 'cosine_score', ('bm25_score')}] 순위 순, 기록된 소요 시간(초))
+    """
+    entry = trace["legs"].get(leg)
+    if entry is None:
+        return [], 0.0
+
+    documents = trace.get("documents", {})
+    results = []
+    for doc_id, score in entry["candidates"]:
+        result = {
+            'id': doc_id,
+            'content': documents.get(doc_id, {}).get("content", ""),
+            'cosine_score': score
+        }
+        if LEG_SCORE_FIELDS.get(leg) == "bm25_score":
+            result['bm25_score'] = score
+        results.append(result)
+    return results, entry["elapsed"]
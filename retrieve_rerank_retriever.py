@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Retrieve then Re-rank 검색 시스템
-BM25 키워드 검색과 벡터 검색을 독립적으로 실행한 후, CohereRerank로 최종 선별
+BM25 키워드 검색과 벡터 검색을 독립적으로 실행한 후, 재순위화(Cohere / 로컬 Cross-Encoder)로 최종 선별
 """
 
 import logging
@@ -11,7 +11,7 @@ from langchain_core.documents import Document
 from vector_db_models import VectorDBManager
 from text_preprocessor import preprocess_for_embedding
 from keyword_extractor import KeywordExtractor
-import cohere
+from rerank_backends import Reranker, create_default_reranker
 import os
 from dotenv import load_dotenv
 
@@ -24,15 +24,16 @@ class RetrieveRerankRetriever:
     Retrieve then Re-rank 검색 시스템
     1단계: Vector + BM25 독립 검색
     2단계: 후보군 통합 및 중복 제거
-    3단계: CohereRerank로 최종 선별
+    3단계: 재순위화로 최종 선별 (Cohere → 로컬 Cross-Encoder 폴백)
     """
     
-    def __init__(self, vector_db_manager: VectorDBManager, enable_bm25: bool = False):
+    def __init__(self, vector_db_manager: VectorDBManager, enable_bm25: bool = False,
+                 reranker: Optional[Reranker] = None):
         self.vector_db_manager = vector_db_manager
         self.bm25_retriever = None
         self.documents = []
         self.keyword_extractor = KeywordExtractor()
-        self.cohere_client = cohere.Client(os.getenv("COHERE_API_KEY"))
+        self.reranker = reranker or create_default_reranker()
         self.enable_bm25 = enable_bm25
         
         # BM25가 활성화된 경우에만 문서 수집 및 인덱스 생성
@@ -263,45 +264,32 @@ class RetrieveRerankRetriever:
             return vector_docs + bm25_docs  # 실패 시 단순 합치기
     
     def _rerank_candidates(self, query: str, candidates: List[Document], k: int = 3) -> List[Document]:
-        """3단계: CohereRerank로 최종 선별"""
+        """3단계: 재순위화로 최종 선별 (캐시되지 않은 후보만 채점, 인덱스로 원본 매핑)"""
         try:
             if not candidates:
                 logger.warning("⚠️ 재순위화할 후보가 없습니다.")
                 return []
             
-            logger.info(f"🎯 CohereRerank 재순위화 시작: {len(candidates)}개 후보 → {k}개 최종 결과")
+            logger.info(f"🎯 재순위화 시작: {len(candidates)}개 후보 → {k}개 최종 결과")
             
-            # Document 객체를 텍스트 리스트로 변환
             documents_text = [doc.page_content for doc in candidates]
+            reranked = self.reranker.rerank(query, documents_text, top_n=k)
+            if reranked is None:
+                logger.error("❌ 모든 재순위화 백엔드 실패")
+                return candidates[:k]
             
-            # Cohere API를 사용한 재순위화
-            response = self.cohere_client.rerank(
-                model="rerank-multilingual-v3.0",
-                query=query,
-                documents=documents_text,
-                top_n=k
-            )
-            
-            # 재순위화된 결과를 Document 객체로 변환
+            backend_name, ranked = reranked
             final_documents = []
-            for i, result in enumerate(response.results):
-                # 원본 Document 찾기
-                original_doc = None
-                for doc in candidates:
-                    if doc.page_content == documents_text[result.index]:
-                        original_doc = doc
-                        break
-                
-                if original_doc:
-                    # 재순위화 정보 추가
-                    original_doc.metadata.update({
-                        'rerank_score': result.relevance_score,
-                        'final_rank': i + 1,
-                        'rerank_method': 'cohere'
-                    })
-                    final_documents.append(original_doc)
+            for rank, (index, score) in enumerate(ranked, 1):
+                doc = candidates[index]
+                doc.metadata.update({
+                    'rerank_score': score,
+                    'final_rank': rank,
+                    'rerank_method': backend_name
+                })
+                final_documents.append(doc)
             
-            logger.info(f"✅ CohereRerank 재순위화 완료: {len(final_documents)}개 최종 결과")
+            logger.info(f"✅ 재순위화 완료 ({backend_name}): {len(final_documents)}개 최종 결과")
             
             # 상위 3개 결과의 점수 로깅
             for i, doc in enumerate(final_documents[:3]):
@@ -312,7 +300,7 @@ class RetrieveRerankRetriever:
             return final_documents
             
         except Exception as e:
-            logger.error(f"❌ CohereRerank 재순위화 실패: {e}")
+            logger.error(f"❌ 재순위화 실패: {e}")
             # 실패 시 원본 순서대로 상위 k개 반환
             return candidates[:k]
     
@@ -321,7 +309,7 @@ class RetrieveRerankRetriever:
         Retrieve then Re-rank 검색 수행
         1단계: Vector + BM25 독립 검색
         2단계: 후보군 통합 및 중복 제거
-        3단계: CohereRerank로 최종 선별
+        3단계: 재순위화로 최종 선별
         """
         try:
             logger.info(f"🚀 Retrieve then Re-rank 검색 시작: '{query}'")
@@ -333,7 +321,7 @@ class RetrieveRerankRetriever:
             # 2단계: 후보군 통합 및 중복 제거
             candidates = self._merge_and_deduplicate_candidates(vector_docs, bm25_docs)
             
-            # 3단계: CohereRerank로 최종 선별
+            # 3단계: 재순위화로 최종 선별
             final_docs = self._rerank_candidates(query, candidates, k=k)
             
             # 결과를 표준 형식으로 변환
@@ -362,13 +350,14 @@ class RetrieveRerankRetriever:
         return {
             "total_documents": len(self.documents),
             "bm25_retriever_ready": self.bm25_retriever is not None,
-            "cohere_rerank_ready": self.cohere_client is not None,
+            "rerank_backends": self.reranker.backend_names,
+            "rerank_cache_size": len(self.reranker.cache),
             "search_method": "retrieve_then_rerank",
             "pipeline_steps": [
                 "1. Vector Search (top 10)",
                 "2. BM25 Search (top 10)", 
                 "3. Merge & Deduplicate",
-                "4. CohereRerank (final top 3)"
+                "4. Rerank: Cohere → Cross-Encoder (final top 3)"
             ]
         }
 
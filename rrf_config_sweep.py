@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+RRF 설정 스윕 및 회귀 게이트
+
+골든셋(test_data.csv)에 대해 RRF 융합 가중치 / 후보 깊이 조합을 평가하고
+품질(MRR)과 지연 시간(p95)의 파레토 프런트를 출력한다.
+
+- 스윕: 설정 조합마다 RAGEvaluator를 실행하되 검색 구간(multi_query/hyde/bm25)
+  결과는 LegResultCache로 공유하므로, 같은 깊이의 검색은 한 번만 수행된다.
+- 회귀 모드: 현재 설정의 MRR이 기준 결과보다 일정 이상 떨어지거나
+  p95 지연 시간이 일정 비율 이상 늘어나면 종료 코드 1로 실패한다.
+- 트레이스: --record-traces로 골든셋 검색 구간 결과를 기록해 두면
+  --replay-traces로 Vector DB 없이 융합/중복 제거 단계만 다시 실행한다.
+
+사용 예:
+    python rrf_config_sweep.py --grid '{"bm25_weight": [1, 3, 6], "rrf_k": [30, 60]}'
+    python rrf_config_sweep.py --baseline rag_evaluation_results_xxx.json
+    python rrf_config_sweep.py --record-traces traces/golden.jsonl.gz
+    python rrf_config_sweep.py --replay-traces traces/golden.jsonl.gz
+"""
+
+import os
+import sys
+import json
+import argparse
+import itertools
+import logging
+from dataclasses import asdict, replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from rrf_fusion_rag_system import (
+    RRFRAGSystem, RRFConfig, LegResultCache, LEG_CONFIG_FIELDS, TraceReplayRAGSystem
+)
+from retrieval_trace_store import RetrievalTraceStore
+from evaluate_rag_system import RAGEvaluator
+
+logger = logging.getLogger(__name__)
+
+# 기본 스윕 범위 (융합 가중치 + 후보 깊이)
+DEFAULT_GRID = {
+    "bm25_weight": [1.0, 3.0, 6.0],
+    "rrf_k": [30, 60],
+    "top_k_per_query": [10, 15],
+    "final_candidates": [20, 30],
+}
+
+# 회귀 게이트 기본 허용치
+DEFAULT_MAX_MRR_DROP = 0.01        # MRR 절대 하락 허용치
+DEFAULT_MAX_P95_INCREASE = 0.20    # p95 지연 시간 상대 증가 허용치 (20%)
+
+
+def build_config_grid(base_config: RRFConfig, grid: Dict[str, List[Any]]) -> List[RRFConfig]:
+    """
+    기본 설정에 grid의 모든 조합을 적용한 설정 목록
+
+    Args:
+        base_config: 기준 RRF 설정
+        grid: {RRFConfig 필드명: 값 목록}
+    """
+    unknown = [name for name in grid if not hasattr(base_config, name)]
+    if unknown:
+        raise ValueError(f"알 수 없는 RRFConfig 필드: {', '.join(unknown)}")
+
+    names = list(grid)
+    return [
+        replace(base_config, **dict(zip(names, values)))
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+
+
+def pareto_front(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """MRR은 높을수록, p95는 낮을수록 좋은 기준의 파레토 최적 행 (MRR 내림차순)"""
+    front = []
+    for row in rows:
+        dominated = any(
+            other['mrr'] >= row['mrr'] and other['p95_ms'] <= row['p95_ms']
+            and (other['mrr'] > row['mrr'] or other['p95_ms'] < row['p95_ms'])
+            for other in rows
+        )
+        if not dominated:
+            front.append(row)
+    return sorted(front, key=lambda r: (-r['mrr'], r['p95_ms']))
+
+
+def check_regression(baseline_metrics: Dict[str, Any], current_metrics: Dict[str, Any],
+                     max_mrr_drop: float = DEFAULT_MAX_MRR_DROP,
+                     max_p95_increase: float = DEFAULT_MAX_P95_INCREASE) -> List[str]:
+    """
+    기준 메트릭 대비 회귀 여부 확인
+
+    Args:
+        baseline_metrics / current_metrics: RAGEvaluator.calculate_metrics 결과
+        max_mrr_drop: 허용하는 MRR 절대 하락폭
+        max_p95_increase: 허용하는 p95 지연 시간 상대 증가율
+
+    Returns:
+        위반 사항 메시지 목록 (비어 있으면 통과)
+    """
+    violations = []
+
+    mrr_drop = baseline_metrics['mrr'] - current_metrics['mrr']
+    if mrr_drop > max_mrr_drop:
+        violations.append(
+            f"MRR 하락: {baseline_metrics['mrr']:.4f} → {current_metrics['mrr']:.4f} "
+            f"(-{mrr_drop:.4f}, 허용 {max_mrr_drop:.4f})"
+        )
+
+    baseline_p95 = baseline_metrics.get('latency', {}).get('total', {}).get('p95_ms')
+    current_p95 = current_metrics.get('latency', {}).get('total', {}).get('p95_ms')
+    if baseline_p95 and current_p95 is not None:
+        increase = (current_p95 - baseline_p95) / baseline_p95
+        if increase > max_p95_increase:
+            violations.append(
+                f"p95 지연 증가: {baseline_p95:.0f}ms → {current_p95:.0f}ms "
+                f"(+{increase:.0%}, 허용 {max_p95_increase:.0%})"
+            )
+
+    return violations
+
+
+class RRFConfigSweep:
+    """RRF 설정 스윕 실행기"""
+
+    def __init__(self, rag_system: RRFRAGSystem, test_cases: List[Dict[str, Any]],
+                 max_workers: Optional[int] = None):
+        """
+        Args:
+            rag_system: 컬렉션/BM25 인덱스가 초기화된 기준 RAG 시스템
+            test_cases: RAGEvaluator.load_test_data 결과
+            max_workers: 설정별 평가 시 동시에 실행할 쿼리 수
+        """
+        self.rag_system = rag_system
+        self.test_cases = test_cases
+        self.max_workers = max_workers
+        self.leg_cache = LegResultCache()
+
+    def evaluate_config(self, config: RRFConfig) -> Dict[str, Any]:
+        """설정 하나를 골든셋으로 평가 (검색 구간 결과는 캐시 공유)"""
+        evaluator = RAGEvaluator(self.rag_system.with_config(config, self.leg_cache),
+                                 max_workers=self.max_workers)
+        results = evaluator.evaluate_all(self.test_cases)
+        return evaluator.calculate_metrics(results)
+
+    def run(self, configs: List[RRFConfig], grid_fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        설정 목록 평가
+
+        Args:
+            configs: 평가할 설정 목록 (build_config_grid 결과)
+            grid_fields: 결과 행에 표시할 설정 필드 (기본: 전체)
+
+        Returns:
+            설정별 결과 행 목록 [{'config', 'mrr', 'hit@1', ..., 'p50_ms', 'p95_ms', 'throughput_qps'}]
+        """
+        rows = []
+        for i, config in enumerate(configs, start=1):
+            logger.info(f"🔧 설정 {i}/{len(configs)} 평가: {config}")
+            metrics = self.evaluate_config(config)
+            config_values = asdict(config)
+            if grid_fields:
+                config_values = {name: config_values[name] for name in grid_fields}
+
+            latency = metrics.get('latency', {})
+            rows.append({
+                'config': config_values,
+                'mrr': metrics.get('mrr', 0.0),
+                'hit@1': metrics.get('hit@1', 0.0),
+                'hit@5': metrics.get('hit@5', 0.0),
+                'hit@10': metrics.get('hit@10', 0.0),
+                'p50_ms': latency.get('total', {}).get('p50_ms', 0.0),
+                'p95_ms': latency.get('total', {}).get('p95_ms', 0.0),
+                'throughput_qps': latency.get('throughput_qps', 0.0),
+            })
+
+        logger.info(f"✅ 스윕 완료: {len(configs)}개 설정, 구간 캐시 적중 {self.leg_cache.hits}회 / "
+                    f"검색 {self.leg_cache.misses}회")
+        return rows
+
+
+def print_pareto_table(rows: List[Dict[str, Any]]):
+    """전체 결과와 파레토 프런트 표 출력"""
+    front_ids = {id(row) for row in pareto_front(rows)}
+
+    print("\n" + "="*90)
+    print("📊 RRF 설정 스윕 결과 (★ = 파레토 최적)")
+    print("="*90)
+    print(f"{'':2}{'MRR':>8}{'Hit@1':>8}{'Hit@5':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'QPS':>8}  설정")
+    for row in sorted(rows, key=lambda r: (-r['mrr'], r['p95_ms'])):
+        marker = "★" if id(row) in front_ids else ""
+        config_str = ", ".join(f"{k}={v}" for k, v in row['config'].items())
+        print(f"{marker:2}{row['mrr']:>8.4f}{row['hit@1']:>8.2%}{row['hit@5']:>8.2%}"
+              f"{row['p50_ms']:>10.0f}{row['p95_ms']:>10.0f}{row['throughput_qps']:>8.2f}  {config_str}")
+    print("="*90)
+
+
+def main() -> int:
+    """메인 실행 함수 (회귀 모드에서 실패 시 1 반환)"""
+    parser = argparse.ArgumentParser(description="RRF 설정 스윕 / 회귀 게이트")
+    parser.add_argument("--test-data", default="test_data.csv", help="골든셋 CSV 경로")
+    parser.add_argument("--collection", default="jira_chunks", help="평가할 컬렉션 이름")
+    parser.add_argument("--grid", help="스윕 범위 JSON (예: '{\"bm25_weight\": [1, 6]}')")
+    parser.add_argument("--workers", type=int, default=None, help="동시 평가 쿼리 수")
+    parser.add_argument("--baseline", help="회귀 모드: 기준 평가 결과 JSON (evaluate_rag_system.py 출력)")
+    parser.add_argument("--max-mrr-drop", type=float, default=DEFAULT_MAX_MRR_DROP)
+    parser.add_argument("--max-p95-increase", type=float, default=DEFAULT_MAX_P95_INCREASE)
+    parser.add_argument("--record-traces", help="기본 설정으로 골든셋을 평가하며 검색 트레이스를 기록할 경로")
+    parser.add_argument("--replay-traces", help="검색 트레이스를 재생하여 Vector DB 없이 평가")
+    args = parser.parse_args()
+
+    os.makedirs('logs', exist_ok=True)
+    base_config = RRFConfig()
+    if args.replay_traces:
+        rag_system = TraceReplayRAGSystem.from_file(args.replay_traces, base_config)
+    else:
+        rag_system = RRFRAGSystem(collection_name=args.collection, rrf_config=base_config)
+    test_cases = RAGEvaluator(rag_system).load_test_data(args.test_data)
+    sweep = RRFConfigSweep(rag_system, test_cases, max_workers=args.workers)
+
+    if args.record_traces:
+        rag_system.trace_store = RetrievalTraceStore(args.record_traces)
+        metrics = sweep.evaluate_config(base_config)
+        print(f"✅ 검색 트레이스 기록 완료: {args.record_traces} ({len(test_cases)}개 쿼리, MRR {metrics['mrr']:.4f})")
+        return 0
+
+    if args.baseline:
+        # 회귀 모드: 현재 기본 설정만 평가하여 기준과 비교
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline_metrics = json.load(f)['metrics']
+        current_metrics = sweep.evaluate_config(base_config)
+        violations = check_regression(baseline_metrics, current_metrics,
+                                      args.max_mrr_drop, args.max_p95_increase)
+        if violations:
+            print("❌ 회귀 게이트 실패:")
+            for violation in violations:
+                print(f"  - {violation}")
+            return 1
+        print(f"✅ 회귀 게이트 통과: MRR {current_metrics['mrr']:.4f}, "
+              f"p95 {current_metrics['latency']['total']['p95_ms']:.0f}ms")
+        return 0
+
+    grid = json.loads(args.grid) if args.grid else DEFAULT_GRID
+    if args.replay_traces and not args.grid:
+        # 재생 모드에서는 검색 구간 결과를 바꾸는 설정은 스윕할 수 없음
+        leg_fields = {name for fields in LEG_CONFIG_FIELDS.values() for name in fields}
+        grid = {name: values for name, values in grid.items() if name not in leg_fields}
+    rows = sweep.run(build_config_grid(base_config, grid), grid_fields=list(grid))
+    print_pareto_table(rows)
+
+    output_path = f"rrf_sweep_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'grid': grid, 'rows': rows, 'pareto': pareto_front(rows)}, f, ensure_ascii=False, indent=2)
+    logger.info(f"✅ 스윕 결과 저장: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
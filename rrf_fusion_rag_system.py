@@ -6,7 +6,10 @@ Multi-Query, HyDE, BM25 검색 결과를 순위 기반으로 지능적 융합 (H
 
 import os
 import sys
+import copy
+import time
 import logging
+import threading
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import chromadb
@@ -20,6 +23,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # 모듈들 import
 from intelligent_chunk_weighting import IntelligentChunkWeighting
 from hyde_rag_system_mock import MockHyDEGenerator, HyDEConfig
+from utils.latency_stats import timed
+from retrieval_trace_store import RetrievalTraceStore, trace_leg_results
 
 # BM25 관련 import
 try:
@@ -125,6 +130,11 @@ class RRFConfig:
     bm25_results: int = 20  # BM25 검색 결과 수
     final_candidates: int = 30  # 최종 후보 수
 
+    # 검색 방식별 RRF 가중치 (BM25는 키워드 정확 매칭이므로 기본 6배)
+    multi_query_weight: float = 1.0
+    hyde_weight: float = 1.0
+    bm25_weight: float = 6.0
+
     # 기존 HyDE 설정
     multi_query_count: int = 3
     top_k_per_query: int = 15
@@ -150,6 +160,17 @@ class RRFFusionEngine:
         self.config = config
         logger.info(f"✅ RRF 융합 엔진 초기화 (k={config.rrf_k})")
 
+    def max_score(self) -> float:
+        """
+        이론상 최대 RRF 점수 (모든 검색 방식에서 1위인 문서의 점수)
+
+        RRF 점수를 다른 소스의 코사인 유사도와 같은 0~1 고정 범위로 옮길 때 상한으로 사용
+        """
+        total_weight = self.config.multi_query_weight + self.config.hyde_weight
+        if self.config.enable_bm25:
+            total_weight += self.config.bm25_weight
+        return total_weight / (self.config.rrf_k + 1)
+
     def calculate_rrf_scores(self, multi_query_results: List[Dict[str, Any]],
                            hyde_results: List[Dict[str, Any]],
                            bm25_results: Optional[List[Dict[str, Any]]] = None) -> Dict[str, float]:
@@ -170,7 +191,7 @@ class RRFFusionEngine:
         logger.info(f"🔄 Multi-Query 결과 RRF 점수 계산: {len(multi_query_results)}개")
         for rank, doc in enumerate(multi_query_results, 1):
             doc_id = doc['id']
-            rrf_score = 1.0 / (self.config.rrf_k + rank)
+            rrf_score = self.config.multi_query_weight / (self.config.rrf_k + rank)
             rrf_scores[doc_id] += rrf_score
 
             logger.debug(f"  Multi-Query {rank}위: {doc_id} → +{rrf_score:.6f}")
@@ -179,22 +200,22 @@ class RRFFusionEngine:
         logger.info(f"🔄 HyDE 결과 RRF 점수 계산: {len(hyde_results)}개")
         for rank, doc in enumerate(hyde_results, 1):
             doc_id = doc['id']
-            rrf_score = 1.0 / (self.config.rrf_k + rank)
+            rrf_score = self.config.hyde_weight / (self.config.rrf_k + rank)
             rrf_scores[doc_id] += rrf_score
 
             logger.debug(f"  HyDE {rank}위: {doc_id} → +{rrf_score:.6f}")
 
-        # 3. BM25 결과 처리 (있는 경우) - 키워드 정확 매칭이므로 6배 가중치
+        # 3. BM25 결과 처리 (있는 경우) - 키워드 정확 매칭이므로 가중치 적용 (기본 6배)
         if bm25_results:
-            logger.info(f"🔄 BM25 결과 RRF 점수 계산: {len(bm25_results)}개 (가중치 6.0x)")
+            bm25_weight = self.config.bm25_weight
+            logger.info(f"🔄 BM25 결과 RRF 점수 계산: {len(bm25_results)}개 (가중치 {bm25_weight:.1f}x)")
             for rank, doc in enumerate(bm25_results, 1):
                 doc_id = doc['id']
                 rrf_score = 1.0 / (self.config.rrf_k + rank)
-                # BM25는 키워드 정확 매칭이므로 6배 가중치 적용
-                weighted_score = rrf_score * 6.0
+                weighted_score = rrf_score * bm25_weight
                 rrf_scores[doc_id] += weighted_score
 
-                logger.debug(f"  BM25 {rank}위: {doc_id} → +{weighted_score:.6f} (기본:{rrf_score:.6f} x6)")
+                logger.debug(f"  BM25 {rank}위: {doc_id} → +{weighted_score:.6f} (기본:{rrf_score:.6f} x{bm25_weight:g})")
 
         logger.info(f"✅ RRF 점수 계산 완료: {len(rrf_scores)}개 고유 문서")
         return dict(rrf_scores)
@@ -296,6 +317,46 @@ class RRFFusionEngine:
             logger.error(f"❌ 융합 효과 분석 실패: {e}")
             return {}
 
+class LegResultCache:
+    """
+    검색 구간(multi_query/hyde/bm25) 결과 캐시 (설정 스윕용)
+
+    키는 (구간, 쿼리, 결과에 영향을 주는 설정값)이므로 융합 가중치/rrf_k만 바뀌는
+    설정들은 같은 검색 결과를 재사용한다. 최초 측정한 소요 시간을 함께 저장해
+    캐시 적중 시에도 해당 깊이의 실제 검색 지연 시간을 리포트에 반영한다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[List[Dict[str, Any]], float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, results: List[Dict[str, Any]], elapsed: float):
+        with self._lock:
+            self._entries[key] = (results, elapsed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 구간별 결과에 영향을 주는 RRFConfig 필드 (LegResultCache 키)
+LEG_CONFIG_FIELDS = {
+    "multi_query": ("multi_query_count", "top_k_per_query", "multi_query_results"),
+    "hyde": ("top_k_per_query", "hyde_results"),
+    "bm25": ("bm25_results",),
+}
+
+
 class RRFRAGSystem:
     """RRF 기반 RAG 시스템"""
 
@@ -323,6 +384,8 @@ class RRFRAGSystem:
         self.bm25_documents = []  # (doc_id, content) 리스트
         self.bm25_corpus_tokenized = []  # 토크나이즈된 코퍼스
         self.tokenizer = None  # 한국어 토크나이저
+        self.leg_cache: Optional[LegResultCache] = None  # 설정 스윕 시 구간 결과 캐시
+        self.trace_store: Optional[RetrievalTraceStore] = None  # 지정 시 구간 결과를 트레이스로 기록
 
         self._init_components()
 
@@ -611,12 +674,66 @@ class RRFRAGSystem:
             logger.error(f"❌ 문서 로드 실패: {e}")
             return []
 
-    def rrf_search(self, query: str) -> List[Dict[str, Any]]:
+    def with_config(self, config: RRFConfig, leg_cache: Optional[LegResultCache] = None) -> "RRFRAGSystem":
+        """
+        컬렉션/BM25 인덱스/생성기를 공유하고 설정만 다른 시스템 복사본 (설정 스윕용)
+
+        Args:
+            config: 적용할 RRF 설정
+            leg_cache: 복사본들이 공유할 구간 결과 캐시
+        """
+        clone = copy.copy(self)
+        clone.config = config
+        clone.rrf_engine = RRFFusionEngine(config)
+        clone.leg_cache = leg_cache
+        return clone
+
+    def _run_leg(self, leg: str, search_fn, query: str,
+                 timings: Optional[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """검색 구간 실행 (leg_cache가 있으면 같은 설정의 결과 재사용)"""
+        if self.leg_cache is None:
+            with timed(timings, leg):
+                return search_fn(query)
+
+        key = (leg, query) + tuple(getattr(self.config, name) for name in LEG_CONFIG_FIELDS[leg])
+        entry = self.leg_cache.get(key)
+        if entry is None:
+            start = time.perf_counter()
+            results = search_fn(query)
+            entry = (results, time.perf_counter() - start)
+            self.leg_cache.put(key, *entry)
+
+        results, elapsed = entry
+        if timings is not None:
+            timings[leg] = timings.get(leg, 0.0) + elapsed
+        return results
+
+    def _record_trace(self, query: str, leg_results: Dict[str, List[Dict[str, Any]]],
+                      timings: Dict[str, float]):
+        """구간 결과와 후보 문서를 트레이스로 기록 (실패해도 검색은 계속)"""
+        try:
+            doc_ids = list(dict.fromkeys(r['id'] for results in leg_results.values() for r in results))
+            config_values = {
+                name: getattr(self.config, name)
+                for leg in leg_results for name in LEG_CONFIG_FIELDS[leg]
+            }
+            self.trace_store.record(
+                query,
+                {leg: (results, timings.get(leg, 0.0)) for leg, results in leg_results.items()},
+                self.load_documents_by_ids(doc_ids),
+                config_values
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 검색 트레이스 기록 실패: {e}")
+
+    def rrf_search(self, query: str, timings: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
         """
         RRF 기반 하이브리드 검색 (Multi-Query + HyDE + BM25)
 
         Args:
             query: 검색 쿼리
+            timings: 전달하면 구간별 소요 시간(초)을 기록
+                (multi_query, hyde, bm25, fusion, load, weighting, dedup)
 
         Returns:
             RRF 융합된 최종 검색 결과
@@ -624,24 +741,32 @@ class RRFRAGSystem:
         try:
             search_methods = []
             logger.info(f"🚀 RRF 기반 하이브리드 검색 시작: '{query}'")
+            if timings is None and self.trace_store is not None:
+                timings = {}
 
             # 1. 멀티쿼리, HyDE, BM25 검색을 독립적으로 실행
             logger.info("📊 1단계: 독립 검색 실행")
-            multi_query_results = self.multi_query_search(query)
+            multi_query_results = self._run_leg("multi_query", self.multi_query_search, query, timings)
             if multi_query_results:
                 search_methods.append("Multi-Query")
 
-            hyde_results = self.hyde_search(query)
+            hyde_results = self._run_leg("hyde", self.hyde_search, query, timings)
             if hyde_results:
                 search_methods.append("HyDE")
 
             # BM25 검색 (활성화된 경우)
             bm25_results = []
             if self.config.enable_bm25 and self.bm25_index:
-                bm25_results = self.bm25_search(query)
+                bm25_results = self._run_leg("bm25", self.bm25_search, query, timings)
                 if bm25_results:
                     search_methods.append("BM25")
 
+            if self.trace_store is not None:
+                leg_results = {"multi_query": multi_query_results, "hyde": hyde_results}
+                if self.config.enable_bm25 and self.bm25_index:
+                    leg_results["bm25"] = bm25_results
+                self._record_trace(query, leg_results, timings)
+
             if not multi_query_results and not hyde_results and not bm25_results:
                 logger.warning("⚠️ 모든 검색 결과가 비어있음")
                 return []
@@ -650,11 +775,12 @@ class RRFRAGSystem:
 
             # 2. RRF로 결과 융합
             logger.info("🔄 2단계: RRF 융합")
-            final_candidate_ids, rrf_scores = self.rrf_engine.fuse_results(
-                multi_query_results,
-                hyde_results,
-                bm25_results if bm25_results else None
-            )
+            with timed(timings, "fusion"):
+                final_candidate_ids, rrf_scores = self.rrf_engine.fuse_results(
+                    multi_query_results,
+                    hyde_results,
+                    bm25_results if bm25_results else None
+                )
 
             if not final_candidate_ids:
                 logger.warning("⚠️ RRF 융합 결과가 비어있음")
@@ -662,11 +788,13 @@ class RRFRAGSystem:
 
             # 3. 최종 후보 문서 정보 로드
             logger.info("📄 3단계: 후보 문서 로드")
-            final_documents = self.load_documents_by_ids(final_candidate_ids)
+            with timed(timings, "load"):
+                final_documents = self.load_documents_by_ids(final_candidate_ids)
 
             # 4. 가중치 적용
             logger.info("⚖️ 4단계: RRF 점수 적용")
-            weighted_results = self._apply_weighting_to_documents(final_documents, query, rrf_scores)
+            with timed(timings, "weighting"):
+                weighted_results = self._apply_weighting_to_documents(final_documents, query, rrf_scores)
 
             # 5. 융합 효과 분석
             fusion_analysis = self.rrf_engine.analyze_fusion_effect(
@@ -684,10 +812,11 @@ class RRFRAGSystem:
             final_results = weighted_results
             if self.config.deduplicate_tickets:
                 logger.info("🎯 5단계: 티켓 중복 제거")
-                final_results = self.deduplicate_by_ticket(
-                    weighted_results,
-                    strategy=self.config.deduplication_strategy
-                )
+                with timed(timings, "dedup"):
+                    final_results = self.deduplicate_by_ticket(
+                        weighted_results,
+                        strategy=self.config.deduplication_strategy
+                    )
 
             logger.info(f"✅ RRF 기반 검색 완료: {len(final_results)}개 결과")
             return final_results
@@ -827,6 +956,87 @@ class RRFRAGSystem:
         else:
             return 'description'
 
+class TraceReplayRAGSystem(RRFRAGSystem):
+    """
+    검색 트레이스 재생 시스템 (Vector DB / LLM 불필요)
+
+    검색 구간은 RetrievalTraceStore에 기록된 후보로 대체하고, RRF 융합 → 가중치 적용 →
+    티켓 중복 제거는 RRFRAGSystem.rrf_search를 그대로 실행한다. RAGEvaluator /
+    RRFConfigSweep에 RRFRAGSystem 대신 넘기면 융합 설정 실험을 수 초 안에 반복할 수 있다.
+
+    구간 결과에 영향을 주는 설정(LEG_CONFIG_FIELDS)은 기록 당시와 같아야 한다.
+    """
+
+    def __init__(self, traces: Dict[str, Dict[str, Any]], rrf_config: Optional[RRFConfig] = None):
+        """
+        Args:
+            traces: RetrievalTraceStore.load() 결과
+            rrf_config: 재생에 사용할 RRF 설정
+        """
+        self.collection_name = "trace_replay"
+        self.config = rrf_config or RRFConfig()
+        self.client = None
+        self.collection = None
+        self.hyde_generator = None
+        self.weighting_system = None
+        self.bm25_documents = []
+        self.bm25_corpus_tokenized = []
+        self.tokenizer = None
+        self.leg_cache = None
+        self.trace_store = None
+
+        self.traces = traces
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        for trace in traces.values():
+            self.documents.update(trace.get("documents", {}))
+        # rrf_search가 BM25 구간을 실행하도록 기록 여부만 표시
+        self.bm25_index = any("bm25" in trace["legs"] for trace in traces.values())
+
+        self._check_config(self.config)
+        self.rrf_engine = RRFFusionEngine(self.config)
+        logger.info(f"✅ 트레이스 재생 시스템 초기화: {len(traces)}개 쿼리, {len(self.documents)}개 문서")
+
+    @classmethod
+    def from_file(cls, path: str, rrf_config: Optional[RRFConfig] = None) -> "TraceReplayRAGSystem":
+        """트레이스 파일로 재생 시스템 생성"""
+        return cls(RetrievalTraceStore(path).load(), rrf_config)
+
+    def _check_config(self, config: RRFConfig):
+        """구간 결과에 영향을 주는 설정이 기록 당시와 다르면 ValueError"""
+        for trace in self.traces.values():
+            for name, recorded in trace.get("config", {}).items():
+                if getattr(config, name) != recorded:
+                    raise ValueError(
+                        f"{name}={getattr(config, name)}은(는) 트레이스 기록 값({recorded})과 달라 "
+                        f"재생할 수 없습니다. 해당 설정으로 트레이스를 다시 기록하세요."
+                    )
+
+    def with_config(self, config: RRFConfig, leg_cache: Optional[LegResultCache] = None) -> "TraceReplayRAGSystem":
+        self._check_config(config)
+        return super().with_config(config, leg_cache)
+
+    def _run_leg(self, leg: str, search_fn, query: str,
+                 timings: Optional[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """기록된 구간 후보 반환 (기록된 소요 시간을 timings에 반영)"""
+        trace = self.traces.get(query)
+        if trace is None:
+            logger.warning(f"⚠️ 트레이스에 없는 쿼리: '{query}'")
+            return []
+
+        results, elapsed = trace_leg_results(trace, leg)
+        if timings is not None:
+            timings[leg] = timings.get(leg, 0.0) + elapsed
+        return results
+
+    def load_documents_by_ids(self, doc_ids: List[str]) -> List[Dict[str, Any]]:
+        """트레이스에 기록된 문서 본문/메타데이터 반환 (ID 순서 유지)"""
+        return [
+            {'id': doc_id, 'content': self.documents[doc_id]["content"],
+             'metadata': self.documents[doc_id]["metadata"]}
+            for doc_id in doc_ids if doc_id in self.documents
+        ]
+
+
 def compare_rrf_vs_hybrid():
     """RRF vs 기존 하이브리드 방식 비교"""
     print("🔬 RRF vs 하이브리드 검색 방식 비교")
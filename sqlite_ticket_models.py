@@ -8,6 +8,7 @@ from typing import List, Optional, Dict, Any
 import sqlite3
 import json
 from datetime import datetime
+from utils.sqlite_pool import get_sqlite_pool, chunked, placeholders
 
 @dataclass
 class Ticket:
@@ -48,17 +49,18 @@ class SQLiteTicketManager:
         if not os.path.exists(db_dir):
             os.makedirs(db_dir, mode=0o755, exist_ok=True)
             print(f"✅ SQLite RDB 디렉토리 생성 및 권한 설정: {db_dir}")
+        # 스레드 로컬 커넥션 풀 (db 파일별 공유)
+        self._pool = get_sqlite_pool(db_path)
         self.init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 풀 커넥션 (with 블록 종료 시 commit/rollback, 커넥션은 유지)"""
+        return self._pool.connection()
     
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            # WAL 모드로 설정하여 동시성 개선
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA cache_size=1000")
-            conn.execute("PRAGMA temp_store=memory")
-            
+        with self._connect() as conn:
+            # WAL/synchronous 등 PRAGMA는 커넥션 풀에서 커넥션 생성 시 1회 설정
             cursor = conn.cursor()
             
             # tickets 테이블 생성 (ERD 스키마 준수)
@@ -111,13 +113,15 @@ class SQLiteTicketManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON tickets(created_at)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_ticket_events_ticket_id ON ticket_events(ticket_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_ticket_events_created_at ON ticket_events(created_at)")
+            # 상태별 목록(ORDER BY created_at), 티켓별 이벤트 조회용 복합 인덱스
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tickets_status_created_at ON tickets(status, created_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ticket_events_ticket_created ON ticket_events(ticket_id, created_at)")
             
             conn.commit()
     
     def insert_ticket(self, ticket: Ticket) -> int:
         """티켓 삽입"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             try:
@@ -178,8 +182,7 @@ class SQLiteTicketManager:
     
     def insert_ticket_event(self, event: TicketEvent) -> int:
         """티켓 이벤트 삽입"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -193,10 +196,27 @@ class SQLiteTicketManager:
             conn.commit()
             return event_id
     
+    def insert_ticket_events(self, events: List[TicketEvent]) -> int:
+        """티켓 이벤트 일괄 삽입 (단일 트랜잭션)
+
+        Returns:
+            삽입된 이벤트 수
+        """
+        if not events:
+            return 0
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT INTO ticket_events (ticket_id, event_type, old_value, new_value, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (event.ticket_id, event.event_type, event.old_value, event.new_value, event.created_at)
+                for event in events
+            ])
+            return len(events)
+    
     def get_ticket_by_id(self, ticket_id: int) -> Optional[Ticket]:
         """티켓 ID로 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -226,8 +246,7 @@ class SQLiteTicketManager:
     
     def get_ticket_by_id(self, ticket_id: int) -> Optional[Ticket]:
         """티켓 ID로 단일 티켓 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -257,10 +276,40 @@ class SQLiteTicketManager:
                 )
             return None
     
+    def get_tickets_by_ids(self, ticket_ids: List[int]) -> List[Ticket]:
+        """여러 티켓 ID로 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        tickets_by_id = {}
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            for batch in chunked(dict.fromkeys(ticket_ids)):
+                cursor.execute(f"""
+                    SELECT ticket_id, original_message_id, status, title, description,
+                           priority, ticket_type, reporter, reporter_email, labels,
+                           jira_project, start_date, created_at, updated_at
+                    FROM tickets WHERE ticket_id IN ({placeholders(len(batch))})
+                """, batch)
+                for row in cursor.fetchall():
+                    tickets_by_id[row[0]] = Ticket(
+                        ticket_id=row[0],
+                        original_message_id=row[1],
+                        status=row[2],
+                        title=row[3],
+                        description=row[4],
+                        priority=row[5],
+                        ticket_type=row[6],
+                        reporter=row[7],
+                        reporter_email=row[8],
+                        labels=json.loads(row[9]) if row[9] else [],
+                        jira_project=row[10],
+                        start_date=row[11],
+                        created_at=row[12],
+                        updated_at=row[13]
+                    )
+        return [tickets_by_id[ticket_id] for ticket_id in ticket_ids if ticket_id in tickets_by_id]
+    
     def get_tickets_by_message_id(self, message_id: str) -> List[Ticket]:
         """메일 ID로 관련 티켓 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -290,8 +339,7 @@ class SQLiteTicketManager:
     
     def get_tickets_by_status(self, status: str) -> List[Ticket]:
         """특정 상태의 티켓만 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -321,8 +369,7 @@ class SQLiteTicketManager:
     
     def get_all_tickets(self) -> List[Ticket]:
         """모든 티켓 조회 (최근 순)"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -357,8 +404,7 @@ class SQLiteTicketManager:
         try:
             current_time = datetime.now().isoformat()
             
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                conn.execute("PRAGMA journal_mode=WAL")
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 티켓 상태 업데이트
@@ -383,7 +429,7 @@ class SQLiteTicketManager:
                 vector_db = VectorDBManager()
                 
                 # 해당 티켓의 메일 ID 찾기
-                with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+                with self._connect() as conn:
                     cursor = conn.cursor()
                     cursor.execute("SELECT original_message_id FROM tickets WHERE ticket_id = ?", (ticket_id,))
                     result = cursor.fetchone()
@@ -419,8 +465,7 @@ class SQLiteTicketManager:
         try:
             current_time = datetime.now().isoformat()
             
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                conn.execute("PRAGMA journal_mode=WAL")
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 티켓 레이블 업데이트 (JSON 형태로 저장)
@@ -453,8 +498,7 @@ class SQLiteTicketManager:
         """티켓 우선순위 업데이트"""
         current_time = datetime.now().isoformat()
         
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # 티켓 우선순위 업데이트
@@ -477,8 +521,7 @@ class SQLiteTicketManager:
         try:
             current_time = datetime.now().isoformat()
             
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                conn.execute("PRAGMA journal_mode=WAL")
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 티켓 description 업데이트
@@ -507,8 +550,7 @@ class SQLiteTicketManager:
     
     def get_ticket_events(self, ticket_id: int) -> List[TicketEvent]:
         """티켓의 모든 이벤트 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -532,8 +574,7 @@ class SQLiteTicketManager:
     
     def get_tickets_by_status(self, status: str) -> List[Ticket]:
         """상태별 티켓 조회"""
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -566,8 +607,7 @@ class SQLiteTicketManager:
     def delete_ticket(self, ticket_id: int) -> bool:
         """티켓 삭제 (관련 이벤트도 함께 삭제)"""
         try:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                conn.execute("PRAGMA journal_mode=WAL")
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 관련 이벤트 먼저 삭제
@@ -4,13 +4,20 @@ Jira 티켓과 같은 구조화된 데이터를 의미 있는 청크로 분할
 """
 
 import re
-from typing import List, Dict, Any, Optional
+import os
+import csv
+import sys
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union, IO
 from dataclasses import dataclass
 from bs4 import BeautifulSoup
 import logging
+from module.html_table_stream import iter_html_rows_by_class
 
 logger = logging.getLogger(__name__)
 
+# 스트리밍 HTML 파싱 시 한 번에 읽는 문자 수
+HTML_READ_SIZE = 64 * 1024
+
 @dataclass
 class StructuredChunk:
     """구조화된 청크 데이터 클래스"""
@@ -70,26 +77,30 @@ class JiraStructuredChunker:
     
     def _extract_ticket_chunks_from_html(self, row, file_name: str) -> List[StructuredChunk]:
         """HTML 행에서 새로운 청킹 전략에 따라 청크들을 추출"""
+        try:
+            cell_texts = [cell.get_text(strip=True) for cell in row.find_all('td')]
+            return self._ticket_chunks_from_cells(row.get('data-issuekey', 'UNKNOWN'), cell_texts, file_name)
+        except Exception as e:
+            logger.error(f"티켓 청킹 실패: {str(e)}")
+            return []
+    
+    def _ticket_chunks_from_cells(self, ticket_id: Optional[str], cell_texts: List[str],
+                                  file_name: str) -> List[StructuredChunk]:
+        """티켓 ID와 행의 셀 텍스트로 청크 생성 (일괄/스트리밍 파싱 공용)"""
         chunks = []
         
         try:
-            # 티켓 ID 추출
-            ticket_id = row.get('data-issuekey', 'UNKNOWN')
+            # 티켓 ID 확인
             if not ticket_id or ticket_id == 'UNKNOWN':
                 return chunks
             
-            cells = row.find_all('td')
-            if len(cells) < 3:  # 최소 필수 필드 수 확인
+            if len(cell_texts) < 3:  # 최소 필수 필드 수 확인
                 return chunks
             
             # 1. 헤더 청크 생성 (Summary + Description)
-            summary_text = ""
-            description_text = ""
-            
             # Summary 추출 (일반적으로 3번째 셀)
-            if len(cells) > 2:
-                summary_cell = cells[2]
-                summary_text = summary_cell.get_text(strip=True)
+            summary_text = cell_texts[2]
+            description_text = ""
             
             # Description은 HTML 테이블에서 직접 추출하기 어려우므로 
             # Summary만으로 헤더 청크 생성 (실제 Description은 API나 상세 페이지에서 가져와야 함)
@@ -142,60 +153,7 @@ class JiraStructuredChunker:
         
         try:
             for row in csv_data:
-                ticket_id = row.get('Key', 'UNKNOWN')
-                
-                # 1. 헤더 청크 생성 (Summary + Description)
-                summary = row.get('Summary', '')
-                description = row.get('Description', '')
-                
-                if summary or description:
-                    # Summary와 Description을 합쳐서 하나의 헤더 청크 생성
-                    header_content = ""
-                    if summary:
-                        header_content += f"요약: {summary}"
-                    if description:
-                        if header_content:
-                            header_content += f"\n설명: {description}"
-                        else:
-                            header_content = f"설명: {description}"
-                    
-                    chunk = StructuredChunk(
-                        content=header_content,
-                        chunk_type="header",
-                        ticket_id=ticket_id,
-                        field_name="header",
-                        field_value=header_content,
-                        metadata={
-                            "file_name": file_name,
-                            "ticket_id": ticket_id,
-                            "field_type": "header",
-                            "summary": summary,
-                            "description": description
-                        },
-                        priority=1
-                    )
-                    chunks.append(chunk)
-                
-                # 2. 댓글 청크 생성 (각 댓글을 개별 청크로)
-                comments = self._extract_comments_from_csv_row(row)
-                for comment in comments:
-                    chunk = StructuredChunk(
-                        content=comment['content'],
-                        chunk_type="comment",
-                        ticket_id=ticket_id,
-                        field_name="comment",
-                        field_value=comment['content'],
-                        metadata={
-                            "file_name": file_name,
-                            "ticket_id": ticket_id,
-                            "field_type": "comment",
-                            "comment_id": comment.get('id', ''),
-                            "comment_date": comment.get('date', '')
-                        },
-                        priority=2,
-                        commenter=comment.get('author', 'Unknown')
-                    )
-                    chunks.append(chunk)
+                chunks.extend(self._chunks_from_csv_row(row, file_name))
             
             print(f"✅ CSV 구조적 청킹 완료: {len(chunks)}개 청크 생성")
             print(f"   - 헤더 청크: {len([c for c in chunks if c.chunk_type == 'header'])}개")
@@ -206,6 +164,131 @@ class JiraStructuredChunker:
         
         return chunks
     
+    def _chunks_from_csv_row(self, row: Dict[str, Any], file_name: str) -> List[StructuredChunk]:
+        """CSV 행 하나를 헤더 청크 + 댓글 청크들로 변환"""
+        chunks = []
+        ticket_id = row.get('Key', 'UNKNOWN')
+        
+        # 1. 헤더 청크 생성 (Summary + Description)
+        summary = row.get('Summary', '')
+        description = row.get('Description', '')
+        
+        if summary or description:
+            # Summary와 Description을 합쳐서 하나의 헤더 청크 생성
+            header_content = ""
+            if summary:
+                header_content += f"요약: {summary}"
+            if description:
+                if header_content:
+                    header_content += f"\n설명: {description}"
+                else:
+                    header_content = f"설명: {description}"
+            
+            chunk = StructuredChunk(
+                content=header_content,
+                chunk_type="header",
+                ticket_id=ticket_id,
+                field_name="header",
+                field_value=header_content,
+                metadata={
+                    "file_name": file_name,
+                    "ticket_id": ticket_id,
+                    "field_type": "header",
+                    "summary": summary,
+                    "description": description
+                },
+                priority=1
+            )
+            chunks.append(chunk)
+        
+        # 2. 댓글 청크 생성 (각 댓글을 개별 청크로)
+        comments = self._extract_comments_from_csv_row(row)
+        for comment in comments:
+            chunk = StructuredChunk(
+                content=comment['content'],
+                chunk_type="comment",
+                ticket_id=ticket_id,
+                field_name="comment",
+                field_value=comment['content'],
+                metadata={
+                    "file_name": file_name,
+                    "ticket_id": ticket_id,
+                    "field_type": "comment",
+                    "comment_id": comment.get('id', ''),
+                    "comment_date": comment.get('date', '')
+                },
+                priority=2,
+                commenter=comment.get('author', 'Unknown')
+            )
+            chunks.append(chunk)
+        
+        return chunks
+    
+    def iter_csv_chunks(self, rows: Iterable[Dict[str, Any]], file_name: str) -> Iterator[StructuredChunk]:
+        """
+        CSV 행을 하나씩 받아 청크를 바로 반환하는 제너레이터 (chunk_csv_data의 스트리밍 버전)
+        
+        행 단위로 처리하므로 메모리 사용량은 행 하나 분량으로 제한되며,
+        오류가 난 행은 건너뛰고 다음 행을 계속 처리한다.
+        
+        Args:
+            rows: CSV 행 이터러블 (예: csv.DictReader)
+            file_name: 파일명
+        """
+        headers = comments = 0
+        for row_idx, row in enumerate(rows, 1):
+            try:
+                row_chunks = self._chunks_from_csv_row(row, file_name)
+            except Exception as e:
+                logger.error(f"CSV 행 {row_idx} 청킹 실패: {str(e)}")
+                continue
+            for chunk in row_chunks:
+                if chunk.chunk_type == 'header':
+                    headers += 1
+                else:
+                    comments += 1
+                yield chunk
+        
+        print(f"✅ CSV 스트리밍 청킹 완료: {headers + comments}개 청크 생성 (헤더: {headers}, 댓글: {comments})")
+    
+    def iter_csv_file_chunks(self, csv_path: str, file_name: Optional[str] = None,
+                             encoding: str = 'utf-8') -> Iterator[StructuredChunk]:
+        """
+        CSV 파일을 한 줄씩 읽으며 청크를 반환 (파일 전체를 메모리에 올리지 않음)
+        
+        Args:
+            csv_path: CSV 파일 경로
+            file_name: 메타데이터에 기록할 파일명 (기본: 경로의 파일명)
+            encoding: 파일 인코딩
+        """
+        file_name = file_name or os.path.basename(csv_path)
+        # Jira 내보내기의 긴 설명/댓글 필드 허용
+        csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+        with open(csv_path, 'r', encoding=encoding, errors='ignore', newline='') as f:
+            yield from self.iter_csv_chunks(csv.DictReader(f), file_name)
+    
+    def iter_jira_html_chunks(self, source: Union[str, IO[str]], file_name: str,
+                              read_size: int = HTML_READ_SIZE) -> Iterator[StructuredChunk]:
+        """
+        Jira HTML 내보내기를 조금씩 읽으며 티켓 행 단위로 청크를 반환 (chunk_jira_html의 스트리밍 버전)
+        
+        문서 전체를 BeautifulSoup으로 파싱하지 않고 module.html_table_stream으로 issuerow 행을
+        하나씩 꺼내, 기존과 같은 규칙(_ticket_chunks_from_cells)으로 청크를 만든다.
+        
+        Args:
+            source: HTML 파일 경로 또는 텍스트 파일 객체
+            file_name: 파일명
+            read_size: 한 번에 읽는 문자 수
+        """
+        rows = total = 0
+        for attrs, cell_texts in iter_html_rows_by_class(source, 'issuerow', chunk_size=read_size):
+            rows += 1
+            for chunk in self._ticket_chunks_from_cells(attrs.get('data-issuekey'), cell_texts, file_name):
+                total += 1
+                yield chunk
+        
+        print(f"✅ 구조적 청킹 완료 (스트리밍): {rows}개 티켓 행, {total}개 청크 생성")
+    
     def _extract_comments_from_csv_row(self, row: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         CSV 행에서 댓글 정보를 추출
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+첨부파일 배치 처리 테스트
+
+테스트 실행:
+    python -m pytest tests/test_attachment_processor.py -v
+"""
+
+import sys
+import os
+import base64
+import threading
+import time
+
+import pytest
+from cachetools import TTLCache
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("PyPDF2")
+pytest.importorskip("langchain_openai")
+
+from attachment_processor import AttachmentProcessor
+
+
+class FakeVectorDB:
+    def __init__(self):
+        self.bulk_calls = []
+
+    def add_attachment_chunks(self, chunks):
+        self.bulk_calls.append([c.chunk_id for c in chunks])
+        return [c.chunk_id for c in chunks]
+
+
+@pytest.fixture
+def processor(tmp_path):
+    proc = AttachmentProcessor.__new__(AttachmentProcessor)
+    proc.logger = __import__("logging").getLogger("test")
+    proc.storage_dir = tmp_path
+    proc.chunk_size = 3
+    proc.max_concurrency = 4
+    proc._analysis_cache = TTLCache(maxsize=16, ttl=60)
+    proc._analysis_cache_lock = threading.Lock()
+    proc.vector_db = FakeVectorDB()
+    proc.llm_calls = []
+    proc.active = proc.max_active = 0
+    lock = threading.Lock()
+
+    def fake_analyze(metadata, content):
+        with lock:
+            proc.llm_calls.append(metadata.original_filename)
+            proc.active += 1
+            proc.max_active = max(proc.max_active, proc.active)
+        time.sleep(0.05)
+        with lock:
+            proc.active -= 1
+        return {"summary": f"요약 {metadata.original_filename}", "keywords": ["k"], "category": "문서"}
+
+    proc.analyze_with_llm = fake_analyze
+    return proc
+
+
+def _attachment(name, text):
+    return {
+        "base64_data": base64.b64encode(text.encode()).decode(),
+        "filename": name,
+        "mime_type": "text/plain"
+    }
+
+
+class TestProcessAttachmentsBatch:
+    """배치 첨부파일 처리 테스트"""
+
+    def test_concurrent_analysis_with_hash_dedup_and_bulk_store(self, processor):
+        attachments = [_attachment(f"file{n}.txt", f"내용 {n} 하나 둘 셋 넷") for n in range(4)]
+        attachments.append(_attachment("copy.txt", "내용 0 하나 둘 셋 넷"))  # file0과 같은 내용
+
+        results = processor.process_attachments_batch(attachments, "T1")
+
+        assert [r.metadata.original_filename for r in results] == [a["filename"] for a in attachments]
+        assert len(processor.llm_calls) == 4
+        assert processor.max_active > 1
+        assert len(processor.vector_db.bulk_calls) == 5
+        assert all(len(ids) == 2 for ids in processor.vector_db.bulk_calls)
+        assert results[4].analysis_result == results[0].analysis_result
+
+    def test_previously_seen_hash_skips_llm(self, processor):
+        processor.process_attachments_batch([_attachment("a.txt", "같은 내용")], "T1")
+        processor.process_attachments_batch([_attachment("b.txt", "같은 내용")], "T2")
+
+        assert processor.llm_calls == ["a.txt"]
+
+    def test_analysis_cache_is_bounded(self, processor):
+        processor._analysis_cache = TTLCache(maxsize=2, ttl=60)
+        for n in range(3):
+            processor.process_attachments_batch([_attachment(f"f{n}.txt", f"내용 {n}")], "T1")
+        assert len(processor._analysis_cache) == 2
+
+        # 가장 오래된 f0는 밀려나 다시 분석
+        processor.process_attachments_batch([_attachment("again.txt", "내용 0")], "T2")
+        assert processor.llm_calls.count("again.txt") == 1
+
+    def test_invalid_attachment_returns_none(self, processor):
+        results = processor.process_attachments_batch(
+            [{"base64_data": "abc", "filename": "bad.bin"}, _attachment("ok.txt", "정상 내용")], "T1"
+        )
+
+        assert results[0] is None
+        assert results[1].metadata.original_filename == "ok.txt"
+
+
+class TestCreateChunks:
+    """청크 원문 위치 테스트"""
+
+    def test_chunks_carry_char_offsets(self, processor):
+        from attachment_processor import AttachmentMetadata
+
+        content = "  하나 둘\n셋   넷 다섯"
+        metadata = AttachmentMetadata("f", "a.txt", "x", 1, "text/plain", "h", "now")
+
+        chunks = processor.create_chunks(content, metadata)
+
+        assert [c["text"] for c in chunks] == ["하나 둘 셋", "넷 다섯"]
+        first = chunks[0]["metadata"]
+        assert content[first["char_start"]:first["char_end"]] == "하나 둘\n셋"
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+첨부파일 청크 하이브리드 검색 테스트
+
+테스트 실행:
+    python -m pytest tests/test_attachment_search.py -v
+"""
+
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import attachment_search
+from attachment_search import AttachmentSearcher, build_attachment_where
+
+
+CHUNKS = {
+    "a1": ("셋톱박스 재부팅 로그 분석 결과", {"ticket_id": "T1", "file_category": "보고서", "char_start": 0, "char_end": 16}),
+    "a2": ("NCMS-EUXP 연동 오류 코드 E401 발생", {"ticket_id": "T1", "file_category": "문서", "char_start": 17, "char_end": 40}),
+    "a3": ("월간 장애 통계 스프레드시트", {"ticket_id": "T1", "file_category": "보고서", "char_start": 41, "char_end": 55}),
+    "b1": ("셋톱박스 재부팅 다른 티켓", {"ticket_id": "T2", "file_category": "보고서", "char_start": 0, "char_end": 14}),
+}
+
+
+def _matches(metadata, where):
+    if not where:
+        return True
+    if "$and" in where:
+        return all(_matches(metadata, cond) for cond in where["$and"])
+    return all(metadata.get(key) == value for key, value in where.items())
+
+
+class FakeAttachmentCollection:
+    """where 필터와 고정 거리(dense)를 흉내내는 가짜 컬렉션"""
+
+    def __init__(self, distances):
+        self.distances = distances
+        self.query_calls = []
+
+    def query(self, query_texts, n_results, include, where=None):
+        self.query_calls.append(where)
+        ids = sorted(
+            (cid for cid, (_, meta) in CHUNKS.items() if _matches(meta, where) and cid in self.distances),
+            key=self.distances.get
+        )[:n_results]
+        return {
+            "ids": [ids],
+            "documents": [[CHUNKS[cid][0] for cid in ids]],
+            "metadatas": [[CHUNKS[cid][1] for cid in ids]],
+            "distances": [[self.distances[cid] for cid in ids]],
+        }
+
+    def get(self, where, limit, include):
+        ids = [cid for cid, (_, meta) in CHUNKS.items() if _matches(meta, where)][:limit]
+        return {
+            "ids": ids,
+            "documents": [CHUNKS[cid][0] for cid in ids],
+            "metadatas": [CHUNKS[cid][1] for cid in ids],
+        }
+
+
+def _searcher(distances):
+    return AttachmentSearcher(FakeAttachmentCollection(distances), tokenizer=lambda text: text.lower().split())
+
+
+class TestAttachmentSearch:
+    """필터/융합/오프셋 테스트"""
+
+    def test_where_clause(self):
+        assert build_attachment_where() is None
+        assert build_attachment_where("T1") == {"ticket_id": "T1"}
+        assert build_attachment_where("T1", "문서") == {"$and": [{"ticket_id": "T1"}, {"file_category": "문서"}]}
+
+    def test_vector_only_results_respect_filters_and_carry_offsets(self, monkeypatch):
+        monkeypatch.setattr(attachment_search, "BM25_AVAILABLE", False)
+        searcher = _searcher({"a1": 0.1, "a2": 0.5, "a3": 0.7, "b1": 0.05})
+
+        hits = searcher.search("셋톱박스 재부팅", n_results=2, ticket_id="T1", file_category="보고서")
+
+        assert [h["chunk_id"] for h in hits] == ["a1", "a3"]
+        assert hits[0]["char_start"] == 0 and hits[0]["char_end"] == 16
+        assert hits[0]["similarity_score"] == pytest.approx(0.9)
+        assert hits[0]["search_method"] == "attachment_vector"
+
+    def test_bm25_surfaces_keyword_match_outside_vector_candidates(self):
+        pytest.importorskip("rank_bm25")
+        # a2는 벡터 후보에 없지만 "e401" 키워드가 정확히 일치
+        searcher = _searcher({"a1": 0.2, "a3": 0.3})
+
+        hits = searcher.search("e401", n_results=3, ticket_id="T1")
+
+        assert "a2" in [h["chunk_id"] for h in hits]
+        a2 = next(h for h in hits if h["chunk_id"] == "a2")
+        assert a2["bm25_score"] > 0
+        assert a2["dense_score"] == 0.0
+        assert a2["search_method"] == "attachment_hybrid"
+
+    def test_empty_query_returns_nothing(self):
+        assert _searcher({"a1": 0.1}).search("  ") == []
+
+    def test_filtered_bm25_index_is_cached_until_ticket_write(self):
+        pytest.importorskip("rank_bm25")
+        collection = FakeAttachmentCollection({"a1": 0.2, "a3": 0.3})
+        collection.get_calls = 0
+        original_get = collection.get
+
+        def counting_get(**kwargs):
+            collection.get_calls += 1
+            return original_get(**kwargs)
+
+        collection.get = counting_get
+        cache = attachment_search._LexicalIndexCache()
+        searcher = AttachmentSearcher(collection, tokenizer=lambda text: text.lower().split(), index_cache=cache)
+
+        searcher.search("e401", ticket_id="T1")
+        searcher.search("재부팅", ticket_id="T1")
+        assert collection.get_calls == 1
+
+        cache.invalidate(["T2"])
+        searcher.search("e401", ticket_id="T1")
+        assert collection.get_calls == 1
+
+        cache.invalidate(["T1"])
+        searcher.search("e401", ticket_id="T1")
+        assert collection.get_calls == 2
+
+
+class FakeEmbeddingFunction:
+    """문자 코드 합으로 만드는 4차원 임베딩"""
+
+    def __call__(self, input):
+        return [[float(len(text)), float(sum(map(ord, text)) % 97), 1.0, 0.5] for text in input]
+
+
+class TestAttachmentCollection:
+    """기본 임베딩으로 저장된 기존 컬렉션과의 호환 테스트 (실제 ChromaDB)"""
+
+    def test_existing_default_collection_is_migrated_not_conflicted(self, tmp_path, monkeypatch):
+        chromadb = pytest.importorskip("chromadb")
+        from vector_db_models import VectorDBManager, AttachmentChunk
+
+        client = chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+        legacy = client.create_collection(name=attachment_search.ATTACHMENT_COLLECTION)
+        legacy.add(ids=["old-1"], documents=["기존 첨부 청크"], embeddings=[[0.1, 0.2, 0.3]],
+                   metadatas=[{"ticket_id": "T9", "file_category": "문서"}])
+
+        monkeypatch.setattr(attachment_search, "get_attachment_embedding_function", lambda: FakeEmbeddingFunction())
+        manager = VectorDBManager.__new__(VectorDBManager)
+        manager.client = client
+        manager._notify_write = lambda *args, **kwargs: None
+
+        stored = manager.add_attachment_chunks([AttachmentChunk(
+            chunk_id="new-1", ticket_id="T9", file_id="f", original_filename="a.pdf", mime_type="application/pdf",
+            content="셋톱박스 로그", chunk_index=0, file_size=10, file_category="문서"
+        )])
+        hits = manager.search_attachment_chunks("셋톱박스", n_results=5, ticket_id="T9")
+
+        assert stored == ["new-1"]
+        collection = client.get_collection(name=attachment_search.ATTACHMENT_KO_COLLECTION)
+        assert sorted(collection.get()["ids"]) == ["new-1", "old-1"]
+        assert {h["chunk_id"] for h in hits} == {"new-1", "old-1"}
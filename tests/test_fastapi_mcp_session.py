@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+FastAPI 서버 MCP 세션 재연결 / 제목·요약 단일 호출 응답 파싱 테스트
+
+테스트 실행:
+    python -m pytest tests/test_fastapi_mcp_session.py -v
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    for module_name in ("fastapi", "fastmcp", "slack_sdk", "datefinder", "dateparser"):
+        pytest.importorskip(module_name)
+    # 모듈 import 시 생성되는 SQLite 파일이 작업 디렉토리에 남지 않도록
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(os.path.join("frontend", "static"), exist_ok=True)
+    import fastapi_server
+    return fastapi_server
+
+
+class FakeResult:
+    def __init__(self, text):
+        self.content = [type("TextContent", (), {"text": text})()]
+
+
+class FlakyMCPClient:
+    """첫 호출에서 전송이 끊기는 가짜 MCP 클라이언트 (재진입 카운터 흉내)"""
+
+    def __init__(self, error):
+        self.error = error
+        self.connected = True
+        self.depth = 0
+        self.closes = 0
+        self.calls = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def __aenter__(self):
+        self.depth += 1
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.depth = max(0, self.depth - 1)
+
+    async def close(self):
+        self.closes += 1
+        self.depth = 0
+        self.connected = False
+
+    async def call_tool(self, name, arguments):
+        self.calls.append(name)
+        if self.error is not None:
+            error, self.error = self.error, None
+            self.connected = False
+            raise error
+        return FakeResult("ok")
+
+
+class TestParseCombinedTicketResponse:
+    """단일 호출 JSON 응답 파싱"""
+
+    def test_well_formed_json(self, server):
+        parsed = server.parse_combined_ticket_response('{"title": " 셋톱박스 재부팅 ", "summary": "1.핵심 문제 요약: 재부팅"}')
+        assert parsed == {"title": "셋톱박스 재부팅", "summary": "1.핵심 문제 요약: 재부팅"}
+
+    def test_fenced_json(self, server):
+        content = '설명입니다\n```json\n{"title": "제목", "summary": "요약"}\n```\n끝'
+        assert server.parse_combined_ticket_response(content) == {"title": "제목", "summary": "요약"}
+        assert server.parse_combined_ticket_response('```\n{"title": "t", "summary": "s"}\n```') == {"title": "t", "summary": "s"}
+
+    @pytest.mark.parametrize("content", [
+        "제목: 재부팅 / 요약: 없음",
+        '["title", "summary"]',
+        '{"title": "제목만 있음"}',
+        '{"title": "", "summary": "요약"}',
+        '{"title": "제목", "summary": "잘린 응답',
+        '```json\n{"title": "제목", ',
+    ])
+    def test_malformed_or_partial_json_returns_none(self, server, content):
+        assert server.parse_combined_ticket_response(content) is None
+
+
+class TestMCPReconnect:
+    """풀 세션 끊김 후 재연결"""
+
+    def test_transport_drop_reconnects_and_retries(self, server, monkeypatch):
+        import httpx
+        client = FlakyMCPClient(httpx.ConnectError("connection reset"))
+        monkeypatch.setattr(server, "mcp", client)
+        monkeypatch.setattr(server.app.state, "mcp_pooled", True, raising=False)
+
+        result = asyncio.run(server.call_mcp_tool("simple_llm_call", {"prompt": "p"}))
+
+        assert result.content[0].text == "ok"
+        assert client.calls == ["simple_llm_call", "simple_llm_call"]
+        assert client.closes == 1
+        assert client.depth == 1  # 재연결된 풀 세션만 남음
+        assert server.app.state.mcp_pooled is True
+
+    @pytest.mark.parametrize("error_name", ["ReadTimeout", "RemoteProtocolError"])
+    def test_failure_after_send_reconnects_without_retry(self, server, monkeypatch, error_name):
+        import httpx
+        client = FlakyMCPClient(getattr(httpx, error_name)("server did not respond"))
+        monkeypatch.setattr(server, "mcp", client)
+        monkeypatch.setattr(server.app.state, "mcp_pooled", True, raising=False)
+
+        # 요청이 이미 전달됐을 수 있으므로 티켓 생성이 중복 실행되지 않아야 함
+        with pytest.raises(getattr(httpx, error_name)):
+            asyncio.run(server.call_mcp_tool("create_ticket_from_single_email_tool", {"email_data": {}}))
+        assert client.calls == ["create_ticket_from_single_email_tool"]
+        assert client.closes == 1  # 다음 호출을 위해 세션은 재연결
+        assert server.app.state.mcp_pooled is True
+
+    def test_disconnected_pool_is_reopened_before_call(self, server, monkeypatch):
+        client = FlakyMCPClient(None)
+        client.connected = False
+        monkeypatch.setattr(server, "mcp", client)
+        monkeypatch.setattr(server.app.state, "mcp_pooled", True, raising=False)
+
+        asyncio.run(server.call_mcp_tool("simple_llm_call", {"prompt": "p"}))
+
+        assert client.closes == 1
+        assert client.calls == ["simple_llm_call"]
+
+    def test_tool_error_is_not_retried(self, server, monkeypatch):
+        from fastmcp.exceptions import ToolError
+        client = FlakyMCPClient(ToolError("invalid email_data"))
+        monkeypatch.setattr(server, "mcp", client)
+        monkeypatch.setattr(server.app.state, "mcp_pooled", True, raising=False)
+        client.connected = True
+
+        with pytest.raises(ToolError):
+            asyncio.run(server.call_mcp_tool("create_ticket_from_single_email_tool", {"email_data": {}}))
+        assert client.calls == ["create_ticket_from_single_email_tool"]
+        assert client.closes == 0
+
+
+class TestKakaoFailureNotifier:
+    """카카오 작업 최종 실패 알림"""
+
+    def test_kakao_failure_handler_is_registered(self, server):
+        assert server.event_worker_pool.failure_handlers["kakao"] is server.notify_kakao_utterance_failure
+
+    def test_failure_event_is_sent_to_bot_user(self, server, monkeypatch):
+        sent = []
+
+        class FakeAsyncClient:
+            def __init__(self, **kwargs):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                pass
+
+            async def post(self, url, headers, json):
+                sent.append((url, json))
+                return type("Response", (), {"raise_for_status": lambda self: None})()
+
+        monkeypatch.setattr(server.httpx, "AsyncClient", FakeAsyncClient)
+        monkeypatch.setattr(server, "KAKAO_BOT_ID", "bot1")
+        monkeypatch.setattr(server, "KAKAO_CLIENT_ID", "rest-key")
+
+        asyncio.run(server.notify_kakao_utterance_failure({"bot_user_key": "u1", "sender": "a@b.c"}, "mcp down"))
+
+        assert sent == [("https://bot-api.kakao.com/v2/bots/bot1/talk", {
+            "event": {"name": server.KAKAO_FAILURE_EVENT, "data": {"error": "mcp down"}},
+            "user": [{"type": "botUserKey", "id": "u1"}]
+        })]
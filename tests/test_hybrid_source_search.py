@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+하이브리드 검색 소스별 병렬 검색 / 점수 정규화 테스트
+
+테스트 실행:
+    python -m pytest tests/test_hybrid_source_search.py -v
+"""
+
+import sys
+import os
+import time
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("langchain")
+pytest.importorskip("langchain_openai")
+
+from langchain_core.documents import Document
+from hybrid_search_retriever import search_sources_concurrently, merge_normalized_documents, get_straggler_count
+
+
+def _sleeping(delay, value):
+    def search():
+        time.sleep(delay)
+        return value
+    return search
+
+
+class TestSourceParallelSearch:
+    """마감 시간 / 부분 결과 테스트"""
+
+    def test_latency_tracks_slowest_source_not_sum(self):
+        searches = {name: _sleeping(0.2, [name]) for name in ("file_chunk", "mail", "structured_chunk")}
+
+        started = time.monotonic()
+        results = search_sources_concurrently(searches)
+
+        assert time.monotonic() - started < 0.5
+        assert results == {"file_chunk": ["file_chunk"], "mail": ["mail"], "structured_chunk": ["structured_chunk"]}
+
+    def test_slow_and_failing_sources_return_partial_results(self):
+        def broken():
+            raise RuntimeError("collection missing")
+
+        started = time.monotonic()
+        results = search_sources_concurrently(
+            {"file_chunk": _sleeping(0, ["fast"]), "mail": _sleeping(1.0, ["slow"]), "structured_chunk": broken},
+            timeouts={"mail": 0.1}
+        )
+
+        assert time.monotonic() - started < 0.5
+        assert results == {"file_chunk": ["fast"], "mail": [], "structured_chunk": []}
+
+    def test_timed_out_search_is_tracked_until_it_finishes(self):
+        baseline = get_straggler_count()
+        results = search_sources_concurrently({"mail": _sleeping(0.3, ["slow"])}, timeouts={"mail": 0.05})
+
+        assert results == {"mail": []}
+        assert get_straggler_count() == baseline + 1
+        time.sleep(0.5)
+        assert get_straggler_count() == baseline
+
+
+class TestScoreNormalization:
+    """소스 간 점수 정규화 테스트"""
+
+    def test_sources_are_put_on_same_scale(self):
+        # 파일 청크는 RRF 점수(작은 값, 상한 0.1), 메일은 코사인 유사도
+        files = [Document(page_content=f"f{i}", metadata={"similarity_score": s, "score_ceiling": 0.1})
+                 for i, s in enumerate([0.09, 0.05, 0.02])]
+        mails = [Document(page_content=f"m{i}", metadata={"similarity_score": s}) for i, s in enumerate([0.7, 0.3])]
+
+        merged = merge_normalized_documents({"file_chunk": files, "mail": mails, "structured_chunk": []})
+
+        assert [d.page_content for d in merged] == ["f0", "m0", "f1", "m1", "f2"]
+        assert [d.metadata["normalized_score"] for d in merged] == pytest.approx([0.9, 0.7, 0.5, 0.3, 0.2])
+
+    def test_single_weak_hit_is_not_promoted(self):
+        files = [Document(page_content="f0", metadata={"similarity_score": 0.8}),
+                 Document(page_content="f1", metadata={"similarity_score": 0.6})]
+        structured = [Document(page_content="s0", metadata={"similarity_score": 0.2})]
+
+        merged = merge_normalized_documents({"file_chunk": files, "structured_chunk": structured})
+
+        assert [d.page_content for d in merged] == ["f0", "f1", "s0"]
+        assert merged[-1].metadata["normalized_score"] == pytest.approx(0.2)
+
+    def test_scores_are_clamped_to_unit_range(self):
+        docs = [Document(page_content="over", metadata={"similarity_score": 0.2, "score_ceiling": 0.1}),
+                Document(page_content="negative", metadata={"similarity_score": -0.3})]
+
+        merged = merge_normalized_documents({"file_chunk": docs})
+
+        assert [d.metadata["normalized_score"] for d in merged] == [1.0, 0.0]
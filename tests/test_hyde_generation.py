@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+HyDE 검색 텍스트 생성 (병렬 생성 + TTL 캐시 + 일괄 검색) 테스트
+
+테스트 실행:
+    python -m pytest tests/test_hyde_generation.py -v
+"""
+
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cachetools import TTLCache
+
+
+class SlowStubGenerator:
+    """호출 수와 동시 실행 여부를 기록하는 오프라인 생성기"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _call(self, kind, result):
+        with self._lock:
+            self.calls.append(kind)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return result
+
+    def generate_multi_queries(self, question):
+        return self._call("multi", [f"{question} 원인", f"{question} 해결"])
+
+    def generate_hypothetical_document(self, question):
+        return self._call("hyde", f"제목: {question} 해결 방안")
+
+
+class BatchQueryCollection:
+    """query 호출마다 query_texts 목록을 기록하는 가짜 컬렉션"""
+
+    def __init__(self):
+        self.queries = []
+
+    def query(self, query_texts, n_results):
+        self.queries.append(list(query_texts))
+        return {
+            'ids': [[f"doc-{i}"] for i in range(len(query_texts))],
+            'documents': [[f"본문 {i}"] for i in range(len(query_texts))],
+            'distances': [[0.1 * (i + 1)] for i in range(len(query_texts))],
+            'metadatas': [[{'ticket_id': f"T-{i}"}] for i in range(len(query_texts))],
+        }
+
+
+class TestHyDESearchTexts:
+    """HyDERAGSystem 생성/검색 경로 테스트"""
+
+    @pytest.fixture
+    def make_system(self):
+        pytest.importorskip("sentence_transformers")
+        pytest.importorskip("sklearn")
+        from hyde_rag_system import HyDERAGSystem, HyDEConfig
+
+        def _make(generator, collection=None):
+            system = HyDERAGSystem.__new__(HyDERAGSystem)
+            system.config = HyDEConfig()
+            system.hyde_generator = generator
+            system.collection = collection
+            system.generation_cache = TTLCache(maxsize=16, ttl=60)
+            system._generation_cache_lock = threading.Lock()
+            return system
+        return _make
+
+    def test_generators_run_concurrently_and_are_cached(self, make_system):
+        generator = SlowStubGenerator()
+        system = make_system(generator)
+
+        first = system.generate_search_texts("셋톱박스 재부팅 현상?")
+        second = system.generate_search_texts("  셋톱박스   재부팅 현상 ")
+
+        assert generator.max_active == 2
+        assert sorted(generator.calls) == ["hyde", "multi"]  # 두 번째는 캐시 사용
+        assert first == second
+        assert first['hypothetical_doc'].startswith("제목:")
+
+    def test_search_uses_single_batched_query(self, make_system):
+        from hyde_rag_system import normalize_question
+
+        collection = BatchQueryCollection()
+        system = make_system(SlowStubGenerator(delay=0), collection)
+        captured = {}
+        system._process_and_deduplicate = lambda results, query: captured.setdefault('results', results)
+
+        system.search("화면 멈춤")
+
+        assert len(collection.queries) == 1
+        assert len(collection.queries[0]) == 4  # 원본 + 멀티 쿼리 2개 + HyDE 문서
+        assert [r['query_type'] for r in captured['results']] == ['original', 'multi', 'multi', 'hyde']
+        assert normalize_question("화면  멈춤?") == "화면 멈춤"
+
+    def test_fallback_output_is_not_cached(self, make_system):
+        from hyde_rag_system import FallbackText
+
+        class FlakyGenerator(SlowStubGenerator):
+            def generate_hypothetical_document(self, question):
+                if self.calls.count("hyde") == 0:
+                    self.calls.append("hyde")
+                    return FallbackText(f"질문 '{question}'에 대한 해결 방법과 상세한 설명이 포함된 문서입니다.")
+                return self._call("hyde", f"제목: {question} 해결 방안")
+
+        generator = FlakyGenerator(delay=0)
+        system = make_system(generator)
+
+        first = system.generate_search_texts("화면 멈춤", use_multi_query=False)
+        second = system.generate_search_texts("화면 멈춤", use_multi_query=False)
+        third = system.generate_search_texts("화면 멈춤", use_multi_query=False)
+
+        assert first['hypothetical_doc'].startswith("질문")
+        assert second['hypothetical_doc'] == third['hypothetical_doc'] == "제목: 화면 멈춤 해결 방안"
+        assert generator.calls == ["hyde", "hyde"]
+
+    def test_cache_settings_are_read_at_construction(self, make_system, monkeypatch):
+        from hyde_rag_system import HyDEConfig
+
+        monkeypatch.setenv("HYDE_CACHE_TTL", "5")
+        monkeypatch.setenv("HYDE_CACHE_SIZE", "7")
+        config = HyDEConfig()
+
+        assert config.generation_cache_ttl == 5.0
+        assert config.generation_cache_size == 7
+
+
+class TestHyDEGeneratorInit:
+    """생성기 초기화: 설정 오류는 숨기지 않고, 스텁은 명시적으로 주입"""
+
+    @pytest.fixture
+    def hyde_module(self, monkeypatch):
+        pytest.importorskip("sentence_transformers")
+        pytest.importorskip("sklearn")
+        import hyde_rag_system
+
+        class FakeClient:
+            def __init__(self, **kwargs):
+                pass
+
+            def get_collection(self, name):
+                return type("Collection", (), {"count": lambda self: 0})()
+
+        monkeypatch.setattr(hyde_rag_system.chromadb, "PersistentClient", FakeClient)
+        monkeypatch.setattr(hyde_rag_system, "KoreanEmbeddingFunction", lambda: None)
+        monkeypatch.setattr(hyde_rag_system, "IntelligentChunkWeighting", lambda: None)
+        return hyde_rag_system
+
+    def test_configuration_error_is_raised(self, hyde_module, monkeypatch):
+        def missing_credentials(config):
+            raise ValueError("AZURE_OPENAI_API_KEY 없음")
+        monkeypatch.setattr(hyde_module, "HyDEDocumentGenerator", missing_credentials)
+
+        with pytest.raises(ValueError, match="AZURE_OPENAI_API_KEY"):
+            hyde_module.HyDERAGSystem()
+
+    def test_injected_generator_is_used(self, hyde_module):
+        generator = SlowStubGenerator(delay=0)
+        system = hyde_module.HyDERAGSystem(generator=generator)
+
+        assert system.hyde_generator is generator
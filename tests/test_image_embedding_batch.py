@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+이미지 배치 임베딩 테스트 (해시 임베딩 폴백으로 오프라인 실행)
+
+테스트 실행:
+    python -m pytest tests/test_image_embedding_batch.py -v
+"""
+
+import sys
+import os
+import io
+import base64
+import threading
+
+import pytest
+from PIL import Image
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_embedding_generator import ImageEmbeddingGenerator
+
+
+def _png(color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    monkeypatch.setenv("AZURE_VISION_ENDPOINT", "https://example.invalid")
+    monkeypatch.setenv("AZURE_VISION_KEY", "test-key")
+    gen = ImageEmbeddingGenerator(use_azure_vision=True)
+    gen.embedded = []
+    lock = threading.Lock()
+
+    def offline_embedding(image_bytes):
+        with lock:
+            gen.embedded.append(image_bytes)
+        return gen._generate_hash_embedding(image_bytes)
+
+    gen._generate_azure_embedding = offline_embedding
+    return gen
+
+
+class TestBatchGenerateEmbeddings:
+    """배치 임베딩 테스트"""
+
+    def test_identical_images_are_embedded_once(self, generator):
+        red, blue = _png("red"), _png("blue")
+        inputs = [red, blue, red, base64.b64encode(red).decode()]
+
+        results = generator.batch_generate_embeddings(inputs, ["a", "b", "c", "d"], batch_size=1)
+
+        assert len(generator.embedded) == 2
+        assert [r["metadata"]["image_id"] for r in results] == ["a", "b", "c", "d"]
+        assert results[0]["embedding"] == results[2]["embedding"] == results[3]["embedding"]
+        assert results[0]["embedding"] != results[1]["embedding"]
+        assert len(results[0]["embedding"]) == 1536
+        assert results[0]["metadata"]["width"] == 4
+
+    def test_undecodable_image_is_marked_failed(self, generator):
+        results = generator.batch_generate_embeddings([b"not an image", _png("green")])
+
+        assert results[0]["method"] == "failed"
+        assert results[1]["method"] == "azure_vision"
+        assert results[1]["embedding"] is not None
+
+    def test_clip_pixels_are_decoded_in_worker_threads(self):
+        gen = ImageEmbeddingGenerator.__new__(ImageEmbeddingGenerator)
+        gen.use_azure_vision = False
+        pending_tiles = []
+
+        def fake_clip(images):
+            # 지연 로딩 상태면 tile이 남아 있음 (load() 후에는 빈 목록)
+            pending_tiles.extend(len(image.tile) for image in images)
+            return [[0.0] * 4 for _ in images]
+
+        gen._generate_clip_embeddings = fake_clip
+
+        results = gen.batch_generate_embeddings([_png("red"), _png("blue")])
+
+        assert pending_tiles == [0, 0]
+        assert [r["method"] for r in results] == ["clip", "clip"]
+        assert results[0]["metadata"]["format"] == "PNG"
+
+
+class TestProcessMailImages:
+    """메일 이미지 처리 테스트"""
+
+    def test_mail_images_are_stored_in_one_call(self, generator):
+        pytest.importorskip("bs4")
+        from image_vector_processor import ImageVectorProcessor
+
+        class FakeVectorDB:
+            def __init__(self):
+                self.calls = []
+
+            def save_image_vectors(self, image_vectors):
+                self.calls.append([v.image_id for v in image_vectors])
+                return len(image_vectors)
+
+        processor = ImageVectorProcessor.__new__(ImageVectorProcessor)
+        processor.embedding_generator = generator
+        processor.vector_db = FakeVectorDB()
+
+        red = base64.b64encode(_png("red")).decode()
+        html = "".join(f'<img src="data:image/png;base64,{red}" alt="로고 {n}">' for n in range(5))
+        html += '<img src="cid:missing">'
+
+        results = processor.process_mail_images("m1", html)
+
+        assert [r["image_id"] for r in results] == [f"m1_img_{n}" for n in range(1, 6)]
+        assert processor.vector_db.calls == [[f"m1_img_{n}" for n in range(1, 6)]]
+        assert len(generator.embedded) == 1
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+증분 BM25 인덱스 및 Vector DB 쓰기 이벤트 테스트
+
+테스트 실행:
+    python -m pytest tests/test_incremental_bm25.py -v
+"""
+
+import sys
+import os
+import gc
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from incremental_bm25_index import IncrementalBM25Index
+from vector_db_models import (
+    VectorDBManager, StructuredChunk,
+    add_vector_db_write_listener, remove_vector_db_write_listener
+)
+
+
+def _docs():
+    return [
+        ("file_chunk:a", "셋톱박스 재부팅 현상 분석", {"chunk_id": "a"}),
+        ("file_chunk:b", "화면 멈춤 현상 로그", {"chunk_id": "b"}),
+        ("mail:m1", "재부팅 요청 메일 재부팅", {"message_id": "m1"}),
+    ]
+
+
+class TestIncrementalBM25Index:
+    """추가/삭제/스냅샷 테스트"""
+
+    def test_add_delete_and_replace(self):
+        index = IncrementalBM25Index()
+        index.add_documents(_docs())
+
+        assert [key for key, *_ in index.search("재부팅")] == ["mail:m1", "file_chunk:a"]
+
+        index.delete_documents(["mail:m1"])
+        index.add_documents([("file_chunk:b", "재부팅 이후 화면 멈춤", {"chunk_id": "b"})])
+
+        keys = [key for key, *_ in index.search("재부팅", k=5)]
+        assert set(keys) == {"file_chunk:a", "file_chunk:b"}
+        assert index.search("로그") == []  # 교체된 문서의 이전 토큰은 제거됨
+        assert index.clear("file_chunk:") == 2 and len(index) == 0
+
+    def test_snapshot_round_trip(self, tmp_path):
+        path = str(tmp_path / "bm25.json")
+        index = IncrementalBM25Index()
+        index.add_documents(_docs())
+        index.save_snapshot(path, extra={"collection_counts": {"mail": 1}})
+
+        tokenized = []
+        restored = IncrementalBM25Index(tokenizer=lambda text: tokenized.append(text) or text.split())
+        extra = restored.load_snapshot(path)
+
+        assert tokenized == []  # 스냅샷 로드 시 재토크나이징 없음
+        assert extra == {"collection_counts": {"mail": 1}}
+        assert len(restored) == 3
+        assert restored.search("현상") == index.search("현상")
+        assert restored.load_snapshot(str(tmp_path / "missing.json")) is None
+
+
+class TestWriteEvents:
+    """VectorDBManager 쓰기 이벤트 전달 테스트"""
+
+    def test_structured_chunk_write_is_published(self):
+        class FakeCollection:
+            def add(self, ids, documents, metadatas):
+                pass
+
+        manager = VectorDBManager.__new__(VectorDBManager)
+        manager._get_or_create_structured_chunk_collection = lambda: FakeCollection()
+        events = []
+        add_vector_db_write_listener(events.append)
+        try:
+            manager.add_structured_chunk(StructuredChunk(
+                chunk_id="s1", ticket_id="BTVO-1", chunk_type="summary", field_name="summary",
+                field_value="재부팅", content="요약: 재부팅", priority=1, file_name="x.csv",
+                file_type="csv", created_at="2025-01-01", metadata={}
+            ))
+        finally:
+            remove_vector_db_write_listener(events.append)
+
+        assert len(events) == 1
+        assert events[0]["op"] == "upsert"
+        assert events[0]["source_type"] == "structured_chunk"
+        assert events[0]["ids"] == ["s1"]
+        assert events[0]["documents"] == ["요약: 재부팅"]
+
+
+def _writer(db_path):
+    """쓰기 순번 DB만 사용하는 VectorDBManager (ChromaDB 없이 _notify_write 호출용)"""
+    manager = VectorDBManager.__new__(VectorDBManager)
+    manager.db_path = db_path
+    return manager
+
+
+class CountingVectorDB:
+    """get_all_* 호출 수를 기록하는 가짜 VectorDBManager"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.full_scans = 0
+        self.file_chunks = [{'chunk_id': 'a', 'file_name': 'manual.pdf', 'content': '셋톱박스 재부팅 절차', 'metadata': {}}]
+
+    def get_all_file_chunks(self):
+        self.full_scans += 1
+        return self.file_chunks
+
+    def get_all_mails(self):
+        return []
+
+    def get_all_structured_chunks(self):
+        return []
+
+    def get_write_sequences(self):
+        return _writer(self.db_path).get_write_sequences()
+
+    def get_write_watermark(self):
+        sequences = self.get_write_sequences()
+        counts = {'file_chunk': len(self.file_chunks), 'mail': 0, 'structured_chunk': 0}
+        return {source_type: {'count': counts[source_type], 'seq': sequences[source_type]} for source_type in counts}
+
+
+class TestHybridSearchRetrieverIndex:
+    """HybridSearchRetriever BM25 증분 반영 / 스냅샷 시작 테스트"""
+
+    @pytest.fixture
+    def make_retriever(self, monkeypatch):
+        pytest.importorskip("langchain")
+        pytest.importorskip("langchain_openai")
+        import hybrid_search_retriever as module
+
+        monkeypatch.setattr(module, "KeywordExtractor", lambda: None)
+        monkeypatch.setattr(module.HybridSearchRetriever, "_setup_retrievers", lambda self: None)
+
+        created = []
+
+        def _make(vector_db):
+            retriever = module.HybridSearchRetriever(vector_db)
+            created.append(retriever)
+            return retriever
+        yield _make
+        for retriever in created:
+            retriever.close()
+
+    def test_write_events_update_index_and_snapshot_skips_full_scan(self, make_retriever, tmp_path):
+        vector_db = CountingVectorDB(str(tmp_path))
+        retriever = make_retriever(vector_db)
+        assert vector_db.full_scans == 1
+
+        writer = _writer(str(tmp_path))
+        writer._notify_write("upsert", "file_chunk", ["b"], ["재부팅 후 화면 멈춤"], [{"chunk_id": "b", "file_name": "log.txt"}])
+        writer._notify_write("delete", "file_chunk", ["a"])
+
+        hits = retriever.bm25_index.search("재부팅")
+        assert [metadata["chunk_id"] for _, _, _, metadata in hits] == ["b"]
+        assert hits[0][3]["source_type"] == "file_chunk"
+
+        # 스냅샷 저장 후 재시작: 이벤트로 따라간 쓰기 순번과 문서 수가 같으면 전체 스캔 없음
+        vector_db.file_chunks = [{'chunk_id': 'b', 'content': '재부팅 후 화면 멈춤',
+                                  'metadata': {"chunk_id": "b", "file_name": "log.txt"}}]
+        retriever.save_snapshot()
+        warm = make_retriever(vector_db)
+
+        assert vector_db.full_scans == 1
+        assert len(warm.bm25_index) == 1
+
+    def test_same_count_update_invalidates_snapshot(self, make_retriever, tmp_path):
+        vector_db = CountingVectorDB(str(tmp_path))
+        retriever = make_retriever(vector_db)
+        retriever.close()
+
+        # 구독하지 않는 다른 프로세스가 같은 문서 수로 내용만 바꿈 - 쓰기 순번만 달라짐
+        vector_db.file_chunks = [{'chunk_id': 'a', 'file_name': 'manual.pdf', 'content': '리모컨 페어링 절차', 'metadata': {}}]
+        _writer(str(tmp_path))._bump_write_sequences(["file_chunk"])
+        restarted = make_retriever(vector_db)
+
+        assert vector_db.full_scans == 2
+        assert [m["chunk_id"] for _, _, _, m in restarted.bm25_index.search("페어링")] == ["a"]
+
+    def test_verify_index_rebuilds_source_changed_by_other_process(self, make_retriever, tmp_path):
+        vector_db = CountingVectorDB(str(tmp_path))
+        retriever = make_retriever(vector_db)
+        writer = _writer(str(tmp_path))
+
+        # 같은 프로세스의 쓰기는 이벤트로 반영되고 순번도 따라가므로 재구성 대상이 아님
+        chunk = {'chunk_id': 'b', 'file_name': 'log.txt', 'content': '화면 멈춤 로그', 'metadata': {'chunk_id': 'b'}}
+        vector_db.file_chunks = vector_db.file_chunks + [chunk]
+        writer._notify_write("upsert", "file_chunk", ["b"], [chunk['content']], [chunk['metadata']])
+        assert retriever.verify_index() == []
+        assert vector_db.full_scans == 1
+
+        # 다른 프로세스의 쓰기: 이벤트 없이 순번만 올라감
+        vector_db.file_chunks = [{'chunk_id': 'c', 'file_name': 'x.txt', 'content': '음성 인식 오류', 'metadata': {}}]
+        writer._bump_write_sequences(["file_chunk"])
+        assert retriever.verify_index() == ["file_chunk"]
+        assert [m["chunk_id"] for _, _, _, m in retriever.bm25_index.search("인식")] == ["c"]
+        assert retriever.bm25_index.search("멈춤") == []
+        assert retriever.verify_index() == []
+
+    def test_sequence_gap_in_event_marks_source_stale(self, make_retriever, tmp_path):
+        vector_db = CountingVectorDB(str(tmp_path))
+        retriever = make_retriever(vector_db)
+        writer = _writer(str(tmp_path))
+
+        # 다른 프로세스의 쓰기 뒤에 이 프로세스의 쓰기 이벤트가 오면 순번이 건너뜀
+        writer._bump_write_sequences(["file_chunk"])
+        vector_db.file_chunks = [{'chunk_id': 'c', 'file_name': 'x.txt', 'content': '음성 인식 오류', 'metadata': {}}]
+        writer._notify_write("delete", "file_chunk", ["a"])
+
+        # 재구성 전까지 스냅샷은 다음 시작 시 유효하지 않도록 기록됨
+        retriever.save_snapshot()
+        assert make_retriever(vector_db) and vector_db.full_scans == 2
+
+        assert retriever.verify_index() == ["file_chunk"]
+        assert [m["chunk_id"] for _, _, _, m in retriever.bm25_index.search("인식")] == ["c"]
+
+    def test_search_does_not_verify_index(self, make_retriever, tmp_path, monkeypatch):
+        vector_db = CountingVectorDB(str(tmp_path))
+        retriever = make_retriever(vector_db)
+        retriever.ensemble_retriever = object()
+        retriever.keyword_extractor = None  # 키워드 추출 단계에서 예외 -> 빈 결과
+        monkeypatch.setattr(retriever, "verify_index", lambda: pytest.fail("검색 경로에서 verify_index 호출"))
+
+        assert retriever.search("재부팅") == []
+
+    def test_unclosed_retriever_is_garbage_collected(self, tmp_path, monkeypatch):
+        pytest.importorskip("langchain")
+        pytest.importorskip("langchain_openai")
+        import weakref
+        import vector_db_models
+        import hybrid_search_retriever as module
+
+        monkeypatch.setattr(module, "KeywordExtractor", lambda: None)
+        monkeypatch.setattr(module.HybridSearchRetriever, "_setup_retrievers", lambda self: None)
+        listeners_before = len(vector_db_models._write_listeners)
+
+        retriever = module.HybridSearchRetriever(CountingVectorDB(str(tmp_path)))
+        ref = weakref.ref(retriever)
+        del retriever
+        gc.collect()
+
+        assert ref() is None
+        _writer(str(tmp_path))._notify_write("delete", "file_chunk", ["a"])
+        assert len(vector_db_models._write_listeners) == listeners_before
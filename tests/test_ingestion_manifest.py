@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+파일 수집 매니페스트 테스트
+
+테스트 실행:
+    python -m pytest tests/test_ingestion_manifest.py -v
+"""
+
+import sys
+import os
+
+import fitz
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.ingestion_manifest import (
+    IngestionManifest, PageCheckpoint, hash_file_content,
+    STAGE_EXTRACT, STAGE_STORE, STATUS_COMPLETED
+)
+from module.vision_pipeline import VisionPagePipeline
+from module.file_processor import FileProcessor
+
+
+class CountingVisionClient:
+    """지정한 페이지 이후로는 실패하는 가짜 비전 클라이언트 (중단 상황 재현)"""
+
+    def __init__(self, fail_from_call=None):
+        self.fail_from_call = fail_from_call
+        self.calls = 0
+
+    def image_bytes_to_text(self, image_bytes, prompt):
+        self.calls += 1
+        if self.fail_from_call is not None and self.calls >= self.fail_from_call:
+            raise RuntimeError("connection reset")
+        return f"vision text {self.calls}"
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return IngestionManifest(str(tmp_path / "manifest.db"))
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "slides.pdf"
+    doc = fitz.open()
+    for n in range(5):
+        doc.new_page().insert_text((72, 72), f"page {n + 1}", fontname="helv")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _pipeline(client):
+    return VisionPagePipeline(client, max_concurrency=1, max_retries=1, sleep=lambda _: None)
+
+
+class TestIngestionManifest:
+    """매니페스트 단계/페이지 기록 테스트"""
+
+    def test_stage_and_page_records(self, manifest):
+        manifest.register_file("h1", "a.pdf", 10)
+        manifest.mark_stage("h1", STAGE_EXTRACT, STATUS_COMPLETED, {"total_pages": 2})
+        manifest.record_page("h1", 2, {"text": "둘째"})
+        manifest.record_page("h1", 1, {"text": "첫째"})
+
+        assert manifest.is_stage_completed("h1", STAGE_EXTRACT)
+        assert not manifest.is_stored("h1")
+        assert manifest.get_completed_pages("h1") == {1: {"text": "첫째"}, 2: {"text": "둘째"}}
+        assert manifest.get_last_completed_page("h1") == 2
+        entry = manifest.get_entry("h1")
+        assert entry["file_name"] == "a.pdf"
+        assert entry["stages"][STAGE_EXTRACT]["detail"] == {"total_pages": 2}
+
+        manifest.forget("h1")
+        assert manifest.get_entry("h1") is None
+
+
+class TestResume:
+    """중단된 파일의 페이지 단위 재개 테스트"""
+
+    def test_interrupted_pdf_resumes_from_finished_pages(self, manifest, sample_pdf):
+        checkpoint = PageCheckpoint(manifest, hash_file_content(sample_pdf))
+
+        # 1차: 3번째 호출부터 실패 → 1, 2페이지만 체크포인트에 남음
+        first = _pipeline(CountingVisionClient(fail_from_call=3)).process_pdf(sample_pdf, checkpoint=checkpoint)
+        assert [r.processing_method for r in first] == ["gpt_vision"] * 2 + ["text_extraction"] * 3
+        assert sorted(checkpoint.completed_pages()) == [1, 2]
+
+        # 2차: 남은 3페이지만 비전 호출
+        client = CountingVisionClient()
+        second = _pipeline(client).process_pdf(sample_pdf, checkpoint=checkpoint)
+
+        assert client.calls == 3
+        assert [r.page_number for r in second] == [1, 2, 3, 4, 5]
+        assert [r.text for r in second[:2]] == ["vision text 1", "vision text 2"]
+        assert all(r.processing_method == "gpt_vision" for r in second)
+
+    def test_stored_file_is_skipped(self, manifest, sample_pdf):
+        file_hash = hash_file_content(sample_pdf)
+        manifest.mark_stage(file_hash, STAGE_STORE, STATUS_COMPLETED, {"chunks": 5})
+
+        result = FileProcessor(None, manifest=manifest).process_file(sample_pdf)
+
+        assert result["skipped"] is True
+        assert result["file_hash"] == file_hash
+        assert result["processed_pages"] == []
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Jira CSV 스트리밍 청킹 (프로세스 풀 + JSONL 증분 저장 + 체크포인트 재개) 테스트
+
+테스트 실행:
+    python -m pytest tests/test_jira_chunk_streaming.py -v
+"""
+
+import sys
+import os
+import csv
+import json
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jira_chunk_processor as module
+from jira_chunk_processor import JiraChunkProcessor, ticket_chunks_to_dict
+
+# 실행마다 달라지는 값 (uuid / 생성 시각)
+VOLATILE_FIELDS = ("chunk_id", "created_at")
+
+
+class SimulatedCrash(Exception):
+    pass
+
+
+def _write_csv(path, rows=23):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Key", "Summary", "Description", "Issue Type", "Priority", "Status",
+                         "Assignee", "Reporter", "Created", "Updated", "Comment"])
+        for i in range(1, rows + 1):
+            key = "" if i == 7 else f"BTVO-{i}"  # 티켓 ID 없는 행은 건너뜀
+            writer.writerow([key, f"셋톱박스 재부팅 {i}", f"설명 {i}", "Bug", "High", "Open",
+                             "김개발", "이사용", "2025-01-01", "2025-01-02", f"댓글 {i} - 홍길동" if i % 2 else ""])
+
+
+def _normalize(ticket):
+    return {
+        **ticket,
+        "chunks": [{k: v for k, v in chunk.items() if k not in VOLATILE_FIELDS} for chunk in ticket["chunks"]]
+    }
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [_normalize(json.loads(line)) for line in f]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = str(tmp_path / "jira.csv")
+    _write_csv(path)
+    return path
+
+
+def _expected(csv_path):
+    processor = JiraChunkProcessor()
+    return [_normalize(ticket_chunks_to_dict(tc)) for tc in processor.process_csv_file(csv_path)]
+
+
+class TestStreamingChunking:
+    """기존 일괄 처리와 동일한 출력 / 재개 테스트"""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_output_matches_batch_processing(self, csv_path, tmp_path, max_workers):
+        output = str(tmp_path / "chunks.jsonl")
+
+        stats = JiraChunkProcessor().process_csv_file_to_jsonl(csv_path, output, batch_size=4, max_workers=max_workers)
+
+        expected = _expected(csv_path)
+        assert _read_jsonl(output) == expected
+        assert stats["total_tickets"] == len(expected) == 22
+        assert stats["total_chunks"] == sum(t["total_chunks"] for t in expected)
+
+    def test_sequential_path_uses_instance(self, csv_path, tmp_path, monkeypatch):
+        processor = JiraChunkProcessor()
+        original = processor._process_row_safely
+        seen = []
+
+        def recording(row, file_name, row_idx):
+            seen.append(row_idx)
+            return original(row, file_name, row_idx)
+
+        monkeypatch.setattr(processor, "_process_row_safely", recording)
+        monkeypatch.setattr(module, "_worker_processor", None)
+        processor.process_csv_file_to_jsonl(csv_path, str(tmp_path / "chunks.jsonl"), batch_size=5, max_workers=1)
+
+        assert len(seen) == 23
+        assert module._worker_processor is None
+
+    def test_resumes_after_last_finished_row(self, csv_path, tmp_path, monkeypatch):
+        output = str(tmp_path / "chunks.jsonl")
+        original = JiraChunkProcessor._process_rows
+        calls = []
+        crash_at = [11]
+
+        def crash_on_third_batch(self, rows, file_name):
+            calls.append(rows[0][0])
+            if rows[0][0] in crash_at:
+                crash_at.clear()
+                raise SimulatedCrash()
+            return original(self, rows, file_name)
+
+        monkeypatch.setattr(JiraChunkProcessor, "_process_rows", crash_on_third_batch)
+        with pytest.raises(SimulatedCrash):
+            JiraChunkProcessor().process_csv_file_to_jsonl(csv_path, output, batch_size=5, max_workers=1)
+
+        # 체크포인트 이후에 쓰다 만 줄은 재개 시 잘려야 함
+        with open(output, "a", encoding="utf-8") as f:
+            f.write('{"ticket_id": "BTVO-broken"')
+
+        calls.clear()
+        stats = JiraChunkProcessor().process_csv_file_to_jsonl(csv_path, output, batch_size=5, max_workers=1)
+
+        assert stats["resumed_from"] == 10
+        assert calls == [11, 16, 21]
+        assert _read_jsonl(output) == _expected(csv_path)
+
+        # 완료 후 재실행은 아무 행도 다시 처리하지 않음
+        calls.clear()
+        JiraChunkProcessor().process_csv_file_to_jsonl(csv_path, output, batch_size=5, max_workers=1)
+        assert calls == []
+        assert len(_read_jsonl(output)) == 22
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+SQLite 작업 큐 테스트
+
+테스트 실행:
+    python -m pytest tests/test_job_queue.py -v
+"""
+
+import asyncio
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.job_queue as job_queue
+from utils.job_queue import SQLiteJobQueue, JobWorkerPool
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteJobQueue(str(tmp_path / "jobs.db"), retry_backoff=0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """job_queue 모듈이 보는 현재 시각 고정 (now[0]을 바꿔 시간 경과 흉내)"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(job_queue.time, "time", lambda: now[0])
+    return now
+
+
+class TestSQLiteJobQueue:
+    """큐 기본 동작 테스트"""
+
+    def test_enqueue_is_idempotent_on_event_id(self, queue):
+        assert queue.enqueue("slack:Ev1", "slack", {"n": 1}) is True
+        assert queue.enqueue("slack:Ev1", "slack", {"n": 2}) is False
+
+        metrics = queue.get_metrics()
+        assert metrics["pending"] == 1
+
+    def test_claim_returns_jobs_in_order(self, queue):
+        queue.enqueue("a", "slack", {"n": 1})
+        queue.enqueue("b", "slack", {"n": 2})
+
+        first = queue.claim_next()
+        second = queue.claim_next()
+
+        assert first.event_id == "a"
+        assert first.payload == {"n": 1}
+        assert first.attempts == 1
+        assert second.event_id == "b"
+        assert queue.claim_next() is None
+
+    def test_fail_retries_until_max_attempts(self, queue):
+        queue.enqueue("a", "slack", {})
+
+        job = queue.claim_next()
+        assert queue.fail(job.job_id, "boom", max_attempts=2) == "pending"
+
+        job = queue.claim_next()
+        assert job.attempts == 2
+        assert queue.fail(job.job_id, "boom", max_attempts=2) == "failed"
+        assert queue.get_job_by_event_id("a").error == "boom"
+
+    def test_failed_job_waits_for_exponential_backoff(self, tmp_path, clock):
+        queue = SQLiteJobQueue(str(tmp_path / "backoff.db"), retry_backoff=10, max_backoff=15)
+        queue.enqueue("a", "slack", {})
+
+        assert queue.fail(queue.claim_next().job_id, "boom", max_attempts=5) == "pending"
+        assert queue.claim_next() is None  # 백오프 중에는 꺼내지 않음
+        assert queue.next_retry_delay() == 10
+
+        clock[0] += 10
+        job = queue.claim_next()
+        assert job.attempts == 2
+
+        # 두 번째 실패는 20초지만 max_backoff로 제한
+        queue.fail(job.job_id, "boom", max_attempts=5)
+        assert queue.get_job_by_event_id("a").next_attempt_at == clock[0] + 15
+
+    def test_dedup_key_uses_sliding_window(self, queue, clock):
+        assert queue.enqueue("k:1", "kakao", {}, dedup_key="u:hello", dedup_window=60) is True
+
+        # 구간 경계와 무관하게 마지막 접수 후 윈도우 안이면 중복
+        clock[0] += 59
+        assert queue.enqueue("k:2", "kakao", {}, dedup_key="u:hello", dedup_window=60) is False
+        assert queue.enqueue("k:3", "kakao", {}, dedup_key="u:other", dedup_window=60) is True
+
+        clock[0] += 2
+        assert queue.enqueue("k:4", "kakao", {}, dedup_key="u:hello", dedup_window=60) is True
+        assert queue.get_metrics()["pending"] == 3
+
+    def test_recover_stale_jobs(self, queue):
+        queue.enqueue("a", "slack", {})
+        queue.claim_next()
+
+        assert queue.recover_stale_jobs() == 1
+        assert queue.get_job_by_event_id("a").status == "pending"
+
+    def test_metrics_report_latency(self, queue):
+        queue.enqueue("a", "slack", {})
+        job = queue.claim_next()
+        queue.complete(job.job_id)
+
+        metrics = queue.get_metrics()
+        assert metrics["done"] == 1
+        assert metrics["sample_size"] == 1
+        assert metrics["queue_latency"]["p95"] >= 0.0
+
+
+class TestJobWorkerPool:
+    """워커 풀 테스트"""
+
+    def test_workers_process_jobs(self, queue):
+        processed = []
+
+        async def handler(payload):
+            processed.append(payload["n"])
+
+        async def scenario():
+            pool = JobWorkerPool(queue, {"slack": handler}, concurrency=2, poll_interval=0.05)
+            pool.start()
+            for i in range(5):
+                queue.enqueue(f"ev{i}", "slack", {"n": i})
+            pool.notify()
+            for _ in range(100):
+                if queue.get_metrics()["done"] == 5:
+                    break
+                await asyncio.sleep(0.02)
+            await pool.stop()
+
+        asyncio.run(scenario())
+
+        assert sorted(processed) == [0, 1, 2, 3, 4]
+
+    def test_failed_handler_is_retried(self, queue):
+        calls = []
+
+        async def flaky(payload):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("temporary")
+
+        pool = JobWorkerPool(queue, {"kakao": flaky}, max_attempts=3)
+        queue.enqueue("k1", "kakao", {})
+        asyncio.run(pool.run_until_empty())
+
+        assert len(calls) == 2
+        assert queue.get_job_by_event_id("k1").status == "done"
+
+    def test_final_failure_calls_failure_handler(self, queue):
+        failures = []
+
+        async def broken(payload):
+            raise RuntimeError("mcp down")
+
+        async def on_failure(payload, error):
+            failures.append((payload["n"], error))
+
+        pool = JobWorkerPool(queue, max_attempts=2)
+        pool.register("slack", broken, on_failure=on_failure)
+        queue.enqueue("s1", "slack", {"n": 1})
+        asyncio.run(pool.run_until_empty())
+
+        # 재시도 중에는 호출되지 않고 최종 실패 시 한 번만 호출
+        assert failures == [(1, "mcp down")]
+        assert queue.get_job_by_event_id("s1").status == "failed"
+
+    def test_prune_removes_only_old_finished_jobs(self, queue):
+        queue.enqueue("old", "slack", {})
+        queue.enqueue("pending", "slack", {})
+        queue.complete(queue.claim_next().job_id)
+
+        assert queue.prune_finished(retention=3600) == 0
+        assert queue.prune_finished(retention=-1) == 1
+
+        # 정리된 event_id는 다시 접수 가능
+        assert queue.get_job_by_event_id("old") is None
+        assert queue.enqueue("old", "slack", {}) is True
+        assert queue.get_job_by_event_id("pending").status == "pending"
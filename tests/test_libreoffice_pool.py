@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+LibreOffice 워커 풀 테스트 (실제 soffice 없이 가짜 워커 사용)
+
+테스트 실행:
+    python -m pytest tests/test_libreoffice_pool.py -v
+"""
+
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.exceptions import ConversionError
+from module import libreoffice_pool
+from module.libreoffice_pool import LibreOfficeWorkerPool, resolve_filter_name
+
+
+class FakeWorker:
+    """변환 결과 파일만 만드는 가짜 워커"""
+
+    started = []
+
+    def __init__(self, worker_id, hang=False, healthy=True, delay=0.0):
+        self.worker_id = worker_id
+        self.hang = hang
+        self.healthy = healthy
+        self.delay = delay
+        self.stopped = False
+        self.killed = False
+        self._release = threading.Event()
+
+    def start(self):
+        FakeWorker.started.append(self.worker_id)
+
+    def is_healthy(self):
+        return self.healthy
+
+    def convert(self, source_path, target_path, timeout):
+        if self.hang:
+            self._release.wait(5)
+        time.sleep(self.delay)
+        with open(target_path, "w") as f:
+            f.write(f"converted by {self.worker_id}")
+        return True
+
+    def kill(self):
+        self.killed = True
+        self._release.set()
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture(autouse=True)
+def reset_started():
+    FakeWorker.started = []
+
+
+class TestLibreOfficeWorkerPool:
+    """풀 동작 테스트"""
+
+    def test_workers_are_reused(self, tmp_path):
+        pool = LibreOfficeWorkerPool(size=2, worker_factory=lambda i: FakeWorker(i))
+
+        for n in range(5):
+            pool.convert("a.docx", str(tmp_path / f"out{n}.pdf"))
+
+        assert FakeWorker.started == [0]
+        assert pool.get_stats()["conversions"] == 5
+
+    def test_concurrent_jobs_are_bounded_by_pool_size(self, tmp_path):
+        pool = LibreOfficeWorkerPool(size=2, worker_factory=lambda i: FakeWorker(i, delay=0.05))
+
+        threads = [
+            threading.Thread(target=pool.convert, args=("a.pptx", str(tmp_path / f"s{n}.pdf")))
+            for n in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(FakeWorker.started) == [0, 1]
+        assert pool.get_stats()["conversions"] == 6
+
+    def test_hung_worker_is_restarted(self, tmp_path):
+        workers = []
+
+        def factory(i):
+            worker = FakeWorker(i, hang=(i == 0))
+            workers.append(worker)
+            return worker
+
+        pool = LibreOfficeWorkerPool(size=1, hang_grace=0.0, worker_factory=factory)
+        with pytest.raises(ConversionError):
+            pool.convert("a.docx", str(tmp_path / "hang.pdf"), timeout=0.1)
+
+        assert workers[0].killed and workers[0].stopped
+        assert pool.get_stats()["restarts"] == 1
+
+        assert pool.convert("a.docx", str(tmp_path / "ok.pdf"))
+        assert (tmp_path / "ok.pdf").read_text() == "converted by 1"
+
+    def test_unhealthy_worker_is_replaced_on_acquire(self, tmp_path):
+        pool = LibreOfficeWorkerPool(
+            size=1, health_check_interval=0.0,
+            worker_factory=lambda i: FakeWorker(i, healthy=(i != 0))
+        )
+        pool.convert("a.docx", str(tmp_path / "out.pdf"))
+
+        assert FakeWorker.started == [0, 1]
+        assert (tmp_path / "out.pdf").read_text() == "converted by 1"
+
+
+class TestHelpers:
+    """필터 선택 / 설치 확인 캐시 테스트"""
+
+    def test_resolve_filter_name(self):
+        assert resolve_filter_name("a.pptx", "a.pdf") == "impress_pdf_Export"
+        assert resolve_filter_name("a.xlsx", "a.pdf") == "calc_pdf_Export"
+        assert resolve_filter_name("a.docx", "a.pdf") == "writer_pdf_Export"
+        assert resolve_filter_name("a.unknown", "a.pdf") is None
+
+    def test_availability_probe_is_cached(self, monkeypatch):
+        calls = []
+
+        def fake_run(*args, **kwargs):
+            calls.append(args)
+            raise FileNotFoundError
+
+        libreoffice_pool.clear_availability_cache()
+        monkeypatch.setattr(libreoffice_pool.subprocess, "run", fake_run)
+
+        assert libreoffice_pool.is_soffice_available("soffice-test") is False
+        assert libreoffice_pool.is_soffice_available("soffice-test") is False
+        assert len(calls) == 1
+        libreoffice_pool.clear_availability_cache()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+AzureOpenAIMemory 저장소/임베딩 인덱스 테스트
+
+테스트 실행:
+    python -m pytest tests/test_mem0_memory_index.py -v
+"""
+
+import sys
+import os
+import json
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mem0_memory_adapter import AzureOpenAIMemory, UserMemoryLog, UserMemoryVectorIndex
+
+VOCAB = ["서버", "오류", "라벨", "버그", "승인", "거절", "로그인", "배포"]
+
+
+def bag_of_words_embed(texts):
+    """오프라인 테스트용 단어 빈도 임베딩"""
+    return [[float(text.count(word)) for word in VOCAB] + [0.01] for text in texts]
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return bag_of_words_embed(texts)
+
+
+def _add(memory, text, user_id="u1"):
+    return memory.add([{"role": "user", "content": text}], user_id=user_id)["id"]
+
+
+class TestAzureOpenAIMemoryIndex:
+
+    def test_search_returns_most_similar(self, tmp_path):
+        memory = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=bag_of_words_embed)
+        _add(memory, "서버 오류 티켓 승인")
+        _add(memory, "라벨을 버그로 수정")
+        _add(memory, "배포 일정 거절")
+
+        results = memory.search("서버 오류", user_id="u1", limit=1)
+
+        assert len(results) == 1
+        assert results[0]["memory"] == "서버 오류 티켓 승인"
+
+    def test_add_embeds_only_new_memory(self, tmp_path):
+        embedder = CountingEmbedder()
+        memory = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=embedder)
+        for i in range(5):
+            _add(memory, f"서버 오류 {i}")
+
+        assert all(len(call) == 1 for call in embedder.calls)
+
+        embedder.calls.clear()
+        memory.search("서버", user_id="u1")
+        # 검색은 쿼리 임베딩 1회만 수행
+        assert embedder.calls == [["서버"]]
+
+    def test_index_persists_and_backfills(self, tmp_path):
+        memory = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=bag_of_words_embed)
+        _add(memory, "로그인 오류")
+
+        embedder = CountingEmbedder()
+        reopened = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=embedder)
+        results = reopened.search("로그인", user_id="u1")
+
+        assert results[0]["memory"] == "로그인 오류"
+        assert embedder.calls == [["로그인"]]
+
+        # 인덱스 파일을 지우면 검색 시 누락분을 일괄 보충
+        for name in os.listdir(os.path.join(str(tmp_path), "index")):
+            os.remove(os.path.join(str(tmp_path), "index", name))
+        embedder = CountingEmbedder()
+        rebuilt = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=embedder)
+        assert rebuilt.search("로그인", user_id="u1")[0]["memory"] == "로그인 오류"
+        assert embedder.calls == [["로그인 오류"], ["로그인"]]
+
+    def test_deleted_memory_is_excluded(self, tmp_path):
+        memory = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=bag_of_words_embed)
+        memory_id = _add(memory, "배포 거절")
+        _add(memory, "라벨 수정")
+
+        assert memory.delete(memory_id, user_id="u1") == {"success": True}
+        results = memory.search("배포 거절", user_id="u1", limit=5)
+
+        assert memory_id not in [r["id"] for r in results]
+
+
+class TestUserMemoryVectorIndex:
+
+    def test_truncated_write_is_recovered(self, tmp_path):
+        index = UserMemoryVectorIndex(str(tmp_path), "u1")
+        index.append(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        # ID만 기록되고 벡터는 기록되지 않은 상황 재현
+        with open(index.ids_path, "a", encoding="utf-8") as f:
+            f.write("c\n")
+
+        reloaded = UserMemoryVectorIndex(str(tmp_path), "u1")
+        assert reloaded.ids == ["a", "b"]
+
+        reloaded.append(["d"], [[1.0, 1.0]])
+        again = UserMemoryVectorIndex(str(tmp_path), "u1")
+        assert again.ids == ["a", "b", "d"]
+        assert again.search([0.0, 1.0], 1)[0][0] == "b"
+
+
+class TestUserMemoryLog:
+
+    def _memory(self, memory_id, text="내용"):
+        return {"id": memory_id, "memory": text, "metadata": {}, "user_id": "u1", "created_at": "2025-01-01"}
+
+    def test_add_appends_single_line(self, tmp_path):
+        log = UserMemoryLog(str(tmp_path), "u1")
+        log.add(self._memory("a"))
+        size_after_first = os.path.getsize(log.log_path)
+        log.add(self._memory("b"))
+
+        with open(log.log_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        assert len(lines) == 2
+        assert os.path.getsize(log.log_path) > size_after_first
+        assert [m["id"] for m in log.all_memories()] == ["a", "b"]
+
+    def test_other_writer_is_visible(self, tmp_path):
+        reader = UserMemoryLog(str(tmp_path), "u1")
+        writer = UserMemoryLog(str(tmp_path), "u1")
+        writer.add(self._memory("a"))
+        writer.delete("a")
+        writer.add(self._memory("b"))
+
+        assert [m["id"] for m in reader.all_memories()] == ["b"]
+
+    def test_compaction_keeps_live_memories(self, tmp_path):
+        log = UserMemoryLog(str(tmp_path), "u1")
+        other = UserMemoryLog(str(tmp_path), "u1")
+        for i in range(10):
+            log.add(self._memory(str(i)))
+        for i in range(8):
+            log.delete(str(i))
+
+        log.compact()
+
+        with open(log.log_path, "r", encoding="utf-8") as f:
+            assert len(f.readlines()) == 2
+        assert [m["id"] for m in log.all_memories()] == ["8", "9"]
+        # 다른 인스턴스는 compaction을 감지하고 다시 로드
+        assert [m["id"] for m in other.all_memories()] == ["8", "9"]
+
+    def test_legacy_json_is_migrated(self, tmp_path):
+        with open(os.path.join(str(tmp_path), "u1.json"), "w", encoding="utf-8") as f:
+            json.dump([self._memory("old")], f)
+
+        memory = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=bag_of_words_embed)
+
+        assert [m["id"] for m in memory.get_all(user_id="u1")["results"]] == ["old"]
+        assert not os.path.exists(os.path.join(str(tmp_path), "u1.json"))
+
+
+class TestUserMemoryVectorIndexConcurrency:
+
+    def test_writers_sharing_files_keep_ids_aligned(self, tmp_path):
+        first = UserMemoryVectorIndex(str(tmp_path), "u1")
+        second = UserMemoryVectorIndex(str(tmp_path), "u1")
+
+        first.append(["a"], [[1.0, 0.0]])
+        second.append(["b", "a"], [[0.0, 1.0], [1.0, 0.0]])  # a는 이미 다른 인스턴스가 추가
+        first.append(["c"], [[1.0, 1.0]])
+
+        reloaded = UserMemoryVectorIndex(str(tmp_path), "u1")
+        assert reloaded.ids == ["a", "b", "c"]
+        assert reloaded.search([0.0, 1.0], 1)[0][0] == "b"
+        second.refresh()
+        assert second.search([1.0, 1.0], 1)[0][0] == "c"
+
+    def test_compaction_drops_deleted_vectors(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(UserMemoryVectorIndex, "COMPACT_MIN_VECTORS", 4)
+        memory = AzureOpenAIMemory(storage_dir=str(tmp_path), embed_fn=bag_of_words_embed)
+        ids = [_add(memory, text) for text in ["서버 오류", "라벨 버그", "배포 거절", "로그인 승인"]]
+        other = UserMemoryVectorIndex(os.path.join(str(tmp_path), "index"), "u1")
+
+        memory.delete(ids[0], user_id="u1")
+        memory.delete(ids[1], user_id="u1")
+        assert len(memory._get_index("u1")) == 4
+        memory.delete(ids[2], user_id="u1")
+
+        assert memory._get_index("u1").ids == [ids[3]]
+        other.refresh()
+        assert other.ids == [ids[3]]
+        assert memory.search("로그인", user_id="u1")[0]["id"] == ids[3]
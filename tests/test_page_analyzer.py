@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+페이지 분석기 문서 단위 API 테스트
+
+테스트 실행:
+    python -m pytest tests/test_page_analyzer.py -v
+"""
+
+import sys
+import os
+
+import fitz
+import pytest
+from docx import Document
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module import page_analyzer
+from module.page_analyzer import PageContentAnalyzer
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for n in range(10):
+        page = doc.new_page()
+        body = "짧은 페이지" if n % 3 == 0 else ("본문 내용이 충분히 긴 텍스트 페이지입니다. " * 5)
+        page.insert_text((72, 72), f"page {n + 1} {body}", fontname="helv")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def sample_docx(tmp_path):
+    path = tmp_path / "sample.docx"
+    doc = Document()
+    for n in range(30):
+        doc.add_paragraph(f"문단 {n} " + ("내용 " * (n % 7)))
+    doc.save(str(path))
+    return str(path)
+
+
+def _summary(result):
+    return (result.content_type, result.confidence, result.reasoning, result.metrics.text_length)
+
+
+class TestDocumentAnalysis:
+    """문서 단위 분석이 페이지 단위 분석과 같은 결과를 내는지 확인"""
+
+    def test_pdf_document_matches_per_page(self, sample_pdf):
+        analyzer = PageContentAnalyzer()
+        per_page = [_summary(analyzer.analyze_pdf_page(sample_pdf, n)) for n in range(1, 11)]
+        document = [(n, _summary(r)) for n, r in analyzer.analyze_pdf_document(sample_pdf, max_workers=1)]
+
+        assert [n for n, _ in document] == list(range(1, 11))
+        assert [s for _, s in document] == per_page
+
+    def test_pdf_document_opens_file_once(self, sample_pdf, monkeypatch):
+        opens = []
+        original_open = page_analyzer.fitz.open
+
+        def counting_open(*args, **kwargs):
+            opens.append(args)
+            return original_open(*args, **kwargs)
+
+        monkeypatch.setattr(page_analyzer.fitz, "open", counting_open)
+        results = list(PageContentAnalyzer().analyze_pdf_document(sample_pdf, max_workers=1))
+
+        assert len(results) == 10
+        assert len(opens) == 1
+
+    def test_pdf_process_pool_matches_sequential(self, sample_pdf):
+        analyzer = PageContentAnalyzer()
+        sequential = [(n, _summary(r)) for n, r in analyzer.analyze_pdf_document(sample_pdf, max_workers=1)]
+        parallel = [(n, _summary(r)) for n, r in analyzer.analyze_pdf_document(sample_pdf, max_workers=2)]
+
+        assert parallel == sequential
+
+    def test_docx_document_matches_per_page(self, sample_docx):
+        analyzer = PageContentAnalyzer()
+        document = list(analyzer.analyze_docx_document(sample_docx))
+
+        assert [n for n, _ in document] == [1, 2, 3]
+        for page_num, result in document:
+            assert _summary(result) == _summary(analyzer.analyze_docx_page(sample_docx, page_num))
+
+
+class TestAdaptiveConvertedPdfCleanup:
+    """레이아웃 처리용 변환 PDF 정리"""
+
+    def _processor(self):
+        from module.adaptive_processor import AdaptiveFileProcessor
+        processor = AdaptiveFileProcessor.__new__(AdaptiveFileProcessor)
+        processor._converted_pdfs = {}
+        processor._temp_pdf_paths = []
+        processor.temp_storage = {}
+        processor.processing_stats = {"text_based_pages": 0, "layout_based_pages": 0,
+                                      "total_pages": 0, "page_classifications": []}
+        return processor
+
+    @pytest.mark.parametrize("fail", [False, True])
+    def test_converted_pdfs_are_removed_after_each_file(self, sample_docx, tmp_path, monkeypatch, fail):
+        from module.types import DocumentType
+        monkeypatch.chdir(tmp_path)
+        processor = self._processor()
+
+        def convert(source, target):
+            with open(target, "wb") as f:
+                f.write(b"%PDF-1.4")
+            if fail:
+                raise RuntimeError("변환 실패")
+
+        def process_docx(file_path):
+            # 같은 파일의 여러 페이지가 변환 결과를 재사용
+            first = processor._get_converted_pdf(file_path, convert)
+            assert processor._get_converted_pdf(file_path, convert) == first
+            return []
+
+        monkeypatch.setattr(processor, "_process_docx_adaptive", process_docx)
+        result = processor.process_file_adaptive(sample_docx, DocumentType.DOCX)
+
+        assert ("error" in result) == fail
+        assert os.listdir(tmp_path / "temp_pdfs") == []
+        assert processor._converted_pdfs == {}
+
+    def test_failed_conversion_is_deleted_and_not_cached(self, sample_docx, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        processor = self._processor()
+        attempts = []
+
+        def convert(source, target):
+            attempts.append(target)
+            with open(target, "wb") as f:
+                f.write(b"%PDF-1.4")
+            if len(attempts) == 1:
+                raise RuntimeError("변환 중 LibreOffice 종료")
+
+        with pytest.raises(RuntimeError):
+            processor._get_converted_pdf(sample_docx, convert)
+        assert processor._converted_pdfs == {}
+        assert os.listdir(tmp_path / "temp_pdfs") == []
+
+        # 다음 페이지는 잘린 PDF를 재사용하지 않고 다시 변환
+        pdf_path = processor._get_converted_pdf(sample_docx, convert)
+        assert len(attempts) == 2 and pdf_path == attempts[1]
+        assert processor._converted_pdfs == {sample_docx: pdf_path}
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+도메인 용어 사전 매처 (GlossaryMatcher) 테스트
+
+테스트 실행:
+    python -m pytest tests/test_query_rewriter.py -v
+"""
+
+import sys
+import os
+import re
+import random
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from query_rewriter import DomainGlossary, GlossaryMatcher, KOREAN_JOSA
+
+GLOSSARY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "glossary.csv")
+
+
+def reference_find_terms(terms, query):
+    """용어별 정규식을 매번 컴파일하던 기존 구현 (동작 비교 기준)"""
+    found_terms = []
+    for term, info in terms.items():
+        for search_term in [term] + info['synonyms']:
+            pattern = re.compile(
+                r'(?:^|[\s\(])' + re.escape(search_term) +
+                r'(?:[\s\)\?,\.!]|은|는|이|가|을|를|에|에서|로|와|과|의|도|만|$)',
+                re.IGNORECASE
+            )
+            for match in pattern.finditer(query):
+                matched_text = match.group().strip()
+                for josa in KOREAN_JOSA:
+                    if matched_text.endswith(josa):
+                        matched_text = matched_text[:-len(josa)]
+                        break
+                found_terms.append({
+                    'term': term, 'matched_text': matched_text.strip(), 'position': match.start(),
+                    'type': info['type'], 'synonyms': info['synonyms'], 'expand_to': info['expand_to']
+                })
+
+    seen = set()
+    unique_terms = []
+    for ft in sorted(found_terms, key=lambda x: x['position']):
+        key = (ft['position'], ft['term'])
+        if key not in seen:
+            unique_terms.append(ft)
+            seen.add(key)
+    return unique_terms
+
+
+class TestGlossaryMatcher:
+    """기존 정규식 구현과의 결과 동일성 / 재로드 / 대용량 사전 테스트"""
+
+    def test_matches_reference_implementation(self):
+        glossary = DomainGlossary(GLOSSARY_PATH)
+        queries = [
+            "EUXP에서 발생한 오류로 확인 문의가 들어온 적이 있어?",
+            "PrePRD 환경에서 인프라 문제로 앱이 다운된 적이 있어?",
+            "sequence number가 맞지 않을 때 우리 시스템에서는 어떤 조치를 했지?",
+            "큐 발송에 이상이 생겨서 상용 배치가 종료되지 않은 적이 있어?",
+            "(euxp) 구 CMS와 CMS, cms? 풀 배치 풀배치도 Full",
+            "pre pre prod pre-prd staging stage.",
+        ]
+
+        # 사전 표면형과 경계/조사 문자를 섞은 무작위 쿼리
+        pieces = [t for term, info in glossary.terms.items() for t in [term] + info['synonyms']]
+        pieces += [" ", " ", "(", ")", "?", "는", "에서", "가", "x", "오류"]
+        rng = random.Random(0)
+        queries += ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 12))) for _ in range(500)]
+
+        for query in queries:
+            assert glossary.find_terms_in_query(query) == reference_find_terms(glossary.terms, query), query
+
+    def test_reloads_when_csv_changes(self, tmp_path):
+        path = tmp_path / "glossary.csv"
+        path.write_text("term,type,synonyms,expand_to\nEUXP,system,전시시스템,EUXP 설명\n", encoding="utf-8")
+        glossary = DomainGlossary(str(path))
+        assert [t['term'] for t in glossary.find_terms_in_query("STG 장애")] == []
+
+        path.write_text("term,type,synonyms,expand_to\nSTG,env,staging,STG 설명\n", encoding="utf-8")
+        os.utime(path, ns=(time.time_ns() + 10**9,) * 2)
+
+        found = glossary.find_terms_in_query("STG 장애")
+        assert [(t['term'], t['matched_text'], t['expand_to']) for t in found] == [("STG", "STG", "STG 설명")]
+
+    def test_large_glossary_is_fast(self):
+        terms = {f"TERM{i}": {'type': 'system', 'synonyms': [f"용어{i}", f"alias {i}"], 'expand_to': ''}
+                 for i in range(5000)}
+        matcher = GlossaryMatcher(terms)
+        query = "TERM42에서 alias 4999 오류가 용어7과 함께 발생했어?"
+
+        started = time.perf_counter()
+        for _ in range(100):
+            found = matcher.find(query)
+        per_query = (time.perf_counter() - started) / 100
+
+        assert [t['term'] for t in found] == ["TERM42", "TERM4999", "TERM7"]
+        assert matcher.pattern_count == 15000
+        assert per_query < 0.002
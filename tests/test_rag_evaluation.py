@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+RAG 평가 하네스 지연 시간 프로파일링 테스트
+
+테스트 실행:
+    python -m pytest tests/test_rag_evaluation.py -v
+"""
+
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.latency_stats import percentile, summarize_latencies, timed
+
+
+class FakeRAGSystem:
+    """쿼리별로 고정 결과를 돌려주고 구간 시간을 기록하는 가짜 검색 시스템"""
+
+    def __init__(self, answers, delay=0.02):
+        self.answers = answers
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def rrf_search(self, query, timings=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            with timed(timings, "multi_query"):
+                time.sleep(self.delay)
+            with timed(timings, "fusion"):
+                pass
+            return [{'metadata': {'ticket_id': tid}} for tid in self.answers[query]]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestLatencyStats:
+    """백분위 / 구간 측정 테스트"""
+
+    def test_percentile_matches_linear_interpolation(self):
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        assert percentile(values, 50) == pytest.approx(5.5)
+        assert percentile(values, 95) == pytest.approx(9.55)
+        assert percentile([], 99) == 0.0
+        assert percentile([7], 99) == 7.0
+
+    def test_timed_accumulates_and_ignores_none(self):
+        timings = {}
+        for _ in range(2):
+            with timed(timings, "bm25"):
+                pass
+        with timed(None, "bm25"):
+            pass
+
+        assert set(timings) == {"bm25"}
+        assert timings["bm25"] >= 0
+        assert summarize_latencies([0.1, 0.2])["p50_ms"] == pytest.approx(150.0)
+
+
+class TestParallelEvaluator:
+    """워커 풀 평가 + 지연 시간 메트릭 테스트"""
+
+    def test_parallel_run_keeps_order_and_reports_latency(self, tmp_path, monkeypatch):
+        pytest.importorskip("sklearn")
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("logs", exist_ok=True)
+        from evaluate_rag_system import RAGEvaluator
+
+        answers = {f"q{n}": [f"T-{n}", "T-x"] if n % 2 else ["T-x", f"T-{n}"] for n in range(8)}
+        rag_system = FakeRAGSystem(answers)
+        evaluator = RAGEvaluator(rag_system, max_workers=4)
+        test_cases = [{'query': q, 'answer_ticket_ids': [f"T-{n}"]} for n, q in enumerate(answers)]
+
+        results = evaluator.evaluate_all(test_cases)
+        metrics = evaluator.calculate_metrics(results)
+
+        assert [r['query'] for r in results] == list(answers)
+        assert [r['rank'] for r in results] == [2, 1] * 4
+        assert rag_system.max_active > 1
+        assert metrics['mrr'] == pytest.approx(0.75)
+        latency = metrics['latency']
+        assert latency['total']['count'] == 8
+        assert latency['total']['p99_ms'] >= latency['total']['p50_ms'] >= 20
+        assert set(latency['legs']) == {'multi_query', 'fusion'}
+        assert latency['throughput_qps'] > 0
+
+
+class FakeChunkCollection:
+    """load_documents_by_ids용 가짜 컬렉션 (문서 ID = 티켓 ID)"""
+
+    def get(self, ids, include=None):
+        return {
+            'ids': list(ids),
+            'documents': [f"{doc_id} 본문" for doc_id in ids],
+            'metadatas': [{'ticket_id': doc_id} for doc_id in ids]
+        }
+
+
+class TestConfigSweep:
+    """RRF 설정 스윕 / 회귀 게이트 테스트"""
+
+    @pytest.fixture
+    def sweep_modules(self, tmp_path, monkeypatch):
+        pytest.importorskip("sklearn")
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("logs", exist_ok=True)
+        import rrf_fusion_rag_system
+        import rrf_config_sweep
+        return rrf_fusion_rag_system, rrf_config_sweep
+
+    def _make_system(self, rrf_module, calls):
+        system = rrf_module.RRFRAGSystem.__new__(rrf_module.RRFRAGSystem)
+        system.config = rrf_module.RRFConfig(enable_bm25=True, deduplicate_tickets=False)
+        system.rrf_engine = rrf_module.RRFFusionEngine(system.config)
+        system.leg_cache = None
+        system.trace_store = None
+        system.bm25_index = object()
+        system.collection = FakeChunkCollection()
+
+        def leg(name, ranking):
+            def search(query):
+                calls.append(name)
+                return [{'id': doc_id} for doc_id in ranking]
+            return search
+
+        # 정답 T-1은 BM25에서만 검색됨 → BM25 가중치가 커야 1위
+        system.multi_query_search = leg("multi_query", ["T-2", "T-3"])
+        system.hyde_search = leg("hyde", ["T-2", "T-3"])
+        system.bm25_search = leg("bm25", ["T-1"])
+        return system
+
+    def test_sweep_reuses_leg_results_and_ranks_by_weight(self, sweep_modules):
+        rrf_module, sweep_module = sweep_modules
+        calls = []
+        system = self._make_system(rrf_module, calls)
+        test_cases = [{'query': 'q', 'answer_ticket_ids': ['T-1']}]
+
+        configs = sweep_module.build_config_grid(system.config, {"bm25_weight": [1.0, 6.0]})
+        rows = sweep_module.RRFConfigSweep(system, test_cases, max_workers=1).run(
+            configs, grid_fields=["bm25_weight"]
+        )
+
+        assert sorted(calls) == ["bm25", "hyde", "multi_query"]  # 두 설정이 검색 결과 공유
+        assert [row['config'] for row in rows] == [{'bm25_weight': 1.0}, {'bm25_weight': 6.0}]
+        assert [row['mrr'] for row in rows] == [pytest.approx(1 / 3), 1.0]
+        assert system.config.bm25_weight == 6.0  # 기준 시스템 설정은 그대로
+
+    def test_cached_configs_report_same_retrieval_latency(self, sweep_modules):
+        rrf_module, sweep_module = sweep_modules
+        system = self._make_system(rrf_module, [])
+        for name in ("multi_query_search", "hyde_search", "bm25_search"):
+            search = getattr(system, name)
+
+            def slow(query, search=search):
+                time.sleep(0.05)
+                return search(query)
+            setattr(system, name, slow)
+        test_cases = [{'query': 'q', 'answer_ticket_ids': ['T-1']}]
+
+        configs = sweep_module.build_config_grid(system.config, {"bm25_weight": [1.0, 3.0, 6.0]})
+        rows = sweep_module.RRFConfigSweep(system, test_cases, max_workers=1).run(configs)
+
+        # 두 번째 설정부터는 구간 캐시를 맞지만 검색 구간 시간은 그대로 포함되어야 함
+        assert rows[0]['p95_ms'] >= 150
+        for row in rows[1:]:
+            assert row['p95_ms'] == pytest.approx(rows[0]['p95_ms'], rel=0.1)
+
+    def test_pareto_front_and_regression_gate(self, sweep_modules):
+        rrf_module, sweep_module = sweep_modules
+        rows = [
+            {'mrr': 0.8, 'p95_ms': 300.0},
+            {'mrr': 0.7, 'p95_ms': 100.0},
+            {'mrr': 0.6, 'p95_ms': 200.0},  # 지배됨
+        ]
+        assert [r['mrr'] for r in sweep_module.pareto_front(rows)] == [0.8, 0.7]
+
+        baseline = {'mrr': 0.80, 'latency': {'total': {'p95_ms': 100.0}}}
+        ok = {'mrr': 0.795, 'latency': {'total': {'p95_ms': 110.0}}}
+        bad = {'mrr': 0.70, 'latency': {'total': {'p95_ms': 150.0}}}
+
+        assert sweep_module.check_regression(baseline, ok) == []
+        assert len(sweep_module.check_regression(baseline, bad)) == 2
+
+        with pytest.raises(ValueError):
+            sweep_module.build_config_grid(rrf_module.RRFConfig(), {"no_such_field": [1]})
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+재순위화 백엔드 폴백 / 점수 캐시 테스트
+
+테스트 실행:
+    python -m pytest tests/test_rerank_backends.py -v
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rerank_backends import Reranker, CohereRerankBackend
+
+
+class FakeBackend:
+    """채점한 문서를 기록하는 오프라인 백엔드"""
+
+    def __init__(self, name, fail=False):
+        self.name = name
+        self.fail = fail
+        self.scored = []
+
+    def score(self, query, texts):
+        if self.fail:
+            raise ConnectionError("network unreachable")
+        self.scored.extend(texts)
+        return [float(text.count(query)) for text in texts]
+
+
+class FakeCohereClient:
+    """top_n 순서대로 index / relevance_score를 돌려주는 가짜 Cohere 클라이언트"""
+
+    def rerank(self, model, query, documents, top_n):
+        ranked = sorted(range(len(documents)), key=lambda i: -len(documents[i]))[:top_n]
+        return SimpleNamespace(results=[
+            SimpleNamespace(index=i, relevance_score=len(documents[i]) / 10) for i in ranked
+        ])
+
+
+class TestReranker:
+    """폴백 체인 / 캐시 / 인덱스 매핑 테스트"""
+
+    def test_falls_back_to_local_backend_when_remote_fails(self):
+        local = FakeBackend("cross_encoder")
+        reranker = Reranker([FakeBackend("cohere", fail=True), local])
+
+        backend, ranked = reranker.rerank("재부팅", ["화면 멈춤", "재부팅 재부팅", "재부팅 현상"], top_n=2)
+
+        assert backend == "cross_encoder"
+        assert ranked == [(1, 2.0), (2, 1.0)]
+
+    def test_only_uncached_documents_are_scored(self):
+        local = FakeBackend("cross_encoder")
+        reranker = Reranker([local])
+
+        reranker.rerank("재부팅", ["재부팅 현상", "화면 멈춤"])
+        _, ranked = reranker.rerank("재부팅", ["화면 멈춤", "재부팅 로그", "재부팅 현상"])
+
+        assert local.scored == ["재부팅 현상", "화면 멈춤", "재부팅 로그"]
+        assert [index for index, _ in ranked][2] == 0
+        assert reranker.rerank("재부팅", []) is None
+        assert Reranker([FakeBackend("cohere", fail=True)]).rerank("q", ["a"]) is None
+
+    def test_cohere_scores_are_mapped_by_index_with_duplicates(self):
+        backend = CohereRerankBackend(client=FakeCohereClient())
+
+        # 동일 본문이 여러 번 있어도 각자의 위치로 매핑됨
+        assert backend.score("q", ["ab", "abcd", "ab"]) == [0.2, 0.4, 0.2]
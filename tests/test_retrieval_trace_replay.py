@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+골든셋 검색 트레이스 기록 / 오프라인 재생 테스트
+
+테스트 실행:
+    python -m pytest tests/test_retrieval_trace_replay.py -v
+"""
+
+import sys
+import os
+import gzip
+import time
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retrieval_trace_store import RetrievalTraceStore, trace_leg_results
+
+
+class CountingCollection:
+    """get 호출 수를 기록하는 가짜 컬렉션 (청크 c-N은 티켓 T-N 소속)"""
+
+    def __init__(self):
+        self.gets = 0
+
+    def get(self, ids, include=None):
+        self.gets += 1
+        return {
+            'ids': list(ids),
+            'documents': [f"{doc_id} 본문" for doc_id in ids],
+            'metadatas': [{'ticket_id': f"T-{doc_id.split('-')[1]}"} for doc_id in ids]
+        }
+
+
+class TestRetrievalTraceStore:
+    """트레이스 파일 기록 / 로드 테스트"""
+
+    def test_round_trip_and_truncated_tail(self, tmp_path):
+        path = str(tmp_path / "traces" / "golden.jsonl.gz")
+        store = RetrievalTraceStore(path)
+        store.record(
+            "재부팅",
+            {"multi_query": ([{'id': 'c-1', 'cosine_score': 0.91234567}], 0.5),
+             "bm25": ([{'id': 'c-2', 'bm25_score': 7.5, 'cosine_score': 7.5}], 0.01)},
+            [{'id': 'c-1', 'content': "본문1", 'metadata': {'ticket_id': 'T-1'}}],
+            {"bm25_results": 20}
+        )
+        with open(path, "ab") as f:
+            f.write(gzip.compress(b'{"version": 1, "query": "cut')[:-6])  # 기록 중 중단
+
+        traces = RetrievalTraceStore(path).load()
+
+        assert list(traces) == ["재부팅"]
+        results, elapsed = trace_leg_results(traces["재부팅"], "multi_query")
+        assert results == [{'id': 'c-1', 'content': "본문1", 'cosine_score': 0.912346}]
+        assert elapsed == 0.5
+        assert trace_leg_results(traces["재부팅"], "bm25")[0][0]['bm25_score'] == 7.5
+        assert trace_leg_results(traces["재부팅"], "hyde") == ([], 0.0)
+
+
+class TestTraceReplay:
+    """기록한 트레이스로 융합/중복 제거만 재실행하는 테스트"""
+
+    @pytest.fixture
+    def rrf_module(self, tmp_path, monkeypatch):
+        pytest.importorskip("sklearn")
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("logs", exist_ok=True)
+        import rrf_fusion_rag_system
+        return rrf_fusion_rag_system
+
+    def _make_live_system(self, rrf_module, collection):
+        system = rrf_module.RRFRAGSystem.__new__(rrf_module.RRFRAGSystem)
+        system.config = rrf_module.RRFConfig(enable_bm25=True)
+        system.rrf_engine = rrf_module.RRFFusionEngine(system.config)
+        system.leg_cache = None
+        system.trace_store = None
+        system.bm25_index = object()
+        system.collection = collection
+        system.multi_query_search = lambda q: [{'id': 'c-2', 'cosine_score': 0.9}, {'id': 'c-3', 'cosine_score': 0.8}]
+        system.hyde_search = lambda q: [{'id': 'c-3', 'cosine_score': 0.7}, {'id': 'c-2', 'cosine_score': 0.6}]
+        system.bm25_search = lambda q: [{'id': 'c-1', 'bm25_score': 3.0}, {'id': 'c-2', 'bm25_score': 1.0}]
+        return system
+
+    @staticmethod
+    def _ranking(results):
+        return [(r['id'], round(r['score'], 9), r['metadata']['ticket_id']) for r in results]
+
+    def test_replay_matches_live_search_without_vector_db(self, rrf_module, tmp_path):
+        path = str(tmp_path / "golden.jsonl.gz")
+        collection = CountingCollection()
+        live = self._make_live_system(rrf_module, collection)
+        live.trace_store = RetrievalTraceStore(path)
+
+        timings = {}
+        live_results = live.rrf_search("셋톱박스 재부팅", timings)
+
+        replay = rrf_module.TraceReplayRAGSystem.from_file(path, rrf_module.RRFConfig(enable_bm25=True))
+        replay_timings = {}
+        replay_results = replay.rrf_search("셋톱박스 재부팅", replay_timings)
+
+        assert self._ranking(replay_results) == self._ranking(live_results)
+        assert replay.collection is None
+        assert replay_timings["bm25"] == pytest.approx(timings["bm25"], abs=1e-6)
+
+        # 융합 가중치만 바꾼 설정은 재생 가능, BM25 가중치를 낮추면 BM25 전용 후보 c-1이 밀려남
+        reweighted = replay.with_config(rrf_module.RRFConfig(enable_bm25=True, bm25_weight=0.5))
+        assert [r['id'] for r in replay_results] == ["c-2", "c-1", "c-3"]
+        assert [r['id'] for r in reweighted.rrf_search("셋톱박스 재부팅")] == ["c-2", "c-3", "c-1"]
+
+    def test_leg_changing_config_is_rejected(self, rrf_module, tmp_path):
+        path = str(tmp_path / "golden.jsonl.gz")
+        live = self._make_live_system(rrf_module, CountingCollection())
+        live.trace_store = RetrievalTraceStore(path)
+        live.rrf_search("q")
+
+        replay = rrf_module.TraceReplayRAGSystem.from_file(path, rrf_module.RRFConfig())
+        with pytest.raises(ValueError, match="bm25_results"):
+            replay.with_config(rrf_module.RRFConfig(bm25_results=5))
+        assert replay.rrf_search("트레이스에 없는 쿼리") == []
+
+    def test_replayed_sweep_latency_includes_recorded_leg_times(self, rrf_module, tmp_path):
+        import rrf_config_sweep
+        path = str(tmp_path / "golden.jsonl.gz")
+        live = self._make_live_system(rrf_module, CountingCollection())
+        live.trace_store = RetrievalTraceStore(path)
+        for name in ("multi_query_search", "hyde_search", "bm25_search"):
+            search = getattr(live, name)
+
+            def slow(query, search=search):
+                time.sleep(0.05)
+                return search(query)
+            setattr(live, name, slow)
+        live.rrf_search("셋톱박스 재부팅")
+
+        replay = rrf_module.TraceReplayRAGSystem.from_file(path, rrf_module.RRFConfig(enable_bm25=True))
+        test_cases = [{'query': "셋톱박스 재부팅", 'answer_ticket_ids': ['T-2']}]
+        configs = rrf_config_sweep.build_config_grid(replay.config, {"bm25_weight": [0.5, 1.0]})
+        rows = rrf_config_sweep.RRFConfigSweep(replay, test_cases, max_workers=1).run(configs)
+
+        # 재생은 융합만 다시 하지만 p95에는 기록된 검색 구간 시간(3 × 50ms)이 포함되어야 함
+        for row in rows:
+            assert row['p95_ms'] >= 150
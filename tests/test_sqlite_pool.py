@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+SQLite 커넥션 풀 및 일괄 조회 API 테스트
+
+테스트 실행:
+    python -m pytest tests/test_sqlite_pool.py -v
+"""
+
+import sys
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sqlite_pool import get_sqlite_pool, chunked
+from database_models import DatabaseManager, Integration, Ticket, TicketEvent, User
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "tickets.db"))
+    yield manager
+    manager._pool.close_all()
+
+
+def _ticket(message_id):
+    now = datetime.now().isoformat()
+    return Ticket(
+        ticket_id=None, original_message_id=message_id, status="pending", title=f"title {message_id}",
+        description="", priority="Medium", ticket_type="Task", reporter="r", reporter_email="r@x.com",
+        labels=["a"], created_at=now, updated_at=now
+    )
+
+
+class TestSQLiteConnectionPool:
+
+    def test_connection_is_reused_per_thread(self, tmp_path):
+        pool = get_sqlite_pool(str(tmp_path / "pool.db"))
+        assert pool.connection() is pool.connection()
+        assert pool.connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(pool.connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not pool.connection()
+        pool.close_all()
+
+    def test_connections_of_finished_threads_are_released(self, tmp_path):
+        pool = get_sqlite_pool(str(tmp_path / "threads.db"))
+
+        def use_connection():
+            pool.connection().execute("SELECT 1")
+
+        for _ in range(5):
+            thread = threading.Thread(target=use_connection)
+            thread.start()
+            thread.join()
+
+        # 종료된 스레드의 커넥션은 풀이 더 이상 참조하지 않음
+        main_conn = pool.connection()
+        assert pool.active_connection_count() == 1
+        assert [id(conn) for _, conn in pool._connections.values()] == [id(main_conn)]
+        pool.close_all()
+
+    def test_pool_is_shared_by_path(self, tmp_path):
+        path = str(tmp_path / "shared.db")
+        assert get_sqlite_pool(path) is get_sqlite_pool(path)
+
+    def test_chunked(self):
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+class TestDatabaseManagerBulkAPIs:
+
+    def test_get_tickets_by_ids_keeps_order(self, db):
+        ids = [db.insert_ticket(_ticket(f"m{i}")) for i in range(3)]
+
+        tickets = db.get_tickets_by_ids([ids[2], 9999, ids[0]])
+
+        assert [t.ticket_id for t in tickets] == [ids[2], ids[0]]
+        assert tickets[0].labels == ["a"]
+
+    def test_insert_ticket_events(self, db):
+        ticket_id = db.insert_ticket(_ticket("m1"))
+        now = datetime.now().isoformat()
+        events = [TicketEvent(None, ticket_id, "status_change", "a", "b", now) for _ in range(3)]
+
+        assert db.insert_ticket_events(events) == 3
+        count = db._connect().execute("SELECT COUNT(*) FROM ticket_events").fetchone()[0]
+        assert count == 3
+
+    def test_integrations_for_many_users(self, db):
+        user_ids = [db.insert_user(User(None, f"u{i}@x.com", "hash")) for i in range(2)]
+        db.insert_integration(Integration(None, user_ids[0], "slack", "user_id", "U1"))
+        db.insert_integration(Integration(None, user_ids[0], "jira", "endpoint", "http://jira"))
+
+        integrations = db.get_integrations_for_users(user_ids, source="slack")
+
+        assert [i.value for i in integrations[user_ids[0]]] == ["U1"]
+        assert integrations[user_ids[1]] == []
+        assert db.get_user_ids_by_integration_values("slack", "user_id", ["U1", "U2"]) == {"U1": user_ids[0]}
+
+    def test_integration_lookup_uses_covering_index(self, db):
+        plan = db._connect().execute("""
+            EXPLAIN QUERY PLAN
+            SELECT user_id FROM integrations WHERE source = ? AND type = ? AND value = ?
+        """, ("slack", "user_id", "U1")).fetchall()
+
+        assert "COVERING INDEX idx_integrations_lookup" in " ".join(row[-1] for row in plan)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+대용량 Jira XML / HTML 테이블 스트리밍 파서 테스트
+
+테스트 실행:
+    python -m pytest tests/test_streaming_parsers.py -v
+"""
+
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.html_table_stream import scan_html_table_row_counts, iter_html_table_rows
+
+
+HTML_SAMPLE = """<html><head><style>td { color: red; }</style></head><body>
+<table><tr><td>레이아웃</td></tr></table>
+<table class="issuetable">
+  <tr><th>Key</th><th>Summary</th><th>Status</th></tr>
+  <tr><td>BTVO-1</td><td> 셋톱 &amp; 재부팅 </td><td>Open</td></tr>
+  <tr><td>BTVO-2</td><td><b>화면</b> <i>멈춤</i></td><td></td></tr>
+  <tr><td>BTVO-3</td><td>중첩<table><tr><td>내부</td></tr></table></td><td>Done
+</table>
+</body></html>"""
+
+XML_SAMPLE = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="0.92"><channel><title>Jira</title>
+<item>
+  <title>[BTVO-1] 첫 번째</title><key>BTVO-1</key><summary>첫 번째 요약</summary>
+  <description>&lt;p&gt;본문&lt;/p&gt;</description><status>Open</status>
+  <comments><comment author="kim" created="2025-01-01">&lt;p&gt;댓글&lt;/p&gt;</comment></comments>
+</item>
+<item><title>[BTVO-2] 두 번째</title><key>BTVO-2</key></item>
+</channel></rss>"""
+
+
+class TestHtmlTableStream:
+    """HTML 테이블 스트리밍 추출 테스트"""
+
+    @pytest.fixture
+    def html_file(self, tmp_path):
+        path = tmp_path / "jira.html"
+        path.write_text(HTML_SAMPLE, encoding="utf-8")
+        return str(path)
+
+    def test_row_counts_include_nested_rows(self, html_file):
+        assert scan_html_table_row_counts(html_file) == [1, 5, 1]
+
+    @pytest.mark.parametrize("chunk_size", [7, 1 << 20])
+    def test_rows_match_get_text_strip(self, html_file, chunk_size):
+        rows = list(iter_html_table_rows(html_file, 1, chunk_size=chunk_size))
+
+        assert rows == [
+            ["Key", "Summary", "Status"],
+            ["BTVO-1", "셋톱 & 재부팅", "Open"],
+            ["BTVO-2", "화면멈춤", ""],
+            ["BTVO-3", "중첩내부", "Done"],
+        ]
+
+    def test_matches_beautifulsoup(self, html_file):
+        bs4 = pytest.importorskip("bs4")
+        soup = bs4.BeautifulSoup(HTML_SAMPLE, "html.parser")
+        table = soup.find_all("table")[1]
+        expected = [
+            [cell.get_text(strip=True) for cell in row.find_all(["td", "th"], recursive=False)]
+            for row in table.find_all("tr", recursive=False)
+        ]
+
+        assert list(iter_html_table_rows(html_file, 1))[:3] == expected[:3]
+
+
+class TestJiraXmlStream:
+    """Jira XML iterparse 테스트"""
+
+    def test_iter_jira_xml_yields_tickets(self, tmp_path):
+        pytest.importorskip("sentence_transformers")
+        from rebuild_vector_db_from_xml import iter_jira_xml, parse_jira_xml
+
+        path = tmp_path / "export.xml"
+        path.write_text(XML_SAMPLE, encoding="utf-8")
+
+        tickets = list(iter_jira_xml(str(path)))
+
+        assert [t["Key"] for t in tickets] == ["BTVO-1", "BTVO-2"]
+        assert tickets[0]["Description"] == "본문"
+        assert tickets[0]["Comments"][0]["text"] == "댓글"
+        assert tickets[1]["Summary"] == "두 번째"
+        assert parse_jira_xml(str(path)) == tickets
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+구조적 청킹 스트리밍 (HTML / CSV 제너레이터 + 배치 저장) 테스트
+
+테스트 실행:
+    python -m pytest tests/test_structured_chunking_streaming.py -v
+"""
+
+import sys
+import os
+import csv
+import io
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from structured_chunking import JiraStructuredChunker
+from vector_db_models import VectorDBManager, StructuredChunk
+
+
+def _jira_html(rows=12):
+    parts = ["<html><body><table id='issuetable'><tbody>"]
+    for i in range(1, rows + 1):
+        key = "" if i == 5 else f' data-issuekey="BTVO-{i}"'
+        parts.append(
+            f'<tr class="issuerow focused"{key}><td>Bug</td><td><a href="/browse/BTVO-{i}">BTVO-{i}</a></td>'
+            f'<td class="summary"><p>셋톱박스 &amp; 리모컨 재부팅 {i}<br/>'
+            f'<table><tr><td>중첩 {i}</td></tr></table></p></td><td>Open</td></tr>'
+        )
+    parts.append('<tr class="other"><td>x</td><td>y</td><td>무시되는 행</td></tr>')
+    parts.append("</tbody></table></body></html>")
+    return "".join(parts)
+
+
+def _as_tuples(chunks):
+    return [(c.ticket_id, c.chunk_type, c.content, c.metadata, c.priority, c.commenter) for c in chunks]
+
+
+class TestStreamingChunker:
+    """기존 일괄 청킹과 동일한 결과 테스트"""
+
+    def test_html_stream_matches_full_parse_across_read_boundaries(self):
+        chunker = JiraStructuredChunker()
+        html = _jira_html()
+
+        expected = chunker.chunk_jira_html(html, "jira.html")
+        streamed = list(chunker.iter_jira_html_chunks(io.StringIO(html), "jira.html", read_size=7))
+
+        assert len(expected) == 11
+        assert _as_tuples(streamed) == _as_tuples(expected)
+        assert "셋톱박스 & 리모컨 재부팅 1" in streamed[0].content
+
+    def test_csv_file_stream_matches_list_chunking(self, tmp_path):
+        path = str(tmp_path / "jira.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["Key", "Summary", "Description", "Comments"])
+            writer.writeheader()
+            writer.writerow({"Key": "BTVO-1", "Summary": "재부팅", "Description": "여러 줄\n설명",
+                             "Comments": "첫 댓글\n---\n둘째 댓글"})
+            writer.writerow({"Key": "BTVO-2", "Summary": "", "Description": "설명만", "Comments": ""})
+
+        chunker = JiraStructuredChunker()
+        with open(path, encoding="utf-8", newline="") as f:
+            expected = chunker.chunk_csv_data(list(csv.DictReader(f)), "jira.csv")
+        streamed = chunker.iter_csv_file_chunks(path)
+
+        assert _as_tuples(streamed) == _as_tuples(expected)
+        assert [c.chunk_type for c in expected] == ["header", "comment", "comment", "header"]
+
+
+class RecordingCollection:
+    def __init__(self):
+        self.upserts = []
+        self.deletes = []
+
+    def upsert(self, ids, documents, metadatas):
+        self.upserts.append(list(ids))
+
+    def delete(self, ids):
+        self.deletes.append(list(ids))
+
+
+def _structured_chunk(i):
+    return StructuredChunk(
+        chunk_id=f"s{i}", content=f"요약: {i}", chunk_type="header", ticket_id=f"BTVO-{i}",
+        field_name="header", field_value=f"요약: {i}", priority=1, file_name="x.csv",
+        file_type=".csv", metadata={}, created_at="2025-01-01"
+    )
+
+
+class TestBatchedStructuredWrites:
+    """제너레이터를 배치만큼씩 소비하는 add_structured_chunks 테스트"""
+
+    def test_generator_is_consumed_batch_by_batch(self):
+        collection = RecordingCollection()
+        manager = VectorDBManager.__new__(VectorDBManager)
+        manager._get_or_create_structured_chunk_collection = lambda: collection
+        produced = []
+
+        def chunks():
+            for i in range(5):
+                produced.append(i)
+                # 이전 배치가 저장된 뒤에야 다음 배치를 만들어야 함
+                assert len(collection.upserts) == i // 2
+                yield _structured_chunk(i)
+
+        stats = manager.add_structured_chunks(chunks(), batch_size=2)
+
+        assert collection.upserts == [["s0", "s1"], ["s2", "s3"], ["s4"]]
+        assert stats["total"] == stats["stored"] == 5
+        assert stats["batches"] == 3
+
+    def test_parse_error_rolls_back_stored_batches(self):
+        collection = RecordingCollection()
+        manager = VectorDBManager.__new__(VectorDBManager)
+        manager._get_or_create_structured_chunk_collection = lambda: collection
+
+        def chunks():
+            for i in range(5):
+                yield _structured_chunk(i)
+            raise ValueError("잘린 HTML")
+
+        with pytest.raises(ValueError):
+            manager.add_structured_chunks(chunks(), batch_size=2)
+
+        assert collection.upserts == [["s0", "s1"], ["s2", "s3"]]
+        assert collection.deletes == [["s0", "s1", "s2", "s3"]]
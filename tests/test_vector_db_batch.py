@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+VectorDBManager 배치 저장 테스트
+
+테스트 실행:
+    python -m pytest tests/test_vector_db_batch.py -v
+"""
+
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.unified_chunk import create_file_unified_chunk, create_jira_unified_chunk
+from vector_db_models import VectorDBManager
+
+
+class FakeCollection:
+    """upsert/add 호출을 기록하는 가짜 ChromaDB 컬렉션"""
+
+    def __init__(self, fail_on_call=None):
+        self.upserts = []
+        self.adds = []
+        self.fail_on_call = fail_on_call
+
+    def upsert(self, ids, documents, metadatas):
+        if self.fail_on_call is not None and len(self.upserts) == self.fail_on_call:
+            self.upserts.append(None)
+            raise RuntimeError("write failed")
+        self.upserts.append(list(ids))
+
+    def add(self, ids, documents, metadatas):
+        self.adds.append(list(ids))
+
+
+@pytest.fixture
+def make_manager():
+    def _make(collection):
+        # ChromaDB/RRF 초기화 없이 저장 경로만 검증
+        manager = VectorDBManager.__new__(VectorDBManager)
+        manager._get_file_chunks_collection = lambda: collection
+        return manager
+    return _make
+
+
+def _file_chunks(count):
+    return [
+        create_file_unified_chunk(
+            text_chunk=f"청크 본문 {n} 셋톱박스 재부팅 현상",
+            file_name="manual.pdf",
+            file_hash="abc",
+            file_type="pdf",
+            file_size=100,
+            page_number=n // 10 + 1
+        )
+        for n in range(count)
+    ]
+
+
+class TestAddUnifiedChunks:
+    """배치 upsert 동작 테스트"""
+
+    def test_300_chunks_use_a_handful_of_batches(self, make_manager):
+        collection = FakeCollection()
+        stats = make_manager(collection).add_unified_chunks(_file_chunks(300), batch_size=64)
+
+        assert [len(ids) for ids in collection.upserts] == [64, 64, 64, 64, 44]
+        assert collection.adds == []
+        assert stats["stored"] == 300
+        assert stats["batches"] == 5
+        assert stats["failed"] == 0
+        assert stats["chunks_per_second"] >= 0
+
+    def test_invalid_chunks_and_failed_batches_are_counted(self, make_manager):
+        chunks = _file_chunks(5)
+        chunks.insert(2, create_jira_unified_chunk(
+            text_chunk="지라 청크", ticket_id="BTVO-1",
+            chunk_type="summary", field_name="summary", field_value="요약"
+        ))
+        collection = FakeCollection(fail_on_call=1)
+
+        stats = make_manager(collection).add_unified_chunks(chunks, batch_size=3)
+
+        assert stats["failed"] == 1 + 3  # jira 청크 변환 실패 + 두 번째 배치 저장 실패
+        assert stats["stored"] == 2
+        assert stats["batches"] == 1
+
+    def test_single_add_path_still_works(self, make_manager):
+        collection = FakeCollection()
+        chunk = _file_chunks(1)[0]
+
+        make_manager(collection).add_unified_chunk(chunk)
+
+        assert collection.adds == [[chunk.chunk_id]]
+
+
+class TestAddAttachmentChunks:
+    """첨부파일 청크 일괄 upsert 테스트"""
+
+    def test_attachment_chunks_use_one_upsert(self, make_manager):
+        from vector_db_models import AttachmentChunk
+
+        collection = FakeCollection()
+        manager = make_manager(collection)
+        manager._get_attachment_chunks_collection = lambda: collection
+        chunks = [
+            AttachmentChunk(
+                chunk_id=f"attachment_T1_f1_{n}", ticket_id="T1", file_id="f1",
+                original_filename="log.txt", mime_type="text/plain", chunk_index=n,
+                content=f"로그 내용 {n}", file_size=10, keywords=["로그", "오류"]
+            )
+            for n in range(3)
+        ]
+
+        ids = manager.add_attachment_chunks(chunks)
+
+        assert ids == [c.chunk_id for c in chunks]
+        assert collection.upserts == [ids]
+        assert manager.add_attachment_chunks([]) == []
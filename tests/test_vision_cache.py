@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+이미지→텍스트 결과 캐시 테스트
+
+테스트 실행:
+    python -m pytest tests/test_vision_cache.py -v
+"""
+
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.vision_cache import VisionResultCache
+from module.image_to_text import AzureOpenAIImageProcessor
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return VisionResultCache(str(tmp_path / "vision_cache.db"))
+
+
+def _make_processor(cache, deployment_name="gpt-4o"):
+    processor = AzureOpenAIImageProcessor(
+        "test-key", "https://example.openai.azure.com/", deployment_name, cache=cache
+    )
+    processor.api_calls = []
+
+    def fake_call(image_bytes, prompt, mime_type):
+        processor.api_calls.append((image_bytes, prompt))
+        return f"text for {image_bytes.decode()}"
+
+    processor._call_vision_api = fake_call
+    return processor
+
+
+class TestVisionResultCache:
+    """캐시 적중/미스 및 키 구성 테스트"""
+
+    def test_reprocessing_same_image_costs_no_api_call(self, cache):
+        processor = _make_processor(cache)
+
+        first = processor.image_bytes_to_text(b"page-1", "추출")
+        second = processor.image_bytes_to_text(b"page-1", "추출")
+
+        assert first == second == "text for page-1"
+        assert len(processor.api_calls) == 1
+        stats = processor.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_prompt_and_model_are_part_of_key(self, cache):
+        processor = _make_processor(cache)
+        processor.image_bytes_to_text(b"img", "prompt A")
+        processor.image_bytes_to_text(b"img", "prompt B")
+
+        other_model = _make_processor(cache, deployment_name="gpt-4o-mini")
+        other_model.image_bytes_to_text(b"img", "prompt A")
+
+        assert len(processor.api_calls) == 2
+        assert len(other_model.api_calls) == 1
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        db_path = str(tmp_path / "shared.db")
+        _make_processor(VisionResultCache(db_path)).image_bytes_to_text(b"img", "p")
+
+        processor = _make_processor(VisionResultCache(db_path))
+        assert processor.image_bytes_to_text(b"img", "p") == "text for img"
+        assert processor.api_calls == []
+
+    def test_image_path_api_shares_cache(self, cache, tmp_path):
+        image_path = tmp_path / "page.png"
+        image_path.write_bytes(b"file-image")
+        processor = _make_processor(cache)
+
+        processor.image_to_text(str(image_path), "p")
+        processor.image_to_text(str(image_path), "p")
+
+        assert len(processor.api_calls) == 1
+
+    def test_cache_can_be_disabled(self):
+        processor = AzureOpenAIImageProcessor(
+            "test-key", "https://example.openai.azure.com/", "gpt-4o", use_cache=False
+        )
+        assert processor.get_cache() is None
+        assert processor.get_cache_stats() == {"enabled": False}
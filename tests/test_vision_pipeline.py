@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+PDF 페이지 비전 파이프라인 테스트
+
+테스트 실행:
+    python -m pytest tests/test_vision_pipeline.py -v
+"""
+
+import sys
+import os
+import threading
+import time
+
+import fitz
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.vision_pipeline import VisionPagePipeline, render_pdf_pages
+
+
+class FakeVisionClient:
+    """호출 동시성/실패를 기록하는 가짜 비전 클라이언트"""
+
+    def __init__(self, fail_times=None, delay=0.01):
+        self.fail_times = dict(fail_times or {})
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def image_bytes_to_text(self, image_bytes, prompt):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append(image_bytes)
+        try:
+            time.sleep(self.delay)
+            with self._lock:
+                if self.fail_times.get(image_bytes, 0) > 0:
+                    self.fail_times[image_bytes] -= 1
+                    raise RuntimeError("429 Too Many Requests")
+            return f"text:{image_bytes.decode()}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class PathOnlyClient:
+    """image_to_text(경로)만 제공하는 구형 클라이언트"""
+
+    def image_to_text(self, image_path, prompt):
+        with open(image_path, "rb") as f:
+            return f"path:{f.read().decode()}"
+
+
+def _pages(count):
+    return [(n, f"p{n}".encode()) for n in range(1, count + 1)]
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for n in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"page {n + 1} body")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+class TestVisionPagePipeline:
+    """병렬 처리/재시도/대체 동작 테스트"""
+
+    def test_results_are_in_page_order(self):
+        client = FakeVisionClient()
+        results = VisionPagePipeline(client, max_concurrency=4).process_pages(_pages(10))
+
+        assert [r.page_number for r in results] == list(range(1, 11))
+        assert [r.text for r in results] == [f"text:p{n}" for n in range(1, 11)]
+
+    def test_concurrency_is_bounded(self):
+        client = FakeVisionClient(delay=0.03)
+        VisionPagePipeline(client, max_concurrency=3).process_pages(_pages(12))
+
+        assert 1 < client.max_active <= 3
+
+    def test_transient_failures_are_retried(self):
+        client = FakeVisionClient(fail_times={b"p2": 2})
+        pipeline = VisionPagePipeline(client, max_concurrency=2, max_retries=3, sleep=lambda _: None)
+        results = pipeline.process_pages(_pages(3))
+
+        assert results[1].text == "text:p2"
+        assert results[1].attempts == 3
+        assert results[1].error is None
+
+    def test_path_only_client_uses_unique_temp_files(self):
+        results = VisionPagePipeline(PathOnlyClient(), max_concurrency=2).process_pages(_pages(4))
+
+        assert [r.text for r in results] == [f"path:p{n}" for n in range(1, 5)]
+
+    def test_failed_pages_fall_back_to_text_layer(self, sample_pdf):
+        rendered = dict(render_pdf_pages(sample_pdf, zoom=0.5))
+        client = FakeVisionClient(fail_times={rendered[2]: 99})
+        client.image_bytes_to_text = lambda image_bytes, prompt: (
+            FakeVisionClient.image_bytes_to_text(client, image_bytes, prompt) if image_bytes == rendered[2] else "vision"
+        )
+        pipeline = VisionPagePipeline(client, max_concurrency=2, max_retries=2, sleep=lambda _: None)
+        results = pipeline.process_pdf(sample_pdf, zoom=0.5)
+
+        assert [r.processing_method for r in results] == ["gpt_vision", "text_extraction", "gpt_vision"]
+        assert "page 2 body" in results[1].text
@@ -49,27 +49,15 @@ class TicketAttachmentProcessor:
             # 2. 이메일에서 첨부파일 추출
             extracted_attachments = self.email_extractor.extract_attachments_from_mail_data(email_data)
 
-            # 3. 첨부파일 처리
+            # 3. 첨부파일 처리 (추출/분석 병렬, 파일별 일괄 저장)
             processed_attachments = []
-            for attachment_data in extracted_attachments:
-                try:
-                    # Base64 데이터에서 첨부파일 처리
-                    processed = self.attachment_processor.process_attachment_from_base64(
-                        base64_data=attachment_data.get('base64_data', ''),
-                        filename=attachment_data.get('filename', f'attachment_{len(processed_attachments)}.bin'),
-                        mime_type=attachment_data.get('mime_type', 'application/octet-stream'),
-                        ticket_id=ticket_id
-                    )
-
-                    if processed:
-                        processed_attachments.append(processed)
-                        self.logger.info(f"첨부파일 처리 완료: {processed.metadata.original_filename}")
-                    else:
-                        self.logger.warning(f"첨부파일 처리 실패: {attachment_data.get('filename')}")
-
-                except Exception as e:
-                    self.logger.error(f"첨부파일 처리 중 오류: {e}")
-                    continue
+            batch_results = self.attachment_processor.process_attachments_batch(extracted_attachments, ticket_id)
+            for attachment_data, processed in zip(extracted_attachments, batch_results):
+                if processed:
+                    processed_attachments.append(processed)
+                    self.logger.info(f"첨부파일 처리 완료: {processed.metadata.original_filename}")
+                else:
+                    self.logger.warning(f"첨부파일 처리 실패: {attachment_data.get('filename')}")
 
             # 4. 티켓에 첨부파일 정보 업데이트
             if processed_attachments:
@@ -3,5 +3,13 @@ Utils package - 유틸리티 모듈
 """
 
 from .rate_limiter import RateLimiter, get_global_rate_limiter, rate_limited
+from .job_queue import Job, SQLiteJobQueue, JobWorkerPool
+from .sqlite_pool import SQLiteConnectionPool, get_sqlite_pool
+from .latency_stats import timed, percentile, summarize_latencies
 
-__all__ = ['RateLimiter', 'get_global_rate_limiter', 'rate_limited']
+__all__ = [
+    'RateLimiter', 'get_global_rate_limiter', 'rate_limited',
+    'Job', 'SQLiteJobQueue', 'JobWorkerPool',
+    'SQLiteConnectionPool', 'get_sqlite_pool',
+    'timed', 'percentile', 'summarize_latencies'
+]
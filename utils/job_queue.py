@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+SQLite 기반 내구성 작업 큐 - 메신저 이벤트 비동기 처리
+
+Slack/Kakao 웹훅은 즉시 응답(ack)하고, 실제 처리(스레드 조회, LLM 호출, 티켓 생성)는
+워커 태스크가 큐에서 꺼내 처리한다.
+
+특징:
+- event_id UNIQUE 제약으로 재전송(retry) 이벤트 중복 처리 방지 (idempotency)
+- 서버 재시작 시 처리 중이던 작업을 pending으로 복구
+- 실패 시 지수 백오프(next_attempt_at)를 두고 max_attempts까지 재시도 (최종 실패 시 source별 실패 핸들러 호출)
+- 이벤트 ID가 없는 소스는 dedup_key + 슬라이딩 윈도우로 중복 제거
+- 보존 기간이 지난 완료/실패 작업 정리 (테이블 무한 증가 방지)
+- 큐 대기 시간/처리 시간 메트릭 제공
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+FailureHandler = Callable[[Dict[str, Any], str], Awaitable[Any]]
+
+
+@dataclass
+class Job:
+    """큐 작업 데이터 모델"""
+    job_id: int
+    event_id: str
+    source: str  # 'slack', 'kakao' 등 (핸들러 선택 키)
+    payload: Dict[str, Any]
+    status: str  # 'pending', 'running', 'done', 'failed'
+    attempts: int
+    enqueued_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    next_attempt_at: float = 0.0
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, int(round(pct / 100.0 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+class SQLiteJobQueue:
+    """
+    SQLite 기반 내구성 작업 큐
+
+    Thread-safe: 모든 쓰기는 내부 Lock + BEGIN IMMEDIATE 트랜잭션으로 직렬화
+    """
+
+    def __init__(self, db_path: str = "job_queue.db", retry_backoff: float = 2.0, max_backoff: float = 300.0):
+        """
+        Args:
+            db_path: 큐 데이터베이스 파일 경로
+            retry_backoff: 첫 재시도까지의 대기 시간 (초, 이후 시도마다 2배)
+            max_backoff: 재시도 대기 시간 상한 (초)
+        """
+        self.db_path = db_path
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self.init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def init_database(self):
+        """큐 테이블 생성"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS event_jobs (
+                        job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        event_id TEXT NOT NULL UNIQUE,
+                        source TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        enqueued_at REAL NOT NULL,
+                        started_at REAL,
+                        finished_at REAL,
+                        error TEXT,
+                        next_attempt_at REAL NOT NULL DEFAULT 0,
+                        dedup_key TEXT
+                    )
+                """)
+                # 이전 버전 DB에 재시도 시각/중복 제거 키 컬럼 추가
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(event_jobs)")}
+                if "next_attempt_at" not in columns:
+                    conn.execute("ALTER TABLE event_jobs ADD COLUMN next_attempt_at REAL NOT NULL DEFAULT 0")
+                if "dedup_key" not in columns:
+                    conn.execute("ALTER TABLE event_jobs ADD COLUMN dedup_key TEXT")
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_event_jobs_status
+                    ON event_jobs (status, job_id)
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_event_jobs_dedup
+                    ON event_jobs (dedup_key, enqueued_at)
+                """)
+            finally:
+                conn.close()
+
+    def enqueue(self, event_id: str, source: str, payload: Dict[str, Any],
+                dedup_key: Optional[str] = None, dedup_window: float = 0.0) -> bool:
+        """
+        이벤트를 큐에 추가
+
+        Args:
+            event_id: 이벤트 고유 ID (중복 제거 키)
+            source: 핸들러 선택 키
+            payload: 작업 데이터 (JSON 직렬화 가능해야 함)
+            dedup_key: 이벤트 ID가 없는 소스의 중복 제거 키 (예: 사용자+발화 해시)
+            dedup_window: 같은 dedup_key의 작업이 최근 이 시간(초) 안에 접수됐으면 중복으로 간주
+
+        Returns:
+            새로 추가되었으면 True, 이미 존재하는 event_id거나 윈도우 안의 중복이면 False
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                now = time.time()
+                if dedup_key is not None and dedup_window > 0:
+                    duplicate = conn.execute("""
+                        SELECT 1 FROM event_jobs
+                        WHERE dedup_key = ? AND enqueued_at >= ?
+                        LIMIT 1
+                    """, (dedup_key, now - dedup_window)).fetchone()
+                    if duplicate:
+                        conn.execute("COMMIT")
+                        return False
+                cursor = conn.execute("""
+                    INSERT OR IGNORE INTO event_jobs (event_id, source, payload, status, enqueued_at, dedup_key)
+                    VALUES (?, ?, ?, 'pending', ?, ?)
+                """, (event_id, source, json.dumps(payload, ensure_ascii=False), now, dedup_key))
+                conn.execute("COMMIT")
+                return cursor.rowcount > 0
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
+    def claim_next(self) -> Optional[Job]:
+        """재시도 대기 시간이 지난 가장 오래된 pending 작업을 running으로 전환하여 반환"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("""
+                    SELECT job_id, event_id, source, payload, status, attempts,
+                           enqueued_at, started_at, finished_at, error
+                    FROM event_jobs
+                    WHERE status = 'pending' AND next_attempt_at <= ?
+                    ORDER BY job_id
+                    LIMIT 1
+                """, (time.time(),)).fetchone()
+                if not row:
+                    conn.execute("COMMIT")
+                    return None
+
+                started_at = time.time()
+                conn.execute("""
+                    UPDATE event_jobs
+                    SET status = 'running', attempts = attempts + 1, started_at = ?
+                    WHERE job_id = ?
+                """, (started_at, row[0]))
+                conn.execute("COMMIT")
+
+                return Job(
+                    job_id=row[0],
+                    event_id=row[1],
+                    source=row[2],
+                    payload=json.loads(row[3]),
+                    status='running',
+                    attempts=row[5] + 1,
+                    enqueued_at=row[6],
+                    started_at=started_at,
+                    finished_at=row[8],
+                    error=row[9]
+                )
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
+    def complete(self, job_id: int):
+        """작업 완료 처리"""
+        self._finish(job_id, 'done', None)
+
+    def fail(self, job_id: int, error: str, max_attempts: int = 3) -> str:
+        """
+        작업 실패 처리
+
+        재시도 예정인 작업은 retry_backoff * 2^(시도 횟수 - 1)초(최대 max_backoff) 뒤에 다시 꺼내진다.
+
+        Returns:
+            변경된 상태 ('pending'이면 재시도 예정, 'failed'면 최종 실패)
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT attempts FROM event_jobs WHERE job_id = ?", (job_id,)
+                ).fetchone()
+                attempts = row[0] if row else max_attempts
+                new_status = 'pending' if attempts < max_attempts else 'failed'
+                now = time.time()
+                backoff = min(self.max_backoff, self.retry_backoff * (2 ** max(0, attempts - 1)))
+                conn.execute("""
+                    UPDATE event_jobs
+                    SET status = ?, error = ?, finished_at = ?, next_attempt_at = ?
+                    WHERE job_id = ?
+                """, (new_status, error, now if new_status == 'failed' else None, now + backoff, job_id))
+                return new_status
+            finally:
+                conn.close()
+
+    def _finish(self, job_id: int, status: str, error: Optional[str]):
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("""
+                    UPDATE event_jobs
+                    SET status = ?, error = ?, finished_at = ?
+                    WHERE job_id = ?
+                """, (status, error, time.time(), job_id))
+            finally:
+                conn.close()
+
+    def next_retry_delay(self) -> Optional[float]:
+        """재시도 대기 중인 pending 작업이 꺼내질 수 있을 때까지 남은 시간 (초, pending 작업이 없으면 None)"""
+        conn = self._connect()
+        try:
+            next_attempt_at = conn.execute(
+                "SELECT MIN(next_attempt_at) FROM event_jobs WHERE status = 'pending'"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        if next_attempt_at is None:
+            return None
+        return max(0.0, next_attempt_at - time.time())
+
+    def recover_stale_jobs(self) -> int:
+        """서버 재시작 시 running 상태로 남은 작업을 pending으로 복구"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    "UPDATE event_jobs SET status = 'pending' WHERE status = 'running'"
+                )
+                return cursor.rowcount
+            finally:
+                conn.close()
+
+    def prune_finished(self, retention: float) -> int:
+        """
+        보존 기간이 지난 완료/실패 작업 삭제
+
+        Args:
+            retention: 보존 기간 (초, finished_at 기준)
+
+        Returns:
+            삭제된 작업 수
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute("""
+                    DELETE FROM event_jobs
+                    WHERE status IN ('done', 'failed') AND finished_at < ?
+                """, (time.time() - retention,))
+                return cursor.rowcount
+            finally:
+                conn.close()
+
+    def get_job_by_event_id(self, event_id: str) -> Optional[Job]:
+        """event_id로 작업 조회"""
+        conn = self._connect()
+        try:
+            row = conn.execute("""
+                SELECT job_id, event_id, source, payload, status, attempts,
+                       enqueued_at, started_at, finished_at, error, next_attempt_at
+                FROM event_jobs
+                WHERE event_id = ?
+            """, (event_id,)).fetchone()
+        finally:
+            conn.close()
+
+        if not row:
+            return None
+        return Job(
+            job_id=row[0],
+            event_id=row[1],
+            source=row[2],
+            payload=json.loads(row[3]),
+            status=row[4],
+            attempts=row[5],
+            enqueued_at=row[6],
+            started_at=row[7],
+            finished_at=row[8],
+            error=row[9],
+            next_attempt_at=row[10]
+        )
+
+    def get_metrics(self, window: int = 500) -> Dict[str, Any]:
+        """
+        큐 상태 및 지연 메트릭 조회
+
+        Args:
+            window: 지연 통계 계산에 사용할 최근 완료 작업 수
+
+        Returns:
+            상태별 작업 수, 큐 대기 시간(enqueue→start), 처리 시간(start→finish) 통계
+        """
+        conn = self._connect()
+        try:
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM event_jobs GROUP BY status"
+            ).fetchall())
+            oldest_pending = conn.execute(
+                "SELECT MIN(enqueued_at) FROM event_jobs WHERE status = 'pending'"
+            ).fetchone()[0]
+            rows = conn.execute("""
+                SELECT enqueued_at, started_at, finished_at
+                FROM event_jobs
+                WHERE status IN ('done', 'failed') AND started_at IS NOT NULL
+                ORDER BY job_id DESC
+                LIMIT ?
+            """, (window,)).fetchall()
+        finally:
+            conn.close()
+
+        queue_latencies = sorted(r[1] - r[0] for r in rows)
+        processing_times = sorted(r[2] - r[1] for r in rows if r[2] is not None)
+
+        def _summary(values: List[float]) -> Dict[str, float]:
+            return {
+                "avg": round(sum(values) / len(values), 4) if values else 0.0,
+                "p50": round(_percentile(values, 50), 4),
+                "p95": round(_percentile(values, 95), 4),
+                "max": round(values[-1], 4) if values else 0.0
+            }
+
+        return {
+            "pending": counts.get('pending', 0),
+            "running": counts.get('running', 0),
+            "done": counts.get('done', 0),
+            "failed": counts.get('failed', 0),
+            "oldest_pending_age": round(time.time() - oldest_pending, 4) if oldest_pending else 0.0,
+            "queue_latency": _summary(queue_latencies),
+            "processing_time": _summary(processing_times),
+            "sample_size": len(rows)
+        }
+
+
+class JobWorkerPool:
+    """
+    asyncio 워커 태스크 풀
+
+    source별 핸들러를 등록하고, 워커가 큐에서 작업을 꺼내 실행한다.
+    """
+
+    def __init__(
+        self,
+        queue: SQLiteJobQueue,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+        concurrency: int = 2,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+        retention: Optional[float] = None,
+        prune_interval: float = 600.0
+    ):
+        """
+        Args:
+            queue: 작업 큐
+            handlers: {source: async handler(payload)} 매핑
+            concurrency: 동시 실행 워커 수
+            poll_interval: 큐가 비었을 때 재확인 간격 (초)
+            max_attempts: 작업당 최대 시도 횟수
+            retention: 완료/실패 작업 보존 기간 (초, None이면 정리하지 않음)
+            prune_interval: 보존 기간 정리 주기 (초)
+        """
+        self.queue = queue
+        self.handlers: Dict[str, JobHandler] = dict(handlers or {})
+        self.failure_handlers: Dict[str, FailureHandler] = {}
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retention = retention
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def register(self, source: str, handler: JobHandler, on_failure: Optional[FailureHandler] = None):
+        """
+        source별 핸들러 등록
+
+        Args:
+            source: 핸들러 선택 키
+            handler: async handler(payload)
+            on_failure: 재시도까지 모두 실패했을 때 호출할 async handler(payload, error)
+        """
+        self.handlers[source] = handler
+        if on_failure is not None:
+            self.failure_handlers[source] = on_failure
+
+    def start(self):
+        """워커 태스크 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._tasks:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        recovered = self.queue.recover_stale_jobs()
+        if recovered:
+            logger.info(f"♻️ 미완료 작업 {recovered}개 복구")
+        for i in range(self.concurrency):
+            self._tasks.append(asyncio.create_task(self._worker_loop(i)))
+        logger.info(f"✅ JobWorkerPool 시작: workers={self.concurrency}")
+
+    async def stop(self):
+        """워커 태스크 종료"""
+        self._stopping = True
+        if self._wakeup:
+            self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self):
+        """새 작업이 추가되었음을 워커에 알림 (폴링 대기 없이 즉시 처리)"""
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def run_until_empty(self):
+        """큐가 빌 때까지 현재 태스크에서 작업 처리 (재시도 대기 중인 작업은 대기 후 처리, 테스트/배치용)"""
+        while True:
+            job = await asyncio.to_thread(self.queue.claim_next)
+            if job is None:
+                delay = await asyncio.to_thread(self.queue.next_retry_delay)
+                if delay is None:
+                    return
+                await asyncio.sleep(delay)
+                continue
+            await self._run_job(job)
+
+    async def _worker_loop(self, worker_index: int):
+        while not self._stopping:
+            job = await asyncio.to_thread(self.queue.claim_next)
+            if job is None:
+                await self._maybe_prune()
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run_job(job, worker_index)
+
+    async def _run_job(self, job: Job, worker_index: int = 0):
+        handler = self.handlers.get(job.source)
+        queue_latency = job.started_at - job.enqueued_at
+        if handler is None:
+            logger.error(f"❌ 핸들러 없음: source={job.source}, event_id={job.event_id}")
+            await asyncio.to_thread(self.queue.fail, job.job_id, f"no handler for {job.source}", 0)
+            return
+
+        try:
+            await handler(job.payload)
+            await asyncio.to_thread(self.queue.complete, job.job_id)
+            logger.info(
+                f"✅ 작업 완료 [worker {worker_index}]: event_id={job.event_id}, "
+                f"queue_latency={queue_latency:.3f}s, processing={time.time() - job.started_at:.3f}s"
+            )
+        except asyncio.CancelledError:
+            # 종료 중 취소된 작업은 다음 시작 시 recover_stale_jobs로 복구됨
+            raise
+        except Exception as e:
+            status = await asyncio.to_thread(self.queue.fail, job.job_id, str(e), self.max_attempts)
+            logger.error(
+                f"❌ 작업 실패 [worker {worker_index}]: event_id={job.event_id}, "
+                f"attempt={job.attempts}, status={status}, error={e}"
+            )
+            on_failure = self.failure_handlers.get(job.source)
+            if status == 'failed' and on_failure is not None:
+                try:
+                    await on_failure(job.payload, str(e))
+                except Exception as notify_error:
+                    logger.error(f"❌ 실패 핸들러 오류: event_id={job.event_id}, error={notify_error}")
+
+    async def _maybe_prune(self):
+        """유휴 상태일 때 보존 기간이 지난 완료/실패 작업 정리 (prune_interval마다 1회)"""
+        if self.retention is None or time.time() - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = time.time()
+        try:
+            pruned = await asyncio.to_thread(self.queue.prune_finished, self.retention)
+            if pruned:
+                logger.info(f"🧹 완료 작업 {pruned}개 정리")
+        except Exception as e:
+            logger.error(f"❌ 완료 작업 정리 실패: {e}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Latency Stats - 구간별 지연 시간 측정 및 백분위 요약
+
+RAG 평가/스윕에서 검색 구간(multi_query, hyde, bm25, fusion, load, dedup)별
+소요 시간을 모으고 p50/p95/p99로 요약하는 데 사용한다.
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+@contextmanager
+def timed(timings: Optional[Dict[str, float]], leg: str):
+    """
+    블록 실행 시간을 timings[leg]에 누적 (초 단위)
+
+    timings가 None이면 아무것도 기록하지 않으므로 호출부에서 분기할 필요가 없다.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[leg] = timings.get(leg, 0.0) + (time.perf_counter() - start)
+
+
+def percentile(values: Iterable[float], q: float) -> float:
+    """선형 보간 백분위 (numpy.percentile 기본 방식과 동일, 값이 없으면 0.0)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    if len(ordered) == 1:
+        return float(ordered[0])
+
+    position = (len(ordered) - 1) * (q / 100.0)
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return float(ordered[lower])
+    return float(ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower))
+
+
+def summarize_latencies(values: List[float],
+                        percentiles: Iterable[int] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+    """
+    지연 시간 목록 요약 (밀리초 단위)
+
+    Returns:
+        {'count', 'mean_ms', 'max_ms', 'p50_ms', 'p95_ms', 'p99_ms', ...}
+    """
+    millis = [v * 1000.0 for v in values]
+    summary = {
+        'count': len(millis),
+        'mean_ms': sum(millis) / len(millis) if millis else 0.0,
+        'max_ms': max(millis) if millis else 0.0
+    }
+    for q in percentiles:
+        summary[f'p{q}_ms'] = percentile(millis, q)
+    return summary
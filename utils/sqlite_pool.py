@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+SQLite 스레드 로컬 커넥션 풀
+
+메서드 호출마다 sqlite3.connect() + PRAGMA journal_mode=WAL을 반복하지 않도록
+스레드별로 하나의 커넥션을 유지하고 재사용한다.
+
+특징:
+- PRAGMA는 커넥션 생성 시 1회만 설정
+- 커넥션별 prepared statement 캐시(cached_statements) 재사용
+- sqlite3.Connection 컨텍스트 매니저 그대로 사용 (with 블록 종료 시 commit/rollback, close 안 함)
+- db 파일 경로별로 하나의 풀을 공유
+- 종료된 스레드의 커넥션은 새 커넥션 생성 시 정리 (스레드마다 rerun하는 Streamlit 대응)
+"""
+
+import os
+import sqlite3
+import threading
+import logging
+import weakref
+from typing import Dict, Iterable, Iterator, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 생성 시 1회 적용되는 기본 PRAGMA
+DEFAULT_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=1000",
+    "PRAGMA temp_store=memory",
+)
+
+# SQLite 바인딩 변수 제한(구버전 999)을 넘지 않도록 IN 절을 나누는 크기
+MAX_IN_PARAMS = 900
+
+
+class SQLiteConnectionPool:
+    """스레드 로컬 SQLite 커넥션 풀"""
+
+    def __init__(
+        self,
+        db_path: str,
+        timeout: float = 30.0,
+        cached_statements: int = 256,
+        pragmas: Sequence[str] = DEFAULT_PRAGMAS
+    ):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            timeout: 잠금 대기 시간 (초)
+            cached_statements: 커넥션별 prepared statement 캐시 크기
+            pragmas: 커넥션 생성 시 실행할 PRAGMA 목록
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.pragmas = tuple(pragmas)
+        self._local = threading.local()
+        # {스레드 ident: (스레드 weakref, 커넥션)} - close_all 및 종료된 스레드 정리용
+        self._connections: Dict[int, Tuple[weakref.ref, sqlite3.Connection]] = {}
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 커넥션 반환 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.timeout,
+                cached_statements=self.cached_statements
+            )
+            for pragma in self.pragmas:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._lock:
+                self._prune_dead_threads()
+                self._connections[threading.get_ident()] = (weakref.ref(threading.current_thread()), conn)
+        return conn
+
+    def _prune_dead_threads(self) -> int:
+        """
+        종료된 스레드의 커넥션 참조 제거 (self._lock 보유 상태에서 호출)
+
+        종료된 스레드의 threading.local 값은 이미 해제되었으므로,
+        풀의 참조만 끊으면 커넥션이 가비지 컬렉션되며 닫힌다.
+        """
+        dead = [
+            ident for ident, (thread_ref, _) in self._connections.items()
+            if thread_ref() is None or not thread_ref().is_alive()
+        ]
+        for ident in dead:
+            del self._connections[ident]
+        return len(dead)
+
+    def active_connection_count(self) -> int:
+        """살아있는 스레드가 보유한 커넥션 수"""
+        with self._lock:
+            self._prune_dead_threads()
+            return len(self._connections)
+
+    def close_all(self):
+        """풀의 모든 커넥션 종료 (프로세스 종료/테스트 정리용)"""
+        with self._lock:
+            connections = [conn for _, conn in self._connections.values()]
+            self._connections = {}
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # 다른 스레드에서 생성된 커넥션은 해당 스레드에서만 닫을 수 있음
+                pass
+        self._local = threading.local()
+
+
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_sqlite_pool(db_path: str, **kwargs) -> SQLiteConnectionPool:
+    """db 파일 경로별 공유 커넥션 풀 반환"""
+    key = os.path.abspath(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = SQLiteConnectionPool(db_path, **kwargs)
+                _pools[key] = pool
+    return pool
+
+
+def chunked(values: Iterable, size: int = MAX_IN_PARAMS) -> Iterator[list]:
+    """IN 절 바인딩용으로 값 목록을 size 단위로 분할"""
+    batch = []
+    for value in values:
+        batch.append(value)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def placeholders(count: int) -> str:
+    """IN 절용 '?, ?, ...' 문자열"""
+    return ", ".join("?" * count)
@@ -6,13 +6,19 @@ Vector DB용 Mail 모델 및 관리자
 import os
 from dotenv import load_dotenv
 from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple, Callable, Iterable
 import uuid
+import time
+import inspect
+import weakref
+from itertools import islice
+import threading
 from datetime import datetime
 import chromadb
 from chromadb.config import Settings
 import json
 from chromadb_singleton import get_chromadb_client, get_chromadb_collection, reset_chromadb_singleton
+from utils.sqlite_pool import get_sqlite_pool
 
 # 텍스트 전처리 모듈 import
 from text_preprocessor import preprocess_for_embedding
@@ -84,6 +90,92 @@ class StructuredChunk:
     created_at: str  # 생성 시각
     commenter: Optional[str] = None  # 댓글 작성자 (comment 타입일 때만)
 
+@dataclass
+class AttachmentChunk:
+    """첨부파일 청크 모델 - Vector DB Collection용"""
+    chunk_id: str  # PK - attachment_{ticket_id}_{file_id}_{chunk_index}
+    ticket_id: str  # 첨부된 티켓 ID
+    file_id: str  # 첨부파일 ID (내용 sha256)
+    original_filename: str  # 원본 파일명
+    mime_type: str  # MIME 타입
+    chunk_index: int  # 파일 내 청크 순번
+    content: str  # 임베딩할 텍스트 내용
+    file_size: int  # 파일 크기 (바이트)
+    analysis_summary: Optional[str] = None  # LLM 분석 요약
+    keywords: Optional[List[str]] = None  # LLM 추출 키워드
+    file_category: Optional[str] = None  # 파일 카테고리
+    business_relevance: Optional[str] = None  # 업무 관련성
+    created_at: str = ""  # 생성 시각
+    source: str = "attachment"
+    char_start: int = 0  # 추출 텍스트 내 청크 시작 위치
+    char_end: int = 0  # 추출 텍스트 내 청크 끝 위치
+
+@dataclass
+class ImageVector:
+    """메일 이미지 벡터 모델 - Vector DB Collection용"""
+    image_id: str  # PK - {mail_id}_img_{n}
+    mail_id: str  # 메일 ID
+    image_data: str  # Base64 인코딩된 이미지
+    image_metadata: Dict[str, Any]  # 크기/형식/해시 등
+    embedding: List[float]  # 이미지 임베딩 벡터
+    description: str  # 이미지 설명 (alt/title 등)
+    tags: List[str]  # 태그
+    created_at: str  # 생성 시각
+    embedding_method: str  # azure_vision, clip
+    file_size: int  # 이미지 크기 (바이트)
+    processing_duration: float  # 처리 시간 (초)
+
+# Vector DB 쓰기 이벤트 구독자 (모든 VectorDBManager 인스턴스 공용)
+# 이벤트: {"op": "upsert" | "delete" | "clear", "source_type": "file_chunk" | "mail" | "structured_chunk" | None,
+#          "ids": [...], "documents": [...], "metadatas": [...]}
+# 바운드 메서드는 WeakMethod로 보관하여 구독 객체(예: HybridSearchRetriever)의 GC를 막지 않는다.
+_write_listeners: List[Callable[[], Optional[Callable[[Dict[str, Any]], None]]]] = []
+_write_listeners_lock = threading.Lock()
+
+# BM25 소스 타입별 ChromaDB 컬렉션 이름 (쓰기 워터마크용)
+SOURCE_COLLECTIONS = {
+    "file_chunk": "file_chunks",
+    "mail": "mails",
+    "structured_chunk": "structured_chunks",
+}
+
+# 소스별 쓰기 순번 DB (<db_path>/write_sequence.db) - 프로세스 간 공유되는 쓰기 카운터
+WRITE_SEQUENCE_FILENAME = "write_sequence.db"
+
+
+def _listener_ref(listener: Callable[[Dict[str, Any]], None]):
+    if inspect.ismethod(listener):
+        return weakref.WeakMethod(listener)
+    return lambda: listener
+
+
+def _live_write_listeners() -> List[Callable[[Dict[str, Any]], None]]:
+    """살아 있는 구독자 목록 (수거된 구독자는 정리) - _write_listeners_lock 안에서 호출"""
+    live = []
+    for ref in list(_write_listeners):
+        listener = ref()
+        if listener is None:
+            _write_listeners.remove(ref)
+        else:
+            live.append(listener)
+    return live
+
+
+def add_vector_db_write_listener(listener: Callable[[Dict[str, Any]], None]):
+    """Vector DB 쓰기 이벤트 구독 (BM25 증분 인덱스 등)"""
+    with _write_listeners_lock:
+        if listener not in _live_write_listeners():
+            _write_listeners.append(_listener_ref(listener))
+
+
+def remove_vector_db_write_listener(listener: Callable[[Dict[str, Any]], None]):
+    """Vector DB 쓰기 이벤트 구독 해제"""
+    with _write_listeners_lock:
+        for ref in list(_write_listeners):
+            if ref() == listener:
+                _write_listeners.remove(ref)
+
+
 class VectorDBManager:
     """Vector DB 관리자 - ChromaDB 사용 (RRF 통합)"""
 
@@ -121,6 +213,99 @@ class VectorDBManager:
         except Exception as e:
             print(f"⚠️ ChromaDB 파일 권한 설정 실패: {e}")
 
+    def _notify_write(self, op: str, source_type: Optional[str], ids: Optional[List[str]] = None,
+                      documents: Optional[List[str]] = None, metadatas: Optional[List[Dict[str, Any]]] = None):
+        """
+        쓰기 이벤트 전달 (구독자 오류는 저장 결과에 영향을 주지 않음)
+
+        구독자 유무와 관계없이 소스별 쓰기 순번을 먼저 올리고, 올린 순번을 이벤트에 담는다.
+        구독자는 순번이 건너뛰면 다른 프로세스의 쓰기가 있었다는 것을 알 수 있다.
+        """
+        source_types = [source_type] if source_type else list(SOURCE_COLLECTIONS)
+        sequences = self._bump_write_sequences([s for s in source_types if s in SOURCE_COLLECTIONS])
+
+        with _write_listeners_lock:
+            listeners = _live_write_listeners()
+        if not listeners:
+            return
+
+        event = {
+            "op": op,
+            "source_type": source_type,
+            "ids": list(ids or []),
+            "documents": list(documents or []),
+            "metadatas": list(metadatas or []),
+            "sequences": sequences
+        }
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                print(f"⚠️ Vector DB 쓰기 이벤트 처리 실패: {e}")
+
+    def _write_sequence_connection(self):
+        """쓰기 순번 DB 커넥션 (db_path가 없으면 None)"""
+        db_path = getattr(self, "db_path", None)
+        if not db_path:
+            return None
+        os.makedirs(db_path, exist_ok=True)
+        conn = get_sqlite_pool(os.path.join(db_path, WRITE_SEQUENCE_FILENAME)).connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS write_sequence (source_type TEXT PRIMARY KEY, seq INTEGER NOT NULL)"
+        )
+        return conn
+
+    def _bump_write_sequences(self, source_types: List[str]) -> Dict[str, int]:
+        """소스별 쓰기 순번 증가 후 새 순번 반환 (실패해도 쓰기는 계속)"""
+        if not source_types:
+            return {}
+        try:
+            conn = self._write_sequence_connection()
+            if conn is None:
+                return {}
+            sequences = {}
+            with conn:
+                for source_type in source_types:
+                    conn.execute(
+                        "INSERT INTO write_sequence (source_type, seq) VALUES (?, 1) "
+                        "ON CONFLICT(source_type) DO UPDATE SET seq = seq + 1",
+                        (source_type,)
+                    )
+                    sequences[source_type] = conn.execute(
+                        "SELECT seq FROM write_sequence WHERE source_type = ?", (source_type,)
+                    ).fetchone()[0]
+            return sequences
+        except Exception as e:
+            print(f"⚠️ Vector DB 쓰기 순번 갱신 실패: {e}")
+            return {}
+
+    def get_write_sequences(self) -> Dict[str, int]:
+        """소스별 쓰기 순번 (모든 프로세스의 VectorDBManager 쓰기 누적, 기록이 없으면 0)"""
+        sequences = {source_type: 0 for source_type in SOURCE_COLLECTIONS}
+        conn = self._write_sequence_connection()
+        if conn is not None:
+            for source_type, seq in conn.execute("SELECT source_type, seq FROM write_sequence"):
+                if source_type in sequences:
+                    sequences[source_type] = seq
+        return sequences
+
+    def get_write_watermark(self) -> Dict[str, Dict[str, int]]:
+        """
+        BM25 스냅샷 유효성 확인용 워터마크 {소스 타입: {"count": 문서 수, "seq": 쓰기 순번}}
+
+        count()와 순번 조회만 하므로 코퍼스 크기와 관계없이 빠르다.
+        순번은 수정/삭제 후 추가처럼 문서 수가 같은 변경도, 다른 프로세스의 쓰기도 반영한다.
+        """
+        sequences = self.get_write_sequences()
+        watermark = {}
+        for source_type, collection_name in SOURCE_COLLECTIONS.items():
+            try:
+                count = self.client.get_collection(collection_name).count()
+            except Exception:
+                count = 0
+            watermark[source_type] = {"count": count, "seq": sequences[source_type]}
+        return watermark
+
     def _init_rrf_system(self):
         """RRF 시스템 초기화 (스마트 컬렉션 감지)"""
         try:
@@ -279,6 +464,7 @@ class VectorDBManager:
                 metadatas=[metadata],
                 ids=[mail.message_id]
             )
+            self._notify_write("upsert", "mail", [mail.message_id], [preprocessed_document], [metadata])
 
             print(f"   🔒 [VectorDB] 저장 후 권한 재확인 중...")
             # 저장 후 권한 재확인
@@ -521,6 +707,7 @@ class VectorDBManager:
             
             # 기존 데이터 삭제
             self.collection.delete(ids=[message_id])
+            self._notify_write("delete", "mail", [message_id])
             
             # 상태 업데이트 후 다시 저장
             mail.status = new_status
@@ -542,6 +729,7 @@ class VectorDBManager:
             
             # 기존 데이터 삭제
             self.collection.delete(ids=[message_id])
+            self._notify_write("delete", "mail", [message_id])
             
             # 레이블을 key_points에 저장 (기존 구조 유지)
             mail.key_points = new_labels
@@ -570,6 +758,8 @@ class VectorDBManager:
                 if rrf_results:
                     # RRF 결과를 기존 형식으로 변환
                     file_chunks = []
+                    rrf_engine = getattr(self.rrf_system, 'rrf_engine', None)
+                    score_ceiling = rrf_engine.max_score() if rrf_engine else None
                     for result in rrf_results[:n_results * 3]:  # 필터링을 위해 더 많이 가져오기
                         content = result.get('content', '')
 
@@ -590,7 +780,8 @@ class VectorDBManager:
                             "created_at": metadata.get("created_at", ""),
                             "search_method": "rrf",
                             "rrf_rank": result.get('rrf_rank', 0),
-                            "weight": result.get('weight', 1.0)
+                            "weight": result.get('weight', 1.0),
+                            "score_ceiling": score_ceiling
                         }
                         file_chunks.append(file_chunk)
 
@@ -759,6 +950,7 @@ class VectorDBManager:
         try:
             self.client.delete_collection(name=self.collection_name)
             self.collection = self._get_or_create_collection()
+            self._notify_write("clear", "mail")
             return True
         except Exception as e:
             print(f"컬렉션 초기화 오류: {e}")
@@ -800,6 +992,7 @@ class VectorDBManager:
             
             # 컬렉션 재생성
             self.collection = self._get_or_create_collection()
+            self._notify_write("clear", None)
             
             print("✅ ChromaDB 강제 재설정 완료!")
             return True
@@ -864,9 +1057,75 @@ class VectorDBManager:
             print(f"❌ 파일 청크 저장 실패: {e}")
             raise e
 
+    def _get_file_chunks_collection(self):
+        """file_chunks 컬렉션 가져오기 또는 생성"""
+        try:
+            return self.client.get_collection(name="file_chunks")
+        except Exception:
+            # 새 컬렉션 생성 (ChromaDB 기본 임베딩 사용)
+            return self.client.create_collection(
+                name="file_chunks",
+                metadata={
+                    "hnsw:space": "cosine",
+                    "description": "Unified file chunks for RAG system",
+                    "created_at": datetime.now().isoformat(),
+                    "schema_version": "unified_v1"
+                }
+            )
+
+    def _build_unified_chunk_record(self, unified_chunk: UnifiedChunk) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        UnifiedChunk를 ChromaDB 저장용 (id, document, metadata)로 변환
+
+        Raises:
+            ValueError: data_source가 "file"이 아닌 경우
+        """
+        # 현재는 file 데이터만 처리
+        if unified_chunk.data_source != "file":
+            raise ValueError(f"현재는 data_source='file'만 지원합니다. (입력: {unified_chunk.data_source})")
+
+        # 메타데이터 준비 (UnifiedChunk 구조)
+        metadata = {
+            # 공통 필드
+            "chunk_id": unified_chunk.chunk_id,
+            "data_source": unified_chunk.data_source,
+            "created_at": unified_chunk.created_at,
+            "updated_at": unified_chunk.updated_at,
+        }
+
+        # file_metadata 추가 (JSON 직렬화)
+        if unified_chunk.file_metadata:
+            # 주요 필드를 메타데이터 최상위에 추가 (검색 편의성)
+            metadata["file_name"] = unified_chunk.file_metadata.get("file_name", "")
+            metadata["file_type"] = unified_chunk.file_metadata.get("file_type", "")
+            metadata["file_hash"] = unified_chunk.file_metadata.get("file_hash", "")
+            metadata["page_number"] = unified_chunk.file_metadata.get("page_number", 1)
+            metadata["architecture"] = unified_chunk.file_metadata.get("architecture", "")
+            metadata["processing_method"] = unified_chunk.file_metadata.get("processing_method", "")
+            metadata["vision_analysis"] = unified_chunk.file_metadata.get("vision_analysis", False)
+            metadata["section_title"] = unified_chunk.file_metadata.get("section_title", "")
+            metadata["element_count"] = unified_chunk.file_metadata.get("element_count", 0)
+
+            # 전체 file_metadata를 JSON으로 저장 (백업용)
+            metadata["file_metadata_json"] = json.dumps(unified_chunk.file_metadata, ensure_ascii=False)
+
+        # jira_metadata 추가 (현재는 None)
+        # ChromaDB는 None을 허용하지 않으므로 빈 문자열로 저장
+        if unified_chunk.jira_metadata:
+            metadata["jira_metadata_json"] = json.dumps(unified_chunk.jira_metadata, ensure_ascii=False)
+        # Note: None 대신 필드를 생략하거나 빈 문자열 사용
+
+        # None 값 제거 (ChromaDB는 None을 허용하지 않음)
+        metadata = {k: v for k, v in metadata.items() if v is not None}
+
+        # 텍스트 전처리 적용
+        preprocessed_text = preprocess_for_embedding(unified_chunk.text_chunk)
+
+        return unified_chunk.chunk_id, preprocessed_text, metadata
+
     def add_unified_chunk(self, unified_chunk: UnifiedChunk):
         """
-        UnifiedChunk를 벡터 DB에 추가
+        UnifiedChunk를 벡터 DB에 추가 (여러 개는 add_unified_chunks 사용)
 
         Args:
             unified_chunk: UnifiedChunk 객체
@@ -876,68 +1135,15 @@ class VectorDBManager:
             Exception: 저장 중 오류 발생
         """
         try:
-            # 현재는 file 데이터만 처리
-            if unified_chunk.data_source != "file":
-                raise ValueError(f"현재는 data_source='file'만 지원합니다. (입력: {unified_chunk.data_source})")
-
-            # file_chunks 컬렉션 가져오기 또는 생성
-            try:
-                collection = self.client.get_collection(name="file_chunks")
-            except Exception:
-                # 새 컬렉션 생성 (ChromaDB 기본 임베딩 사용)
-                collection = self.client.create_collection(
-                    name="file_chunks",
-                    metadata={
-                        "hnsw:space": "cosine",
-                        "description": "Unified file chunks for RAG system",
-                        "created_at": datetime.now().isoformat(),
-                        "schema_version": "unified_v1"
-                    }
-                )
-
-            # 메타데이터 준비 (UnifiedChunk 구조)
-            metadata = {
-                # 공통 필드
-                "chunk_id": unified_chunk.chunk_id,
-                "data_source": unified_chunk.data_source,
-                "created_at": unified_chunk.created_at,
-                "updated_at": unified_chunk.updated_at,
-            }
-
-            # file_metadata 추가 (JSON 직렬화)
-            if unified_chunk.file_metadata:
-                # 주요 필드를 메타데이터 최상위에 추가 (검색 편의성)
-                metadata["file_name"] = unified_chunk.file_metadata.get("file_name", "")
-                metadata["file_type"] = unified_chunk.file_metadata.get("file_type", "")
-                metadata["file_hash"] = unified_chunk.file_metadata.get("file_hash", "")
-                metadata["page_number"] = unified_chunk.file_metadata.get("page_number", 1)
-                metadata["architecture"] = unified_chunk.file_metadata.get("architecture", "")
-                metadata["processing_method"] = unified_chunk.file_metadata.get("processing_method", "")
-                metadata["vision_analysis"] = unified_chunk.file_metadata.get("vision_analysis", False)
-                metadata["section_title"] = unified_chunk.file_metadata.get("section_title", "")
-                metadata["element_count"] = unified_chunk.file_metadata.get("element_count", 0)
-
-                # 전체 file_metadata를 JSON으로 저장 (백업용)
-                metadata["file_metadata_json"] = json.dumps(unified_chunk.file_metadata, ensure_ascii=False)
-
-            # jira_metadata 추가 (현재는 None)
-            # ChromaDB는 None을 허용하지 않으므로 빈 문자열로 저장
-            if unified_chunk.jira_metadata:
-                metadata["jira_metadata_json"] = json.dumps(unified_chunk.jira_metadata, ensure_ascii=False)
-            # Note: None 대신 필드를 생략하거나 빈 문자열 사용
-
-            # None 값 제거 (ChromaDB는 None을 허용하지 않음)
-            metadata = {k: v for k, v in metadata.items() if v is not None}
-
-            # 텍스트 전처리 적용
-            preprocessed_text = preprocess_for_embedding(unified_chunk.text_chunk)
+            chunk_id, document, metadata = self._build_unified_chunk_record(unified_chunk)
 
             # ChromaDB에 저장
-            collection.add(
-                documents=[preprocessed_text],
+            self._get_file_chunks_collection().add(
+                documents=[document],
                 metadatas=[metadata],
-                ids=[unified_chunk.chunk_id]
+                ids=[chunk_id]
             )
+            self._notify_write("upsert", "file_chunk", [chunk_id], [document], [metadata])
 
             file_name = unified_chunk.file_metadata.get("file_name", "Unknown") if unified_chunk.file_metadata else "Unknown"
             print(f"✅ UnifiedChunk 저장 완료: {file_name} (ID: {unified_chunk.chunk_id})")
@@ -945,6 +1151,63 @@ class VectorDBManager:
         except Exception as e:
             print(f"❌ UnifiedChunk 저장 실패: {e}")
             raise e
+
+    def add_unified_chunks(self, unified_chunks: List[UnifiedChunk],
+                           batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        여러 UnifiedChunk를 배치 단위로 임베딩 및 저장
+
+        배치마다 upsert 1회로 저장하므로 임베딩 호출과 ChromaDB 쓰기가
+        청크 수가 아니라 배치 수만큼만 발생한다.
+
+        Args:
+            unified_chunks: UnifiedChunk 목록
+            batch_size: 배치 크기 (기본: VECTOR_DB_BATCH_SIZE 환경변수, 없으면 64)
+
+        Returns:
+            처리 통계 (total, stored, failed, batches, elapsed_seconds, chunks_per_second)
+        """
+        batch_size = max(1, batch_size or int(os.getenv("VECTOR_DB_BATCH_SIZE", "64")))
+        start_time = time.time()
+        stats = {"total": len(unified_chunks), "stored": 0, "failed": 0, "batches": 0}
+
+        collection = self._get_file_chunks_collection() if unified_chunks else None
+
+        for start in range(0, len(unified_chunks), batch_size):
+            ids, documents, metadatas = [], [], []
+            for unified_chunk in unified_chunks[start:start + batch_size]:
+                try:
+                    chunk_id, document, metadata = self._build_unified_chunk_record(unified_chunk)
+                except Exception as e:
+                    print(f"❌ UnifiedChunk 변환 실패 (ID: {unified_chunk.chunk_id}): {e}")
+                    stats["failed"] += 1
+                    continue
+                ids.append(chunk_id)
+                documents.append(document)
+                metadatas.append(metadata)
+
+            if not ids:
+                continue
+
+            try:
+                collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+                stats["stored"] += len(ids)
+                stats["batches"] += 1
+            except Exception as e:
+                print(f"❌ UnifiedChunk 배치 저장 실패 ({len(ids)}개): {e}")
+                stats["failed"] += len(ids)
+                continue
+            self._notify_write("upsert", "file_chunk", ids, documents, metadatas)
+
+        elapsed = time.time() - start_time
+        stats["elapsed_seconds"] = round(elapsed, 3)
+        stats["chunks_per_second"] = round(stats["stored"] / elapsed, 1) if elapsed > 0 else 0.0
+
+        print(
+            f"✅ UnifiedChunk 배치 저장 완료: {stats['stored']}/{stats['total']}개, "
+            f"{stats['batches']}개 배치, {stats['elapsed_seconds']}초 ({stats['chunks_per_second']}개/초)"
+        )
+        return stats
     
     def clear_all_data(self):
         """모든 데이터 삭제"""
@@ -954,6 +1217,7 @@ class VectorDBManager:
             for collection in collections:
                 self.client.delete_collection(collection.name)
                 print(f"✅ 컬렉션 삭제 완료: {collection.name}")
+            self._notify_write("clear", None)
             
             print("✅ 모든 벡터 DB 데이터가 삭제되었습니다.")
             
@@ -961,6 +1225,213 @@ class VectorDBManager:
             print(f"❌ 데이터 삭제 실패: {e}")
             raise e
     
+    def _get_attachment_chunks_collection(self):
+        """
+        첨부파일 청크 컬렉션 가져오기 또는 생성
+
+        임베딩 함수는 컬렉션에 연결하지 않는다 (기존 컬렉션과 "Embedding function conflict" 방지).
+        ko-sroberta 사용 가능 시 별도 컬렉션에 저장/검색 시 임베딩을 직접 전달하며,
+        처음 생성될 때 기본 임베딩 컬렉션의 청크를 다시 임베딩해 옮긴다.
+        """
+        from attachment_search import ATTACHMENT_COLLECTION, get_attachment_collection_name
+
+        name = get_attachment_collection_name()
+        try:
+            return self.client.get_collection(name=name)
+        except Exception:
+            collection = self.client.create_collection(
+                name=name,
+                metadata={
+                    "hnsw:space": "cosine",
+                    "description": "Email attachment chunks",
+                    "created_at": datetime.now().isoformat()
+                }
+            )
+
+        if name != ATTACHMENT_COLLECTION:
+            self._migrate_legacy_attachment_chunks(collection)
+        return collection
+
+    def _migrate_legacy_attachment_chunks(self, collection, batch_size: int = 256):
+        """기본 임베딩 attachment_chunks 컬렉션의 청크를 ko-sroberta 컬렉션으로 복사"""
+        from attachment_search import ATTACHMENT_COLLECTION, embed_attachment_texts
+
+        try:
+            legacy = self.client.get_collection(name=ATTACHMENT_COLLECTION)
+        except Exception:
+            return
+
+        migrated = 0
+        try:
+            while True:
+                page = legacy.get(limit=batch_size, offset=migrated, include=["documents", "metadatas"])
+                if not page["ids"]:
+                    break
+                collection.upsert(
+                    ids=page["ids"],
+                    documents=page["documents"],
+                    metadatas=page["metadatas"],
+                    embeddings=embed_attachment_texts(page["documents"])
+                )
+                migrated += len(page["ids"])
+            if migrated:
+                print(f"✅ 첨부파일 청크 {migrated}개를 {collection.name} 컬렉션으로 이전")
+        except Exception as e:
+            print(f"❌ 첨부파일 청크 이전 실패 ({migrated}개 완료): {e}")
+
+    def _build_attachment_chunk_record(self, attachment_chunk: AttachmentChunk) -> Tuple[str, str, Dict[str, Any]]:
+        """AttachmentChunk를 ChromaDB 저장용 (id, document, metadata)로 변환"""
+        metadata = {
+            "chunk_id": attachment_chunk.chunk_id,
+            "ticket_id": attachment_chunk.ticket_id,
+            "file_id": attachment_chunk.file_id,
+            "original_filename": attachment_chunk.original_filename,
+            "mime_type": attachment_chunk.mime_type,
+            "chunk_index": attachment_chunk.chunk_index,
+            "file_size": attachment_chunk.file_size,
+            "analysis_summary": attachment_chunk.analysis_summary or "",
+            # ChromaDB 메타데이터는 리스트를 허용하지 않으므로 문자열로 저장
+            "keywords": ", ".join(str(k) for k in (attachment_chunk.keywords or [])),
+            "file_category": attachment_chunk.file_category or "",
+            "business_relevance": attachment_chunk.business_relevance or "",
+            "created_at": attachment_chunk.created_at or datetime.now().isoformat(),
+            "source": attachment_chunk.source,
+            "char_start": attachment_chunk.char_start,
+            "char_end": attachment_chunk.char_end
+        }
+        return attachment_chunk.chunk_id, preprocess_for_embedding(attachment_chunk.content), metadata
+
+    def add_attachment_chunk(self, attachment_chunk: AttachmentChunk) -> bool:
+        """첨부파일 청크 1개 저장 (여러 개는 add_attachment_chunks 사용)"""
+        return len(self.add_attachment_chunks([attachment_chunk])) == 1
+
+    def add_attachment_chunks(self, attachment_chunks: List[AttachmentChunk]) -> List[str]:
+        """
+        첨부파일 청크들을 한 번의 upsert로 저장
+
+        같은 티켓/파일을 다시 처리해도 chunk_id가 같으므로 중복 없이 덮어쓴다.
+
+        Returns:
+            저장된 chunk_id 목록 (실패 시 빈 목록)
+        """
+        if not attachment_chunks:
+            return []
+
+        try:
+            ids, documents, metadatas = [], [], []
+            for attachment_chunk in attachment_chunks:
+                chunk_id, document, metadata = self._build_attachment_chunk_record(attachment_chunk)
+                ids.append(chunk_id)
+                documents.append(document)
+                metadatas.append(metadata)
+
+            from attachment_search import embed_attachment_texts, invalidate_attachment_index
+
+            kwargs = {}
+            embeddings = embed_attachment_texts(documents)
+            if embeddings is not None:
+                kwargs["embeddings"] = embeddings
+            self._get_attachment_chunks_collection().upsert(ids=ids, documents=documents, metadatas=metadatas, **kwargs)
+            invalidate_attachment_index(metadata["ticket_id"] for metadata in metadatas)
+            print(f"✅ 첨부파일 청크 {len(ids)}개 저장 완료: {attachment_chunks[0].original_filename}")
+            return ids
+
+        except Exception as e:
+            print(f"❌ 첨부파일 청크 저장 실패: {e}")
+            return []
+
+    def _get_image_vectors_collection(self):
+        """image_vectors 컬렉션 가져오기 또는 생성 (임베딩은 ImageEmbeddingGenerator가 직접 제공)"""
+        try:
+            return self.client.get_collection(name="image_vectors")
+        except Exception:
+            return self.client.create_collection(
+                name="image_vectors",
+                metadata={
+                    "hnsw:space": "cosine",
+                    "description": "Mail image embeddings",
+                    "created_at": datetime.now().isoformat()
+                }
+            )
+
+    def save_image_vector(self, image_vector: ImageVector) -> bool:
+        """이미지 벡터 1개 저장 (여러 개는 save_image_vectors 사용)"""
+        return self.save_image_vectors([image_vector]) == 1
+
+    def save_image_vectors(self, image_vectors: List[ImageVector]) -> int:
+        """
+        이미지 벡터들을 한 번의 upsert로 저장
+
+        Returns:
+            저장된 이미지 수 (실패 시 0)
+        """
+        if not image_vectors:
+            return 0
+
+        try:
+            ids, embeddings, documents, metadatas = [], [], [], []
+            for image_vector in image_vectors:
+                ids.append(image_vector.image_id)
+                embeddings.append(image_vector.embedding)
+                documents.append(image_vector.description or "")
+                metadatas.append({
+                    "image_id": image_vector.image_id,
+                    "mail_id": image_vector.mail_id,
+                    "image_data": image_vector.image_data,
+                    "image_metadata_json": json.dumps(image_vector.image_metadata, ensure_ascii=False, default=str),
+                    "tags": ", ".join(image_vector.tags or []),
+                    "created_at": image_vector.created_at,
+                    "embedding_method": image_vector.embedding_method,
+                    "file_size": image_vector.file_size,
+                    "processing_duration": image_vector.processing_duration
+                })
+
+            self._get_image_vectors_collection().upsert(
+                ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas
+            )
+            print(f"✅ 이미지 벡터 {len(ids)}개 저장 완료 (메일: {image_vectors[0].mail_id})")
+            return len(ids)
+
+        except Exception as e:
+            print(f"❌ 이미지 벡터 저장 실패: {e}")
+            return 0
+
+    def search_attachment_chunks(self, query: str, n_results: int = 5, ticket_id: Optional[str] = None,
+                                 file_category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        첨부파일 청크 검색 (벡터 + BM25 하이브리드, 티켓/카테고리 필터)
+
+        Returns:
+            청크 단위 결과 (chunk_id, content, metadata, char_start/char_end, similarity_score 등)
+        """
+        try:
+            from attachment_search import AttachmentSearcher, get_attachment_embedding_function
+            searcher = AttachmentSearcher(
+                self._get_attachment_chunks_collection(),
+                embedding_function=get_attachment_embedding_function()
+            )
+            return searcher.search(query, n_results=n_results, ticket_id=ticket_id, file_category=file_category)
+        except Exception as e:
+            print(f"❌ 첨부파일 청크 검색 실패: {e}")
+            return []
+
+    def _build_structured_chunk_record(self, structured_chunk: StructuredChunk):
+        """StructuredChunk를 (id, document, metadata) 레코드로 변환"""
+        metadata = {
+            "chunk_id": structured_chunk.chunk_id,
+            "chunk_type": structured_chunk.chunk_type,
+            "ticket_id": structured_chunk.ticket_id,
+            "field_name": structured_chunk.field_name,
+            "field_value": structured_chunk.field_value,
+            "priority": structured_chunk.priority,
+            "file_name": structured_chunk.file_name,
+            "file_type": structured_chunk.file_type,
+            "created_at": structured_chunk.created_at,
+            "commenter": structured_chunk.commenter or "",
+            **structured_chunk.metadata
+        }
+        return structured_chunk.chunk_id, structured_chunk.content, metadata
+    
     def add_structured_chunk(self, structured_chunk: StructuredChunk) -> bool:
         """
         구조적 청크를 Vector DB에 추가
@@ -976,26 +1447,15 @@ class VectorDBManager:
             collection = self._get_or_create_structured_chunk_collection()
             
             # 메타데이터 준비
-            metadata = {
-                "chunk_id": structured_chunk.chunk_id,
-                "chunk_type": structured_chunk.chunk_type,
-                "ticket_id": structured_chunk.ticket_id,
-                "field_name": structured_chunk.field_name,
-                "field_value": structured_chunk.field_value,
-                "priority": structured_chunk.priority,
-                "file_name": structured_chunk.file_name,
-                "file_type": structured_chunk.file_type,
-                "created_at": structured_chunk.created_at,
-                "commenter": structured_chunk.commenter or "",
-                **structured_chunk.metadata
-            }
+            chunk_id, document, metadata = self._build_structured_chunk_record(structured_chunk)
             
             # ChromaDB에 추가
             collection.add(
-                ids=[structured_chunk.chunk_id],
-                documents=[structured_chunk.content],
+                ids=[chunk_id],
+                documents=[document],
                 metadatas=[metadata]
             )
+            self._notify_write("upsert", "structured_chunk", [chunk_id], [document], [metadata])
             
             print(f"✅ 구조적 청크 저장 완료: {structured_chunk.ticket_id} - {structured_chunk.field_name}")
             return True
@@ -1004,6 +1464,90 @@ class VectorDBManager:
             print(f"❌ 구조적 청크 저장 실패: {str(e)}")
             return False
     
+    def add_structured_chunks(self, structured_chunks: Iterable[StructuredChunk],
+                              batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        구조적 청크를 배치 단위로 저장 (제너레이터를 받아 배치만큼씩 소비)
+        
+        JiraStructuredChunker.iter_* 스트리밍 청커와 연결하면 대용량 내보내기도
+        배치 하나 분량의 청크만 메모리에 올린 채 저장할 수 있다.
+        입력 이터러블이 도중에 예외를 던지면 이번 호출에서 저장한 배치를 삭제(롤백)한 뒤
+        예외를 다시 던지므로, 파일 일부만 저장된 채 남지 않는다.
+        
+        Args:
+            structured_chunks: StructuredChunk 이터러블 (리스트 또는 제너레이터)
+            batch_size: 배치 크기 (기본: VECTOR_DB_BATCH_SIZE 환경변수, 없으면 64)
+            
+        Returns:
+            처리 통계 (total, stored, failed, batches, elapsed_seconds, chunks_per_second)
+        """
+        batch_size = max(1, batch_size or int(os.getenv("VECTOR_DB_BATCH_SIZE", "64")))
+        start_time = time.time()
+        stats = {"total": 0, "stored": 0, "failed": 0, "batches": 0}
+        
+        collection = None
+        stored_ids: List[str] = []
+        iterator = iter(structured_chunks)
+        while True:
+            try:
+                batch = list(islice(iterator, batch_size))
+            except Exception:
+                self._rollback_structured_chunks(collection, stored_ids)
+                raise
+            if not batch:
+                break
+            stats["total"] += len(batch)
+            
+            ids, documents, metadatas = [], [], []
+            for structured_chunk in batch:
+                try:
+                    chunk_id, document, metadata = self._build_structured_chunk_record(structured_chunk)
+                except Exception as e:
+                    print(f"❌ 구조적 청크 변환 실패: {e}")
+                    stats["failed"] += 1
+                    continue
+                ids.append(chunk_id)
+                documents.append(document)
+                metadatas.append(metadata)
+            
+            if not ids:
+                continue
+            
+            try:
+                if collection is None:
+                    collection = self._get_or_create_structured_chunk_collection()
+                collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+                stored_ids.extend(ids)
+                stats["stored"] += len(ids)
+                stats["batches"] += 1
+            except Exception as e:
+                print(f"❌ 구조적 청크 배치 저장 실패 ({len(ids)}개): {e}")
+                stats["failed"] += len(ids)
+                continue
+            self._notify_write("upsert", "structured_chunk", ids, documents, metadatas)
+        
+        elapsed = time.time() - start_time
+        stats["elapsed_seconds"] = round(elapsed, 3)
+        stats["chunks_per_second"] = round(stats["stored"] / elapsed, 1) if elapsed > 0 else 0.0
+        
+        print(
+            f"✅ 구조적 청크 배치 저장 완료: {stats['stored']}/{stats['total']}개, "
+            f"{stats['batches']}개 배치, {stats['elapsed_seconds']}초 ({stats['chunks_per_second']}개/초)"
+        )
+        return stats
+    
+    def _rollback_structured_chunks(self, collection, ids: List[str]):
+        """add_structured_chunks 도중 저장한 구조적 청크 삭제"""
+        if collection is None or not ids:
+            return
+        try:
+            collection.delete(ids=ids)
+            print(f"↩️ 구조적 청크 부분 저장 롤백: {len(ids)}개 삭제")
+        except Exception as e:
+            print(f"❌ 구조적 청크 롤백 실패 ({len(ids)}개): {e}")
+            return
+        self._notify_write("delete", "structured_chunk", ids)
+    
     def _get_or_create_structured_chunk_collection(self):
         """구조적 청크 전용 컬렉션 가져오기 또는 생성"""
         try:
@@ -1146,7 +1690,7 @@ class VectorDBManager:
                 for i, doc in enumerate(results['documents']):
                     metadata = results['metadatas'][i] if results['metadatas'] else {}
                     file_chunks.append({
-                        'chunk_id': metadata.get('chunk_id', f'chunk_{i}'),
+                        'chunk_id': metadata.get('chunk_id', results['ids'][i]),
                         'file_name': metadata.get('file_name', ''),
                         'content': doc,
                         'metadata': metadata,
@@ -1170,7 +1714,7 @@ class VectorDBManager:
                 for i, doc in enumerate(results['documents']):
                     metadata = results['metadatas'][i] if results['metadatas'] else {}
                     mails.append({
-                        'message_id': metadata.get('message_id', f'mail_{i}'),
+                        'message_id': metadata.get('message_id', results['ids'][i]),
                         'subject': metadata.get('subject', ''),
                         'sender': metadata.get('sender', ''),
                         'content': doc,
@@ -1196,7 +1740,7 @@ class VectorDBManager:
                 for i, doc in enumerate(results['documents']):
                     metadata = results['metadatas'][i] if results['metadatas'] else {}
                     structured_chunks.append({
-                        'chunk_id': metadata.get('chunk_id', f'structured_{i}'),
+                        'chunk_id': metadata.get('chunk_id', results['ids'][i]),
                         'ticket_id': metadata.get('ticket_id', ''),
                         'chunk_type': metadata.get('chunk_type', ''),
                         'content': doc,